@@ -1,5 +1,6 @@
 #!/usr/bin/env python
 import wx, os, sys
+from multiprocessing import freeze_support
 
 #TODO: Not sure what this was for.  Causes problems with 
 #TODO: py2exe because sys.path[0] is a zip file.
@@ -9,5 +10,8 @@ from fr0stlib.gui import Fr0stApp
 
 
 if __name__ == '__main__':
+    # Batch renders run in worker processes, which re-run this script when
+    # frozen by py2exe.
+    freeze_support()
     app = Fr0stApp()
     app.MainLoop()
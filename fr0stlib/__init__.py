@@ -1,4 +1,8 @@
+import os
+import sys
 import shutil
+import tempfile
+import mmap
 import random
 import itertools
 import ctypes
@@ -6,27 +10,37 @@ import collections
 import xml.etree.cElementTree as etree
 import copy
 import re
+import struct
+import marshal
+import binascii
 
 import Image
 import numpy
 from fr0stlib import _utils as utils
 from fr0stlib.pyflam3 import Genome,RandomContext,flam3_estimate_bounding_box
 from fr0stlib.pyflam3.variations import variable_list,variation_list,variables
+from fr0stlib.pyflam3.variations import variations
 from fr0stlib.pyflam3.constants import flam3_nvariations
 from fr0stlib.compatibility import compatibilize
+from fr0stlib.xformarray import XformArray
 from math import *
 
 from fr0stlib.functions import *
 
-try:
-    import wx
-except ImportError:
-    wx = False
+# wx is only picked up if the gui has already loaded it, so fr0stlib can be
+# used on machines without a display.
+wx = sys.modules.get("wx") or False
 
 
 VERSION = "fr0st 0.5 alpha"
 
 _variables = dict([i[0:2] for i in variable_list])
+_variable_ids = dict((v[0], i) for i, v in enumerate(variable_list))
+
+# Every mutation of a flame, xform or chaos list stamps the object with a new
+# number from this counter. Numbers are never reused, so a tuple of versions
+# identifies the state of a flame and can be used to cache its string.
+_versions = itertools.count()
 
 class ParsingError(Exception):
     pass
@@ -37,8 +51,10 @@ class Flame(object):
     re_flame  = re.compile(r'<flame .*?</flame>',re.DOTALL)
 
     _default = set(("final", "gradient", "xform", "name",
-                    "width", "height", "x_offset", "y_offset"))
-    
+                    "width", "height", "x_offset", "y_offset",
+                    "_version", "_strings"))
+    _version = -1
+
     def __init__(self, string=""):
         # Set minimum required attributes.
         self.name = "Untitled"
@@ -110,9 +126,34 @@ class Flame(object):
 
         return self
 
-    def to_string(self, omit_details=False):
+    def __setattr__(self, name, v):
+        if name == "xform" and type(v) is not XformList:
+            v = XformList(v)
+        object.__setattr__(self, name, v)
+        self.__dict__["_version"] = _versions.next()
+
+
+    def __delattr__(self, name):
+        object.__delattr__(self, name)
+        self.__dict__["_version"] = _versions.next()
+
+
+    def _state(self, omit_details=False):
+        return (self._version, [x._state() for x in self.iter_xforms()],
+                None if omit_details else self.gradient.data.tostring())
+
+
+    def to_string(self, omit_details=False, compact_palette=False):
         """Extracts parameters from a Flame object and converts them into
-        string format."""
+        string format. The result is cached until the flame, its xforms or
+        its palette are modified. If compact_palette is true, the palette is
+        written as a hex encoded palette element."""
+        state = self._state(omit_details)
+        strings = self.__dict__.setdefault("_strings", {})
+        key = omit_details, compact_palette
+        cached = strings.get(key)
+        if cached is not None and cached[0] == state:
+            return cached[1]
 
         # Make the flame header
         lst =  ['<flame ']
@@ -136,11 +177,113 @@ class Flame(object):
         
         # Make the gradient
         if not omit_details:
-            lst.append(self.gradient.to_string())
+            lst.append(self.gradient.to_string(compact_palette))
 
         lst.append('</flame>')
 
-        return "".join(lst)
+        string = "".join(lst)
+        strings[key] = state, string
+        return string
+
+
+    def to_genome(self):
+        """Converts the flame into a flam3 genome, ready to be passed to
+        any libflam3 function. Faster than parsing the output of to_string."""
+        return Genome.from_flame(self)
+
+
+    # Per xform attributes stored in the coefficient block after the coefs
+    # and post coefs. Missing attributes are stored as nan.
+    _binary_xform_attrs = "weight", "color", "color_speed", "animate", "opacity"
+    _binary_header = struct.Struct("<IIIII")
+    _binary_vars = numpy.dtype([("xform", "<u2"), ("id", "<u2"),
+                                ("value", "<f8")])
+
+    def to_binary(self):
+        """Packs the flame into a compact binary string. The layout is:
+        a header with the sizes of the following blocks, the marshalled
+        flame and extra xform attributes, a float64 block with coefs, post
+        coefs and attributes of each xform, the chaos matrix, sparse tables of
+        variation and parameter values and the raw palette."""
+        xforms = list(self.iter_xforms())
+        block = numpy.empty((len(xforms), 17))
+        varlist, paramlist, extras = [], [], []
+        for i, x in enumerate(xforms):
+            block[i, :6] = x.coefs
+            block[i, 6:12] = x.post.coefs
+            block[i, 12:] = [x.__dict__.get(k, numpy.nan)
+                             for k in self._binary_xform_attrs]
+            extra = {}
+            for k, v in x.__dict__.iteritems():
+                if k in variations:
+                    varlist.append((i, variations[k], v))
+                elif k in _variable_ids:
+                    paramlist.append((i, _variable_ids[k], v))
+                elif k not in x._default and k not in self._binary_xform_attrs:
+                    extra[k] = v
+            extras.append(extra)
+
+        chaos = numpy.array([x.chaos[:] for x in self.xform], numpy.float64)
+        header = dict((k, v) for k, v in self.__dict__.iteritems()
+                      if k not in ("xform", "final", "gradient",
+                                   "_version", "_strings"))
+        meta = marshal.dumps(_plain((header, extras)))
+        return "".join((self._binary_header.pack(len(meta), len(self.xform),
+                                                 bool(self.final), len(varlist),
+                                                 len(paramlist)),
+                        meta,
+                        block.tostring(),
+                        chaos.tostring(),
+                        numpy.array(varlist, self._binary_vars).tostring(),
+                        numpy.array(paramlist, self._binary_vars).tostring(),
+                        self.gradient.to_binary()))
+
+
+    @classmethod
+    def from_binary(cls, buf, offset=0):
+        """Unpacks a flame created by to_binary, starting at offset. Returns
+        the flame and the offset at which its data ends."""
+        lmeta, nx, final, nvars, nparams = \
+               cls._binary_header.unpack_from(buf, offset)
+        offset += cls._binary_header.size
+        header, extras = marshal.loads(buf[offset:offset+lmeta])
+        offset += lmeta
+        ntotal = nx + final
+        block = _frombuffer(buf, numpy.float64, ntotal * 17, offset)
+        block = block.reshape(ntotal, 17).tolist()
+        offset += ntotal * 17 * 8
+        chaos = _frombuffer(buf, numpy.float64, nx * nx, offset)
+        chaos = chaos.reshape(nx, nx).tolist()
+        offset += nx * nx * 8
+        varlist = _frombuffer(buf, cls._binary_vars, nvars, offset).tolist()
+        offset += nvars * cls._binary_vars.itemsize
+        paramlist = _frombuffer(buf, cls._binary_vars, nparams, offset).tolist()
+        offset += nparams * cls._binary_vars.itemsize
+
+        kwds = []
+        for row, extra in zip(block, extras):
+            kw = dict(extra)
+            kw["coefs"] = row[:6]
+            kw.update((k, v) for k, v in zip(cls._binary_xform_attrs, row[12:])
+                      if v == v)
+            kwds.append(kw)
+        for i, id, value in varlist:
+            kwds[i][variation_list[id]] = value
+        for i, id, value in paramlist:
+            kwds[i][variable_list[id][0]] = value
+
+        # Bypass __init__, as the header holds all attributes of the flame.
+        self = cls.__new__(cls)
+        self.__dict__.update(header)
+        self.xform = [Xform(self, chaos=chaos[i], **kwds[i])
+                      for i in xrange(nx)]
+        self.final = Xform(self, **kwds[nx]) if final else None
+        for x, row in zip(self.iter_xforms(), block):
+            x.post.coefs = row[6:12]
+        self.gradient = Palette.from_binary(buf, offset)
+        offset += Palette.binary_size
+
+        return self, offset
 
 
     def __repr__(self):
@@ -171,22 +314,18 @@ class Flame(object):
 
 
     def copy(self):
-        return Flame(string=self.to_string())
-
-#    def copy(self):
-#        self.xform, xforms = [], self.xform
-#
-#        new_flame = copy.deepcopy(self)
-#
-#        for xform in xforms:
-#            new_xform = xform.copy()
-#            new_xform._parent = new_flame
-#            new_flame.xform.append(new_xform)
-#
-#        self.xform = xforms
-#
-#        return new_flame
-    
+        """Returns an independent copy of the flame. Xforms, chaos, post
+        xforms and the palette are cloned directly, without going through
+        to_string."""
+        new = object.__new__(type(self))
+        d = _copy_attributes(self.__dict__)
+        object.__setattr__(new, "__dict__", d)
+        d.pop("_strings", None)
+        d["gradient"] = self.gradient.copy()
+        d["xform"] = XformList(x._copy(new) for x in self.xform)
+        d["final"] = self.final._copy(new) if self.final else None
+        return new
+
 
 
     def iter_xforms(self):
@@ -215,7 +354,7 @@ class Flame(object):
         b_max = TwoDoubles()
         b_eps = 0.01
         nsamples = 10000
-        genome = Genome.from_string(self.to_string(False))[0]
+        genome = self.to_genome()
         flam3_estimate_bounding_box(genome, b_eps, nsamples, b_min, b_max, RandomContext())
         #print "%f %f" % ((b_min[0]+b_max[0])/2,(b_min[1]+b_max[1])/2)
         bxoff = (b_min[0]+b_max[0])/2
@@ -321,9 +460,51 @@ class Palette(collections.Sequence):
 #    def __contains__(self, value):
 #        return NotImplementedError("contains makes no sense on palettes")
 
-    def to_string(self):
-        s = '   <color index="%s" rgb="%s %s %s"/>\n'
-        return ''.join([s % (idx, int(self.data[idx, 0]), int(self.data[idx, 1]), int(self.data[idx, 2])) for idx in xrange(256)])
+    _string = None, None
+    _color_format = ''.join('   <color index="%s" rgb="%%d %%d %%d"/>\n' % idx
+                            for idx in xrange(256))
+
+    def to_string(self, compact=False):
+        """Returns the palette as 256 color elements, or as a single hex
+        encoded palette element if compact is true."""
+        # The data array can be modified in place, so it's compared directly
+        # to find out if the cached string is still valid.
+        state = self.data.tostring(), compact
+        if self._string[0] == state:
+            return self._string[1]
+        if compact:
+            data = binascii.hexlify(self.data.astype(numpy.uint8).tostring())
+            string = ''.join(['   <palette count="256" format="RGB">\n']
+                             + ['      %s\n' % data[i:i+48].upper()
+                                for i in xrange(0, len(data), 48)]
+                             + ['   </palette>\n'])
+        else:
+            string = self._color_format % tuple(self.data.ravel().tolist())
+        self._string = state, string
+        return string
+
+    binary_size = 256 * 3
+
+    def to_binary(self):
+        return self.data.astype(numpy.uint8).tostring()
+
+    def copy(self):
+        palette = Palette()
+        palette.data = self.data.copy()
+        palette._string = self._string
+        return palette
+
+    @classmethod
+    def from_binary(cls, buf, offset=0):
+        palette = cls()
+        palette.data = numpy.frombuffer(buf, numpy.uint8, cls.binary_size,
+                                        offset).reshape(256, 3).copy()
+        return palette
+
+    @classmethod
+    def from_string(cls, string):
+        """Reads the palette of a flame xml string."""
+        return cls.from_flame_element(etree.fromstring(string.strip()))
 
     @classmethod
     def from_flame_element(cls, flame):
@@ -337,57 +518,45 @@ class Palette(collections.Sequence):
             if palette_element.get('format').strip().lower() != 'rgb':
                 raise ParsingError('Only rgb palettes are currently supported')
 
-            data = ''.join(palette_element.text.split())
+            try:
+                data = binascii.unhexlify(''.join(palette_element.text.split()))
+            except TypeError, e:
+                raise ParsingError('Invalid palette data: %s' % e)
 
-            for idx in range(0, len(data), 6):
-                palette.data[idx/6, 0] = int(data[idx+0:idx+2], 16)
-                palette.data[idx/6, 1] = int(data[idx+2:idx+4], 16)
-                palette.data[idx/6, 2] = int(data[idx+4:idx+6], 16)
+            if len(data) != 256 * 3:
+                raise ParsingError('Not enough palette entries specified: %s != %s' % (256, len(data) / 3))
 
-            if idx != 255 * 6:
-                raise ParsingError('Not enough palette entries specified: %s != %s' % (255 * 6, idx))
+            palette.data = numpy.frombuffer(data, numpy.uint8).reshape(256, 3).copy()
 
         else:
-            for color in flame.findall('color'):
-                r, g, b = color.get('rgb').split()
-                index = int(color.get('index'))
-                palette.data[index, 0] = float(r)
-                palette.data[index, 1] = float(g)
-                palette.data[index, 2] = float(b)
+            colors = flame.findall('color')
+            if colors:
+                index = [int(color.get('index')) for color in colors]
+                rgb = " ".join([color.get('rgb') for color in colors]).split()
+                palette.data[index] = numpy.array(rgb, numpy.float64).reshape(-1, 3)
 
         return palette
 
 
     def rotate(self, index):
-        self.data = numpy.array(
-                list(self.data[-index:]) + list(self.data[:-index]), dtype=numpy.uint8)
+        self.data = numpy.roll(self.data, index, 0)
 
     def hue(self, value):
-        value = value/360.0
-        for i in xrange(256):
-            h,l,s = rgb2hls(self.data[i])
-            h += value
-            h = clip(h,0,1,True)
-            rgb = hls2rgb((h,l,s))
-            self.data[i] = hls2rgb((h,l,s))
+        hls = array_rgb2hls(self.data)
+        hls[:,0] = array_clip(hls[:,0] + value/360.0, 0, 1, True)
+        self.data[:] = array_hls2rgb(hls)
 
             
     def saturation(self, value):
-        value = value/100.0
-        for i in xrange(256):
-            h,l,s = rgb2hls(self.data[i])
-            s += value
-            s = clip(s,0,1)
-            self.data[i] = hls2rgb((h,l,s))
+        hls = array_rgb2hls(self.data)
+        hls[:,2] = numpy.clip(hls[:,2] + value/100.0, 0, 1)
+        self.data[:] = array_hls2rgb(hls)
 
             
     def brightness(self, value):
-        value = value/100.0
-        for i in xrange(256):
-            h,l,s = rgb2hls(self.data[i])
-            l += value
-            l = clip(l,0,1)
-            self.data[i] = hls2rgb((h,l,s))
+        hls = array_rgb2hls(self.data)
+        hls[:,1] = numpy.clip(hls[:,1] + value/100.0, 0, 1)
+        self.data[:] = array_hls2rgb(hls)
 
             
     def invert(self):
@@ -405,33 +574,14 @@ class Palette(collections.Sequence):
         elif curve=='cos': cur = 1
         else: raise ValueError('Curve must be lin or cos')
 
-        #from 0 (compliment) to dist (left split)
-        gen = []
-        for i in xrange(dist):
-            r = utils.pblend(comp[0], lspl[0], (i/float(dist)), cur)
-            g = utils.pblend(comp[1], lspl[1], (i/float(dist)), cur)
-            b = utils.pblend(comp[2], lspl[2], (i/float(dist)), cur)
-            gen.append((r, g, b))
-        #from dist to 128 (seed)
-        for i in xrange(128-dist):
-            r = utils.pblend(lspl[0], seed[0], (i/float(128-dist)), cur)
-            g = utils.pblend(lspl[1], seed[1], (i/float(128-dist)), cur)
-            b = utils.pblend(lspl[2], seed[2], (i/float(128-dist)), cur)
-            gen.append((r, g, b))
-        #from 127 to 255-dist
-        for i in xrange(128-dist):
-            r = utils.pblend(seed[0], rspl[0], (i/float(128-dist)), cur)
-            g = utils.pblend(seed[1], rspl[1], (i/float(128-dist)), cur)
-            b = utils.pblend(seed[2], rspl[2], (i/float(128-dist)), cur)
-            gen.append((r, g, b))
-        #from 255-dist to 255
-        for i in xrange(dist):
-            r = utils.pblend(rspl[0], comp[0], (i/float(dist)), cur)
-            g = utils.pblend(rspl[1], comp[1], (i/float(dist)), cur)
-            b = utils.pblend(rspl[2], comp[2], (i/float(dist)), cur)
-            gen.append((r, g, b))
-        
-        self.data = numpy.array(gen, dtype=numpy.uint8)
+        # from 0 (compliment) to dist (left split), from dist to 128 (seed),
+        # from 127 to 255-dist and from 255-dist to 255.
+        segments = ((comp, lspl, dist), (lspl, seed, 128-dist),
+                    (seed, rspl, 128-dist), (rspl, comp, dist))
+        gen = [array_pblend(start, end,
+                            (numpy.arange(n) / float(n))[:,None], cur)
+               for start, end, n in segments if n > 0]
+        self.data = numpy.concatenate(gen).astype(numpy.uint8)
 
 
     def from_seeds(self, seeds, curve='cos'):
@@ -445,14 +595,10 @@ class Palette(collections.Sequence):
         for i in xrange(ns):
             if i+1<=r: ds.append(d+1)
             else:      ds.append(d)
-        gen = []
-        for i in xrange(ns):
-            for j in xrange(ds[i]):
-                h = utils.pblend(seeds[i-1][0], seeds[i][0], (j/float(ds[i])), cur)
-                s = utils.pblend(seeds[i-1][1], seeds[i][1], (j/float(ds[i])), cur)
-                v = utils.pblend(seeds[i-1][2], seeds[i][2], (j/float(ds[i])), cur)
-                gen.append(hsv2rgb((h,s,v)))
-        self.data = numpy.array(gen, dtype=numpy.uint8)
+        gen = [array_pblend(seeds[i-1], seeds[i],
+                            (numpy.arange(ds[i]) / float(ds[i]))[:,None], cur)
+               for i in xrange(ns) if ds[i]]
+        self.data = array_hsv2rgb(numpy.concatenate(gen))
 
 
     def random(self, hue=(0,1), saturation=(0,1), value=(0,1),  nodes=(5,5),
@@ -473,15 +619,14 @@ class Palette(collections.Sequence):
             idx = 3*(x + img.size[0]*y)
             grab[i] = bin[idx:idx+3]
 
-        best = utils.palette_improve(grab, num_tries, try_size)
-        for i in xrange(256):
-            self.data[i] = (best[i,0], best[i,1], best[i,2])
+        self.data[:] = utils.palette_improve(grab, num_tries, try_size)
 
 
 class Xform(object):
     """Container for transform parameters."""
 
-    _default = set(("_parent","a","b","c","d","e","f","_chaos","_post"))
+    _default = set(("_parent","a","b","c","d","e","f","_chaos","_post",
+                    "_version","_string","_index"))
     # We need to specify attributes with an explicit default value.
     # See iter_attributes for more details.
     opacity = 1.0
@@ -570,15 +715,37 @@ class Xform(object):
 
         return x
 
+    def __setattr__(self, name, v):
+        object.__setattr__(self, name, v)
+        self.__dict__["_version"] = _versions.next()
+
+
+    def __delattr__(self, name):
+        object.__delattr__(self, name)
+        self.__dict__["_version"] = _versions.next()
+
+
+    def _state(self):
+        final = self is self._parent.final
+        return (self._version, self._post._version, self._chaos._version,
+                final, 0 if final else len(self._parent.xform))
+
+
     def to_string(self):
-        lst = ['   <%sxform '%("final" if self.isfinal() else "")]
+        state = self._state()
+        cached = self.__dict__.get("_string")
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        lst = ['   <%sxform '%("final" if state[3] else "")]
         lst.extend('%s="%s" ' %i for i in self.iter_attributes())
         lst.append('coefs="%s %s %s %s %s %s" ' % self.screen_coefs)
         lst.append(self.post.to_string())
         lst.append(self.chaos.to_string())
         lst.append('/>\n')
-        
-        return "".join(lst)
+
+        string = "".join(lst)
+        self.__dict__["_string"] = state, string
+        return string
     
             
     def __repr__(self):
@@ -596,7 +763,7 @@ class Xform(object):
         """Returns a default value for non-existing attributes"""
         # __getattribute__ is the real lookup special method,  __getattr__ is
         # only called when it fails.
-        if v in variation_list:
+        if v in variations:
             return 0.0
 
         if v in self._default:
@@ -631,7 +798,10 @@ class Xform(object):
     def index(self):
         if self is self._parent.final:
             return None
-        return self._parent.xform.index(self)
+        try:
+            return self.__dict__["_index"]
+        except KeyError:
+            raise ValueError("xform is not in its flame's xform list")
     
        
     @property
@@ -827,38 +997,34 @@ class Xform(object):
 
 
     def isfinal(self):
-        return self.index is None
+        return self is self._parent.final
 
     
     def copy(self):
         if not self.isfinal():
-            self._parent, parent = None, self._parent
-            self._chaos, chaos = None, self._chaos
-            self.post._parent = None
-            xf = copy.deepcopy(self)
-
-            xf.post._parent = xf
-            xf._parent = parent
-
-            self._chaos = chaos
-            self._parent = parent
-            self.post._parent = self
-
-            xf._chaos = Chaos(xf, chaos)
-
+            xf = self._copy(self._parent)
             self._parent.xform.append(xf)
-
             return xf
 
 
+    def _copy(self, parent):
+        """Returns a copy of the xform which belongs to parent. The copy is
+        not added to the parent's xform list."""
+        xf = object.__new__(type(self))
+        d = _copy_attributes(self.__dict__)
+        object.__setattr__(xf, "__dict__", d)
+        d["_parent"] = parent
+        if type(self) is Xform:
+            d["_chaos"] = self._chaos._copy(xf)
+            d["_post"] = self._post._copy(xf)
+        return xf
+
+
     def delete(self):
         if self.isfinal():
             self._parent.final = None            
         else:
-            index = self.index
-            self._parent.xform.remove(self)
-            for x in self._parent.xform:
-                del x.chaos[index]
+            del self._parent.xform[self.index]
 
 
 
@@ -875,6 +1041,11 @@ class PostXform(Xform):
         if name not in self._allowed:
             raise AttributeError, 'Can\'t assign "%s" to %s' %(name,self)
         object.__setattr__(self,name,v)
+        self.__dict__["_version"] = _versions.next()
+
+    def __delattr__(self,name):
+        object.__delattr__(self,name)
+        self.__dict__["_version"] = _versions.next()
 
     def copy(self):
         raise TypeError, "Can't copy a post transform"
@@ -894,51 +1065,86 @@ class PostXform(Xform):
 
 class Chaos(list):
     """ A list which returns 1 for unassigned items, and pads the list when
-    necessary to store values in their correct locations."""
+    necessary to store values in their correct locations. Its length is
+    always the number of xforms in the flame.
+
+    Only explicitly assigned values are stored. The xform list of the flame
+    inserts and deletes the column of an xform in every chaos row when it's
+    added to or removed from the middle of the list."""
 
     def __repr__(self):
         return "Chaos(%s)" %self[:]
 
     def __init__(self, parent, lst):
         self._parent = parent
-        lst = map(float, lst)
-        # HACK: 100 extra items could run out in theory. However, it's
-        # complicated to do a "proper" implementation of this, due to the slice
-        # methods.
-        lst.extend([1] * 100)
-        list.__init__(self, lst)
+        self._version = _versions.next()
+        list.__init__(self, map(float, lst))
+
+    def _copy(self, parent):
+        new = list.__new__(Chaos)
+        list.__init__(new, list.__getslice__(self, 0, sys.maxint))
+        new._parent = parent
+        new._version = self._version
+        return new
 
     def __len__(self):
-        if self._parent.isfinal():
+        xform = self._parent
+        if xform is xform._parent.final:
             return 0
-        return len(self._parent._parent.xform)
+        return len(xform._parent.xform)
 
     def __iter__(self):
-        return (self[i] for i in xrange(len(self)))
+        return iter(self[:])
+
+    def _pos(self, pos):
+        n = len(self)
+        if pos < 0:
+            pos += n
+        if not 0 <= pos < n:
+            raise IndexError(pos)
+        return pos
         
     def __getitem__(self,pos):
-        if abs(pos) > len(self)-1:
-            raise IndexError
-        return list.__getitem__(self,pos)
+        pos = self._pos(pos)
+        if pos < list.__len__(self):
+            return list.__getitem__(self,pos)
+        return 1.0
 
     def __getslice__(self,pos,pos2):
         if (pos<0) or (pos2<0):
             raise NotImplementedError, "Negative slicing not supported"
-        return list.__getslice__(self,pos, min(pos2, len(self)))
+        pos2 = min(pos2, len(self))
+        lst = list.__getslice__(self, pos, pos2)
+        lst.extend([1.0] * (pos2 - pos - len(lst)))
+        return lst
     
     def __setitem__(self,pos,val):
         if val < 0:
             raise ValueError(val)
-        if abs(pos) > len(self)-1:
-            raise IndexError(pos)
-        list.__setitem__(self,pos,val)
-      
+        pos = self._pos(pos)
+        missing = pos + 1 - list.__len__(self)
+        if missing > 0:
+            self.extend([1.0] * missing)
+        list.__setitem__(self,pos,float(val))
+        self._version = _versions.next()
+
     def __setslice__(self,pos,pos2,val):
         if any(i < 0 for i in val):
             raise ValueError(val)
         if (pos<0) or (pos2<0):
             raise NotImplementedError, "Negative slicing not supported"
-        list.__setslice__(self, pos, min(pos2, len(self)), val)
+        for i, v in zip(xrange(pos, min(pos2, len(self))), val):
+            self[i] = v
+
+    def _insert_column(self, pos):
+        if pos < list.__len__(self):
+            self.insert(pos, 1.0)
+            self._version = _versions.next()
+
+    def _delete_column(self, pos):
+        if pos < list.__len__(self):
+            list.__delitem__(self, pos)
+            self._version = _versions.next()
 
     def to_string(self):
         lst = self[:]
@@ -950,27 +1156,527 @@ class Chaos(list):
 
 
 
-def save_flames(filename,*flames):
-    lst = [f.to_string() if isinstance(f,Flame) else f for f in flames]
-    lst.insert(0, """<flames name="Fr0st Batch">""")
-    lst.append("""</flames>""")
-    head, ext = os.path.splitext(filename)
-    if os.path.exists(filename) and ext == ".flame":
-        shutil.copy(filename,head + ".bak")
-    f = open(filename,"w")
-    f.write("\n".join(lst))
-    f.close()
+class XformList(list):
+    """The xforms of a flame. Keeps track of the position of each xform, so
+    Xform.index is a lookup instead of a search, and keeps the chaos rows of
+    all xforms in sync when xforms are inserted or removed."""
+
+    def __init__(self, xforms=()):
+        list.__init__(self, xforms)
+        self._reindex()
+
+    def _reindex(self, start=0):
+        for i in xrange(start, len(self)):
+            list.__getitem__(self, i).__dict__["_index"] = i
+
+    def _detach(self, xform):
+        xform.__dict__.pop("_index", None)
+
+    def _rebuild(self, op, *args):
+        """Performs an arbitrary change on the list, moving the chaos columns
+        along with the xforms they refer to."""
+        old = list(self)
+        rows = [list.__getslice__(x._chaos, 0, sys.maxint) for x in old]
+        op(self, *args)
+        positions = dict((id(x), i) for i, x in enumerate(old))
+        for x in old:
+            self._detach(x)
+        self._reindex()
+        for x in self:
+            if id(x) not in positions:
+                continue
+            row = rows[positions[id(x)]]
+            chaos = x._chaos
+            del chaos[:]
+            columns = [positions.get(id(y), sys.maxint) for y in self]
+            list.extend(chaos, [row[i] if i < len(row) else 1.0
+                                for i in columns])
+            chaos._version = _versions.next()
+
+    def append(self, xform):
+        list.append(self, xform)
+        xform.__dict__["_index"] = len(self) - 1
+
+    def extend(self, xforms):
+        start = len(self)
+        list.extend(self, xforms)
+        self._reindex(start)
+
+    def __iadd__(self, xforms):
+        self.extend(xforms)
+        return self
 
+    def insert(self, pos, xform):
+        n = len(self)
+        if pos < 0:
+            pos = max(pos + n, 0)
+        pos = min(pos, n)
+        for x in self:
+            x._chaos._insert_column(pos)
+        list.insert(self, pos, xform)
+        self._reindex(pos)
+
+    def __delitem__(self, pos):
+        if isinstance(pos, slice):
+            return self._rebuild(list.__delitem__, pos)
+        if pos < 0:
+            pos += len(self)
+        xform = self[pos]
+        list.__delitem__(self, pos)
+        self._detach(xform)
+        for x in self:
+            x._chaos._delete_column(pos)
+        self._reindex(pos)
+
+    def pop(self, pos=-1):
+        xform = self[pos]
+        del self[pos]
+        return xform
+
+    def remove(self, xform):
+        del self[self.index(xform)]
+
+    def __setitem__(self, pos, xform):
+        # The new xform takes over the chaos column of the one it replaces.
+        if isinstance(pos, slice):
+            return self._rebuild(list.__setitem__, pos, xform)
+        if pos < 0:
+            pos += len(self)
+        self._detach(self[pos])
+        list.__setitem__(self, pos, xform)
+        xform.__dict__["_index"] = pos
+
+    def __setslice__(self, pos, pos2, xforms):
+        self._rebuild(list.__setslice__, pos, pos2, xforms)
+
+    def __delslice__(self, pos, pos2):
+        self._rebuild(list.__delslice__, pos, pos2)
+
+    def __imul__(self, n):
+        self._rebuild(list.__imul__, n)
+        return self
 
-def load_flame_strings(filename):
+    def reverse(self):
+        self._rebuild(list.reverse)
+
+    def sort(self, *args, **kwds):
+        self._rebuild(list.sort, *args, **kwds)
+
+
+
+def save_flames(filename, *flames, **kwds):
+    """Writes flames (Flame objects or strings) to a file.
+
+    The changed keyword can be given a list of positions of flames which
+    differ from the ones currently stored in the file. All other flames are
+    then assumed to be unchanged and at the same position, so they're copied
+    over from the old file instead of being serialized again. If only new
+    flames are added at the end, the old data is copied as one block. The
+    file is always streamed to a temporary file which replaces the original,
+    so an interrupted save never leaves a truncated file behind.
+
+    If compact_palette is true, the palettes of Flame objects are written as
+    hex encoded palette elements, which take about half as much space."""
+    changed = kwds.pop("changed", None)
+    compact = kwds.pop("compact_palette", False)
+    if kwds:
+        raise TypeError("Unexpected keyword arguments: %s" % ", ".join(kwds))
+
+    index = None
+    if changed is not None and os.path.exists(filename):
+        index = FlameIndex(filename)
+        if len(index) > len(flames):
+            # Flames were removed, so positions can't be trusted.
+            index = None
+
+    if index is None:
+        return _write_flames(filename, flames, compact=compact)
+
+    # Make sure flames assumed to be unchanged match the data in the file.
+    # This guards against the file being out of sync.
+    changed = set(changed).union(xrange(len(index), len(flames)))
+    unchanged = [i for i in xrange(len(index)) if i not in changed]
+    if unchanged:
+        changed.update(_mismatched(filename, index, flames, unchanged,
+                                   compact))
+    if not changed:
+        return
+    if index.entries and min(changed) >= len(index):
+        return _append_flames(filename, index, flames[len(index):], compact)
+    return _write_flames(filename, flames, index, changed, compact)
+
+
+def _flame_string(flame, compact=False):
+    if isinstance(flame, Flame):
+        return flame.to_string(compact_palette=compact)
+    return flame
+
+
+def _mismatched(filename, index, flames, positions, compact=False):
+    """Yields the positions whose flames differ from the file's data. Flame
+    objects are compared by their string, which is cached until they're
+    modified."""
+    with open(filename, "rb") as fd:
+        mm = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        for i in positions:
+            entry = index.entries[i]
+            if (mm[entry.offset:entry.offset + entry.length]
+                != _flame_string(flames[i], compact)):
+                yield i
+    finally:
+        mm.close()
+
+
+def _append_flames(filename, index, flames, compact=False):
+    last = index.entries[-1]
+    end = last.offset + last.length
+    def write(f):
+        with open(filename, "rb") as old:
+            remaining = end
+            while remaining:
+                data = old.read(min(1<<20, remaining))
+                if not data:
+                    raise IOError("%s changed while saving." % filename)
+                f.write(data)
+                remaining -= len(data)
+        for flame in flames:
+            f.write("\n")
+            f.write(_flame_string(flame, compact))
+        f.write("\n</flames>")
+    _replace_file(filename, write)
+
+
+def _write_flames(filename, flames, index=None, changed=(), compact=False):
+    mm = None
+    if index is not None and index.entries:
+        with open(filename, "rb") as old:
+            mm = mmap.mmap(old.fileno(), 0, access=mmap.ACCESS_READ)
+    def write(f):
+        f.write("""<flames name="Fr0st Batch">""")
+        for i, flame in enumerate(flames):
+            f.write("\n")
+            if mm is not None and i not in changed:
+                entry = index.entries[i]
+                f.write(mm[entry.offset:entry.offset + entry.length])
+            else:
+                f.write(_flame_string(flame, compact))
+        f.write("\n</flames>")
+    try:
+        _replace_file(filename, write)
+    finally:
+        if mm is not None:
+            mm.close()
+
+
+def _replace_file(filename, write):
+    """Calls write with a temporary file, which then replaces filename. The
+    previous version of .flame files is kept as .bak."""
+    dirname = os.path.dirname(os.path.abspath(filename))
+    fd, temppath = tempfile.mkstemp(suffix=".tmp", dir=dirname)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            write(f)
+    except:
+        os.remove(temppath)
+        raise
+
+    if not os.path.exists(filename):
+        # mkstemp makes the file private, new files follow the umask instead.
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(temppath, 0666 & ~umask)
+    else:
+        shutil.copymode(filename, temppath)
+        head, ext = os.path.splitext(filename)
+        if ext == ".flame":
+            _backup(filename, head + ".bak")
+        if "win32" in sys.platform and os.path.exists(filename):
+            # rename can't overwrite existing files on windows.
+            os.remove(filename)
+    os.rename(temppath, filename)
+
+
+def _backup(filename, backup):
+    """Keeps the previous version of a file around. A hard link is used
+    where possible, so the file's data doesn't need to be copied."""
+    if os.path.exists(backup):
+        os.remove(backup)
+    try:
+        os.link(filename, backup)
+    except (AttributeError, OSError):
+        shutil.copy(filename, backup)
+
+
+def iter_flame_strings(filename, chunksize=65536):
+    """Scans a flame file and yields each flame as a string. The file is read
+    in chunks, so it never needs to be loaded into memory as a whole."""
+    buf, scanned = "", 0
     with open(filename) as fd:
-        s = fd.read()
+        for chunk in iter(lambda: fd.read(chunksize), ""):
+            buf += chunk
+            # Nothing new can match until a closing tag arrives, so large
+            # flames aren't rescanned on every chunk.
+            if buf.find("</flame>", max(scanned - 7, 0)) == -1:
+                scanned = len(buf)
+                continue
+            end = 0
+            for match in Flame.re_flame.finditer(buf):
+                yield match.group()
+                end = match.end()
+            # Only keep data that could still be part of an unfinished flame.
+            start = buf.find("<flame ", end)
+            buf = buf[start:] if start != -1 else buf[end:][-6:]
+            scanned = len(buf)
+
+
+def iter_flames(filename):
+    """Parses a flame file incrementally, yielding flame objects one at a
+    time. Elements are discarded once converted, so memory usage stays flat
+    regardless of the number of flames in the file.
+
+    Only direct children of the root are flames. Nested flame elements (e.g.
+    the edit history written by flam3) belong to their parent flame."""
+    context = etree.iterparse(filename, events=("start", "end"))
+    _, root = context.next()
+    depth = 0
+    for event, element in context:
+        if event == "start":
+            depth += 1
+            continue
+        depth -= 1
+        if depth == 0 and element.tag == "flame":
+            yield Flame().from_element(element)
+            root.clear()
 
-    return Flame.from_strings(s, str)
 
-def load_flames(filename):
-    """Reads a flame file and returns a list of flame objects."""
-    with open(filename) as fd:
-        tree = etree.parse(fd)
+def load_flame_strings(filename):
+    return list(iter_flame_strings(filename))
+
+def load_flames(filename, cache=False):
+    """Reads a flame file and returns a list of flame objects.
+
+    If cache is true, a binary copy of the flames is kept next to the file
+    (see binary_cache_path), which is much faster to load than the xml. The
+    cache is rebuilt whenever the flame file is modified."""
+    if cache:
+        return _load_cached_flames(filename)
+    return list(iter_flames(filename))
+
+
+_binary_magic = "FR0STBIN"
+_binary_version = 1
+_binary_file_header = struct.Struct("<8sIdQI")
+
+def save_flames_binary(filename, *flames, **kwds):
+    """Writes flames (Flame objects or strings) to a binary flame file. The
+    stamp keyword records the (mtime, size) of the file the flames were
+    loaded from, to validate caches."""
+    stamp = kwds.pop("stamp", (0, 0))
+    if kwds:
+        raise TypeError("Unexpected keyword arguments: %s" % ", ".join(kwds))
+    dirname = os.path.dirname(os.path.abspath(filename))
+    fd, temppath = tempfile.mkstemp(suffix=".tmp", dir=dirname)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(_binary_file_header.pack(_binary_magic, _binary_version,
+                                             stamp[0], stamp[1], len(flames)))
+            for flame in flames:
+                if not isinstance(flame, Flame):
+                    flame = Flame(flame)
+                f.write(flame.to_binary())
+    except:
+        os.remove(temppath)
+        raise
+    if "win32" in sys.platform and os.path.exists(filename):
+        os.remove(filename)
+    os.rename(temppath, filename)
+
+
+def load_flames_binary(filename, stamp=None):
+    """Reads a binary flame file and returns a list of flame objects. If a
+    stamp is given and doesn't match the one stored in the file, ValueError
+    is raised."""
+    with open(filename, "rb") as fd:
+        buf = fd.read()
+    if len(buf) < _binary_file_header.size:
+        raise ValueError("%s is not a binary flame file" % filename)
+    magic, version, mtime, size, count = _binary_file_header.unpack_from(buf)
+    if magic != _binary_magic or version != _binary_version:
+        raise ValueError("%s is not a binary flame file" % filename)
+    if stamp is not None and (mtime, size) != stamp:
+        raise ValueError("%s is out of date" % filename)
+    offset = _binary_file_header.size
+    flames = []
+    for i in xrange(count):
+        flame, offset = Flame.from_binary(buf, offset)
+        flames.append(flame)
+    return flames
+
+
+def binary_cache_path(filename):
+    head, ext = os.path.splitext(filename)
+    return head + ".flamebin"
+
+
+def _load_cached_flames(filename):
+    st = os.stat(filename)
+    stamp = st.st_mtime, st.st_size
+    cachepath = binary_cache_path(filename)
+    try:
+        return load_flames_binary(cachepath, stamp)
+    except (IOError, ValueError, EOFError, struct.error):
+        pass
+    flames = list(iter_flames(filename))
+    try:
+        save_flames_binary(cachepath, *flames, stamp=stamp)
+    except (IOError, OSError):
+        # The cache is only an optimization, e.g. the dir may be read-only.
+        pass
+    return flames
+
+
+def _copy_attributes(d):
+    """Copies an attribute dict, making sure lists aren't shared."""
+    d = d.copy()
+    for k, v in d.items():
+        if type(v) is list:
+            d[k] = list(v)
+    return d
+
+
+def _plain(obj):
+    """Converts numpy scalars inside obj to python types, so it can be
+    marshalled."""
+    if isinstance(obj, dict):
+        return dict((k, _plain(v)) for k, v in obj.iteritems())
+    if isinstance(obj, (list, tuple)):
+        return type(obj)(map(_plain, obj))
+    if isinstance(obj, numpy.generic):
+        return obj.item()
+    return obj
+
+
+def _frombuffer(buf, dtype, count, offset):
+    if not count:
+        return numpy.empty(0, dtype)
+    return numpy.frombuffer(buf, dtype, count, offset)
+
+
+
+def _unescape(name):
+    """Resolves entities in an attribute value, as parsing it would."""
+    if "&" not in name:
+        return name
+    try:
+        return etree.fromstring('<n v="%s"/>' % name).get("v")
+    except SyntaxError:
+        return name
+
+
+FlameIndexEntry = collections.namedtuple("FlameIndexEntry",
+                                         "offset length name nxforms")
+
+class FlameIndex(collections.Sequence):
+    """Byte offset index of the flames contained in a file. Flames can be
+    fetched by position or by name, reading only the region of the file they
+    occupy through mmap.
+
+    The index checks the file's modification time and size on every access.
+    If the file has grown and the previously indexed data looks unchanged,
+    only the appended data is scanned. Otherwise it's rebuilt. To keep the
+    check independent of the file's size, only the head of the file and the
+    end of the indexed data are compared, which is enough to tell an append
+    from a rewrite."""
+    re_name = re.compile(r'<flame [^>]*?\bname="(.*?)"')
+    sample_size = 4096
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.entries = []
+        self._names = {}
+        self._stamp = None
+        self._sample = None
+        self.refresh()
+
+
+    def refresh(self):
+        st = os.stat(self.filename)
+        stamp = st.st_mtime, st.st_size
+        if stamp == self._stamp:
+            return
+        start = 0
+        if self._stamp and self.entries and stamp[1] > self._stamp[1]:
+            start = self.entries[-1].offset + self.entries[-1].length
+        with open(self.filename, "rb") as fd:
+            mm = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ) \
+                 if stamp[1] else ""
+            try:
+                if start and not self._is_indexed(mm):
+                    start = 0
+                if not start:
+                    self.entries = []
+                    self._names = {}
+                for match in Flame.re_flame.finditer(mm, start):
+                    s = match.group()
+                    name = self.re_name.match(s)
+                    self._add(FlameIndexEntry(match.start(), len(s),
+                                              name and _unescape(name.group(1)),
+                                              s.count("<xform ")))
+                self._sample = self._get_sample(mm)
+            finally:
+                if mm:
+                    mm.close()
+        self._stamp = stamp
+
+
+    def _end(self):
+        if not self.entries:
+            return 0
+        return self.entries[-1].offset + self.entries[-1].length
+
+
+    def _get_sample(self, mm):
+        end, n = self._end(), self.sample_size
+        return mm[:min(n, end)] + mm[max(0, end - n):end]
+
+
+    def _is_indexed(self, mm):
+        """Checks if the indexed part of the file looks unchanged."""
+        return self._get_sample(mm) == self._sample
+
+
+    def _add(self, entry):
+        self._names.setdefault(entry.name, len(self.entries))
+        self.entries.append(entry)
+
+
+    def __len__(self):
+        self.refresh()
+        return len(self.entries)
+
+
+    def __getitem__(self, key):
+        """Returns the string of the flame at the given position or with the
+        given name."""
+        self.refresh()
+        if isinstance(key, basestring):
+            if key not in self._names:
+                raise KeyError(key)
+            key = self._names[key]
+        entry = self.entries[key]
+        with open(self.filename, "rb") as fd:
+            mm = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                return mm[entry.offset:entry.offset + entry.length]
+            finally:
+                mm.close()
+
+
+    def names(self):
+        self.refresh()
+        return [entry.name for entry in self.entries]
+
 
-    return [Flame().from_element(e) for e in tree.findall('flame')]
+    def get_flame(self, key):
+        return Flame(self[key])
@@ -1,6571 +0,0 @@
-/* Generated by Cython 0.10.3 on Tue Oct 13 00:41:11 2009 */
-
-#define PY_SSIZE_T_CLEAN
-#include "Python.h"
-#include "structmember.h"
-#ifndef PY_LONG_LONG
-  #define PY_LONG_LONG LONG_LONG
-#endif
-#ifndef DL_EXPORT
-  #define DL_EXPORT(t) t
-#endif
-#if PY_VERSION_HEX < 0x02040000
-  #define METH_COEXIST 0
-#endif
-#if PY_VERSION_HEX < 0x02050000
-  typedef int Py_ssize_t;
-  #define PY_SSIZE_T_MAX INT_MAX
-  #define PY_SSIZE_T_MIN INT_MIN
-  #define PyInt_FromSsize_t(z) PyInt_FromLong(z)
-  #define PyInt_AsSsize_t(o)   PyInt_AsLong(o)
-  #define PyNumber_Index(o)    PyNumber_Int(o)
-  #define PyIndex_Check(o)     PyNumber_Check(o)
-#endif
-#if PY_VERSION_HEX < 0x02060000
-  #define Py_REFCNT(ob) (((PyObject*)(ob))->ob_refcnt)
-  #define Py_TYPE(ob)   (((PyObject*)(ob))->ob_type)
-  #define Py_SIZE(ob)   (((PyVarObject*)(ob))->ob_size)
-  #define PyVarObject_HEAD_INIT(type, size) \
-          PyObject_HEAD_INIT(type) size,
-  #define PyType_Modified(t)
-
-  typedef struct {
-       void *buf;
-       PyObject *obj;
-       Py_ssize_t len;
-       Py_ssize_t itemsize;
-       int readonly;
-       int ndim;
-       char *format;
-       Py_ssize_t *shape;
-       Py_ssize_t *strides;
-       Py_ssize_t *suboffsets;
-       void *internal;
-  } Py_buffer;
-
-  #define PyBUF_SIMPLE 0
-  #define PyBUF_WRITABLE 0x0001
-  #define PyBUF_LOCK 0x0002
-  #define PyBUF_FORMAT 0x0004
-  #define PyBUF_ND 0x0008
-  #define PyBUF_STRIDES (0x0010 | PyBUF_ND)
-  #define PyBUF_C_CONTIGUOUS (0x0020 | PyBUF_STRIDES)
-  #define PyBUF_F_CONTIGUOUS (0x0040 | PyBUF_STRIDES)
-  #define PyBUF_ANY_CONTIGUOUS (0x0080 | PyBUF_STRIDES)
-  #define PyBUF_INDIRECT (0x0100 | PyBUF_STRIDES)
-
-#endif
-#if PY_MAJOR_VERSION < 3
-  #define __Pyx_BUILTIN_MODULE_NAME "__builtin__"
-#else
-  #define __Pyx_BUILTIN_MODULE_NAME "builtins"
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define Py_TPFLAGS_CHECKTYPES 0
-  #define Py_TPFLAGS_HAVE_INDEX 0
-#endif
-#if (PY_VERSION_HEX < 0x02060000) || (PY_MAJOR_VERSION >= 3)
-  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyBaseString_Type            PyUnicode_Type
-  #define PyString_Type                PyBytes_Type
-  #define PyInt_Type                   PyLong_Type
-  #define PyInt_Check(op)              PyLong_Check(op)
-  #define PyInt_CheckExact(op)         PyLong_CheckExact(op)
-  #define PyInt_FromString             PyLong_FromString
-  #define PyInt_FromUnicode            PyLong_FromUnicode
-  #define PyInt_FromLong               PyLong_FromLong
-  #define PyInt_FromSize_t             PyLong_FromSize_t
-  #define PyInt_FromSsize_t            PyLong_FromSsize_t
-  #define PyInt_AsLong                 PyLong_AsLong
-  #define PyInt_AS_LONG                PyLong_AS_LONG
-  #define PyInt_AsSsize_t              PyLong_AsSsize_t
-  #define PyInt_AsUnsignedLongMask     PyLong_AsUnsignedLongMask
-  #define PyInt_AsUnsignedLongLongMask PyLong_AsUnsignedLongLongMask
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
-#else
-  #define __Pyx_PyNumber_Divide(x,y)         PyNumber_Divide(x,y)
-  #define PyBytes_Type                 PyString_Type
-#endif
-#if PY_MAJOR_VERSION >= 3
-  #define PyMethod_New(func, self, klass) PyInstanceMethod_New(func)
-#endif
-#if !defined(WIN32) && !defined(MS_WINDOWS)
-  #ifndef __stdcall
-    #define __stdcall
-  #endif
-  #ifndef __cdecl
-    #define __cdecl
-  #endif
-#else
-  #define _USE_MATH_DEFINES
-#endif
-#ifdef __cplusplus
-#define __PYX_EXTERN_C extern "C"
-#else
-#define __PYX_EXTERN_C extern
-#endif
-#include <math.h>
-#define __PYX_HAVE_API__lib___utils
-#include "stdlib.h"
-#include "numpy/arrayobject.h"
-
-
-#ifdef __GNUC__
-#define INLINE __inline__
-#elif _WIN32
-#define INLINE __inline
-#else
-#define INLINE 
-#endif
-
-typedef struct {PyObject **p; char *s; long n; char is_unicode; char intern; char is_identifier;} __Pyx_StringTabEntry; /*proto*/
-
-
-
-static int __pyx_skip_dispatch = 0;
-
-
-/* Type Conversion Predeclarations */
-
-#if PY_MAJOR_VERSION < 3
-#define __Pyx_PyBytes_FromString PyString_FromString
-#define __Pyx_PyBytes_AsString   PyString_AsString
-#else
-#define __Pyx_PyBytes_FromString PyBytes_FromString
-#define __Pyx_PyBytes_AsString   PyBytes_AsString
-#endif
-
-#define __Pyx_PyBool_FromLong(b) ((b) ? (Py_INCREF(Py_True), Py_True) : (Py_INCREF(Py_False), Py_False))
-static INLINE int __Pyx_PyObject_IsTrue(PyObject* x);
-static INLINE PY_LONG_LONG __pyx_PyInt_AsLongLong(PyObject* x);
-static INLINE unsigned PY_LONG_LONG __pyx_PyInt_AsUnsignedLongLong(PyObject* x);
-static INLINE Py_ssize_t __pyx_PyIndex_AsSsize_t(PyObject* b);
-
-#define __pyx_PyInt_AsLong(x) (PyInt_CheckExact(x) ? PyInt_AS_LONG(x) : PyInt_AsLong(x))
-#define __pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
-
-static INLINE unsigned char __pyx_PyInt_unsigned_char(PyObject* x);
-static INLINE unsigned short __pyx_PyInt_unsigned_short(PyObject* x);
-static INLINE char __pyx_PyInt_char(PyObject* x);
-static INLINE short __pyx_PyInt_short(PyObject* x);
-static INLINE int __pyx_PyInt_int(PyObject* x);
-static INLINE long __pyx_PyInt_long(PyObject* x);
-static INLINE signed char __pyx_PyInt_signed_char(PyObject* x);
-static INLINE signed short __pyx_PyInt_signed_short(PyObject* x);
-static INLINE signed int __pyx_PyInt_signed_int(PyObject* x);
-static INLINE signed long __pyx_PyInt_signed_long(PyObject* x);
-static INLINE long double __pyx_PyInt_long_double(PyObject* x);
-#ifdef __GNUC__
-/* Test for GCC > 2.95 */
-#if __GNUC__ > 2 ||               (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)) 
-#define likely(x)   __builtin_expect(!!(x), 1)
-#define unlikely(x) __builtin_expect(!!(x), 0)
-#else /* __GNUC__ > 2 ... */
-#define likely(x)   (x)
-#define unlikely(x) (x)
-#endif /* __GNUC__ > 2 ... */
-#else /* __GNUC__ */
-#define likely(x)   (x)
-#define unlikely(x) (x)
-#endif /* __GNUC__ */
-    
-static PyObject *__pyx_m;
-static PyObject *__pyx_b;
-static PyObject *__pyx_empty_tuple;
-static int __pyx_lineno;
-static int __pyx_clineno = 0;
-static const char * __pyx_cfilenm= __FILE__;
-static const char *__pyx_filename;
-static const char **__pyx_f;
-
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name, PyObject* kw_name); /*proto*/
-
-static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
-    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found); /*proto*/
-
-static int __Pyx_ParseOptionalKeywords(PyObject *kwds, PyObject **argnames[],     PyObject *kwds2, PyObject *values[], Py_ssize_t num_pos_args,     const char* function_name); /*proto*/
-static INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info);
-static INLINE void __Pyx_ZeroBuffer(Py_buffer* buf); /*proto*/
-static INLINE const char* __Pyx_ConsumeWhitespace(const char* ts); /*proto*/
-static void __Pyx_BufferNdimError(Py_buffer* buffer, int expected_ndim); /*proto*/
-static const char* __Pyx_DescribeTokenInFormatString(const char* ts); /*proto*/
-static const char* __Pyx_CheckTypestring_nn___pyx_t_5numpy_float32_t(const char* ts); /*proto*/
-
-static int __Pyx_GetBuffer_nn___pyx_t_5numpy_float32_t(PyObject* obj, Py_buffer* buf, int flags, int nd, int cast); /*proto*/
-
-static void __Pyx_RaiseBufferFallbackError(void); /*proto*/
-
-static INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-static INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-static void __Pyx_RaiseBufferIndexError(int axis); /*proto*/
-#define __Pyx_BufPtrStrided2d(type, buf, i0, s0, i1, s1) (type)((char*)buf + i0 * s0 + i1 * s1)
-static const char* __Pyx_CheckTypestring_nn___pyx_t_5numpy_int32_t(const char* ts); /*proto*/
-
-static int __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t(PyObject* obj, Py_buffer* buf, int flags, int nd, int cast); /*proto*/
-#define __Pyx_BufPtrStrided1d(type, buf, i0, s0) (type)((char*)buf + i0 * s0)
-
-static INLINE PyObject *__Pyx_GetItemInt(PyObject *o, Py_ssize_t i, int is_unsigned) {
-    PyObject *r;
-    if (PyList_CheckExact(o) && 0 <= i && i < PyList_GET_SIZE(o)) {
-        r = PyList_GET_ITEM(o, i);
-        Py_INCREF(r);
-    }
-    else if (PyTuple_CheckExact(o) && 0 <= i && i < PyTuple_GET_SIZE(o)) {
-        r = PyTuple_GET_ITEM(o, i);
-        Py_INCREF(r);
-    }
-    else if (Py_TYPE(o)->tp_as_sequence && Py_TYPE(o)->tp_as_sequence->sq_item && (likely(i >= 0) || !is_unsigned))
-        r = PySequence_GetItem(o, i);
-    else {
-        PyObject *j = (likely(i >= 0) || !is_unsigned) ? PyInt_FromLong(i) : PyLong_FromUnsignedLongLong((sizeof(unsigned long long) > sizeof(Py_ssize_t) ? (1ULL << (sizeof(Py_ssize_t)*8)) : 0) + i);
-        if (!j)
-            return 0;
-        r = PyObject_GetItem(o, j);
-        Py_DECREF(j);
-    }
-    return r;
-}
-
-static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact); /*proto*/
-#if PY_MAJOR_VERSION < 3
-static int __Pyx_GetBuffer(PyObject *obj, Py_buffer *view, int flags);
-static void __Pyx_ReleaseBuffer(Py_buffer *view);
-#else
-#define __Pyx_GetBuffer PyObject_GetBuffer
-#define __Pyx_ReleaseBuffer PyBuffer_Release
-#endif
-
-Py_ssize_t __Pyx_zeros[] = {0, 0};
-Py_ssize_t __Pyx_minusones[] = {-1, -1};
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list); /*proto*/
-
-static int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type); /*proto*/
-
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name); /*proto*/
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-
-static INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb); /*proto*/
-
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb); /*proto*/
-
-static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name, long size);  /*proto*/
-
-static PyObject *__Pyx_ImportModule(const char *name); /*proto*/
-
-static void __Pyx_AddTraceback(const char *funcname); /*proto*/
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t); /*proto*/
-
-/* Type declarations */
-
-typedef npy_int8 __pyx_t_5numpy_int8_t;
-
-typedef npy_int16 __pyx_t_5numpy_int16_t;
-
-typedef npy_int32 __pyx_t_5numpy_int32_t;
-
-typedef npy_int64 __pyx_t_5numpy_int64_t;
-
-typedef npy_uint8 __pyx_t_5numpy_uint8_t;
-
-typedef npy_uint16 __pyx_t_5numpy_uint16_t;
-
-typedef npy_uint32 __pyx_t_5numpy_uint32_t;
-
-typedef npy_uint64 __pyx_t_5numpy_uint64_t;
-
-typedef npy_float32 __pyx_t_5numpy_float32_t;
-
-typedef npy_float64 __pyx_t_5numpy_float64_t;
-
-typedef npy_long __pyx_t_5numpy_int_t;
-
-typedef npy_longlong __pyx_t_5numpy_long_t;
-
-typedef npy_ulong __pyx_t_5numpy_uint_t;
-
-typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
-
-typedef npy_double __pyx_t_5numpy_float_t;
-
-typedef npy_double __pyx_t_5numpy_double_t;
-
-typedef npy_longdouble __pyx_t_5numpy_longdouble_t;
-
-typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
-
-typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
-
-typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
-/* Module declarations from python_buffer */
-
-/* Module declarations from stdlib */
-
-/* Module declarations from numpy */
-
-/* Module declarations from numpy */
-
-static PyTypeObject *__pyx_ptype_5numpy_dtype = 0;
-static PyTypeObject *__pyx_ptype_5numpy_ndarray = 0;
-/* Module declarations from lib._utils */
-
-
-
-/* Implementation of lib._utils */
-static PyObject *__pyx_int_0;
-static PyObject *__pyx_int_255;
-static PyObject *__pyx_int_253;
-static PyObject *__pyx_int_1;
-static PyObject *__pyx_int_252;
-static PyObject *__pyx_int_2;
-static char __pyx_k_orig[] = "orig";
-static PyObject *__pyx_kp_orig;
-static char __pyx_k_ntries[] = "ntries";
-static PyObject *__pyx_kp_ntries;
-static char __pyx_k_trysize[] = "trysize";
-static PyObject *__pyx_kp_trysize;
-static char __pyx_k_pal[] = "pal";
-static PyObject *__pyx_kp_pal;
-static char __pyx_k_i0[] = "i0";
-static PyObject *__pyx_kp_i0;
-static char __pyx_k_23[] = "i1";
-static PyObject *__pyx_kp_23;
-static char __pyx_k_cps[] = "cps";
-static PyObject *__pyx_kp_cps;
-static char __pyx_k_times[] = "times";
-static PyObject *__pyx_kp_times;
-static char __pyx_k_ti[] = "ti";
-static PyObject *__pyx_kp_ti;
-static char __pyx_k_ci[] = "ci";
-static PyObject *__pyx_kp_ci;
-static char __pyx_k_bi[] = "bi";
-static PyObject *__pyx_kp_bi;
-static char __pyx_k_to[] = "to";
-static PyObject *__pyx_kp_to;
-static char __pyx_k_co[] = "co";
-static PyObject *__pyx_kp_co;
-static char __pyx_k_bo[] = "bo";
-static PyObject *__pyx_kp_bo;
-static char __pyx_k_curve[] = "curve";
-static PyObject *__pyx_kp_curve;
-static char __pyx_k_amp[] = "amp";
-static PyObject *__pyx_kp_amp;
-static char __pyx_k_freq[] = "freq";
-static PyObject *__pyx_kp_freq;
-static char __pyx_k_slope[] = "slope";
-static PyObject *__pyx_kp_slope;
-static char __pyx_k_mode[] = "mode";
-static PyObject *__pyx_kp_mode;
-static char __pyx_k_peak[] = "peak";
-static PyObject *__pyx_kp_peak;
-static char __pyx_k_d[] = "d";
-static PyObject *__pyx_kp_d;
-static char __pyx_k_i[] = "i";
-static PyObject *__pyx_kp_i;
-static char __pyx_k_s[] = "s";
-static PyObject *__pyx_kp_s;
-static char __pyx_k_e[] = "e";
-static PyObject *__pyx_kp_e;
-static char __pyx_k_numpy[] = "numpy";
-static PyObject *__pyx_kp_numpy;
-static char __pyx_k_np[] = "np";
-static PyObject *__pyx_kp_np;
-static char __pyx_k_random[] = "random";
-static PyObject *__pyx_kp_random;
-static char __pyx_k_rn[] = "rn";
-static PyObject *__pyx_kp_rn;
-static char __pyx_k_copy[] = "copy";
-static PyObject *__pyx_kp_copy;
-static char __pyx_k_get_length[] = "get_length";
-static PyObject *__pyx_kp_get_length;
-static char __pyx_k_pix_swap[] = "pix_swap";
-static PyObject *__pyx_kp_pix_swap;
-static char __pyx_k_randint[] = "randint";
-static PyObject *__pyx_kp_randint;
-static char __pyx_k_pix_diff[] = "pix_diff";
-static PyObject *__pyx_kp_pix_diff;
-static char __pyx_k_zeros[] = "zeros";
-static PyObject *__pyx_kp_zeros;
-static char __pyx_k_dtype[] = "dtype";
-static PyObject *__pyx_kp_dtype;
-static char __pyx_k_24[] = "float32";
-static PyObject *__pyx_kp_24;
-static char __pyx_k_cdiff[] = "cdiff";
-static PyObject *__pyx_kp_cdiff;
-static char __pyx_k_cos[] = "cos";
-static PyObject *__pyx_kp_cos;
-static char __pyx_k_pi[] = "pi";
-static PyObject *__pyx_kp_pi;
-static char __pyx_k_sinh[] = "sinh";
-static PyObject *__pyx_kp_sinh;
-static char __pyx_k_tanh[] = "tanh";
-static PyObject *__pyx_kp_tanh;
-static char __pyx_k_exp[] = "exp";
-static PyObject *__pyx_kp_exp;
-static char __pyx_k_ValueError[] = "ValueError";
-static PyObject *__pyx_kp_ValueError;
-static char __pyx_k_sin[] = "sin";
-static PyObject *__pyx_kp_sin;
-static char __pyx_k_sign[] = "sign";
-static PyObject *__pyx_kp_sign;
-static PyObject *__pyx_builtin_ValueError;
-static PyObject *__pyx_kp_25;
-static PyObject *__pyx_kp_26;
-static PyObject *__pyx_kp_27;
-static PyObject *__pyx_kp_28;
-static PyObject *__pyx_kp_29;
-static PyObject *__pyx_kp_30;
-static char __pyx_k_25[] = "Frequency much be positive non-zero";
-static char __pyx_k_26[] = "Frequency must be positive non-zero";
-static char __pyx_k_27[] = "peak need to be 0-1";
-static char __pyx_k_28[] = "peak need to be 0-1";
-static char __pyx_k_29[] = "invalid mode";
-static char __pyx_k_30[] = "invalid curve";
-static PyObject *__pyx_kp_31;
-static char __pyx_k_31[] = "invalid curve";
-static char __pyx_k___getbuffer__[] = "__getbuffer__";
-static PyObject *__pyx_kp___getbuffer__;
-static char __pyx_k___releasebuffer__[] = "__releasebuffer__";
-static PyObject *__pyx_kp___releasebuffer__;
-static char __pyx_k_info[] = "info";
-static PyObject *__pyx_kp_info;
-static char __pyx_k_flags[] = "flags";
-static PyObject *__pyx_kp_flags;
-static char __pyx_k_iteritems[] = "iteritems";
-static PyObject *__pyx_kp_iteritems;
-static char __pyx_k_next[] = "next";
-static PyObject *__pyx_kp_next;
-static char __pyx_k_StopIteration[] = "StopIteration";
-static PyObject *__pyx_kp_StopIteration;
-static char __pyx_k_pop[] = "pop";
-static PyObject *__pyx_kp_pop;
-static char __pyx_k_RuntimeError[] = "RuntimeError";
-static PyObject *__pyx_kp_RuntimeError;
-static PyObject *__pyx_kp_1;
-static PyObject *__pyx_kp_2;
-static PyObject *__pyx_kp_20;
-static PyObject *__pyx_kp_21;
-static PyObject *__pyx_kp_22;
-static PyObject *__pyx_builtin_StopIteration;
-static PyObject *__pyx_builtin_RuntimeError;
-static char __pyx_k_1[] = "ndarray is not C contiguous";
-static char __pyx_k_2[] = "ndarray is not Fortran contiguous";
-static char __pyx_k_3[] = "b";
-static char __pyx_k_4[] = "B";
-static char __pyx_k_5[] = "h";
-static char __pyx_k_6[] = "H";
-static char __pyx_k_7[] = "i";
-static char __pyx_k_8[] = "I";
-static char __pyx_k_9[] = "l";
-static char __pyx_k_10[] = "L";
-static char __pyx_k_11[] = "q";
-static char __pyx_k_12[] = "Q";
-static char __pyx_k_13[] = "f";
-static char __pyx_k_14[] = "d";
-static char __pyx_k_15[] = "g";
-static char __pyx_k_16[] = "Zf";
-static char __pyx_k_17[] = "Zd";
-static char __pyx_k_18[] = "Zg";
-static char __pyx_k_19[] = "O";
-static char __pyx_k_20[] = "unknown dtype code in numpy.pxd (%d)";
-static char __pyx_k_21[] = "Format string allocated too short.";
-static char __pyx_k_22[] = "unknown dtype code in numpy.pxd (%d)";
-
-/* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":15
- * """
- * 
- * def palette_improve(np.ndarray[ndim=2, dtype=np.float32_t] orig, int ntries,\             # <<<<<<<<<<<<<<
- *          int trysize):
- *     cdef np.ndarray[ndim=2, dtype=np.float32_t] best = orig.copy()
- */
-
-static PyObject *__pyx_pf_3lib_6_utils_palette_improve(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_3lib_6_utils_palette_improve(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyArrayObject *__pyx_v_orig = 0;
-  int __pyx_v_ntries;
-  int __pyx_v_trysize;
-  PyArrayObject *__pyx_v_best = 0;
-  PyArrayObject *__pyx_v_pal;
-  int __pyx_v_best_len;
-  int __pyx_v_j;
-  int __pyx_v_i;
-  int __pyx_v_i0;
-  int __pyx_v_i1;
-  int __pyx_v_as_is;
-  int __pyx_v_swapd;
-  int __pyx_v_pal_len;
-  Py_buffer __pyx_bstruct_orig;
-  Py_ssize_t __pyx_bstride_0_orig = 0;
-  Py_ssize_t __pyx_bstride_1_orig = 0;
-  Py_ssize_t __pyx_bshape_0_orig = 0;
-  Py_ssize_t __pyx_bshape_1_orig = 0;
-  Py_buffer __pyx_bstruct_pal;
-  Py_ssize_t __pyx_bstride_0_pal = 0;
-  Py_ssize_t __pyx_bstride_1_pal = 0;
-  Py_ssize_t __pyx_bshape_0_pal = 0;
-  Py_ssize_t __pyx_bshape_1_pal = 0;
-  Py_buffer __pyx_bstruct_best;
-  Py_ssize_t __pyx_bstride_0_best = 0;
-  Py_ssize_t __pyx_bstride_1_best = 0;
-  Py_ssize_t __pyx_bshape_0_best = 0;
-  Py_ssize_t __pyx_bshape_1_best = 0;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  int __pyx_4;
-  PyObject *__pyx_5 = 0;
-  PyObject *__pyx_6 = 0;
-  int __pyx_7;
-  PyArrayObject *__pyx_t_1 = NULL;
-  PyArrayObject *__pyx_t_2 = NULL;
-  int __pyx_t_3;
-  PyObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_orig,&__pyx_kp_ntries,&__pyx_kp_trysize,0};
-  __pyx_self = __pyx_self;
-  if (unlikely(__pyx_kwds)) {
-    PyObject* values[3] = {0,0,0};
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_orig);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_kp_ntries);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("palette_improve", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-      case  2:
-      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_kp_trysize);
-      if (likely(values[2])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("palette_improve", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "palette_improve") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_orig = ((PyArrayObject *)values[0]);
-    __pyx_v_ntries = __pyx_PyInt_int(values[1]); if (unlikely((__pyx_v_ntries == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_trysize = __pyx_PyInt_int(values[2]); if (unlikely((__pyx_v_trysize == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 16; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_orig = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-    __pyx_v_ntries = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_ntries == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_trysize = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_trysize == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 16; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("palette_improve", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("lib._utils.palette_improve");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_v_pal = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  __pyx_bstruct_best.buf = NULL;
-  __pyx_bstruct_pal.buf = NULL;
-  __pyx_bstruct_orig.buf = NULL;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_orig), __pyx_ptype_5numpy_ndarray, 1, "orig", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_float32_t((PyObject*)__pyx_v_orig, &__pyx_bstruct_orig, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 15; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_bstride_0_orig = __pyx_bstruct_orig.strides[0]; __pyx_bstride_1_orig = __pyx_bstruct_orig.strides[1];
-  __pyx_bshape_0_orig = __pyx_bstruct_orig.shape[0]; __pyx_bshape_1_orig = __pyx_bstruct_orig.shape[1];
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":17
- * def palette_improve(np.ndarray[ndim=2, dtype=np.float32_t] orig, int ntries,\
- *          int trysize):
- *     cdef np.ndarray[ndim=2, dtype=np.float32_t] best = orig.copy()             # <<<<<<<<<<<<<<
- *     cdef np.ndarray[ndim=2, dtype=np.float32_t] pal
- *     cdef int best_len = get_length(best)
- */
-  __pyx_1 = PyObject_GetAttr(((PyObject *)__pyx_v_orig), __pyx_kp_copy); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_2 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  if (!(__Pyx_TypeTest(__pyx_2, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_1 = ((PyArrayObject *)__pyx_2);
-  if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_float32_t((PyObject*)__pyx_t_1, &__pyx_bstruct_best, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {
-    __pyx_v_best = ((PyArrayObject *)Py_None); Py_INCREF(Py_None); __pyx_bstruct_best.buf = NULL;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 17; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  } else {__pyx_bstride_0_best = __pyx_bstruct_best.strides[0]; __pyx_bstride_1_best = __pyx_bstruct_best.strides[1];
-    __pyx_bshape_0_best = __pyx_bstruct_best.shape[0]; __pyx_bshape_1_best = __pyx_bstruct_best.shape[1];
-  }
-  __pyx_t_1 = 0;
-  __pyx_v_best = ((PyArrayObject *)__pyx_2);
-  __pyx_2 = 0;
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":19
- *     cdef np.ndarray[ndim=2, dtype=np.float32_t] best = orig.copy()
- *     cdef np.ndarray[ndim=2, dtype=np.float32_t] pal
- *     cdef int best_len = get_length(best)             # <<<<<<<<<<<<<<
- *     cdef int j, i, i0, i1, as_is, swapd, pal_len
- *     for i in range(ntries):
- */
-  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_get_length); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 19; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 19; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_INCREF(((PyObject *)__pyx_v_best));
-  PyTuple_SET_ITEM(__pyx_2, 0, ((PyObject *)__pyx_v_best));
-  __pyx_3 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 19; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-  __pyx_4 = __pyx_PyInt_int(__pyx_3); if (unlikely((__pyx_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 19; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_3); __pyx_3 = 0;
-  __pyx_v_best_len = __pyx_4;
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":21
- *     cdef int best_len = get_length(best)
- *     cdef int j, i, i0, i1, as_is, swapd, pal_len
- *     for i in range(ntries):             # <<<<<<<<<<<<<<
- *         pal = best.copy()
- *         for j in range(256):
- */
-  for (__pyx_v_i = 0; __pyx_v_i < __pyx_v_ntries; __pyx_v_i+=1) {
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":22
- *     cdef int j, i, i0, i1, as_is, swapd, pal_len
- *     for i in range(ntries):
- *         pal = best.copy()             # <<<<<<<<<<<<<<
- *         for j in range(256):
- *             pix_swap(pal, j, rn.randint(0, 255))
- */
-    __pyx_1 = PyObject_GetAttr(((PyObject *)__pyx_v_best), __pyx_kp_copy); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 22; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_2 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 22; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_1); __pyx_1 = 0;
-    if (!(__Pyx_TypeTest(__pyx_2, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 22; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_2 = ((PyArrayObject *)__pyx_2);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_pal);
-    __pyx_t_3 = __Pyx_GetBuffer_nn___pyx_t_5numpy_float32_t((PyObject*)__pyx_t_2, &__pyx_bstruct_pal, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0);
-    if (unlikely(__pyx_t_3 < 0)) 
-    {
-        PyErr_Fetch(&__pyx_t_4, &__pyx_t_5, &__pyx_t_6);
-        if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_float32_t((PyObject*)__pyx_v_pal, &__pyx_bstruct_pal, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {
-            Py_XDECREF(__pyx_t_4); Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_6);
-            __Pyx_RaiseBufferFallbackError();
-          } else {
-            PyErr_Restore(__pyx_t_4, __pyx_t_5, __pyx_t_6);
-        }
-    }
-    __pyx_bstride_0_pal = __pyx_bstruct_pal.strides[0]; __pyx_bstride_1_pal = __pyx_bstruct_pal.strides[1];
-    __pyx_bshape_0_pal = __pyx_bstruct_pal.shape[0]; __pyx_bshape_1_pal = __pyx_bstruct_pal.shape[1];
-    if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 22; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_2 = 0;
-    Py_DECREF(((PyObject *)__pyx_v_pal));
-    __pyx_v_pal = ((PyArrayObject *)__pyx_2);
-    __pyx_2 = 0;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":23
- *     for i in range(ntries):
- *         pal = best.copy()
- *         for j in range(256):             # <<<<<<<<<<<<<<
- *             pix_swap(pal, j, rn.randint(0, 255))
- *         pal_len = get_length(pal)
- */
-    for (__pyx_v_j = 0; __pyx_v_j < 256; __pyx_v_j+=1) {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":24
- *         pal = best.copy()
- *         for j in range(256):
- *             pix_swap(pal, j, rn.randint(0, 255))             # <<<<<<<<<<<<<<
- *         pal_len = get_length(pal)
- *         for j in range(trysize):
- */
-      __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_swap); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_1 = PyInt_FromLong(__pyx_v_j); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_rn); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_5 = PyObject_GetAttr(__pyx_2, __pyx_kp_randint); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      __pyx_2 = PyTuple_New(2); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_INCREF(__pyx_int_0);
-      PyTuple_SET_ITEM(__pyx_2, 0, __pyx_int_0);
-      Py_INCREF(__pyx_int_255);
-      PyTuple_SET_ITEM(__pyx_2, 1, __pyx_int_255);
-      __pyx_6 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_5); __pyx_5 = 0;
-      Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-      __pyx_5 = PyTuple_New(3); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_INCREF(((PyObject *)__pyx_v_pal));
-      PyTuple_SET_ITEM(__pyx_5, 0, ((PyObject *)__pyx_v_pal));
-      PyTuple_SET_ITEM(__pyx_5, 1, __pyx_1);
-      PyTuple_SET_ITEM(__pyx_5, 2, __pyx_6);
-      __pyx_1 = 0;
-      __pyx_6 = 0;
-      __pyx_2 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 24; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-      Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-    }
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":25
- *         for j in range(256):
- *             pix_swap(pal, j, rn.randint(0, 255))
- *         pal_len = get_length(pal)             # <<<<<<<<<<<<<<
- *         for j in range(trysize):
- *             i0 = (1 + rn.randint(0,253))
- */
-    __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_get_length); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 25; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_6 = PyTuple_New(1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 25; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_INCREF(((PyObject *)__pyx_v_pal));
-    PyTuple_SET_ITEM(__pyx_6, 0, ((PyObject *)__pyx_v_pal));
-    __pyx_3 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_6), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 25; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_1); __pyx_1 = 0;
-    Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
-    __pyx_4 = __pyx_PyInt_int(__pyx_3); if (unlikely((__pyx_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 25; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    __pyx_v_pal_len = __pyx_4;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":26
- *             pix_swap(pal, j, rn.randint(0, 255))
- *         pal_len = get_length(pal)
- *         for j in range(trysize):             # <<<<<<<<<<<<<<
- *             i0 = (1 + rn.randint(0,253))
- *             i1 = (1 + rn.randint(0,253))
- */
-    for (__pyx_v_j = 0; __pyx_v_j < __pyx_v_trysize; __pyx_v_j+=1) {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":27
- *         pal_len = get_length(pal)
- *         for j in range(trysize):
- *             i0 = (1 + rn.randint(0,253))             # <<<<<<<<<<<<<<
- *             i1 = (1 + rn.randint(0,253))
- *             if i0-i1==1:
- */
-      __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_rn); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_2 = PyObject_GetAttr(__pyx_5, __pyx_kp_randint); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_5); __pyx_5 = 0;
-      __pyx_1 = PyTuple_New(2); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_INCREF(__pyx_int_0);
-      PyTuple_SET_ITEM(__pyx_1, 0, __pyx_int_0);
-      Py_INCREF(__pyx_int_253);
-      PyTuple_SET_ITEM(__pyx_1, 1, __pyx_int_253);
-      __pyx_6 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-      __pyx_t_6 = PyNumber_Add(__pyx_int_1, __pyx_6); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_6); __pyx_6 = 0;
-      __pyx_4 = __pyx_PyInt_int(__pyx_t_6); if (unlikely((__pyx_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 27; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_v_i0 = __pyx_4;
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":28
- *         for j in range(trysize):
- *             i0 = (1 + rn.randint(0,253))
- *             i1 = (1 + rn.randint(0,253))             # <<<<<<<<<<<<<<
- *             if i0-i1==1:
- *                 as_is = (pix_diff(pal, i1-1, i1) +
- */
-      __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_rn); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_5 = PyObject_GetAttr(__pyx_3, __pyx_kp_randint); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-      __pyx_2 = PyTuple_New(2); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_INCREF(__pyx_int_0);
-      PyTuple_SET_ITEM(__pyx_2, 0, __pyx_int_0);
-      Py_INCREF(__pyx_int_253);
-      PyTuple_SET_ITEM(__pyx_2, 1, __pyx_int_253);
-      __pyx_1 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_5); __pyx_5 = 0;
-      Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-      __pyx_t_6 = PyNumber_Add(__pyx_int_1, __pyx_1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_1); __pyx_1 = 0;
-      __pyx_4 = __pyx_PyInt_int(__pyx_t_6); if (unlikely((__pyx_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 28; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-      __pyx_v_i1 = __pyx_4;
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":29
- *             i0 = (1 + rn.randint(0,253))
- *             i1 = (1 + rn.randint(0,253))
- *             if i0-i1==1:             # <<<<<<<<<<<<<<
- *                 as_is = (pix_diff(pal, i1-1, i1) +
- *                         pix_diff(pal, i0, i0+1))
- */
-      __pyx_7 = ((__pyx_v_i0 - __pyx_v_i1) == 1);
-      if (__pyx_7) {
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":30
- *             i1 = (1 + rn.randint(0,253))
- *             if i0-i1==1:
- *                 as_is = (pix_diff(pal, i1-1, i1) +             # <<<<<<<<<<<<<<
- *                         pix_diff(pal, i0, i0+1))
- *                 swapd = (pix_diff(pal, i1-1, i0) +
- */
-        __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_3 = PyInt_FromLong((__pyx_v_i1 - 1)); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_5 = PyInt_FromLong(__pyx_v_i1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_2 = PyTuple_New(3); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_2, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_2, 1, __pyx_3);
-        PyTuple_SET_ITEM(__pyx_2, 2, __pyx_5);
-        __pyx_3 = 0;
-        __pyx_5 = 0;
-        __pyx_1 = PyObject_Call(__pyx_6, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_6); __pyx_6 = 0;
-        Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":31
- *             if i0-i1==1:
- *                 as_is = (pix_diff(pal, i1-1, i1) +
- *                         pix_diff(pal, i0, i0+1))             # <<<<<<<<<<<<<<
- *                 swapd = (pix_diff(pal, i1-1, i0) +
- *                         pix_diff(pal, i0, i1+1))
- */
-        __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 31; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_5 = PyInt_FromLong(__pyx_v_i0); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 31; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_6 = PyInt_FromLong((__pyx_v_i0 + 1)); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 31; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_2 = PyTuple_New(3); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 31; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_2, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_2, 1, __pyx_5);
-        PyTuple_SET_ITEM(__pyx_2, 2, __pyx_6);
-        __pyx_5 = 0;
-        __pyx_6 = 0;
-        __pyx_5 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 31; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_3); __pyx_3 = 0;
-        Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-        __pyx_t_6 = PyNumber_Add(__pyx_1, __pyx_5); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_1); __pyx_1 = 0;
-        Py_DECREF(__pyx_5); __pyx_5 = 0;
-        __pyx_4 = __pyx_PyInt_int(__pyx_t_6); if (unlikely((__pyx_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_v_as_is = __pyx_4;
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":32
- *                 as_is = (pix_diff(pal, i1-1, i1) +
- *                         pix_diff(pal, i0, i0+1))
- *                 swapd = (pix_diff(pal, i1-1, i0) +             # <<<<<<<<<<<<<<
- *                         pix_diff(pal, i0, i1+1))
- *             elif i1-i0==1:
- */
-        __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_3 = PyInt_FromLong((__pyx_v_i1 - 1)); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_2 = PyInt_FromLong(__pyx_v_i0); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_1 = PyTuple_New(3); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_1, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_1, 1, __pyx_3);
-        PyTuple_SET_ITEM(__pyx_1, 2, __pyx_2);
-        __pyx_3 = 0;
-        __pyx_2 = 0;
-        __pyx_5 = PyObject_Call(__pyx_6, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_6); __pyx_6 = 0;
-        Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":33
- *                         pix_diff(pal, i0, i0+1))
- *                 swapd = (pix_diff(pal, i1-1, i0) +
- *                         pix_diff(pal, i0, i1+1))             # <<<<<<<<<<<<<<
- *             elif i1-i0==1:
- *                 as_is = (pix_diff(pal, i0-1, i0) +
- */
-        __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_2 = PyInt_FromLong(__pyx_v_i0); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_6 = PyInt_FromLong((__pyx_v_i1 + 1)); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_1 = PyTuple_New(3); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_1, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_1, 1, __pyx_2);
-        PyTuple_SET_ITEM(__pyx_1, 2, __pyx_6);
-        __pyx_2 = 0;
-        __pyx_6 = 0;
-        __pyx_2 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 33; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_3); __pyx_3 = 0;
-        Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-        __pyx_t_6 = PyNumber_Add(__pyx_5, __pyx_2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_5); __pyx_5 = 0;
-        Py_DECREF(__pyx_2); __pyx_2 = 0;
-        __pyx_4 = __pyx_PyInt_int(__pyx_t_6); if (unlikely((__pyx_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 32; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_v_swapd = __pyx_4;
-        goto __pyx_L12;
-      }
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":34
- *                 swapd = (pix_diff(pal, i1-1, i0) +
- *                         pix_diff(pal, i0, i1+1))
- *             elif i1-i0==1:             # <<<<<<<<<<<<<<
- *                 as_is = (pix_diff(pal, i0-1, i0) +
- *                       pix_diff(pal, i1, i1+1))
- */
-      __pyx_7 = ((__pyx_v_i1 - __pyx_v_i0) == 1);
-      if (__pyx_7) {
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":35
- *                         pix_diff(pal, i0, i1+1))
- *             elif i1-i0==1:
- *                 as_is = (pix_diff(pal, i0-1, i0) +             # <<<<<<<<<<<<<<
- *                       pix_diff(pal, i1, i1+1))
- *                 swapd = (pix_diff(pal, i0-1, i1) +
- */
-        __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 35; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_3 = PyInt_FromLong((__pyx_v_i0 - 1)); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 35; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_1 = PyInt_FromLong(__pyx_v_i0); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 35; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_5 = PyTuple_New(3); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 35; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_5, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_5, 1, __pyx_3);
-        PyTuple_SET_ITEM(__pyx_5, 2, __pyx_1);
-        __pyx_3 = 0;
-        __pyx_1 = 0;
-        __pyx_2 = PyObject_Call(__pyx_6, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 35; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_6); __pyx_6 = 0;
-        Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":36
- *             elif i1-i0==1:
- *                 as_is = (pix_diff(pal, i0-1, i0) +
- *                       pix_diff(pal, i1, i1+1))             # <<<<<<<<<<<<<<
- *                 swapd = (pix_diff(pal, i0-1, i1) +
- *                         pix_diff(pal, i1, i0+1))
- */
-        __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_1 = PyInt_FromLong(__pyx_v_i1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_6 = PyInt_FromLong((__pyx_v_i1 + 1)); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_5 = PyTuple_New(3); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_5, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_5, 1, __pyx_1);
-        PyTuple_SET_ITEM(__pyx_5, 2, __pyx_6);
-        __pyx_1 = 0;
-        __pyx_6 = 0;
-        __pyx_1 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_3); __pyx_3 = 0;
-        Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-        __pyx_t_6 = PyNumber_Add(__pyx_2, __pyx_1); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 35; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_2); __pyx_2 = 0;
-        Py_DECREF(__pyx_1); __pyx_1 = 0;
-        __pyx_4 = __pyx_PyInt_int(__pyx_t_6); if (unlikely((__pyx_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 35; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_v_as_is = __pyx_4;
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":37
- *                 as_is = (pix_diff(pal, i0-1, i0) +
- *                       pix_diff(pal, i1, i1+1))
- *                 swapd = (pix_diff(pal, i0-1, i1) +             # <<<<<<<<<<<<<<
- *                         pix_diff(pal, i1, i0+1))
- *             else:
- */
-        __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_3 = PyInt_FromLong((__pyx_v_i0 - 1)); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_5 = PyInt_FromLong(__pyx_v_i1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_2 = PyTuple_New(3); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_2, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_2, 1, __pyx_3);
-        PyTuple_SET_ITEM(__pyx_2, 2, __pyx_5);
-        __pyx_3 = 0;
-        __pyx_5 = 0;
-        __pyx_1 = PyObject_Call(__pyx_6, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_6); __pyx_6 = 0;
-        Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":38
- *                       pix_diff(pal, i1, i1+1))
- *                 swapd = (pix_diff(pal, i0-1, i1) +
- *                         pix_diff(pal, i1, i0+1))             # <<<<<<<<<<<<<<
- *             else:
- *                 as_is = (pix_diff(pal, i0, i0+1) +
- */
-        __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_5 = PyInt_FromLong(__pyx_v_i1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_6 = PyInt_FromLong((__pyx_v_i0 + 1)); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_2 = PyTuple_New(3); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_2, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_2, 1, __pyx_5);
-        PyTuple_SET_ITEM(__pyx_2, 2, __pyx_6);
-        __pyx_5 = 0;
-        __pyx_6 = 0;
-        __pyx_5 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 38; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_3); __pyx_3 = 0;
-        Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-        __pyx_t_6 = PyNumber_Add(__pyx_1, __pyx_5); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_1); __pyx_1 = 0;
-        Py_DECREF(__pyx_5); __pyx_5 = 0;
-        __pyx_4 = __pyx_PyInt_int(__pyx_t_6); if (unlikely((__pyx_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 37; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_v_swapd = __pyx_4;
-        goto __pyx_L12;
-      }
-      /*else*/ {
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":40
- *                         pix_diff(pal, i1, i0+1))
- *             else:
- *                 as_is = (pix_diff(pal, i0, i0+1) +             # <<<<<<<<<<<<<<
- *                         pix_diff(pal, i0, i0-1) +
- *                         pix_diff(pal, i1, i1+1) +
- */
-        __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_3 = PyInt_FromLong(__pyx_v_i0); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_2 = PyInt_FromLong((__pyx_v_i0 + 1)); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_1 = PyTuple_New(3); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_1, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_1, 1, __pyx_3);
-        PyTuple_SET_ITEM(__pyx_1, 2, __pyx_2);
-        __pyx_3 = 0;
-        __pyx_2 = 0;
-        __pyx_5 = PyObject_Call(__pyx_6, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_6); __pyx_6 = 0;
-        Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":41
- *             else:
- *                 as_is = (pix_diff(pal, i0, i0+1) +
- *                         pix_diff(pal, i0, i0-1) +             # <<<<<<<<<<<<<<
- *                         pix_diff(pal, i1, i1+1) +
- *                         pix_diff(pal, i1, i1-1))
- */
-        __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_2 = PyInt_FromLong(__pyx_v_i0); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_6 = PyInt_FromLong((__pyx_v_i0 - 1)); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_1 = PyTuple_New(3); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_1, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_1, 1, __pyx_2);
-        PyTuple_SET_ITEM(__pyx_1, 2, __pyx_6);
-        __pyx_2 = 0;
-        __pyx_6 = 0;
-        __pyx_2 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_3); __pyx_3 = 0;
-        Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-        __pyx_t_6 = PyNumber_Add(__pyx_5, __pyx_2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 40; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_5); __pyx_5 = 0;
-        Py_DECREF(__pyx_2); __pyx_2 = 0;
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":42
- *                 as_is = (pix_diff(pal, i0, i0+1) +
- *                         pix_diff(pal, i0, i0-1) +
- *                         pix_diff(pal, i1, i1+1) +             # <<<<<<<<<<<<<<
- *                         pix_diff(pal, i1, i1-1))
- *                 swapd = (pix_diff(pal, i1, i0+1) +
- */
-        __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_3 = PyInt_FromLong(__pyx_v_i1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_1 = PyInt_FromLong((__pyx_v_i1 + 1)); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_5 = PyTuple_New(3); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_5, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_5, 1, __pyx_3);
-        PyTuple_SET_ITEM(__pyx_5, 2, __pyx_1);
-        __pyx_3 = 0;
-        __pyx_1 = 0;
-        __pyx_2 = PyObject_Call(__pyx_6, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_6); __pyx_6 = 0;
-        Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-        __pyx_t_5 = PyNumber_Add(__pyx_t_6, __pyx_2); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 41; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        Py_DECREF(__pyx_2); __pyx_2 = 0;
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":43
- *                         pix_diff(pal, i0, i0-1) +
- *                         pix_diff(pal, i1, i1+1) +
- *                         pix_diff(pal, i1, i1-1))             # <<<<<<<<<<<<<<
- *                 swapd = (pix_diff(pal, i1, i0+1) +
- *                         pix_diff(pal, i1, i0-1) +
- */
-        __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_1 = PyInt_FromLong(__pyx_v_i1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_6 = PyInt_FromLong((__pyx_v_i1 - 1)); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_5 = PyTuple_New(3); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_5, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_5, 1, __pyx_1);
-        PyTuple_SET_ITEM(__pyx_5, 2, __pyx_6);
-        __pyx_1 = 0;
-        __pyx_6 = 0;
-        __pyx_2 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 43; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_3); __pyx_3 = 0;
-        Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-        __pyx_t_6 = PyNumber_Add(__pyx_t_5, __pyx_2); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        Py_DECREF(__pyx_2); __pyx_2 = 0;
-        __pyx_4 = __pyx_PyInt_int(__pyx_t_6); if (unlikely((__pyx_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 42; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_v_as_is = __pyx_4;
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":44
- *                         pix_diff(pal, i1, i1+1) +
- *                         pix_diff(pal, i1, i1-1))
- *                 swapd = (pix_diff(pal, i1, i0+1) +             # <<<<<<<<<<<<<<
- *                         pix_diff(pal, i1, i0-1) +
- *                         pix_diff(pal, i0, i1+1) +
- */
-        __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_6 = PyInt_FromLong(__pyx_v_i1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_3 = PyInt_FromLong((__pyx_v_i0 + 1)); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_5 = PyTuple_New(3); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_5, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_5, 1, __pyx_6);
-        PyTuple_SET_ITEM(__pyx_5, 2, __pyx_3);
-        __pyx_6 = 0;
-        __pyx_3 = 0;
-        __pyx_2 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_1); __pyx_1 = 0;
-        Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":45
- *                         pix_diff(pal, i1, i1-1))
- *                 swapd = (pix_diff(pal, i1, i0+1) +
- *                         pix_diff(pal, i1, i0-1) +             # <<<<<<<<<<<<<<
- *                         pix_diff(pal, i0, i1+1) +
- *                         pix_diff(pal, i0, i1-1))
- */
-        __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_3 = PyInt_FromLong(__pyx_v_i1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_1 = PyInt_FromLong((__pyx_v_i0 - 1)); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_5 = PyTuple_New(3); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_5, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_5, 1, __pyx_3);
-        PyTuple_SET_ITEM(__pyx_5, 2, __pyx_1);
-        __pyx_3 = 0;
-        __pyx_1 = 0;
-        __pyx_3 = PyObject_Call(__pyx_6, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_6); __pyx_6 = 0;
-        Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-        __pyx_t_6 = PyNumber_Add(__pyx_2, __pyx_3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 44; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_2); __pyx_2 = 0;
-        Py_DECREF(__pyx_3); __pyx_3 = 0;
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":46
- *                 swapd = (pix_diff(pal, i1, i0+1) +
- *                         pix_diff(pal, i1, i0-1) +
- *                         pix_diff(pal, i0, i1+1) +             # <<<<<<<<<<<<<<
- *                         pix_diff(pal, i0, i1-1))
- *             if swapd < as_is:
- */
-        __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_6 = PyInt_FromLong(__pyx_v_i0); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_5 = PyInt_FromLong((__pyx_v_i1 + 1)); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_2 = PyTuple_New(3); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_2, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_2, 1, __pyx_6);
-        PyTuple_SET_ITEM(__pyx_2, 2, __pyx_5);
-        __pyx_6 = 0;
-        __pyx_5 = 0;
-        __pyx_3 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_1); __pyx_1 = 0;
-        Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-        __pyx_t_5 = PyNumber_Add(__pyx_t_6, __pyx_3); if (unlikely(!__pyx_t_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 45; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        Py_DECREF(__pyx_3); __pyx_3 = 0;
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":47
- *                         pix_diff(pal, i1, i0-1) +
- *                         pix_diff(pal, i0, i1+1) +
- *                         pix_diff(pal, i0, i1-1))             # <<<<<<<<<<<<<<
- *             if swapd < as_is:
- *                 pix_swap(pal, i0, i1)
- */
-        __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_5 = PyInt_FromLong(__pyx_v_i0); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_1 = PyInt_FromLong((__pyx_v_i1 - 1)); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_2 = PyTuple_New(3); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_2, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_2, 1, __pyx_5);
-        PyTuple_SET_ITEM(__pyx_2, 2, __pyx_1);
-        __pyx_5 = 0;
-        __pyx_1 = 0;
-        __pyx_3 = PyObject_Call(__pyx_6, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 47; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_6); __pyx_6 = 0;
-        Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-        __pyx_t_6 = PyNumber_Add(__pyx_t_5, __pyx_3); if (unlikely(!__pyx_t_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-        Py_DECREF(__pyx_3); __pyx_3 = 0;
-        __pyx_4 = __pyx_PyInt_int(__pyx_t_6); if (unlikely((__pyx_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 46; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        __pyx_v_swapd = __pyx_4;
-      }
-      __pyx_L12:;
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":48
- *                         pix_diff(pal, i0, i1+1) +
- *                         pix_diff(pal, i0, i1-1))
- *             if swapd < as_is:             # <<<<<<<<<<<<<<
- *                 pix_swap(pal, i0, i1)
- *                 pal_len += (swapd - as_is)
- */
-      __pyx_7 = (__pyx_v_swapd < __pyx_v_as_is);
-      if (__pyx_7) {
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":49
- *                         pix_diff(pal, i0, i1-1))
- *             if swapd < as_is:
- *                 pix_swap(pal, i0, i1)             # <<<<<<<<<<<<<<
- *                 pal_len += (swapd - as_is)
- *                 #end trysize loop
- */
-        __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_swap); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_1 = PyInt_FromLong(__pyx_v_i0); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_6 = PyInt_FromLong(__pyx_v_i1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_2 = PyTuple_New(3); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_INCREF(((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_2, 0, ((PyObject *)__pyx_v_pal));
-        PyTuple_SET_ITEM(__pyx_2, 1, __pyx_1);
-        PyTuple_SET_ITEM(__pyx_2, 2, __pyx_6);
-        __pyx_1 = 0;
-        __pyx_6 = 0;
-        __pyx_3 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 49; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_5); __pyx_5 = 0;
-        Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-        Py_DECREF(__pyx_3); __pyx_3 = 0;
-
-        /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":50
- *             if swapd < as_is:
- *                 pix_swap(pal, i0, i1)
- *                 pal_len += (swapd - as_is)             # <<<<<<<<<<<<<<
- *                 #end trysize loop
- *         if pal_len < best_len:
- */
-        __pyx_v_pal_len += (__pyx_v_swapd - __pyx_v_as_is);
-        goto __pyx_L13;
-      }
-      __pyx_L13:;
-    }
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":52
- *                 pal_len += (swapd - as_is)
- *                 #end trysize loop
- *         if pal_len < best_len:             # <<<<<<<<<<<<<<
- *             best = pal.copy()
- *             best_len = pal_len
- */
-    __pyx_7 = (__pyx_v_pal_len < __pyx_v_best_len);
-    if (__pyx_7) {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":53
- *                 #end trysize loop
- *         if pal_len < best_len:
- *             best = pal.copy()             # <<<<<<<<<<<<<<
- *             best_len = pal_len
- *         #end ntries loop
- */
-      __pyx_1 = PyObject_GetAttr(((PyObject *)__pyx_v_pal), __pyx_kp_copy); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_6 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_1); __pyx_1 = 0;
-      if (!(__Pyx_TypeTest(__pyx_6, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_1 = ((PyArrayObject *)__pyx_6);
-      __Pyx_SafeReleaseBuffer(&__pyx_bstruct_best);
-      __pyx_t_3 = __Pyx_GetBuffer_nn___pyx_t_5numpy_float32_t((PyObject*)__pyx_t_1, &__pyx_bstruct_best, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0);
-      if (unlikely(__pyx_t_3 < 0)) 
-      {
-          PyErr_Fetch(&__pyx_t_6, &__pyx_t_5, &__pyx_t_4);
-          if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_float32_t((PyObject*)__pyx_v_best, &__pyx_bstruct_best, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {
-              Py_XDECREF(__pyx_t_6); Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_4);
-              __Pyx_RaiseBufferFallbackError();
-            } else {
-              PyErr_Restore(__pyx_t_6, __pyx_t_5, __pyx_t_4);
-          }
-      }
-      __pyx_bstride_0_best = __pyx_bstruct_best.strides[0]; __pyx_bstride_1_best = __pyx_bstruct_best.strides[1];
-      __pyx_bshape_0_best = __pyx_bstruct_best.shape[0]; __pyx_bshape_1_best = __pyx_bstruct_best.shape[1];
-      if (unlikely(__pyx_t_3 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 53; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_1 = 0;
-      Py_DECREF(((PyObject *)__pyx_v_best));
-      __pyx_v_best = ((PyArrayObject *)__pyx_6);
-      __pyx_6 = 0;
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":54
- *         if pal_len < best_len:
- *             best = pal.copy()
- *             best_len = pal_len             # <<<<<<<<<<<<<<
- *         #end ntries loop
- *     for i in xrange(256):
- */
-      __pyx_v_best_len = __pyx_v_pal_len;
-      goto __pyx_L14;
-    }
-    __pyx_L14:;
-  }
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":56
- *             best_len = pal_len
- *         #end ntries loop
- *     for i in xrange(256):             # <<<<<<<<<<<<<<
- *         i0 = (1 + rn.randint(0, 252))
- *         i1 = i0 + 1
- */
-  for (__pyx_v_i = 0; __pyx_v_i < 256; __pyx_v_i+=1) {
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":57
- *         #end ntries loop
- *     for i in xrange(256):
- *         i0 = (1 + rn.randint(0, 252))             # <<<<<<<<<<<<<<
- *         i1 = i0 + 1
- *         as_is = (pix_diff(best, i0-1, i0) +
- */
-    __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_rn); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_2 = PyObject_GetAttr(__pyx_5, __pyx_kp_randint); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    __pyx_3 = PyTuple_New(2); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_INCREF(__pyx_int_0);
-    PyTuple_SET_ITEM(__pyx_3, 0, __pyx_int_0);
-    Py_INCREF(__pyx_int_252);
-    PyTuple_SET_ITEM(__pyx_3, 1, __pyx_int_252);
-    __pyx_1 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-    __pyx_t_4 = PyNumber_Add(__pyx_int_1, __pyx_1); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_1); __pyx_1 = 0;
-    __pyx_4 = __pyx_PyInt_int(__pyx_t_4); if (unlikely((__pyx_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 57; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_v_i0 = __pyx_4;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":58
- *     for i in xrange(256):
- *         i0 = (1 + rn.randint(0, 252))
- *         i1 = i0 + 1             # <<<<<<<<<<<<<<
- *         as_is = (pix_diff(best, i0-1, i0) +
- *             pix_diff(best, i1, i1+1))
- */
-    __pyx_v_i1 = (__pyx_v_i0 + 1);
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":59
- *         i0 = (1 + rn.randint(0, 252))
- *         i1 = i0 + 1
- *         as_is = (pix_diff(best, i0-1, i0) +             # <<<<<<<<<<<<<<
- *             pix_diff(best, i1, i1+1))
- *         swapd = (pix_diff(best, i0-1, i1) +
- */
-    __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_5 = PyInt_FromLong((__pyx_v_i0 - 1)); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_2 = PyInt_FromLong(__pyx_v_i0); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyTuple_New(3); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_INCREF(((PyObject *)__pyx_v_best));
-    PyTuple_SET_ITEM(__pyx_3, 0, ((PyObject *)__pyx_v_best));
-    PyTuple_SET_ITEM(__pyx_3, 1, __pyx_5);
-    PyTuple_SET_ITEM(__pyx_3, 2, __pyx_2);
-    __pyx_5 = 0;
-    __pyx_2 = 0;
-    __pyx_1 = PyObject_Call(__pyx_6, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_6); __pyx_6 = 0;
-    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":60
- *         i1 = i0 + 1
- *         as_is = (pix_diff(best, i0-1, i0) +
- *             pix_diff(best, i1, i1+1))             # <<<<<<<<<<<<<<
- *         swapd = (pix_diff(best, i0-1, i1) +
- *             pix_diff(best, i0, i1+1))
- */
-    __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_2 = PyInt_FromLong(__pyx_v_i1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_6 = PyInt_FromLong((__pyx_v_i1 + 1)); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyTuple_New(3); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_INCREF(((PyObject *)__pyx_v_best));
-    PyTuple_SET_ITEM(__pyx_3, 0, ((PyObject *)__pyx_v_best));
-    PyTuple_SET_ITEM(__pyx_3, 1, __pyx_2);
-    PyTuple_SET_ITEM(__pyx_3, 2, __pyx_6);
-    __pyx_2 = 0;
-    __pyx_6 = 0;
-    __pyx_2 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 60; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-    __pyx_t_4 = PyNumber_Add(__pyx_1, __pyx_2); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_1); __pyx_1 = 0;
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    __pyx_4 = __pyx_PyInt_int(__pyx_t_4); if (unlikely((__pyx_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 59; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_v_as_is = __pyx_4;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":61
- *         as_is = (pix_diff(best, i0-1, i0) +
- *             pix_diff(best, i1, i1+1))
- *         swapd = (pix_diff(best, i0-1, i1) +             # <<<<<<<<<<<<<<
- *             pix_diff(best, i0, i1+1))
- *         if swapd < as_is:
- */
-    __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 61; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_5 = PyInt_FromLong((__pyx_v_i0 - 1)); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 61; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyInt_FromLong(__pyx_v_i1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 61; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_1 = PyTuple_New(3); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 61; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_INCREF(((PyObject *)__pyx_v_best));
-    PyTuple_SET_ITEM(__pyx_1, 0, ((PyObject *)__pyx_v_best));
-    PyTuple_SET_ITEM(__pyx_1, 1, __pyx_5);
-    PyTuple_SET_ITEM(__pyx_1, 2, __pyx_3);
-    __pyx_5 = 0;
-    __pyx_3 = 0;
-    __pyx_2 = PyObject_Call(__pyx_6, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 61; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_6); __pyx_6 = 0;
-    Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":62
- *             pix_diff(best, i1, i1+1))
- *         swapd = (pix_diff(best, i0-1, i1) +
- *             pix_diff(best, i0, i1+1))             # <<<<<<<<<<<<<<
- *         if swapd < as_is:
- *             pix_swap(best, i0, i1)
- */
-    __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyInt_FromLong(__pyx_v_i0); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_6 = PyInt_FromLong((__pyx_v_i1 + 1)); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_1 = PyTuple_New(3); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_INCREF(((PyObject *)__pyx_v_best));
-    PyTuple_SET_ITEM(__pyx_1, 0, ((PyObject *)__pyx_v_best));
-    PyTuple_SET_ITEM(__pyx_1, 1, __pyx_3);
-    PyTuple_SET_ITEM(__pyx_1, 2, __pyx_6);
-    __pyx_3 = 0;
-    __pyx_6 = 0;
-    __pyx_3 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_1), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 62; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-    __pyx_t_4 = PyNumber_Add(__pyx_2, __pyx_3); if (unlikely(!__pyx_t_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 61; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    __pyx_4 = __pyx_PyInt_int(__pyx_t_4); if (unlikely((__pyx_4 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 61; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_v_swapd = __pyx_4;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":63
- *         swapd = (pix_diff(best, i0-1, i1) +
- *             pix_diff(best, i0, i1+1))
- *         if swapd < as_is:             # <<<<<<<<<<<<<<
- *             pix_swap(best, i0, i1)
- *     return best
- */
-    __pyx_7 = (__pyx_v_swapd < __pyx_v_as_is);
-    if (__pyx_7) {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":64
- *             pix_diff(best, i0, i1+1))
- *         if swapd < as_is:
- *             pix_swap(best, i0, i1)             # <<<<<<<<<<<<<<
- *     return best
- * 
- */
-      __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_swap); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_5 = PyInt_FromLong(__pyx_v_i0); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_1 = PyInt_FromLong(__pyx_v_i1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_2 = PyTuple_New(3); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_INCREF(((PyObject *)__pyx_v_best));
-      PyTuple_SET_ITEM(__pyx_2, 0, ((PyObject *)__pyx_v_best));
-      PyTuple_SET_ITEM(__pyx_2, 1, __pyx_5);
-      PyTuple_SET_ITEM(__pyx_2, 2, __pyx_1);
-      __pyx_5 = 0;
-      __pyx_1 = 0;
-      __pyx_3 = PyObject_Call(__pyx_6, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 64; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_6); __pyx_6 = 0;
-      Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-      goto __pyx_L17;
-    }
-    __pyx_L17:;
-  }
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":65
- *         if swapd < as_is:
- *             pix_swap(best, i0, i1)
- *     return best             # <<<<<<<<<<<<<<
- * 
- * def get_length(np.ndarray[ndim=2, dtype=np.float32_t] pal):
- */
-  Py_INCREF(((PyObject *)__pyx_v_best));
-  __pyx_r = ((PyObject *)__pyx_v_best);
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  Py_XDECREF(__pyx_1);
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_5);
-  Py_XDECREF(__pyx_6);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_orig);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_pal);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_best);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("lib._utils.palette_improve");
-  __pyx_r = NULL;
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_orig);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_pal);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_best);
-  __pyx_L2:;
-  Py_XDECREF(__pyx_v_best);
-  Py_DECREF(__pyx_v_pal);
-  return __pyx_r;
-}
-
-/* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":67
- *     return best
- * 
- * def get_length(np.ndarray[ndim=2, dtype=np.float32_t] pal):             # <<<<<<<<<<<<<<
- *     cdef int length = 0
- *     cdef int i
- */
-
-static PyObject *__pyx_pf_3lib_6_utils_get_length(PyObject *__pyx_self, PyObject *__pyx_v_pal); /*proto*/
-static PyObject *__pyx_pf_3lib_6_utils_get_length(PyObject *__pyx_self, PyObject *__pyx_v_pal) {
-  int __pyx_v_length;
-  int __pyx_v_i;
-  Py_buffer __pyx_bstruct_pal;
-  Py_ssize_t __pyx_bstride_0_pal = 0;
-  Py_ssize_t __pyx_bstride_1_pal = 0;
-  Py_ssize_t __pyx_bshape_0_pal = 0;
-  Py_ssize_t __pyx_bshape_1_pal = 0;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  PyObject *__pyx_4 = 0;
-  int __pyx_5;
-  __pyx_self = __pyx_self;
-  __pyx_bstruct_pal.buf = NULL;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pal), __pyx_ptype_5numpy_ndarray, 1, "pal", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_float32_t((PyObject*)__pyx_v_pal, &__pyx_bstruct_pal, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 67; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_bstride_0_pal = __pyx_bstruct_pal.strides[0]; __pyx_bstride_1_pal = __pyx_bstruct_pal.strides[1];
-  __pyx_bshape_0_pal = __pyx_bstruct_pal.shape[0]; __pyx_bshape_1_pal = __pyx_bstruct_pal.shape[1];
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":68
- * 
- * def get_length(np.ndarray[ndim=2, dtype=np.float32_t] pal):
- *     cdef int length = 0             # <<<<<<<<<<<<<<
- *     cdef int i
- *     for i in range(1,256):
- */
-  __pyx_v_length = 0;
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":70
- *     cdef int length = 0
- *     cdef int i
- *     for i in range(1,256):             # <<<<<<<<<<<<<<
- *         length += pix_diff(pal, i, i-1)
- *     return length
- */
-  for (__pyx_v_i = 1; __pyx_v_i < 256; __pyx_v_i+=1) {
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":71
- *     cdef int i
- *     for i in range(1,256):
- *         length += pix_diff(pal, i, i-1)             # <<<<<<<<<<<<<<
- *     return length
- * 
- */
-    __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_pix_diff); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_2 = PyInt_FromLong(__pyx_v_i); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyInt_FromLong((__pyx_v_i - 1)); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_4 = PyTuple_New(3); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_INCREF(__pyx_v_pal);
-    PyTuple_SET_ITEM(__pyx_4, 0, __pyx_v_pal);
-    PyTuple_SET_ITEM(__pyx_4, 1, __pyx_2);
-    PyTuple_SET_ITEM(__pyx_4, 2, __pyx_3);
-    __pyx_2 = 0;
-    __pyx_3 = 0;
-    __pyx_2 = PyObject_Call(__pyx_1, ((PyObject *)__pyx_4), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_1); __pyx_1 = 0;
-    Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
-    __pyx_5 = __pyx_PyInt_int(__pyx_2); if (unlikely((__pyx_5 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 71; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    __pyx_v_length += __pyx_5;
-  }
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":72
- *     for i in range(1,256):
- *         length += pix_diff(pal, i, i-1)
- *     return length             # <<<<<<<<<<<<<<
- * 
- * def pix_diff(np.ndarray[ndim=2, dtype=np.float32_t] pal, int i0, int i1):
- */
-  __pyx_3 = PyInt_FromLong(__pyx_v_length); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 72; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_3;
-  __pyx_3 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  Py_XDECREF(__pyx_1);
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_4);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_pal);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("lib._utils.get_length");
-  __pyx_r = NULL;
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_pal);
-  __pyx_L2:;
-  return __pyx_r;
-}
-
-/* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":74
- *     return length
- * 
- * def pix_diff(np.ndarray[ndim=2, dtype=np.float32_t] pal, int i0, int i1):             # <<<<<<<<<<<<<<
- *     cdef int diff = 0
- *     cdef int i
- */
-
-static PyObject *__pyx_pf_3lib_6_utils_pix_diff(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_3lib_6_utils_pix_diff(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyArrayObject *__pyx_v_pal = 0;
-  int __pyx_v_i0;
-  int __pyx_v_i1;
-  int __pyx_v_diff;
-  int __pyx_v_i;
-  Py_buffer __pyx_bstruct_pal;
-  Py_ssize_t __pyx_bstride_0_pal = 0;
-  Py_ssize_t __pyx_bstride_1_pal = 0;
-  Py_ssize_t __pyx_bshape_0_pal = 0;
-  Py_ssize_t __pyx_bshape_1_pal = 0;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_pal,&__pyx_kp_i0,&__pyx_kp_23,0};
-  __pyx_self = __pyx_self;
-  if (unlikely(__pyx_kwds)) {
-    PyObject* values[3] = {0,0,0};
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_pal);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_kp_i0);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("pix_diff", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-      case  2:
-      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_kp_23);
-      if (likely(values[2])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("pix_diff", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "pix_diff") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_pal = ((PyArrayObject *)values[0]);
-    __pyx_v_i0 = __pyx_PyInt_int(values[1]); if (unlikely((__pyx_v_i0 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_i1 = __pyx_PyInt_int(values[2]); if (unlikely((__pyx_v_i1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_pal = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-    __pyx_v_i0 = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_i0 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_i1 = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_i1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pix_diff", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("lib._utils.pix_diff");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_bstruct_pal.buf = NULL;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pal), __pyx_ptype_5numpy_ndarray, 1, "pal", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_float32_t((PyObject*)__pyx_v_pal, &__pyx_bstruct_pal, PyBUF_FORMAT| PyBUF_STRIDES, 2, 0) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 74; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_bstride_0_pal = __pyx_bstruct_pal.strides[0]; __pyx_bstride_1_pal = __pyx_bstruct_pal.strides[1];
-  __pyx_bshape_0_pal = __pyx_bstruct_pal.shape[0]; __pyx_bshape_1_pal = __pyx_bstruct_pal.shape[1];
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":75
- * 
- * def pix_diff(np.ndarray[ndim=2, dtype=np.float32_t] pal, int i0, int i1):
- *     cdef int diff = 0             # <<<<<<<<<<<<<<
- *     cdef int i
- *     for i in range(3):
- */
-  __pyx_v_diff = 0;
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":77
- *     cdef int diff = 0
- *     cdef int i
- *     for i in range(3):             # <<<<<<<<<<<<<<
- *         diff += (pal[i0,i] - pal[i1,i])**2
- *     return diff
- */
-  for (__pyx_v_i = 0; __pyx_v_i < 3; __pyx_v_i+=1) {
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":78
- *     cdef int i
- *     for i in range(3):
- *         diff += (pal[i0,i] - pal[i1,i])**2             # <<<<<<<<<<<<<<
- *     return diff
- * 
- */
-    __pyx_t_1 = __pyx_v_i0;
-    __pyx_t_2 = __pyx_v_i;
-    __pyx_t_3 = -1;
-    if (__pyx_t_1 < 0) {
-      __pyx_t_1 += __pyx_bshape_0_pal;
-      if (unlikely(__pyx_t_1 < 0)) __pyx_t_3 = 0;
-    } else if (unlikely(__pyx_t_1 >= __pyx_bshape_0_pal)) __pyx_t_3 = 0;
-    if (__pyx_t_2 < 0) {
-      __pyx_t_2 += __pyx_bshape_1_pal;
-      if (unlikely(__pyx_t_2 < 0)) __pyx_t_3 = 1;
-    } else if (unlikely(__pyx_t_2 >= __pyx_bshape_1_pal)) __pyx_t_3 = 1;
-    if (unlikely(__pyx_t_3 != -1)) {
-        __Pyx_RaiseBufferIndexError(__pyx_t_3);
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_t_3 = __pyx_v_i1;
-    __pyx_t_4 = __pyx_v_i;
-    __pyx_t_5 = -1;
-    if (__pyx_t_3 < 0) {
-      __pyx_t_3 += __pyx_bshape_0_pal;
-      if (unlikely(__pyx_t_3 < 0)) __pyx_t_5 = 0;
-    } else if (unlikely(__pyx_t_3 >= __pyx_bshape_0_pal)) __pyx_t_5 = 0;
-    if (__pyx_t_4 < 0) {
-      __pyx_t_4 += __pyx_bshape_1_pal;
-      if (unlikely(__pyx_t_4 < 0)) __pyx_t_5 = 1;
-    } else if (unlikely(__pyx_t_4 >= __pyx_bshape_1_pal)) __pyx_t_5 = 1;
-    if (unlikely(__pyx_t_5 != -1)) {
-        __Pyx_RaiseBufferIndexError(__pyx_t_5);
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 78; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_v_diff += pow(((*__Pyx_BufPtrStrided2d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_pal.buf, __pyx_t_1, __pyx_bstride_0_pal, __pyx_t_2, __pyx_bstride_1_pal)) - (*__Pyx_BufPtrStrided2d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_pal.buf, __pyx_t_3, __pyx_bstride_0_pal, __pyx_t_4, __pyx_bstride_1_pal))), 2);
-  }
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":79
- *     for i in range(3):
- *         diff += (pal[i0,i] - pal[i1,i])**2
- *     return diff             # <<<<<<<<<<<<<<
- * 
- * def pix_swap(np.ndarray[ndim=2, dtype=np.float32_t] pal, int i0, int i1):
- */
-  __pyx_1 = PyInt_FromLong(__pyx_v_diff); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 79; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_1;
-  __pyx_1 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  Py_XDECREF(__pyx_1);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_pal);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("lib._utils.pix_diff");
-  __pyx_r = NULL;
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_pal);
-  __pyx_L2:;
-  return __pyx_r;
-}
-
-/* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":81
- *     return diff
- * 
- * def pix_swap(np.ndarray[ndim=2, dtype=np.float32_t] pal, int i0, int i1):             # <<<<<<<<<<<<<<
- *     cdef int i
- *     cdef float tmp
- */
-
-static PyObject *__pyx_pf_3lib_6_utils_pix_swap(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_3lib_6_utils_pix_swap(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyArrayObject *__pyx_v_pal = 0;
-  int __pyx_v_i0;
-  int __pyx_v_i1;
-  int __pyx_v_i;
-  float __pyx_v_tmp;
-  Py_buffer __pyx_bstruct_pal;
-  Py_ssize_t __pyx_bstride_0_pal = 0;
-  Py_ssize_t __pyx_bstride_1_pal = 0;
-  Py_ssize_t __pyx_bshape_0_pal = 0;
-  Py_ssize_t __pyx_bshape_1_pal = 0;
-  PyObject *__pyx_r;
-  int __pyx_t_1;
-  int __pyx_t_2;
-  int __pyx_t_3;
-  int __pyx_t_4;
-  int __pyx_t_5;
-  int __pyx_t_6;
-  int __pyx_t_7;
-  int __pyx_t_8;
-  int __pyx_t_9;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_pal,&__pyx_kp_i0,&__pyx_kp_23,0};
-  __pyx_self = __pyx_self;
-  if (unlikely(__pyx_kwds)) {
-    PyObject* values[3] = {0,0,0};
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_pal);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_kp_i0);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("pix_swap", 1, 3, 3, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-      case  2:
-      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_kp_23);
-      if (likely(values[2])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("pix_swap", 1, 3, 3, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "pix_swap") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_pal = ((PyArrayObject *)values[0]);
-    __pyx_v_i0 = __pyx_PyInt_int(values[1]); if (unlikely((__pyx_v_i0 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_i1 = __pyx_PyInt_int(values[2]); if (unlikely((__pyx_v_i1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
-    goto __pyx_L5_argtuple_error;
-  } else {
-    __pyx_v_pal = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-    __pyx_v_i0 = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely((__pyx_v_i0 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_i1 = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_i1 == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pix_swap", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("lib._utils.pix_swap");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_bstruct_pal.buf = NULL;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_pal), __pyx_ptype_5numpy_ndarray, 1, "pal", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_float32_t((PyObject*)__pyx_v_pal, &__pyx_bstruct_pal, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 2, 0) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 81; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_bstride_0_pal = __pyx_bstruct_pal.strides[0]; __pyx_bstride_1_pal = __pyx_bstruct_pal.strides[1];
-  __pyx_bshape_0_pal = __pyx_bstruct_pal.shape[0]; __pyx_bshape_1_pal = __pyx_bstruct_pal.shape[1];
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":84
- *     cdef int i
- *     cdef float tmp
- *     for i in range(3):             # <<<<<<<<<<<<<<
- *         tmp = pal[i0,i]
- *         pal[i0,i] = pal[i1,i]
- */
-  for (__pyx_v_i = 0; __pyx_v_i < 3; __pyx_v_i+=1) {
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":85
- *     cdef float tmp
- *     for i in range(3):
- *         tmp = pal[i0,i]             # <<<<<<<<<<<<<<
- *         pal[i0,i] = pal[i1,i]
- *         pal[i1,i] = tmp
- */
-    __pyx_t_1 = __pyx_v_i0;
-    __pyx_t_2 = __pyx_v_i;
-    __pyx_t_3 = -1;
-    if (__pyx_t_1 < 0) {
-      __pyx_t_1 += __pyx_bshape_0_pal;
-      if (unlikely(__pyx_t_1 < 0)) __pyx_t_3 = 0;
-    } else if (unlikely(__pyx_t_1 >= __pyx_bshape_0_pal)) __pyx_t_3 = 0;
-    if (__pyx_t_2 < 0) {
-      __pyx_t_2 += __pyx_bshape_1_pal;
-      if (unlikely(__pyx_t_2 < 0)) __pyx_t_3 = 1;
-    } else if (unlikely(__pyx_t_2 >= __pyx_bshape_1_pal)) __pyx_t_3 = 1;
-    if (unlikely(__pyx_t_3 != -1)) {
-        __Pyx_RaiseBufferIndexError(__pyx_t_3);
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 85; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_v_tmp = (*__Pyx_BufPtrStrided2d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_pal.buf, __pyx_t_1, __pyx_bstride_0_pal, __pyx_t_2, __pyx_bstride_1_pal));
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":86
- *     for i in range(3):
- *         tmp = pal[i0,i]
- *         pal[i0,i] = pal[i1,i]             # <<<<<<<<<<<<<<
- *         pal[i1,i] = tmp
- * 
- */
-    __pyx_t_3 = __pyx_v_i1;
-    __pyx_t_4 = __pyx_v_i;
-    __pyx_t_5 = -1;
-    if (__pyx_t_3 < 0) {
-      __pyx_t_3 += __pyx_bshape_0_pal;
-      if (unlikely(__pyx_t_3 < 0)) __pyx_t_5 = 0;
-    } else if (unlikely(__pyx_t_3 >= __pyx_bshape_0_pal)) __pyx_t_5 = 0;
-    if (__pyx_t_4 < 0) {
-      __pyx_t_4 += __pyx_bshape_1_pal;
-      if (unlikely(__pyx_t_4 < 0)) __pyx_t_5 = 1;
-    } else if (unlikely(__pyx_t_4 >= __pyx_bshape_1_pal)) __pyx_t_5 = 1;
-    if (unlikely(__pyx_t_5 != -1)) {
-        __Pyx_RaiseBufferIndexError(__pyx_t_5);
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_t_5 = __pyx_v_i0;
-    __pyx_t_6 = __pyx_v_i;
-    __pyx_t_7 = -1;
-    if (__pyx_t_5 < 0) {
-      __pyx_t_5 += __pyx_bshape_0_pal;
-      if (unlikely(__pyx_t_5 < 0)) __pyx_t_7 = 0;
-    } else if (unlikely(__pyx_t_5 >= __pyx_bshape_0_pal)) __pyx_t_7 = 0;
-    if (__pyx_t_6 < 0) {
-      __pyx_t_6 += __pyx_bshape_1_pal;
-      if (unlikely(__pyx_t_6 < 0)) __pyx_t_7 = 1;
-    } else if (unlikely(__pyx_t_6 >= __pyx_bshape_1_pal)) __pyx_t_7 = 1;
-    if (unlikely(__pyx_t_7 != -1)) {
-        __Pyx_RaiseBufferIndexError(__pyx_t_7);
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 86; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    *__Pyx_BufPtrStrided2d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_pal.buf, __pyx_t_5, __pyx_bstride_0_pal, __pyx_t_6, __pyx_bstride_1_pal) = (*__Pyx_BufPtrStrided2d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_pal.buf, __pyx_t_3, __pyx_bstride_0_pal, __pyx_t_4, __pyx_bstride_1_pal));
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":87
- *         tmp = pal[i0,i]
- *         pal[i0,i] = pal[i1,i]
- *         pal[i1,i] = tmp             # <<<<<<<<<<<<<<
- * 
- * def spline(np.ndarray[ndim=1, dtype=np.float32_t] cps,
- */
-    __pyx_t_7 = __pyx_v_i1;
-    __pyx_t_8 = __pyx_v_i;
-    __pyx_t_9 = -1;
-    if (__pyx_t_7 < 0) {
-      __pyx_t_7 += __pyx_bshape_0_pal;
-      if (unlikely(__pyx_t_7 < 0)) __pyx_t_9 = 0;
-    } else if (unlikely(__pyx_t_7 >= __pyx_bshape_0_pal)) __pyx_t_9 = 0;
-    if (__pyx_t_8 < 0) {
-      __pyx_t_8 += __pyx_bshape_1_pal;
-      if (unlikely(__pyx_t_8 < 0)) __pyx_t_9 = 1;
-    } else if (unlikely(__pyx_t_8 >= __pyx_bshape_1_pal)) __pyx_t_9 = 1;
-    if (unlikely(__pyx_t_9 != -1)) {
-        __Pyx_RaiseBufferIndexError(__pyx_t_9);
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 87; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    *__Pyx_BufPtrStrided2d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_pal.buf, __pyx_t_7, __pyx_bstride_0_pal, __pyx_t_8, __pyx_bstride_1_pal) = __pyx_v_tmp;
-  }
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_pal);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("lib._utils.pix_swap");
-  __pyx_r = NULL;
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_pal);
-  __pyx_L2:;
-  return __pyx_r;
-}
-
-/* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":89
- *         pal[i1,i] = tmp
- * 
- * def spline(np.ndarray[ndim=1, dtype=np.float32_t] cps,             # <<<<<<<<<<<<<<
- *            np.ndarray[ndim=1, dtype=np.int32_t] times,
- *            int ti=0, int ci=-1, int bi=0, int to=0, int co=-1, int bo=0,
- */
-
-static PyObject *__pyx_pf_3lib_6_utils_spline(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_3lib_6_utils_spline(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  PyArrayObject *__pyx_v_cps = 0;
-  PyArrayObject *__pyx_v_times = 0;
-  int __pyx_v_ti;
-  int __pyx_v_ci;
-  int __pyx_v_bi;
-  int __pyx_v_to;
-  int __pyx_v_co;
-  int __pyx_v_bo;
-  int __pyx_v_curve;
-  float __pyx_v_amp;
-  int __pyx_v_freq;
-  float __pyx_v_slope;
-  int __pyx_v_mode;
-  float __pyx_v_peak;
-  PyArrayObject *__pyx_v_results;
-  float __pyx_v_cona;
-  float __pyx_v_conb;
-  float __pyx_v_conc;
-  float __pyx_v_cond;
-  float __pyx_v_h00;
-  float __pyx_v_h01;
-  float __pyx_v_h10;
-  float __pyx_v_h11;
-  float __pyx_v_tani;
-  float __pyx_v_tano;
-  int __pyx_v_step;
-  float __pyx_v_i;
-  int __pyx_v_dt0;
-  int __pyx_v_dt1;
-  int __pyx_v_dt2;
-  float __pyx_v_dv0;
-  float __pyx_v_dv1;
-  float __pyx_v_dv2;
-  Py_buffer __pyx_bstruct_results;
-  Py_ssize_t __pyx_bstride_0_results = 0;
-  Py_ssize_t __pyx_bshape_0_results = 0;
-  Py_buffer __pyx_bstruct_times;
-  Py_ssize_t __pyx_bstride_0_times = 0;
-  Py_ssize_t __pyx_bshape_0_times = 0;
-  Py_buffer __pyx_bstruct_cps;
-  Py_ssize_t __pyx_bstride_0_cps = 0;
-  Py_ssize_t __pyx_bshape_0_cps = 0;
-  PyObject *__pyx_r;
-  PyObject *__pyx_1 = 0;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  PyObject *__pyx_4 = 0;
-  PyObject *__pyx_5 = 0;
-  int __pyx_6;
-  int __pyx_7;
-  PyObject *__pyx_8 = 0;
-  PyObject *__pyx_9 = 0;
-  PyObject *__pyx_10 = 0;
-  PyObject *__pyx_11 = 0;
-  PyObject *__pyx_12 = 0;
-  __pyx_t_5numpy_float32_t __pyx_13;
-  float __pyx_14;
-  long __pyx_t_1;
-  int __pyx_t_2;
-  long __pyx_t_3;
-  PyArrayObject *__pyx_t_4 = NULL;
-  PyObject *__pyx_t_5 = NULL;
-  PyObject *__pyx_t_6 = NULL;
-  PyObject *__pyx_t_7 = NULL;
-  long __pyx_t_8;
-  long __pyx_t_9;
-  long __pyx_t_10;
-  long __pyx_t_11;
-  long __pyx_t_12;
-  long __pyx_t_13;
-  long __pyx_t_14;
-  long __pyx_t_15;
-  long __pyx_t_16;
-  long __pyx_t_17;
-  long __pyx_t_18;
-  long __pyx_t_19;
-  long __pyx_t_20;
-  long __pyx_t_21;
-  int __pyx_t_22;
-  int __pyx_t_23;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_cps,&__pyx_kp_times,&__pyx_kp_ti,&__pyx_kp_ci,&__pyx_kp_bi,&__pyx_kp_to,&__pyx_kp_co,&__pyx_kp_bo,&__pyx_kp_curve,&__pyx_kp_amp,&__pyx_kp_freq,&__pyx_kp_slope,&__pyx_kp_mode,&__pyx_kp_peak,0};
-  __pyx_self = __pyx_self;
-  __pyx_v_ti = 0;
-  __pyx_v_ci = -1;
-  __pyx_v_bi = 0;
-  __pyx_v_to = 0;
-  __pyx_v_co = -1;
-  __pyx_v_bo = 0;
-  __pyx_v_curve = -1;
-  __pyx_v_amp = ((float)0);
-  __pyx_v_freq = 1;
-  __pyx_v_slope = ((float)1);
-  __pyx_v_mode = 0;
-  __pyx_v_peak = ((float)0.5);
-  if (unlikely(__pyx_kwds)) {
-    PyObject* values[14] = {0,0,0,0,0,0,0,0,0,0,0,0,0,0};
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case 14: values[13] = PyTuple_GET_ITEM(__pyx_args, 13);
-      case 13: values[12] = PyTuple_GET_ITEM(__pyx_args, 12);
-      case 12: values[11] = PyTuple_GET_ITEM(__pyx_args, 11);
-      case 11: values[10] = PyTuple_GET_ITEM(__pyx_args, 10);
-      case 10: values[9] = PyTuple_GET_ITEM(__pyx_args, 9);
-      case  9: values[8] = PyTuple_GET_ITEM(__pyx_args, 8);
-      case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-      case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-      case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_cps);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_kp_times);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("spline", 0, 2, 14, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "spline") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_cps = ((PyArrayObject *)values[0]);
-    __pyx_v_times = ((PyArrayObject *)values[1]);
-    if (values[2]) {
-      __pyx_v_ti = __pyx_PyInt_int(values[2]); if (unlikely((__pyx_v_ti == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[3]) {
-      __pyx_v_ci = __pyx_PyInt_int(values[3]); if (unlikely((__pyx_v_ci == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[4]) {
-      __pyx_v_bi = __pyx_PyInt_int(values[4]); if (unlikely((__pyx_v_bi == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[5]) {
-      __pyx_v_to = __pyx_PyInt_int(values[5]); if (unlikely((__pyx_v_to == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[6]) {
-      __pyx_v_co = __pyx_PyInt_int(values[6]); if (unlikely((__pyx_v_co == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[7]) {
-      __pyx_v_bo = __pyx_PyInt_int(values[7]); if (unlikely((__pyx_v_bo == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[8]) {
-      __pyx_v_curve = __pyx_PyInt_int(values[8]); if (unlikely((__pyx_v_curve == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[9]) {
-      __pyx_v_amp = __pyx_PyFloat_AsDouble(values[9]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[10]) {
-      __pyx_v_freq = __pyx_PyInt_int(values[10]); if (unlikely((__pyx_v_freq == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[11]) {
-      __pyx_v_slope = __pyx_PyFloat_AsDouble(values[11]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[12]) {
-      __pyx_v_mode = __pyx_PyInt_int(values[12]); if (unlikely((__pyx_v_mode == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[13]) {
-      __pyx_v_peak = __pyx_PyFloat_AsDouble(values[13]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-  } else {
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case 14:
-      __pyx_v_peak = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 13)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case 13:
-      __pyx_v_mode = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 12)); if (unlikely((__pyx_v_mode == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 93; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case 12:
-      __pyx_v_slope = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 11)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case 11:
-      __pyx_v_freq = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 10)); if (unlikely((__pyx_v_freq == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case 10:
-      __pyx_v_amp = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 9)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  9:
-      __pyx_v_curve = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 8)); if (unlikely((__pyx_v_curve == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 92; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  8:
-      __pyx_v_bo = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 7)); if (unlikely((__pyx_v_bo == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  7:
-      __pyx_v_co = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 6)); if (unlikely((__pyx_v_co == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  6:
-      __pyx_v_to = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 5)); if (unlikely((__pyx_v_to == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  5:
-      __pyx_v_bi = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_bi == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  4:
-      __pyx_v_ci = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_ci == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  3:
-      __pyx_v_ti = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_ti == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 91; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  2:
-      __pyx_v_times = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 1));
-      __pyx_v_cps = ((PyArrayObject *)PyTuple_GET_ITEM(__pyx_args, 0));
-      break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("spline", 0, 2, 14, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("lib._utils.spline");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-  __pyx_v_results = ((PyArrayObject *)Py_None); Py_INCREF(Py_None);
-  __pyx_bstruct_results.buf = NULL;
-  __pyx_bstruct_cps.buf = NULL;
-  __pyx_bstruct_times.buf = NULL;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_cps), __pyx_ptype_5numpy_ndarray, 1, "cps", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_times), __pyx_ptype_5numpy_ndarray, 1, "times", 0))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 90; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_float32_t((PyObject*)__pyx_v_cps, &__pyx_bstruct_cps, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_bstride_0_cps = __pyx_bstruct_cps.strides[0];
-  __pyx_bshape_0_cps = __pyx_bstruct_cps.shape[0];
-  if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t((PyObject*)__pyx_v_times, &__pyx_bstruct_times, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0) == -1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 89; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_bstride_0_times = __pyx_bstruct_times.strides[0];
-  __pyx_bshape_0_times = __pyx_bstruct_times.shape[0];
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":99
- *     cdef float h00, h01, h10, h11
- *     cdef float tani, tano
- *     cdef int step = 0             # <<<<<<<<<<<<<<
- *     cdef float i = 0.0
- *     cdef int dt0, dt1, dt2
- */
-  __pyx_v_step = 0;
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":100
- *     cdef float tani, tano
- *     cdef int step = 0
- *     cdef float i = 0.0             # <<<<<<<<<<<<<<
- *     cdef int dt0, dt1, dt2
- *     cdef float dv0, dv1, dv2
- */
-  __pyx_v_i = 0.0;
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":104
- *     cdef float dv0, dv1, dv2
- * 
- *     results = np.zeros(times[2]-times[1], dtype=np.float32)             # <<<<<<<<<<<<<<
- * 
- *     cona = (1-ti)*(1-bi)*(1+ci)*0.5
- */
-  __pyx_1 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_2 = PyObject_GetAttr(__pyx_1, __pyx_kp_zeros); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-  __pyx_t_1 = 2;
-  __pyx_t_2 = -1;
-  if (__pyx_t_1 < 0) {
-    __pyx_t_1 += __pyx_bshape_0_times;
-    if (unlikely(__pyx_t_1 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_1 >= __pyx_bshape_0_times)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_2);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_t_3 = 1;
-  __pyx_t_2 = -1;
-  if (__pyx_t_3 < 0) {
-    __pyx_t_3 += __pyx_bshape_0_times;
-    if (unlikely(__pyx_t_3 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_3 >= __pyx_bshape_0_times)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_2);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_1 = PyInt_FromLong(((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int32_t *, __pyx_bstruct_times.buf, __pyx_t_1, __pyx_bstride_0_times)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int32_t *, __pyx_bstruct_times.buf, __pyx_t_3, __pyx_bstride_0_times)))); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  PyTuple_SET_ITEM(__pyx_3, 0, __pyx_1);
-  __pyx_1 = 0;
-  __pyx_1 = PyDict_New(); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_5 = PyObject_GetAttr(__pyx_4, __pyx_kp_24); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_4); __pyx_4 = 0;
-  if (PyDict_SetItem(__pyx_1, __pyx_kp_dtype, __pyx_5) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_5); __pyx_5 = 0;
-  __pyx_4 = PyEval_CallObjectWithKeywords(__pyx_2, ((PyObject *)__pyx_3), ((PyObject *)__pyx_1)); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_2); __pyx_2 = 0;
-  Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-  Py_DECREF(((PyObject *)__pyx_1)); __pyx_1 = 0;
-  if (!(__Pyx_TypeTest(__pyx_4, __pyx_ptype_5numpy_ndarray))) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = ((PyArrayObject *)__pyx_4);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_results);
-  __pyx_t_2 = __Pyx_GetBuffer_nn___pyx_t_5numpy_float32_t((PyObject*)__pyx_t_4, &__pyx_bstruct_results, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0);
-  if (unlikely(__pyx_t_2 < 0)) 
-  {
-      PyErr_Fetch(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7);
-      if (unlikely(__Pyx_GetBuffer_nn___pyx_t_5numpy_float32_t((PyObject*)__pyx_v_results, &__pyx_bstruct_results, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0) == -1)) {
-          Py_XDECREF(__pyx_t_5); Py_XDECREF(__pyx_t_6); Py_XDECREF(__pyx_t_7);
-          __Pyx_RaiseBufferFallbackError();
-        } else {
-          PyErr_Restore(__pyx_t_5, __pyx_t_6, __pyx_t_7);
-      }
-  }
-  __pyx_bstride_0_results = __pyx_bstruct_results.strides[0];
-  __pyx_bshape_0_results = __pyx_bstruct_results.shape[0];
-  if (unlikely(__pyx_t_2 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 104; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_t_4 = 0;
-  Py_DECREF(((PyObject *)__pyx_v_results));
-  __pyx_v_results = ((PyArrayObject *)__pyx_4);
-  __pyx_4 = 0;
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":106
- *     results = np.zeros(times[2]-times[1], dtype=np.float32)
- * 
- *     cona = (1-ti)*(1-bi)*(1+ci)*0.5             # <<<<<<<<<<<<<<
- *     conb = (1-ti)*(1+bi)*(1-ci)*0.5
- *     conc = (1-to)*(1-bo)*(1-co)*0.5
- */
-  __pyx_v_cona = ((((1 - __pyx_v_ti) * (1 - __pyx_v_bi)) * (1 + __pyx_v_ci)) * 0.5);
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":107
- * 
- *     cona = (1-ti)*(1-bi)*(1+ci)*0.5
- *     conb = (1-ti)*(1+bi)*(1-ci)*0.5             # <<<<<<<<<<<<<<
- *     conc = (1-to)*(1-bo)*(1-co)*0.5
- *     cond = (1-to)*(1+bo)*(1+co)*0.5
- */
-  __pyx_v_conb = ((((1 - __pyx_v_ti) * (1 + __pyx_v_bi)) * (1 - __pyx_v_ci)) * 0.5);
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":108
- *     cona = (1-ti)*(1-bi)*(1+ci)*0.5
- *     conb = (1-ti)*(1+bi)*(1-ci)*0.5
- *     conc = (1-to)*(1-bo)*(1-co)*0.5             # <<<<<<<<<<<<<<
- *     cond = (1-to)*(1+bo)*(1+co)*0.5
- * 
- */
-  __pyx_v_conc = ((((1 - __pyx_v_to) * (1 - __pyx_v_bo)) * (1 - __pyx_v_co)) * 0.5);
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":109
- *     conb = (1-ti)*(1+bi)*(1-ci)*0.5
- *     conc = (1-to)*(1-bo)*(1-co)*0.5
- *     cond = (1-to)*(1+bo)*(1+co)*0.5             # <<<<<<<<<<<<<<
- * 
- *     dv0 = cps[1] - cps[0]
- */
-  __pyx_v_cond = ((((1 - __pyx_v_to) * (1 + __pyx_v_bo)) * (1 + __pyx_v_co)) * 0.5);
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":111
- *     cond = (1-to)*(1+bo)*(1+co)*0.5
- * 
- *     dv0 = cps[1] - cps[0]             # <<<<<<<<<<<<<<
- *     dv1 = cps[2] - cps[1]
- *     dv2 = cps[3] - cps[2]
- */
-  __pyx_t_8 = 1;
-  __pyx_t_2 = -1;
-  if (__pyx_t_8 < 0) {
-    __pyx_t_8 += __pyx_bshape_0_cps;
-    if (unlikely(__pyx_t_8 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_8 >= __pyx_bshape_0_cps)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_2);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_t_9 = 0;
-  __pyx_t_2 = -1;
-  if (__pyx_t_9 < 0) {
-    __pyx_t_9 += __pyx_bshape_0_cps;
-    if (unlikely(__pyx_t_9 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_9 >= __pyx_bshape_0_cps)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_2);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 111; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_v_dv0 = ((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_cps.buf, __pyx_t_8, __pyx_bstride_0_cps)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_cps.buf, __pyx_t_9, __pyx_bstride_0_cps)));
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":112
- * 
- *     dv0 = cps[1] - cps[0]
- *     dv1 = cps[2] - cps[1]             # <<<<<<<<<<<<<<
- *     dv2 = cps[3] - cps[2]
- *     dt0 = times[1] - times[0]
- */
-  __pyx_t_10 = 2;
-  __pyx_t_2 = -1;
-  if (__pyx_t_10 < 0) {
-    __pyx_t_10 += __pyx_bshape_0_cps;
-    if (unlikely(__pyx_t_10 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_10 >= __pyx_bshape_0_cps)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_2);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_t_11 = 1;
-  __pyx_t_2 = -1;
-  if (__pyx_t_11 < 0) {
-    __pyx_t_11 += __pyx_bshape_0_cps;
-    if (unlikely(__pyx_t_11 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_11 >= __pyx_bshape_0_cps)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_2);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 112; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_v_dv1 = ((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_cps.buf, __pyx_t_10, __pyx_bstride_0_cps)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_cps.buf, __pyx_t_11, __pyx_bstride_0_cps)));
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":113
- *     dv0 = cps[1] - cps[0]
- *     dv1 = cps[2] - cps[1]
- *     dv2 = cps[3] - cps[2]             # <<<<<<<<<<<<<<
- *     dt0 = times[1] - times[0]
- *     dt1 = times[2] - times[1]
- */
-  __pyx_t_12 = 3;
-  __pyx_t_2 = -1;
-  if (__pyx_t_12 < 0) {
-    __pyx_t_12 += __pyx_bshape_0_cps;
-    if (unlikely(__pyx_t_12 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_12 >= __pyx_bshape_0_cps)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_2);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_t_13 = 2;
-  __pyx_t_2 = -1;
-  if (__pyx_t_13 < 0) {
-    __pyx_t_13 += __pyx_bshape_0_cps;
-    if (unlikely(__pyx_t_13 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_13 >= __pyx_bshape_0_cps)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_2);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 113; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_v_dv2 = ((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_cps.buf, __pyx_t_12, __pyx_bstride_0_cps)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_cps.buf, __pyx_t_13, __pyx_bstride_0_cps)));
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":114
- *     dv1 = cps[2] - cps[1]
- *     dv2 = cps[3] - cps[2]
- *     dt0 = times[1] - times[0]             # <<<<<<<<<<<<<<
- *     dt1 = times[2] - times[1]
- *     dt2 = times[3] - times[2]
- */
-  __pyx_t_14 = 1;
-  __pyx_t_2 = -1;
-  if (__pyx_t_14 < 0) {
-    __pyx_t_14 += __pyx_bshape_0_times;
-    if (unlikely(__pyx_t_14 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_14 >= __pyx_bshape_0_times)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_2);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_t_15 = 0;
-  __pyx_t_2 = -1;
-  if (__pyx_t_15 < 0) {
-    __pyx_t_15 += __pyx_bshape_0_times;
-    if (unlikely(__pyx_t_15 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_15 >= __pyx_bshape_0_times)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_2);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 114; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_v_dt0 = ((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int32_t *, __pyx_bstruct_times.buf, __pyx_t_14, __pyx_bstride_0_times)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int32_t *, __pyx_bstruct_times.buf, __pyx_t_15, __pyx_bstride_0_times)));
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":115
- *     dv2 = cps[3] - cps[2]
- *     dt0 = times[1] - times[0]
- *     dt1 = times[2] - times[1]             # <<<<<<<<<<<<<<
- *     dt2 = times[3] - times[2]
- * 
- */
-  __pyx_t_16 = 2;
-  __pyx_t_2 = -1;
-  if (__pyx_t_16 < 0) {
-    __pyx_t_16 += __pyx_bshape_0_times;
-    if (unlikely(__pyx_t_16 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_16 >= __pyx_bshape_0_times)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_2);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_t_17 = 1;
-  __pyx_t_2 = -1;
-  if (__pyx_t_17 < 0) {
-    __pyx_t_17 += __pyx_bshape_0_times;
-    if (unlikely(__pyx_t_17 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_17 >= __pyx_bshape_0_times)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_2);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 115; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_v_dt1 = ((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int32_t *, __pyx_bstruct_times.buf, __pyx_t_16, __pyx_bstride_0_times)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int32_t *, __pyx_bstruct_times.buf, __pyx_t_17, __pyx_bstride_0_times)));
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":116
- *     dt0 = times[1] - times[0]
- *     dt1 = times[2] - times[1]
- *     dt2 = times[3] - times[2]             # <<<<<<<<<<<<<<
- * 
- *     while step < dt1:
- */
-  __pyx_t_18 = 3;
-  __pyx_t_2 = -1;
-  if (__pyx_t_18 < 0) {
-    __pyx_t_18 += __pyx_bshape_0_times;
-    if (unlikely(__pyx_t_18 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_18 >= __pyx_bshape_0_times)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_2);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_t_19 = 2;
-  __pyx_t_2 = -1;
-  if (__pyx_t_19 < 0) {
-    __pyx_t_19 += __pyx_bshape_0_times;
-    if (unlikely(__pyx_t_19 < 0)) __pyx_t_2 = 0;
-  } else if (unlikely(__pyx_t_19 >= __pyx_bshape_0_times)) __pyx_t_2 = 0;
-  if (unlikely(__pyx_t_2 != -1)) {
-      __Pyx_RaiseBufferIndexError(__pyx_t_2);
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 116; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  }
-  __pyx_v_dt2 = ((*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int32_t *, __pyx_bstruct_times.buf, __pyx_t_18, __pyx_bstride_0_times)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_int32_t *, __pyx_bstruct_times.buf, __pyx_t_19, __pyx_bstride_0_times)));
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":118
- *     dt2 = times[3] - times[2]
- * 
- *     while step < dt1:             # <<<<<<<<<<<<<<
- *         h00 = 2*i**3 - 3*i**2 + 1
- *         h01 = -2*i**3 + 3*i**2
- */
-  while (1) {
-    __pyx_6 = (__pyx_v_step < __pyx_v_dt1);
-    if (!__pyx_6) break;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":119
- * 
- *     while step < dt1:
- *         h00 = 2*i**3 - 3*i**2 + 1             # <<<<<<<<<<<<<<
- *         h01 = -2*i**3 + 3*i**2
- *         h10 = i**3 - 2*i**2 + i
- */
-    __pyx_v_h00 = (((2 * pow(__pyx_v_i, 3)) - (3 * pow(__pyx_v_i, 2))) + 1);
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":120
- *     while step < dt1:
- *         h00 = 2*i**3 - 3*i**2 + 1
- *         h01 = -2*i**3 + 3*i**2             # <<<<<<<<<<<<<<
- *         h10 = i**3 - 2*i**2 + i
- *         h11 = i**3 - i**2
- */
-    __pyx_v_h01 = ((-2 * pow(__pyx_v_i, 3)) + (3 * pow(__pyx_v_i, 2)));
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":121
- *         h00 = 2*i**3 - 3*i**2 + 1
- *         h01 = -2*i**3 + 3*i**2
- *         h10 = i**3 - 2*i**2 + i             # <<<<<<<<<<<<<<
- *         h11 = i**3 - i**2
- * 
- */
-    __pyx_v_h10 = ((pow(__pyx_v_i, 3) - (2 * pow(__pyx_v_i, 2))) + __pyx_v_i);
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":122
- *         h01 = -2*i**3 + 3*i**2
- *         h10 = i**3 - 2*i**2 + i
- *         h11 = i**3 - i**2             # <<<<<<<<<<<<<<
- * 
- * # ralf  q(k) = (x(k+1)-2*x(k) + x(k-1))/(x(k+1)-x(k-1))
- */
-    __pyx_v_h11 = (pow(__pyx_v_i, 3) - pow(__pyx_v_i, 2));
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":125
- * 
- * # ralf  q(k) = (x(k+1)-2*x(k) + x(k-1))/(x(k+1)-x(k-1))
- *         tani =  cona*dv0 + conb*(dv1)             # <<<<<<<<<<<<<<
- *         tano =  conc*dv1 + cond*dv2
- *         if not (ti==0 and ci==-1 and bi==0): tani *= 2*dt1/(dt1+dt0)
- */
-    __pyx_v_tani = ((__pyx_v_cona * __pyx_v_dv0) + (__pyx_v_conb * __pyx_v_dv1));
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":126
- * # ralf  q(k) = (x(k+1)-2*x(k) + x(k-1))/(x(k+1)-x(k-1))
- *         tani =  cona*dv0 + conb*(dv1)
- *         tano =  conc*dv1 + cond*dv2             # <<<<<<<<<<<<<<
- *         if not (ti==0 and ci==-1 and bi==0): tani *= 2*dt1/(dt1+dt0)
- *         if not (to==0 and co==-1 and bo==0): tano *= 2*dt2/(dt2+dt1)
- */
-    __pyx_v_tano = ((__pyx_v_conc * __pyx_v_dv1) + (__pyx_v_cond * __pyx_v_dv2));
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":127
- *         tani =  cona*dv0 + conb*(dv1)
- *         tano =  conc*dv1 + cond*dv2
- *         if not (ti==0 and ci==-1 and bi==0): tani *= 2*dt1/(dt1+dt0)             # <<<<<<<<<<<<<<
- *         if not (to==0 and co==-1 and bo==0): tano *= 2*dt2/(dt2+dt1)
- * 
- */
-    __pyx_6 = (__pyx_v_ti == 0);
-    if (__pyx_6) {
-      __pyx_6 = (__pyx_v_ci == -1);
-      if (__pyx_6) {
-        __pyx_6 = (__pyx_v_bi == 0);
-      }
-    }
-    __pyx_7 = (!__pyx_6);
-    if (__pyx_7) {
-      __pyx_v_tani *= ((2 * __pyx_v_dt1) / (__pyx_v_dt1 + __pyx_v_dt0));
-      goto __pyx_L8;
-    }
-    __pyx_L8:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":128
- *         tano =  conc*dv1 + cond*dv2
- *         if not (ti==0 and ci==-1 and bi==0): tani *= 2*dt1/(dt1+dt0)
- *         if not (to==0 and co==-1 and bo==0): tano *= 2*dt2/(dt2+dt1)             # <<<<<<<<<<<<<<
- * 
- *         results[step] = h00*cps[1] + h01*cps[2] + h10*tani + h11*tano
- */
-    __pyx_6 = (__pyx_v_to == 0);
-    if (__pyx_6) {
-      __pyx_6 = (__pyx_v_co == -1);
-      if (__pyx_6) {
-        __pyx_6 = (__pyx_v_bo == 0);
-      }
-    }
-    __pyx_7 = (!__pyx_6);
-    if (__pyx_7) {
-      __pyx_v_tano *= ((2 * __pyx_v_dt2) / (__pyx_v_dt2 + __pyx_v_dt1));
-      goto __pyx_L9;
-    }
-    __pyx_L9:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":130
- *         if not (to==0 and co==-1 and bo==0): tano *= 2*dt2/(dt2+dt1)
- * 
- *         results[step] = h00*cps[1] + h01*cps[2] + h10*tani + h11*tano             # <<<<<<<<<<<<<<
- *         if curve<>-1: results[step] += cdiff(dv1, i, curve, amp, freq, slope, peak, mode)
- *         i += 1.0/float(dt1)
- */
-    __pyx_t_20 = 1;
-    __pyx_t_2 = -1;
-    if (__pyx_t_20 < 0) {
-      __pyx_t_20 += __pyx_bshape_0_cps;
-      if (unlikely(__pyx_t_20 < 0)) __pyx_t_2 = 0;
-    } else if (unlikely(__pyx_t_20 >= __pyx_bshape_0_cps)) __pyx_t_2 = 0;
-    if (unlikely(__pyx_t_2 != -1)) {
-        __Pyx_RaiseBufferIndexError(__pyx_t_2);
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_t_21 = 2;
-    __pyx_t_2 = -1;
-    if (__pyx_t_21 < 0) {
-      __pyx_t_21 += __pyx_bshape_0_cps;
-      if (unlikely(__pyx_t_21 < 0)) __pyx_t_2 = 0;
-    } else if (unlikely(__pyx_t_21 >= __pyx_bshape_0_cps)) __pyx_t_2 = 0;
-    if (unlikely(__pyx_t_2 != -1)) {
-        __Pyx_RaiseBufferIndexError(__pyx_t_2);
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    __pyx_t_2 = __pyx_v_step;
-    __pyx_t_22 = -1;
-    if (__pyx_t_2 < 0) {
-      __pyx_t_2 += __pyx_bshape_0_results;
-      if (unlikely(__pyx_t_2 < 0)) __pyx_t_22 = 0;
-    } else if (unlikely(__pyx_t_2 >= __pyx_bshape_0_results)) __pyx_t_22 = 0;
-    if (unlikely(__pyx_t_22 != -1)) {
-        __Pyx_RaiseBufferIndexError(__pyx_t_22);
-        {__pyx_filename = __pyx_f[0]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    }
-    *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_results.buf, __pyx_t_2, __pyx_bstride_0_results) = ((((__pyx_v_h00 * (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_cps.buf, __pyx_t_20, __pyx_bstride_0_cps))) + (__pyx_v_h01 * (*__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_cps.buf, __pyx_t_21, __pyx_bstride_0_cps)))) + (__pyx_v_h10 * __pyx_v_tani)) + (__pyx_v_h11 * __pyx_v_tano));
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":131
- * 
- *         results[step] = h00*cps[1] + h01*cps[2] + h10*tani + h11*tano
- *         if curve<>-1: results[step] += cdiff(dv1, i, curve, amp, freq, slope, peak, mode)             # <<<<<<<<<<<<<<
- *         i += 1.0/float(dt1)
- *         step += 1
- */
-    __pyx_6 = (__pyx_v_curve != -1);
-    if (__pyx_6) {
-      __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_cdiff); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_2 = PyFloat_FromDouble(__pyx_v_dv1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_3 = PyFloat_FromDouble(__pyx_v_i); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_1 = PyInt_FromLong(__pyx_v_curve); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_4 = PyFloat_FromDouble(__pyx_v_amp); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_8 = PyInt_FromLong(__pyx_v_freq); if (unlikely(!__pyx_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_9 = PyFloat_FromDouble(__pyx_v_slope); if (unlikely(!__pyx_9)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_10 = PyFloat_FromDouble(__pyx_v_peak); if (unlikely(!__pyx_10)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_11 = PyInt_FromLong(__pyx_v_mode); if (unlikely(!__pyx_11)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_12 = PyTuple_New(8); if (unlikely(!__pyx_12)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      PyTuple_SET_ITEM(__pyx_12, 0, __pyx_2);
-      PyTuple_SET_ITEM(__pyx_12, 1, __pyx_3);
-      PyTuple_SET_ITEM(__pyx_12, 2, __pyx_1);
-      PyTuple_SET_ITEM(__pyx_12, 3, __pyx_4);
-      PyTuple_SET_ITEM(__pyx_12, 4, __pyx_8);
-      PyTuple_SET_ITEM(__pyx_12, 5, __pyx_9);
-      PyTuple_SET_ITEM(__pyx_12, 6, __pyx_10);
-      PyTuple_SET_ITEM(__pyx_12, 7, __pyx_11);
-      __pyx_2 = 0;
-      __pyx_3 = 0;
-      __pyx_1 = 0;
-      __pyx_4 = 0;
-      __pyx_8 = 0;
-      __pyx_9 = 0;
-      __pyx_10 = 0;
-      __pyx_11 = 0;
-      __pyx_2 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_12), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_5); __pyx_5 = 0;
-      Py_DECREF(((PyObject *)__pyx_12)); __pyx_12 = 0;
-      __pyx_13 = __pyx_PyFloat_AsDouble(__pyx_2); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      __pyx_t_22 = __pyx_v_step;
-      __pyx_t_23 = -1;
-      if (__pyx_t_22 < 0) {
-        __pyx_t_22 += __pyx_bshape_0_results;
-        if (unlikely(__pyx_t_22 < 0)) __pyx_t_23 = 0;
-      } else if (unlikely(__pyx_t_22 >= __pyx_bshape_0_results)) __pyx_t_23 = 0;
-      if (unlikely(__pyx_t_23 != -1)) {
-          __Pyx_RaiseBufferIndexError(__pyx_t_23);
-          {__pyx_filename = __pyx_f[0]; __pyx_lineno = 131; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      }
-      *__Pyx_BufPtrStrided1d(__pyx_t_5numpy_float32_t *, __pyx_bstruct_results.buf, __pyx_t_22, __pyx_bstride_0_results) += __pyx_13;
-      goto __pyx_L10;
-    }
-    __pyx_L10:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":132
- *         results[step] = h00*cps[1] + h01*cps[2] + h10*tani + h11*tano
- *         if curve<>-1: results[step] += cdiff(dv1, i, curve, amp, freq, slope, peak, mode)
- *         i += 1.0/float(dt1)             # <<<<<<<<<<<<<<
- *         step += 1
- *     return results
- */
-    __pyx_3 = PyFloat_FromDouble(1.0); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_1 = PyInt_FromLong(__pyx_v_dt1); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_4 = PyTuple_New(1); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_4, 0, __pyx_1);
-    __pyx_1 = 0;
-    __pyx_8 = PyObject_Call(((PyObject *)((PyObject*)&PyFloat_Type)), ((PyObject *)__pyx_4), NULL); if (unlikely(!__pyx_8)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
-    __pyx_t_7 = __Pyx_PyNumber_Divide(__pyx_3, __pyx_8); if (unlikely(!__pyx_t_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    Py_DECREF(__pyx_8); __pyx_8 = 0;
-    __pyx_14 = __pyx_PyFloat_AsDouble(__pyx_t_7); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 132; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_v_i += __pyx_14;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":133
- *         if curve<>-1: results[step] += cdiff(dv1, i, curve, amp, freq, slope, peak, mode)
- *         i += 1.0/float(dt1)
- *         step += 1             # <<<<<<<<<<<<<<
- *     return results
- * 
- */
-    __pyx_v_step += 1;
-  }
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":134
- *         i += 1.0/float(dt1)
- *         step += 1
- *     return results             # <<<<<<<<<<<<<<
- * 
- * """
- */
-  Py_INCREF(((PyObject *)__pyx_v_results));
-  __pyx_r = ((PyObject *)__pyx_v_results);
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  Py_XDECREF(__pyx_1);
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_4);
-  Py_XDECREF(__pyx_5);
-  Py_XDECREF(__pyx_8);
-  Py_XDECREF(__pyx_9);
-  Py_XDECREF(__pyx_10);
-  Py_XDECREF(__pyx_11);
-  Py_XDECREF(__pyx_12);
-  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
-    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_results);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_times);
-    __Pyx_SafeReleaseBuffer(&__pyx_bstruct_cps);
-  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
-  __Pyx_AddTraceback("lib._utils.spline");
-  __pyx_r = NULL;
-  goto __pyx_L2;
-  __pyx_L0:;
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_results);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_times);
-  __Pyx_SafeReleaseBuffer(&__pyx_bstruct_cps);
-  __pyx_L2:;
-  Py_DECREF(__pyx_v_results);
-  return __pyx_r;
-}
-
-/* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":143
- *     w/ amp + peak: 9 - plin, 10 - ppar (w/mode - 0=--, 1=-+, 2=+-, 3=++)
- * """
- * def cdiff(float d, float i, int curve=0, float amp=0, int freq=1, float slope=1,             # <<<<<<<<<<<<<<
- *           float peak=0.5, int mode=0):
- *     cdef float val
- */
-
-static PyObject *__pyx_pf_3lib_6_utils_cdiff(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_3lib_6_utils_cdiff(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  float __pyx_v_d;
-  float __pyx_v_i;
-  int __pyx_v_curve;
-  float __pyx_v_amp;
-  int __pyx_v_freq;
-  float __pyx_v_slope;
-  float __pyx_v_peak;
-  int __pyx_v_mode;
-  float __pyx_v_val;
-  PyObject *__pyx_r;
-  int __pyx_1;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  PyObject *__pyx_4 = 0;
-  PyObject *__pyx_5 = 0;
-  PyObject *__pyx_6 = 0;
-  float __pyx_7;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  PyObject *__pyx_t_3 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_d,&__pyx_kp_i,&__pyx_kp_curve,&__pyx_kp_amp,&__pyx_kp_freq,&__pyx_kp_slope,&__pyx_kp_peak,&__pyx_kp_mode,0};
-  __pyx_self = __pyx_self;
-  __pyx_v_curve = 0;
-  __pyx_v_amp = ((float)0);
-  __pyx_v_freq = 1;
-  __pyx_v_slope = ((float)1);
-  __pyx_v_peak = ((float)0.5);
-  __pyx_v_mode = 0;
-  if (unlikely(__pyx_kwds)) {
-    PyObject* values[8] = {0,0,0,0,0,0,0,0};
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  8: values[7] = PyTuple_GET_ITEM(__pyx_args, 7);
-      case  7: values[6] = PyTuple_GET_ITEM(__pyx_args, 6);
-      case  6: values[5] = PyTuple_GET_ITEM(__pyx_args, 5);
-      case  5: values[4] = PyTuple_GET_ITEM(__pyx_args, 4);
-      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_d);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_kp_i);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("cdiff", 0, 2, 8, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "cdiff") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_d = __pyx_PyFloat_AsDouble(values[0]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_i = __pyx_PyFloat_AsDouble(values[1]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    if (values[2]) {
-      __pyx_v_curve = __pyx_PyInt_int(values[2]); if (unlikely((__pyx_v_curve == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[3]) {
-      __pyx_v_amp = __pyx_PyFloat_AsDouble(values[3]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[4]) {
-      __pyx_v_freq = __pyx_PyInt_int(values[4]); if (unlikely((__pyx_v_freq == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[5]) {
-      __pyx_v_slope = __pyx_PyFloat_AsDouble(values[5]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[6]) {
-      __pyx_v_peak = __pyx_PyFloat_AsDouble(values[6]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    if (values[7]) {
-      __pyx_v_mode = __pyx_PyInt_int(values[7]); if (unlikely((__pyx_v_mode == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-  } else {
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  8:
-      __pyx_v_mode = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 7)); if (unlikely((__pyx_v_mode == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  7:
-      __pyx_v_peak = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 6)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  6:
-      __pyx_v_slope = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 5)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  5:
-      __pyx_v_freq = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 4)); if (unlikely((__pyx_v_freq == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  4:
-      __pyx_v_amp = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  3:
-      __pyx_v_curve = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely((__pyx_v_curve == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  2:
-      __pyx_v_i = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __pyx_v_d = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("cdiff", 0, 2, 8, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("lib._utils.cdiff");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":147
- *     cdef float val
- * 
- *     if i==0: return 0.0             # <<<<<<<<<<<<<<
- * 
- *     if curve==-1:
- */
-  __pyx_1 = (__pyx_v_i == 0);
-  if (__pyx_1) {
-    __pyx_2 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 147; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_r = __pyx_2;
-    __pyx_2 = 0;
-    goto __pyx_L0;
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":149
- *     if i==0: return 0.0
- * 
- *     if curve==-1:             # <<<<<<<<<<<<<<
- *         return 0.0
- *     elif curve==0:
- */
-  switch (__pyx_v_curve) {
-    case -1:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":150
- * 
- *     if curve==-1:
- *         return 0.0             # <<<<<<<<<<<<<<
- *     elif curve==0:
- *         if d==0 and amp==0: return 0.0
- */
-    __pyx_2 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 150; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_r = __pyx_2;
-    __pyx_2 = 0;
-    goto __pyx_L0;
-    break;
-    case 0:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":152
- *         return 0.0
- *     elif curve==0:
- *         if d==0 and amp==0: return 0.0             # <<<<<<<<<<<<<<
- *         val = (d + amp) * i
- *     elif curve==1:
- */
-    __pyx_1 = (__pyx_v_d == 0);
-    if (__pyx_1) {
-      __pyx_1 = (__pyx_v_amp == 0);
-    }
-    if (__pyx_1) {
-      __pyx_2 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 152; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_r = __pyx_2;
-      __pyx_2 = 0;
-      goto __pyx_L0;
-      goto __pyx_L7;
-    }
-    __pyx_L7:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":153
- *     elif curve==0:
- *         if d==0 and amp==0: return 0.0
- *         val = (d + amp) * i             # <<<<<<<<<<<<<<
- *     elif curve==1:
- *         if d==0 and amp==0: return 0.0
- */
-    __pyx_v_val = ((__pyx_v_d + __pyx_v_amp) * __pyx_v_i);
-    break;
-    case 1:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":155
- *         val = (d + amp) * i
- *     elif curve==1:
- *         if d==0 and amp==0: return 0.0             # <<<<<<<<<<<<<<
- *         val = (d + amp) * i**2
- *     elif curve==2:
- */
-    __pyx_1 = (__pyx_v_d == 0);
-    if (__pyx_1) {
-      __pyx_1 = (__pyx_v_amp == 0);
-    }
-    if (__pyx_1) {
-      __pyx_2 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 155; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_r = __pyx_2;
-      __pyx_2 = 0;
-      goto __pyx_L0;
-      goto __pyx_L8;
-    }
-    __pyx_L8:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":156
- *     elif curve==1:
- *         if d==0 and amp==0: return 0.0
- *         val = (d + amp) * i**2             # <<<<<<<<<<<<<<
- *     elif curve==2:
- *         if d==0 and amp==0: return 0
- */
-    __pyx_v_val = ((__pyx_v_d + __pyx_v_amp) * pow(__pyx_v_i, 2));
-    break;
-    case 2:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":158
- *         val = (d + amp) * i**2
- *     elif curve==2:
- *         if d==0 and amp==0: return 0             # <<<<<<<<<<<<<<
- *         val = (d + amp) * (1 - (1-i)**2)
- *     elif curve==3:
- */
-    __pyx_1 = (__pyx_v_d == 0);
-    if (__pyx_1) {
-      __pyx_1 = (__pyx_v_amp == 0);
-    }
-    if (__pyx_1) {
-      Py_INCREF(__pyx_int_0);
-      __pyx_r = __pyx_int_0;
-      goto __pyx_L0;
-      goto __pyx_L9;
-    }
-    __pyx_L9:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":159
- *     elif curve==2:
- *         if d==0 and amp==0: return 0
- *         val = (d + amp) * (1 - (1-i)**2)             # <<<<<<<<<<<<<<
- *     elif curve==3:
- *         if d==0 and amp==0: return 0.0
- */
-    __pyx_v_val = ((__pyx_v_d + __pyx_v_amp) * (1 - pow((1 - __pyx_v_i), 2)));
-    break;
-    case 3:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":161
- *         val = (d + amp) * (1 - (1-i)**2)
- *     elif curve==3:
- *         if d==0 and amp==0: return 0.0             # <<<<<<<<<<<<<<
- *         val = (0.5*(d+amp)*(np.cos((i+1)*np.pi)+1))**slope
- *     elif curve==4:
- */
-    __pyx_1 = (__pyx_v_d == 0);
-    if (__pyx_1) {
-      __pyx_1 = (__pyx_v_amp == 0);
-    }
-    if (__pyx_1) {
-      __pyx_2 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 161; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_r = __pyx_2;
-      __pyx_2 = 0;
-      goto __pyx_L0;
-      goto __pyx_L10;
-    }
-    __pyx_L10:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":162
- *     elif curve==3:
- *         if d==0 and amp==0: return 0.0
- *         val = (0.5*(d+amp)*(np.cos((i+1)*np.pi)+1))**slope             # <<<<<<<<<<<<<<
- *     elif curve==4:
- *         if d==0: return 0.0
- */
-    __pyx_2 = PyFloat_FromDouble((0.5 * (__pyx_v_d + __pyx_v_amp))); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_4 = PyObject_GetAttr(__pyx_3, __pyx_kp_cos); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    __pyx_3 = PyFloat_FromDouble((__pyx_v_i + 1)); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_6 = PyObject_GetAttr(__pyx_5, __pyx_kp_pi); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    __pyx_t_1 = PyNumber_Multiply(__pyx_3, __pyx_6); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    Py_DECREF(__pyx_6); __pyx_6 = 0;
-    __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_5, 0, __pyx_t_1);
-    __pyx_t_1 = 0;
-    __pyx_3 = PyObject_Call(__pyx_4, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-    __pyx_t_1 = PyNumber_Add(__pyx_3, __pyx_int_1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    __pyx_t_2 = PyNumber_Multiply(__pyx_2, __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_6 = PyFloat_FromDouble(__pyx_v_slope); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_1 = PyNumber_Power(__pyx_t_2, __pyx_6, Py_None); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    Py_DECREF(__pyx_6); __pyx_6 = 0;
-    __pyx_7 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 162; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_v_val = __pyx_7;
-    break;
-    case 4:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":164
- *         val = (0.5*(d+amp)*(np.cos((i+1)*np.pi)+1))**slope
- *     elif curve==4:
- *         if d==0: return 0.0             # <<<<<<<<<<<<<<
- *         val = (np.sinh((2*i-1)*slope) + np.sinh(slope))/(2*np.sinh(slope))/d
- *     elif curve==5:
- */
-    __pyx_1 = (__pyx_v_d == 0);
-    if (__pyx_1) {
-      __pyx_4 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 164; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_r = __pyx_4;
-      __pyx_4 = 0;
-      goto __pyx_L0;
-      goto __pyx_L11;
-    }
-    __pyx_L11:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":165
- *     elif curve==4:
- *         if d==0: return 0.0
- *         val = (np.sinh((2*i-1)*slope) + np.sinh(slope))/(2*np.sinh(slope))/d             # <<<<<<<<<<<<<<
- *     elif curve==5:
- *         if d==0: return 0.0
- */
-    __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyObject_GetAttr(__pyx_5, __pyx_kp_sinh); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    __pyx_2 = PyFloat_FromDouble((((2 * __pyx_v_i) - 1) * __pyx_v_slope)); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_6 = PyTuple_New(1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_6, 0, __pyx_2);
-    __pyx_2 = 0;
-    __pyx_4 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_6), NULL); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
-    __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_2 = PyObject_GetAttr(__pyx_5, __pyx_kp_sinh); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    __pyx_3 = PyFloat_FromDouble(__pyx_v_slope); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_6 = PyTuple_New(1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_6, 0, __pyx_3);
-    __pyx_3 = 0;
-    __pyx_5 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_6), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
-    __pyx_t_1 = PyNumber_Add(__pyx_4, __pyx_5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_2 = PyObject_GetAttr(__pyx_3, __pyx_kp_sinh); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    __pyx_6 = PyFloat_FromDouble(__pyx_v_slope); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_4 = PyTuple_New(1); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_4, 0, __pyx_6);
-    __pyx_6 = 0;
-    __pyx_5 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_4), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(((PyObject *)__pyx_4)); __pyx_4 = 0;
-    __pyx_t_2 = PyNumber_Multiply(__pyx_int_2, __pyx_5); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    __pyx_t_3 = __Pyx_PyNumber_Divide(__pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    Py_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_3 = PyFloat_FromDouble(__pyx_v_d); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_2 = __Pyx_PyNumber_Divide(__pyx_t_3, __pyx_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    __pyx_7 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 165; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_v_val = __pyx_7;
-    break;
-    case 5:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":167
- *         val = (np.sinh((2*i-1)*slope) + np.sinh(slope))/(2*np.sinh(slope))/d
- *     elif curve==5:
- *         if d==0: return 0.0             # <<<<<<<<<<<<<<
- *         val = (np.tanh((2*i-1)*slope) + np.tanh(slope))/(2*np.tanh(slope))/d
- *     elif curve==6:
- */
-    __pyx_1 = (__pyx_v_d == 0);
-    if (__pyx_1) {
-      __pyx_6 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 167; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_r = __pyx_6;
-      __pyx_6 = 0;
-      goto __pyx_L0;
-      goto __pyx_L12;
-    }
-    __pyx_L12:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":168
- *     elif curve==5:
- *         if d==0: return 0.0
- *         val = (np.tanh((2*i-1)*slope) + np.tanh(slope))/(2*np.tanh(slope))/d             # <<<<<<<<<<<<<<
- *     elif curve==6:
- *         if d==0 and amp==0: return 0.0
- */
-    __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_4 = PyObject_GetAttr(__pyx_2, __pyx_kp_tanh); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    __pyx_5 = PyFloat_FromDouble((((2 * __pyx_v_i) - 1) * __pyx_v_slope)); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_3, 0, __pyx_5);
-    __pyx_5 = 0;
-    __pyx_6 = PyObject_Call(__pyx_4, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-    __pyx_2 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_5 = PyObject_GetAttr(__pyx_2, __pyx_kp_tanh); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    __pyx_4 = PyFloat_FromDouble(__pyx_v_slope); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_3, 0, __pyx_4);
-    __pyx_4 = 0;
-    __pyx_2 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-    __pyx_t_2 = PyNumber_Add(__pyx_6, __pyx_2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_6); __pyx_6 = 0;
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_5 = PyObject_GetAttr(__pyx_4, __pyx_kp_tanh); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    __pyx_3 = PyFloat_FromDouble(__pyx_v_slope); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_6 = PyTuple_New(1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_6, 0, __pyx_3);
-    __pyx_3 = 0;
-    __pyx_2 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_6), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
-    __pyx_t_3 = PyNumber_Multiply(__pyx_int_2, __pyx_2); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    __pyx_t_1 = __Pyx_PyNumber_Divide(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    Py_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_4 = PyFloat_FromDouble(__pyx_v_d); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_3 = __Pyx_PyNumber_Divide(__pyx_t_1, __pyx_4); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    __pyx_7 = __pyx_PyFloat_AsDouble(__pyx_t_3); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 168; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    __pyx_v_val = __pyx_7;
-    break;
-    case 6:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":170
- *         val = (np.tanh((2*i-1)*slope) + np.tanh(slope))/(2*np.tanh(slope))/d
- *     elif curve==6:
- *         if d==0 and amp==0: return 0.0             # <<<<<<<<<<<<<<
- *         val = (d+amp) * ((1-np.exp(-slope*i))/(1-np.exp(-slope)))
- *     elif curve==7:
- */
-    __pyx_1 = (__pyx_v_d == 0);
-    if (__pyx_1) {
-      __pyx_1 = (__pyx_v_amp == 0);
-    }
-    if (__pyx_1) {
-      __pyx_3 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 170; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_r = __pyx_3;
-      __pyx_3 = 0;
-      goto __pyx_L0;
-      goto __pyx_L13;
-    }
-    __pyx_L13:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":171
- *     elif curve==6:
- *         if d==0 and amp==0: return 0.0
- *         val = (d+amp) * ((1-np.exp(-slope*i))/(1-np.exp(-slope)))             # <<<<<<<<<<<<<<
- *     elif curve==7:
- *         if freq<=0:
- */
-    __pyx_5 = PyFloat_FromDouble((__pyx_v_d + __pyx_v_amp)); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_2 = PyObject_GetAttr(__pyx_6, __pyx_kp_exp); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_6); __pyx_6 = 0;
-    __pyx_4 = PyFloat_FromDouble(((-__pyx_v_slope) * __pyx_v_i)); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_3, 0, __pyx_4);
-    __pyx_4 = 0;
-    __pyx_6 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-    __pyx_t_3 = PyNumber_Subtract(__pyx_int_1, __pyx_6); if (unlikely(!__pyx_t_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_6); __pyx_6 = 0;
-    __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_2 = PyObject_GetAttr(__pyx_4, __pyx_kp_exp); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    __pyx_3 = PyFloat_FromDouble((-__pyx_v_slope)); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_6 = PyTuple_New(1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_6, 0, __pyx_3);
-    __pyx_3 = 0;
-    __pyx_4 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_6), NULL); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
-    __pyx_t_1 = PyNumber_Subtract(__pyx_int_1, __pyx_4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    __pyx_t_2 = __Pyx_PyNumber_Divide(__pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-    Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PyNumber_Multiply(__pyx_5, __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    Py_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_7 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 171; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_v_val = __pyx_7;
-    break;
-    case 7:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":173
- *         val = (d+amp) * ((1-np.exp(-slope*i))/(1-np.exp(-slope)))
- *     elif curve==7:
- *         if freq<=0:             # <<<<<<<<<<<<<<
- *             raise ValueError('Frequency much be positive non-zero')
- *         if amp==0: return 0.0
- */
-    __pyx_1 = (__pyx_v_freq <= 0);
-    if (__pyx_1) {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":174
- *     elif curve==7:
- *         if freq<=0:
- *             raise ValueError('Frequency much be positive non-zero')             # <<<<<<<<<<<<<<
- *         if amp==0: return 0.0
- *         val = (0.5*amp*(np.cos(2*freq*i*np.pi + np.pi)+1))**slope + i*d
- */
-      __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_INCREF(__pyx_kp_25);
-      PyTuple_SET_ITEM(__pyx_3, 0, __pyx_kp_25);
-      __pyx_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-      __Pyx_Raise(__pyx_2, 0, 0);
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      goto __pyx_L14;
-    }
-    __pyx_L14:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":175
- *         if freq<=0:
- *             raise ValueError('Frequency much be positive non-zero')
- *         if amp==0: return 0.0             # <<<<<<<<<<<<<<
- *         val = (0.5*amp*(np.cos(2*freq*i*np.pi + np.pi)+1))**slope + i*d
- *     elif curve==8:
- */
-    __pyx_1 = (__pyx_v_amp == 0);
-    if (__pyx_1) {
-      __pyx_6 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 175; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_r = __pyx_6;
-      __pyx_6 = 0;
-      goto __pyx_L0;
-      goto __pyx_L15;
-    }
-    __pyx_L15:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":176
- *             raise ValueError('Frequency much be positive non-zero')
- *         if amp==0: return 0.0
- *         val = (0.5*amp*(np.cos(2*freq*i*np.pi + np.pi)+1))**slope + i*d             # <<<<<<<<<<<<<<
- *     elif curve==8:
- *         if freq<=0:
- */
-    __pyx_4 = PyFloat_FromDouble((0.5 * __pyx_v_amp)); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyObject_GetAttr(__pyx_5, __pyx_kp_cos); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    __pyx_2 = PyFloat_FromDouble(((2 * __pyx_v_freq) * __pyx_v_i)); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_5 = PyObject_GetAttr(__pyx_6, __pyx_kp_pi); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_6); __pyx_6 = 0;
-    __pyx_t_1 = PyNumber_Multiply(__pyx_2, __pyx_5); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_2 = PyObject_GetAttr(__pyx_6, __pyx_kp_pi); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_6); __pyx_6 = 0;
-    __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_5, 0, __pyx_t_2);
-    __pyx_t_2 = 0;
-    __pyx_6 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-    __pyx_t_2 = PyNumber_Add(__pyx_6, __pyx_int_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_6); __pyx_6 = 0;
-    __pyx_t_1 = PyNumber_Multiply(__pyx_4, __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    Py_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_2 = PyFloat_FromDouble(__pyx_v_slope); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_2 = PyNumber_Power(__pyx_t_1, __pyx_2, Py_None); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    __pyx_3 = PyFloat_FromDouble((__pyx_v_i * __pyx_v_d)); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_1 = PyNumber_Add(__pyx_t_2, __pyx_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    __pyx_7 = __pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 176; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_v_val = __pyx_7;
-    break;
-    case 8:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":178
- *         val = (0.5*amp*(np.cos(2*freq*i*np.pi + np.pi)+1))**slope + i*d
- *     elif curve==8:
- *         if freq<=0:             # <<<<<<<<<<<<<<
- *             raise ValueError('Frequency must be positive non-zero')
- *         if amp==0: return 0.0
- */
-    __pyx_1 = (__pyx_v_freq <= 0);
-    if (__pyx_1) {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":179
- *     elif curve==8:
- *         if freq<=0:
- *             raise ValueError('Frequency must be positive non-zero')             # <<<<<<<<<<<<<<
- *         if amp==0: return 0.0
- *         val = amp*np.sin(i*np.pi*2*freq) + i*d
- */
-      __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_INCREF(__pyx_kp_26);
-      PyTuple_SET_ITEM(__pyx_5, 0, __pyx_kp_26);
-      __pyx_6 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-      __Pyx_Raise(__pyx_6, 0, 0);
-      Py_DECREF(__pyx_6); __pyx_6 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      goto __pyx_L16;
-    }
-    __pyx_L16:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":180
- *         if freq<=0:
- *             raise ValueError('Frequency must be positive non-zero')
- *         if amp==0: return 0.0             # <<<<<<<<<<<<<<
- *         val = amp*np.sin(i*np.pi*2*freq) + i*d
- *         if np.sign(val**slope) <> np.sign(val):
- */
-    __pyx_1 = (__pyx_v_amp == 0);
-    if (__pyx_1) {
-      __pyx_4 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 180; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_r = __pyx_4;
-      __pyx_4 = 0;
-      goto __pyx_L0;
-      goto __pyx_L17;
-    }
-    __pyx_L17:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":181
- *             raise ValueError('Frequency must be positive non-zero')
- *         if amp==0: return 0.0
- *         val = amp*np.sin(i*np.pi*2*freq) + i*d             # <<<<<<<<<<<<<<
- *         if np.sign(val**slope) <> np.sign(val):
- *             val = val**slope * np.sign(val)
- */
-    __pyx_2 = PyFloat_FromDouble(__pyx_v_amp); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_5 = PyObject_GetAttr(__pyx_3, __pyx_kp_sin); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    __pyx_6 = PyFloat_FromDouble(__pyx_v_i); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyObject_GetAttr(__pyx_4, __pyx_kp_pi); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    __pyx_t_1 = PyNumber_Multiply(__pyx_6, __pyx_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_6); __pyx_6 = 0;
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    __pyx_t_2 = PyNumber_Multiply(__pyx_t_1, __pyx_int_2); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_4 = PyInt_FromLong(__pyx_v_freq); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_1 = PyNumber_Multiply(__pyx_t_2, __pyx_4); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    __pyx_6 = PyTuple_New(1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_6, 0, __pyx_t_1);
-    __pyx_t_1 = 0;
-    __pyx_3 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_6), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
-    __pyx_t_1 = PyNumber_Multiply(__pyx_2, __pyx_3); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    __pyx_4 = PyFloat_FromDouble((__pyx_v_i * __pyx_v_d)); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_t_2 = PyNumber_Add(__pyx_t_1, __pyx_4); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    __pyx_7 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 181; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_v_val = __pyx_7;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":182
- *         if amp==0: return 0.0
- *         val = amp*np.sin(i*np.pi*2*freq) + i*d
- *         if np.sign(val**slope) <> np.sign(val):             # <<<<<<<<<<<<<<
- *             val = val**slope * np.sign(val)
- *         else:
- */
-    __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_6 = PyObject_GetAttr(__pyx_5, __pyx_kp_sign); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    __pyx_2 = PyFloat_FromDouble(pow(__pyx_v_val, __pyx_v_slope)); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_3, 0, __pyx_2);
-    __pyx_2 = 0;
-    __pyx_4 = PyObject_Call(__pyx_6, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_6); __pyx_6 = 0;
-    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-    __pyx_5 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_2 = PyObject_GetAttr(__pyx_5, __pyx_kp_sign); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    __pyx_6 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_3, 0, __pyx_6);
-    __pyx_6 = 0;
-    __pyx_5 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-    __pyx_6 = PyObject_RichCompare(__pyx_4, __pyx_5, Py_NE); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    __pyx_1 = __Pyx_PyObject_IsTrue(__pyx_6); if (unlikely(__pyx_1 < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 182; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_6); __pyx_6 = 0;
-    if (__pyx_1) {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":183
- *         val = amp*np.sin(i*np.pi*2*freq) + i*d
- *         if np.sign(val**slope) <> np.sign(val):
- *             val = val**slope * np.sign(val)             # <<<<<<<<<<<<<<
- *         else:
- *             val = val**slope
- */
-      __pyx_2 = PyFloat_FromDouble(pow(__pyx_v_val, __pyx_v_slope)); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_3 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_4 = PyObject_GetAttr(__pyx_3, __pyx_kp_sign); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-      __pyx_5 = PyFloat_FromDouble(__pyx_v_val); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_6 = PyTuple_New(1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      PyTuple_SET_ITEM(__pyx_6, 0, __pyx_5);
-      __pyx_5 = 0;
-      __pyx_3 = PyObject_Call(__pyx_4, ((PyObject *)__pyx_6), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_4); __pyx_4 = 0;
-      Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
-      __pyx_t_2 = PyNumber_Multiply(__pyx_2, __pyx_3); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-      __pyx_7 = __pyx_PyFloat_AsDouble(__pyx_t_2); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 183; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_v_val = __pyx_7;
-      goto __pyx_L18;
-    }
-    /*else*/ {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":185
- *             val = val**slope * np.sign(val)
- *         else:
- *             val = val**slope             # <<<<<<<<<<<<<<
- *     elif curve==9:
- *         if peak <= 0.0 or peak >= 1.0:
- */
-      __pyx_v_val = pow(__pyx_v_val, __pyx_v_slope);
-    }
-    __pyx_L18:;
-    break;
-    case 9:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":187
- *             val = val**slope
- *     elif curve==9:
- *         if peak <= 0.0 or peak >= 1.0:             # <<<<<<<<<<<<<<
- *             raise ValueError('peak need to be 0-1')
- *         if amp==0: return 0.0
- */
-    __pyx_1 = (__pyx_v_peak <= 0.0);
-    if (!__pyx_1) {
-      __pyx_1 = (__pyx_v_peak >= 1.0);
-    }
-    if (__pyx_1) {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":188
- *     elif curve==9:
- *         if peak <= 0.0 or peak >= 1.0:
- *             raise ValueError('peak need to be 0-1')             # <<<<<<<<<<<<<<
- *         if amp==0: return 0.0
- *         if  i <= peak: val = i * (amp/peak)
- */
-      __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_INCREF(__pyx_kp_27);
-      PyTuple_SET_ITEM(__pyx_5, 0, __pyx_kp_27);
-      __pyx_4 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-      __Pyx_Raise(__pyx_4, 0, 0);
-      Py_DECREF(__pyx_4); __pyx_4 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 188; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      goto __pyx_L19;
-    }
-    __pyx_L19:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":189
- *         if peak <= 0.0 or peak >= 1.0:
- *             raise ValueError('peak need to be 0-1')
- *         if amp==0: return 0.0             # <<<<<<<<<<<<<<
- *         if  i <= peak: val = i * (amp/peak)
- *         elif i > peak: val = (1-i)*(amp/(1-peak))
- */
-    __pyx_1 = (__pyx_v_amp == 0);
-    if (__pyx_1) {
-      __pyx_6 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 189; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_r = __pyx_6;
-      __pyx_6 = 0;
-      goto __pyx_L0;
-      goto __pyx_L20;
-    }
-    __pyx_L20:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":190
- *             raise ValueError('peak need to be 0-1')
- *         if amp==0: return 0.0
- *         if  i <= peak: val = i * (amp/peak)             # <<<<<<<<<<<<<<
- *         elif i > peak: val = (1-i)*(amp/(1-peak))
- *         val += i*d
- */
-    __pyx_1 = (__pyx_v_i <= __pyx_v_peak);
-    if (__pyx_1) {
-      __pyx_v_val = (__pyx_v_i * (__pyx_v_amp / __pyx_v_peak));
-      goto __pyx_L21;
-    }
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":191
- *         if amp==0: return 0.0
- *         if  i <= peak: val = i * (amp/peak)
- *         elif i > peak: val = (1-i)*(amp/(1-peak))             # <<<<<<<<<<<<<<
- *         val += i*d
- *     elif curve==10:
- */
-    __pyx_1 = (__pyx_v_i > __pyx_v_peak);
-    if (__pyx_1) {
-      __pyx_v_val = ((1 - __pyx_v_i) * (__pyx_v_amp / (1 - __pyx_v_peak)));
-      goto __pyx_L21;
-    }
-    __pyx_L21:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":192
- *         if  i <= peak: val = i * (amp/peak)
- *         elif i > peak: val = (1-i)*(amp/(1-peak))
- *         val += i*d             # <<<<<<<<<<<<<<
- *     elif curve==10:
- *         if peak <= 0.0 or peak >= 1.0:
- */
-    __pyx_v_val += (__pyx_v_i * __pyx_v_d);
-    break;
-    case 10:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":194
- *         val += i*d
- *     elif curve==10:
- *         if peak <= 0.0 or peak >= 1.0:             # <<<<<<<<<<<<<<
- *             raise ValueError('peak need to be 0-1')
- *         if mode < 0 or mode > 3:
- */
-    __pyx_1 = (__pyx_v_peak <= 0.0);
-    if (!__pyx_1) {
-      __pyx_1 = (__pyx_v_peak >= 1.0);
-    }
-    if (__pyx_1) {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":195
- *     elif curve==10:
- *         if peak <= 0.0 or peak >= 1.0:
- *             raise ValueError('peak need to be 0-1')             # <<<<<<<<<<<<<<
- *         if mode < 0 or mode > 3:
- *             raise ValueError('invalid mode')
- */
-      __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_INCREF(__pyx_kp_28);
-      PyTuple_SET_ITEM(__pyx_2, 0, __pyx_kp_28);
-      __pyx_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-      __Pyx_Raise(__pyx_3, 0, 0);
-      Py_DECREF(__pyx_3); __pyx_3 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 195; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      goto __pyx_L22;
-    }
-    __pyx_L22:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":196
- *         if peak <= 0.0 or peak >= 1.0:
- *             raise ValueError('peak need to be 0-1')
- *         if mode < 0 or mode > 3:             # <<<<<<<<<<<<<<
- *             raise ValueError('invalid mode')
- *         if amp==0: return 0.0
- */
-    __pyx_1 = (__pyx_v_mode < 0);
-    if (!__pyx_1) {
-      __pyx_1 = (__pyx_v_mode > 3);
-    }
-    if (__pyx_1) {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":197
- *             raise ValueError('peak need to be 0-1')
- *         if mode < 0 or mode > 3:
- *             raise ValueError('invalid mode')             # <<<<<<<<<<<<<<
- *         if amp==0: return 0.0
- *         elif mode==0:
- */
-      __pyx_5 = PyTuple_New(1); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 197; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_INCREF(__pyx_kp_29);
-      PyTuple_SET_ITEM(__pyx_5, 0, __pyx_kp_29);
-      __pyx_4 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_5), NULL); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 197; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(((PyObject *)__pyx_5)); __pyx_5 = 0;
-      __Pyx_Raise(__pyx_4, 0, 0);
-      Py_DECREF(__pyx_4); __pyx_4 = 0;
-      {__pyx_filename = __pyx_f[0]; __pyx_lineno = 197; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      goto __pyx_L23;
-    }
-    __pyx_L23:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":198
- *         if mode < 0 or mode > 3:
- *             raise ValueError('invalid mode')
- *         if amp==0: return 0.0             # <<<<<<<<<<<<<<
- *         elif mode==0:
- *             if  i <= peak: val = amp * (1-(1-(i/peak))**2)
- */
-    __pyx_1 = (__pyx_v_amp == 0);
-    if (__pyx_1) {
-      __pyx_6 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 198; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_r = __pyx_6;
-      __pyx_6 = 0;
-      goto __pyx_L0;
-      goto __pyx_L24;
-    }
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":199
- *             raise ValueError('invalid mode')
- *         if amp==0: return 0.0
- *         elif mode==0:             # <<<<<<<<<<<<<<
- *             if  i <= peak: val = amp * (1-(1-(i/peak))**2)
- *             elif i > peak: val = amp * (1-(1-((1-i)/(1-peak)))**2)
- */
-    __pyx_1 = (__pyx_v_mode == 0);
-    if (__pyx_1) {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":200
- *         if amp==0: return 0.0
- *         elif mode==0:
- *             if  i <= peak: val = amp * (1-(1-(i/peak))**2)             # <<<<<<<<<<<<<<
- *             elif i > peak: val = amp * (1-(1-((1-i)/(1-peak)))**2)
- *         elif mode==1:
- */
-      __pyx_1 = (__pyx_v_i <= __pyx_v_peak);
-      if (__pyx_1) {
-        __pyx_v_val = (__pyx_v_amp * (1 - pow((1 - (__pyx_v_i / __pyx_v_peak)), 2)));
-        goto __pyx_L25;
-      }
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":201
- *         elif mode==0:
- *             if  i <= peak: val = amp * (1-(1-(i/peak))**2)
- *             elif i > peak: val = amp * (1-(1-((1-i)/(1-peak)))**2)             # <<<<<<<<<<<<<<
- *         elif mode==1:
- *             if  i <= peak: val = amp * (1-(1-(i/peak))**2)
- */
-      __pyx_1 = (__pyx_v_i > __pyx_v_peak);
-      if (__pyx_1) {
-        __pyx_v_val = (__pyx_v_amp * (1 - pow((1 - ((1 - __pyx_v_i) / (1 - __pyx_v_peak))), 2)));
-        goto __pyx_L25;
-      }
-      __pyx_L25:;
-      goto __pyx_L24;
-    }
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":202
- *             if  i <= peak: val = amp * (1-(1-(i/peak))**2)
- *             elif i > peak: val = amp * (1-(1-((1-i)/(1-peak)))**2)
- *         elif mode==1:             # <<<<<<<<<<<<<<
- *             if  i <= peak: val = amp * (1-(1-(i/peak))**2)
- *             elif i > peak: val = amp * ((1-i)/(1-peak))**2
- */
-    __pyx_1 = (__pyx_v_mode == 1);
-    if (__pyx_1) {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":203
- *             elif i > peak: val = amp * (1-(1-((1-i)/(1-peak)))**2)
- *         elif mode==1:
- *             if  i <= peak: val = amp * (1-(1-(i/peak))**2)             # <<<<<<<<<<<<<<
- *             elif i > peak: val = amp * ((1-i)/(1-peak))**2
- *         elif mode==2:
- */
-      __pyx_1 = (__pyx_v_i <= __pyx_v_peak);
-      if (__pyx_1) {
-        __pyx_v_val = (__pyx_v_amp * (1 - pow((1 - (__pyx_v_i / __pyx_v_peak)), 2)));
-        goto __pyx_L26;
-      }
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":204
- *         elif mode==1:
- *             if  i <= peak: val = amp * (1-(1-(i/peak))**2)
- *             elif i > peak: val = amp * ((1-i)/(1-peak))**2             # <<<<<<<<<<<<<<
- *         elif mode==2:
- *             if  i <= peak: val = amp * (i/peak)**2
- */
-      __pyx_1 = (__pyx_v_i > __pyx_v_peak);
-      if (__pyx_1) {
-        __pyx_v_val = (__pyx_v_amp * pow(((1 - __pyx_v_i) / (1 - __pyx_v_peak)), 2));
-        goto __pyx_L26;
-      }
-      __pyx_L26:;
-      goto __pyx_L24;
-    }
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":205
- *             if  i <= peak: val = amp * (1-(1-(i/peak))**2)
- *             elif i > peak: val = amp * ((1-i)/(1-peak))**2
- *         elif mode==2:             # <<<<<<<<<<<<<<
- *             if  i <= peak: val = amp * (i/peak)**2
- *             elif i > peak: val = amp * (1-(1-((1-i)/(1-peak)))**2)
- */
-    __pyx_1 = (__pyx_v_mode == 2);
-    if (__pyx_1) {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":206
- *             elif i > peak: val = amp * ((1-i)/(1-peak))**2
- *         elif mode==2:
- *             if  i <= peak: val = amp * (i/peak)**2             # <<<<<<<<<<<<<<
- *             elif i > peak: val = amp * (1-(1-((1-i)/(1-peak)))**2)
- *         elif mode==3:
- */
-      __pyx_1 = (__pyx_v_i <= __pyx_v_peak);
-      if (__pyx_1) {
-        __pyx_v_val = (__pyx_v_amp * pow((__pyx_v_i / __pyx_v_peak), 2));
-        goto __pyx_L27;
-      }
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":207
- *         elif mode==2:
- *             if  i <= peak: val = amp * (i/peak)**2
- *             elif i > peak: val = amp * (1-(1-((1-i)/(1-peak)))**2)             # <<<<<<<<<<<<<<
- *         elif mode==3:
- *             if  i <= peak: val = amp * (i/peak)**2
- */
-      __pyx_1 = (__pyx_v_i > __pyx_v_peak);
-      if (__pyx_1) {
-        __pyx_v_val = (__pyx_v_amp * (1 - pow((1 - ((1 - __pyx_v_i) / (1 - __pyx_v_peak))), 2)));
-        goto __pyx_L27;
-      }
-      __pyx_L27:;
-      goto __pyx_L24;
-    }
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":208
- *             if  i <= peak: val = amp * (i/peak)**2
- *             elif i > peak: val = amp * (1-(1-((1-i)/(1-peak)))**2)
- *         elif mode==3:             # <<<<<<<<<<<<<<
- *             if  i <= peak: val = amp * (i/peak)**2
- *             elif i > peak: val = amp * ((1-i)/(1-peak))**2
- */
-    __pyx_1 = (__pyx_v_mode == 3);
-    if (__pyx_1) {
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":209
- *             elif i > peak: val = amp * (1-(1-((1-i)/(1-peak)))**2)
- *         elif mode==3:
- *             if  i <= peak: val = amp * (i/peak)**2             # <<<<<<<<<<<<<<
- *             elif i > peak: val = amp * ((1-i)/(1-peak))**2
- *         val += i*d
- */
-      __pyx_1 = (__pyx_v_i <= __pyx_v_peak);
-      if (__pyx_1) {
-        __pyx_v_val = (__pyx_v_amp * pow((__pyx_v_i / __pyx_v_peak), 2));
-        goto __pyx_L28;
-      }
-
-      /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":210
- *         elif mode==3:
- *             if  i <= peak: val = amp * (i/peak)**2
- *             elif i > peak: val = amp * ((1-i)/(1-peak))**2             # <<<<<<<<<<<<<<
- *         val += i*d
- *     else:
- */
-      __pyx_1 = (__pyx_v_i > __pyx_v_peak);
-      if (__pyx_1) {
-        __pyx_v_val = (__pyx_v_amp * pow(((1 - __pyx_v_i) / (1 - __pyx_v_peak)), 2));
-        goto __pyx_L28;
-      }
-      __pyx_L28:;
-      goto __pyx_L24;
-    }
-    __pyx_L24:;
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":211
- *             if  i <= peak: val = amp * (i/peak)**2
- *             elif i > peak: val = amp * ((1-i)/(1-peak))**2
- *         val += i*d             # <<<<<<<<<<<<<<
- *     else:
- *         raise ValueError('invalid curve')
- */
-    __pyx_v_val += (__pyx_v_i * __pyx_v_d);
-    break;
-    default:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":213
- *         val += i*d
- *     else:
- *         raise ValueError('invalid curve')             # <<<<<<<<<<<<<<
- * 
- *     return val - i*d
- */
-    __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_INCREF(__pyx_kp_30);
-    PyTuple_SET_ITEM(__pyx_2, 0, __pyx_kp_30);
-    __pyx_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-    __Pyx_Raise(__pyx_3, 0, 0);
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 213; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    break;
-  }
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":215
- *         raise ValueError('invalid curve')
- * 
- *     return val - i*d             # <<<<<<<<<<<<<<
- * 
- * """
- */
-  __pyx_5 = PyFloat_FromDouble((__pyx_v_val - (__pyx_v_i * __pyx_v_d))); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 215; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_r = __pyx_5;
-  __pyx_5 = 0;
-  goto __pyx_L0;
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_4);
-  Py_XDECREF(__pyx_5);
-  Py_XDECREF(__pyx_6);
-  __Pyx_AddTraceback("lib._utils.cdiff");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  return __pyx_r;
-}
-
-/* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":225
- *          1 - cos
- * """
- * def pblend(float s, float e, float i, int curve=0):             # <<<<<<<<<<<<<<
- *     if i==0: return s
- *     elif i==1: return e
- */
-
-static PyObject *__pyx_pf_3lib_6_utils_pblend(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
-static PyObject *__pyx_pf_3lib_6_utils_pblend(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
-  float __pyx_v_s;
-  float __pyx_v_e;
-  float __pyx_v_i;
-  int __pyx_v_curve;
-  PyObject *__pyx_r;
-  int __pyx_1;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  PyObject *__pyx_4 = 0;
-  PyObject *__pyx_5 = 0;
-  PyObject *__pyx_6 = 0;
-  PyObject *__pyx_7 = 0;
-  PyObject *__pyx_t_1 = NULL;
-  PyObject *__pyx_t_2 = NULL;
-  static PyObject **__pyx_pyargnames[] = {&__pyx_kp_s,&__pyx_kp_e,&__pyx_kp_i,&__pyx_kp_curve,0};
-  __pyx_self = __pyx_self;
-  __pyx_v_curve = 0;
-  if (unlikely(__pyx_kwds)) {
-    PyObject* values[4] = {0,0,0,0};
-    Py_ssize_t kw_args = PyDict_Size(__pyx_kwds);
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  4: values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
-      case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
-      case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
-      case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
-      case  0: break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  0:
-      values[0] = PyDict_GetItem(__pyx_kwds, __pyx_kp_s);
-      if (likely(values[0])) kw_args--;
-      else goto __pyx_L5_argtuple_error;
-      case  1:
-      values[1] = PyDict_GetItem(__pyx_kwds, __pyx_kp_e);
-      if (likely(values[1])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("pblend", 0, 3, 4, 1); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-      case  2:
-      values[2] = PyDict_GetItem(__pyx_kwds, __pyx_kp_i);
-      if (likely(values[2])) kw_args--;
-      else {
-        __Pyx_RaiseArgtupleInvalid("pblend", 0, 3, 4, 2); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      }
-    }
-    if (unlikely(kw_args > 0)) {
-      if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, PyTuple_GET_SIZE(__pyx_args), "pblend") < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-    __pyx_v_s = __pyx_PyFloat_AsDouble(values[0]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_e = __pyx_PyFloat_AsDouble(values[1]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    __pyx_v_i = __pyx_PyFloat_AsDouble(values[2]); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    if (values[3]) {
-      __pyx_v_curve = __pyx_PyInt_int(values[3]); if (unlikely((__pyx_v_curve == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-    }
-  } else {
-    switch (PyTuple_GET_SIZE(__pyx_args)) {
-      case  4:
-      __pyx_v_curve = __pyx_PyInt_int(PyTuple_GET_ITEM(__pyx_args, 3)); if (unlikely((__pyx_v_curve == (int)-1) && PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      case  3:
-      __pyx_v_i = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 2)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __pyx_v_e = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 1)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      __pyx_v_s = __pyx_PyFloat_AsDouble(PyTuple_GET_ITEM(__pyx_args, 0)); if (unlikely(PyErr_Occurred())) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-      break;
-      default: goto __pyx_L5_argtuple_error;
-    }
-  }
-  goto __pyx_L4_argument_unpacking_done;
-  __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("pblend", 0, 3, 4, PyTuple_GET_SIZE(__pyx_args)); {__pyx_filename = __pyx_f[0]; __pyx_lineno = 225; __pyx_clineno = __LINE__; goto __pyx_L3_error;}
-  __pyx_L3_error:;
-  __Pyx_AddTraceback("lib._utils.pblend");
-  return NULL;
-  __pyx_L4_argument_unpacking_done:;
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":226
- * """
- * def pblend(float s, float e, float i, int curve=0):
- *     if i==0: return s             # <<<<<<<<<<<<<<
- *     elif i==1: return e
- * 
- */
-  __pyx_1 = (__pyx_v_i == 0);
-  if (__pyx_1) {
-    __pyx_2 = PyFloat_FromDouble(__pyx_v_s); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 226; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_r = __pyx_2;
-    __pyx_2 = 0;
-    goto __pyx_L0;
-    goto __pyx_L6;
-  }
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":227
- * def pblend(float s, float e, float i, int curve=0):
- *     if i==0: return s
- *     elif i==1: return e             # <<<<<<<<<<<<<<
- * 
- *     if s==e: return s
- */
-  __pyx_1 = (__pyx_v_i == 1);
-  if (__pyx_1) {
-    __pyx_2 = PyFloat_FromDouble(__pyx_v_e); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 227; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_r = __pyx_2;
-    __pyx_2 = 0;
-    goto __pyx_L0;
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":229
- *     elif i==1: return e
- * 
- *     if s==e: return s             # <<<<<<<<<<<<<<
- * 
- *     if curve==0:
- */
-  __pyx_1 = (__pyx_v_s == __pyx_v_e);
-  if (__pyx_1) {
-    __pyx_2 = PyFloat_FromDouble(__pyx_v_s); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 229; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_r = __pyx_2;
-    __pyx_2 = 0;
-    goto __pyx_L0;
-    goto __pyx_L7;
-  }
-  __pyx_L7:;
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":231
- *     if s==e: return s
- * 
- *     if curve==0:             # <<<<<<<<<<<<<<
- *         return s + ((e-s) * i)
- *     elif curve==1:
- */
-  switch (__pyx_v_curve) {
-    case 0:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":232
- * 
- *     if curve==0:
- *         return s + ((e-s) * i)             # <<<<<<<<<<<<<<
- *     elif curve==1:
- *         return s + (0.5*(e-s)*(np.cos((i+1)*np.pi)+1))
- */
-    __pyx_2 = PyFloat_FromDouble((__pyx_v_s + ((__pyx_v_e - __pyx_v_s) * __pyx_v_i))); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 232; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_r = __pyx_2;
-    __pyx_2 = 0;
-    goto __pyx_L0;
-    break;
-    case 1:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":234
- *         return s + ((e-s) * i)
- *     elif curve==1:
- *         return s + (0.5*(e-s)*(np.cos((i+1)*np.pi)+1))             # <<<<<<<<<<<<<<
- *     else:
- *         raise ValueError('invalid curve')
- */
-    __pyx_2 = PyFloat_FromDouble(__pyx_v_s); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_3 = PyFloat_FromDouble((0.5 * (__pyx_v_e - __pyx_v_s))); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_4 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_5 = PyObject_GetAttr(__pyx_4, __pyx_kp_cos); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    __pyx_4 = PyFloat_FromDouble((__pyx_v_i + 1)); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_6 = __Pyx_GetName(__pyx_m, __pyx_kp_np); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_7 = PyObject_GetAttr(__pyx_6, __pyx_kp_pi); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_6); __pyx_6 = 0;
-    __pyx_t_1 = PyNumber_Multiply(__pyx_4, __pyx_7); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    Py_DECREF(__pyx_7); __pyx_7 = 0;
-    __pyx_6 = PyTuple_New(1); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyTuple_SET_ITEM(__pyx_6, 0, __pyx_t_1);
-    __pyx_t_1 = 0;
-    __pyx_4 = PyObject_Call(__pyx_5, ((PyObject *)__pyx_6), NULL); if (unlikely(!__pyx_4)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    Py_DECREF(((PyObject *)__pyx_6)); __pyx_6 = 0;
-    __pyx_t_1 = PyNumber_Add(__pyx_4, __pyx_int_1); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_4); __pyx_4 = 0;
-    __pyx_t_2 = PyNumber_Multiply(__pyx_3, __pyx_t_1); if (unlikely(!__pyx_t_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    Py_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-    __pyx_t_1 = PyNumber_Add(__pyx_2, __pyx_t_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 234; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    Py_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __pyx_r = __pyx_t_1;
-    __pyx_t_1 = 0;
-    goto __pyx_L0;
-    break;
-    default:
-
-    /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":236
- *         return s + (0.5*(e-s)*(np.cos((i+1)*np.pi)+1))
- *     else:
- *         raise ValueError('invalid curve')             # <<<<<<<<<<<<<<
- */
-    __pyx_7 = PyTuple_New(1); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 236; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_INCREF(__pyx_kp_31);
-    PyTuple_SET_ITEM(__pyx_7, 0, __pyx_kp_31);
-    __pyx_5 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_7), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 236; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(((PyObject *)__pyx_7)); __pyx_7 = 0;
-    __Pyx_Raise(__pyx_5, 0, 0);
-    Py_DECREF(__pyx_5); __pyx_5 = 0;
-    {__pyx_filename = __pyx_f[0]; __pyx_lineno = 236; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    break;
-  }
-
-  __pyx_r = Py_None; Py_INCREF(Py_None);
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_4);
-  Py_XDECREF(__pyx_5);
-  Py_XDECREF(__pyx_6);
-  Py_XDECREF(__pyx_7);
-  __Pyx_AddTraceback("lib._utils.pblend");
-  __pyx_r = NULL;
-  __pyx_L0:;
-  return __pyx_r;
-}
-
-/* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":50
- *         # experimental exception made for __getbuffer__ and __releasebuffer__
- *         # -- the details of this may change.
- *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
- *             # This implementation of getbuffer is geared towards Cython
- *             # requirements, and does not yet fullfill the PEP.
- */
-
-static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /*proto*/
-static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
-  int __pyx_v_copy_shape;
-  int __pyx_v_i;
-  int __pyx_v_ndim;
-  int __pyx_v_t;
-  char *__pyx_v_f;
-  PyArray_Descr *__pyx_v_descr = 0;
-  PyObject *__pyx_v_stack;
-  int __pyx_v_hasfields;
-  PyObject *__pyx_v_iterator;
-  int __pyx_r;
-  int __pyx_1;
-  PyObject *__pyx_2 = 0;
-  PyObject *__pyx_3 = 0;
-  int __pyx_4;
-  PyObject *__pyx_5 = 0;
-  PyObject *__pyx_6 = 0;
-  PyObject *__pyx_7 = 0;
-  Py_ssize_t __pyx_8 = 0;
-  PyObject *__pyx_t_1 = NULL;
-  if (__pyx_v_info == NULL) return 0;
-  __pyx_v_info->obj = Py_None; Py_INCREF(Py_None);
-  __pyx_v_stack = ((PyObject *)Py_None); Py_INCREF(Py_None);
-  __pyx_v_iterator = Py_None; Py_INCREF(Py_None);
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":56
- *             # of flags
- *             cdef int copy_shape, i, ndim
- *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
- * 
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
- */
-  __pyx_v_ndim = PyArray_NDIM(((PyArrayObject *)__pyx_v_self));
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":58
- *             ndim = PyArray_NDIM(self)
- * 
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
- *                 copy_shape = 1
- *             else:
- */
-  __pyx_1 = ((sizeof(npy_intp)) != (sizeof(Py_ssize_t)));
-  if (__pyx_1) {
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":59
- * 
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
- *                 copy_shape = 1             # <<<<<<<<<<<<<<
- *             else:
- *                 copy_shape = 0
- */
-    __pyx_v_copy_shape = 1;
-    goto __pyx_L5;
-  }
-  /*else*/ {
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":61
- *                 copy_shape = 1
- *             else:
- *                 copy_shape = 0             # <<<<<<<<<<<<<<
- * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
- */
-    __pyx_v_copy_shape = 0;
-  }
-  __pyx_L5:;
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":63
- *                 copy_shape = 0
- * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
- *                 raise ValueError("ndarray is not C contiguous")
- */
-  __pyx_1 = ((__pyx_v_flags & PyBUF_C_CONTIGUOUS) == PyBUF_C_CONTIGUOUS);
-  if (__pyx_1) {
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":64
- * 
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
- *                 raise ValueError("ndarray is not C contiguous")
- * 
- */
-    __pyx_1 = (!PyArray_CHKFLAGS(((PyArrayObject *)__pyx_v_self), NPY_C_CONTIGUOUS));
-  }
-  if (__pyx_1) {
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":65
- *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_C_CONTIGUOUS)):
- *                 raise ValueError("ndarray is not C contiguous")             # <<<<<<<<<<<<<<
- * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
- */
-    __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_INCREF(__pyx_kp_1);
-    PyTuple_SET_ITEM(__pyx_2, 0, __pyx_kp_1);
-    __pyx_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-    __Pyx_Raise(__pyx_3, 0, 0);
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 65; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":67
- *                 raise ValueError("ndarray is not C contiguous")
- * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
- *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
- *                 raise ValueError("ndarray is not Fortran contiguous")
- */
-  __pyx_1 = ((__pyx_v_flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS);
-  if (__pyx_1) {
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":68
- * 
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
- *                 raise ValueError("ndarray is not Fortran contiguous")
- * 
- */
-    __pyx_1 = (!PyArray_CHKFLAGS(((PyArrayObject *)__pyx_v_self), NPY_F_CONTIGUOUS));
-  }
-  if (__pyx_1) {
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":69
- *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
- *                 and not PyArray_CHKFLAGS(self, NPY_F_CONTIGUOUS)):
- *                 raise ValueError("ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
- * 
- *             info.buf = PyArray_DATA(self)
- */
-    __pyx_2 = PyTuple_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_INCREF(__pyx_kp_2);
-    PyTuple_SET_ITEM(__pyx_2, 0, __pyx_kp_2);
-    __pyx_3 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_2), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(((PyObject *)__pyx_2)); __pyx_2 = 0;
-    __Pyx_Raise(__pyx_3, 0, 0);
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    {__pyx_filename = __pyx_f[1]; __pyx_lineno = 69; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    goto __pyx_L7;
-  }
-  __pyx_L7:;
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":71
- *                 raise ValueError("ndarray is not Fortran contiguous")
- * 
- *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
- *             info.ndim = ndim
- *             if copy_shape:
- */
-  __pyx_v_info->buf = PyArray_DATA(((PyArrayObject *)__pyx_v_self));
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":72
- * 
- *             info.buf = PyArray_DATA(self)
- *             info.ndim = ndim             # <<<<<<<<<<<<<<
- *             if copy_shape:
- *                 # Allocate new buffer for strides and shape info. This is allocated
- */
-  __pyx_v_info->ndim = __pyx_v_ndim;
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":73
- *             info.buf = PyArray_DATA(self)
- *             info.ndim = ndim
- *             if copy_shape:             # <<<<<<<<<<<<<<
- *                 # Allocate new buffer for strides and shape info. This is allocated
- *                 # as one block, strides first.
- */
-  __pyx_4 = __pyx_v_copy_shape;
-  if (__pyx_4) {
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":76
- *                 # Allocate new buffer for strides and shape info. This is allocated
- *                 # as one block, strides first.
- *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)             # <<<<<<<<<<<<<<
- *                 info.shape = info.strides + ndim
- *                 for i in range(ndim):
- */
-    __pyx_v_info->strides = ((Py_ssize_t *)malloc((((sizeof(Py_ssize_t)) * __pyx_v_ndim) * 2)));
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":77
- *                 # as one block, strides first.
- *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)
- *                 info.shape = info.strides + ndim             # <<<<<<<<<<<<<<
- *                 for i in range(ndim):
- *                     info.strides[i] = PyArray_STRIDES(self)[i]
- */
-    __pyx_v_info->shape = (__pyx_v_info->strides + __pyx_v_ndim);
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":78
- *                 info.strides = <Py_ssize_t*>stdlib.malloc(sizeof(Py_ssize_t) * ndim * 2)
- *                 info.shape = info.strides + ndim
- *                 for i in range(ndim):             # <<<<<<<<<<<<<<
- *                     info.strides[i] = PyArray_STRIDES(self)[i]
- *                     info.shape[i] = PyArray_DIMS(self)[i]
- */
-    for (__pyx_v_i = 0; __pyx_v_i < __pyx_v_ndim; __pyx_v_i+=1) {
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":79
- *                 info.shape = info.strides + ndim
- *                 for i in range(ndim):
- *                     info.strides[i] = PyArray_STRIDES(self)[i]             # <<<<<<<<<<<<<<
- *                     info.shape[i] = PyArray_DIMS(self)[i]
- *             else:
- */
-      (__pyx_v_info->strides[__pyx_v_i]) = (PyArray_STRIDES(((PyArrayObject *)__pyx_v_self))[__pyx_v_i]);
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":80
- *                 for i in range(ndim):
- *                     info.strides[i] = PyArray_STRIDES(self)[i]
- *                     info.shape[i] = PyArray_DIMS(self)[i]             # <<<<<<<<<<<<<<
- *             else:
- *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
- */
-      (__pyx_v_info->shape[__pyx_v_i]) = (PyArray_DIMS(((PyArrayObject *)__pyx_v_self))[__pyx_v_i]);
-    }
-    goto __pyx_L8;
-  }
-  /*else*/ {
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":82
- *                     info.shape[i] = PyArray_DIMS(self)[i]
- *             else:
- *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
- *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
- *             info.suboffsets = NULL
- */
-    __pyx_v_info->strides = ((Py_ssize_t *)PyArray_STRIDES(((PyArrayObject *)__pyx_v_self)));
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":83
- *             else:
- *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
- *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)             # <<<<<<<<<<<<<<
- *             info.suboffsets = NULL
- *             info.itemsize = PyArray_ITEMSIZE(self)
- */
-    __pyx_v_info->shape = ((Py_ssize_t *)PyArray_DIMS(((PyArrayObject *)__pyx_v_self)));
-  }
-  __pyx_L8:;
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":84
- *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
- *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
- *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
- *             info.itemsize = PyArray_ITEMSIZE(self)
- *             info.readonly = not PyArray_ISWRITEABLE(self)
- */
-  __pyx_v_info->suboffsets = NULL;
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":85
- *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
- *             info.suboffsets = NULL
- *             info.itemsize = PyArray_ITEMSIZE(self)             # <<<<<<<<<<<<<<
- *             info.readonly = not PyArray_ISWRITEABLE(self)
- * 
- */
-  __pyx_v_info->itemsize = PyArray_ITEMSIZE(((PyArrayObject *)__pyx_v_self));
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":86
- *             info.suboffsets = NULL
- *             info.itemsize = PyArray_ITEMSIZE(self)
- *             info.readonly = not PyArray_ISWRITEABLE(self)             # <<<<<<<<<<<<<<
- * 
- *             cdef int t
- */
-  __pyx_v_info->readonly = (!PyArray_ISWRITEABLE(((PyArrayObject *)__pyx_v_self)));
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":89
- * 
- *             cdef int t
- *             cdef char* f = NULL             # <<<<<<<<<<<<<<
- *             cdef dtype descr = self.descr
- *             cdef list stack
- */
-  __pyx_v_f = NULL;
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":90
- *             cdef int t
- *             cdef char* f = NULL
- *             cdef dtype descr = self.descr             # <<<<<<<<<<<<<<
- *             cdef list stack
- * 
- */
-  Py_INCREF(((PyObject *)((PyArrayObject *)__pyx_v_self)->descr));
-  __pyx_v_descr = ((PyArrayObject *)__pyx_v_self)->descr;
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":93
- *             cdef list stack
- * 
- *             cdef bint hasfields = PyDataType_HASFIELDS(descr)             # <<<<<<<<<<<<<<
- * 
- *             # Ugly hack warning:
- */
-  __pyx_v_hasfields = PyDataType_HASFIELDS(__pyx_v_descr);
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":103
- *             # functions).
- * 
- *             if not hasfields and not copy_shape:             # <<<<<<<<<<<<<<
- *                 # do not call releasebuffer
- *                 info.obj = None
- */
-  __pyx_1 = (!__pyx_v_hasfields);
-  if (__pyx_1) {
-    __pyx_1 = (!__pyx_v_copy_shape);
-  }
-  if (__pyx_1) {
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":105
- *             if not hasfields and not copy_shape:
- *                 # do not call releasebuffer
- *                 info.obj = None             # <<<<<<<<<<<<<<
- *             else:
- *                 # need to call releasebuffer
- */
-    Py_INCREF(Py_None);
-    Py_DECREF(__pyx_v_info->obj);
-    __pyx_v_info->obj = Py_None;
-    goto __pyx_L11;
-  }
-  /*else*/ {
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":108
- *             else:
- *                 # need to call releasebuffer
- *                 info.obj = self             # <<<<<<<<<<<<<<
- * 
- *             if not hasfields:
- */
-    Py_INCREF(__pyx_v_self);
-    Py_DECREF(__pyx_v_info->obj);
-    __pyx_v_info->obj = __pyx_v_self;
-  }
-  __pyx_L11:;
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":110
- *                 info.obj = self
- * 
- *             if not hasfields:             # <<<<<<<<<<<<<<
- *                 t = descr.type_num
- *                 if   t == NPY_BYTE:        f = "b"
- */
-  __pyx_1 = (!__pyx_v_hasfields);
-  if (__pyx_1) {
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":111
- * 
- *             if not hasfields:
- *                 t = descr.type_num             # <<<<<<<<<<<<<<
- *                 if   t == NPY_BYTE:        f = "b"
- *                 elif t == NPY_UBYTE:       f = "B"
- */
-    __pyx_v_t = __pyx_v_descr->type_num;
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":112
- *             if not hasfields:
- *                 t = descr.type_num
- *                 if   t == NPY_BYTE:        f = "b"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_UBYTE:       f = "B"
- *                 elif t == NPY_SHORT:       f = "h"
- */
-    switch (__pyx_v_t) {
-      case NPY_BYTE:
-      __pyx_v_f = __pyx_k_3;
-      break;
-      case NPY_UBYTE:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":113
- *                 t = descr.type_num
- *                 if   t == NPY_BYTE:        f = "b"
- *                 elif t == NPY_UBYTE:       f = "B"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_SHORT:       f = "h"
- *                 elif t == NPY_USHORT:      f = "H"
- */
-      __pyx_v_f = __pyx_k_4;
-      break;
-      case NPY_SHORT:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":114
- *                 if   t == NPY_BYTE:        f = "b"
- *                 elif t == NPY_UBYTE:       f = "B"
- *                 elif t == NPY_SHORT:       f = "h"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_USHORT:      f = "H"
- *                 elif t == NPY_INT:         f = "i"
- */
-      __pyx_v_f = __pyx_k_5;
-      break;
-      case NPY_USHORT:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":115
- *                 elif t == NPY_UBYTE:       f = "B"
- *                 elif t == NPY_SHORT:       f = "h"
- *                 elif t == NPY_USHORT:      f = "H"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_INT:         f = "i"
- *                 elif t == NPY_UINT:        f = "I"
- */
-      __pyx_v_f = __pyx_k_6;
-      break;
-      case NPY_INT:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":116
- *                 elif t == NPY_SHORT:       f = "h"
- *                 elif t == NPY_USHORT:      f = "H"
- *                 elif t == NPY_INT:         f = "i"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_UINT:        f = "I"
- *                 elif t == NPY_LONG:        f = "l"
- */
-      __pyx_v_f = __pyx_k_7;
-      break;
-      case NPY_UINT:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":117
- *                 elif t == NPY_USHORT:      f = "H"
- *                 elif t == NPY_INT:         f = "i"
- *                 elif t == NPY_UINT:        f = "I"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_LONG:        f = "l"
- *                 elif t == NPY_ULONG:       f = "L"
- */
-      __pyx_v_f = __pyx_k_8;
-      break;
-      case NPY_LONG:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":118
- *                 elif t == NPY_INT:         f = "i"
- *                 elif t == NPY_UINT:        f = "I"
- *                 elif t == NPY_LONG:        f = "l"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_ULONG:       f = "L"
- *                 elif t == NPY_LONGLONG:    f = "q"
- */
-      __pyx_v_f = __pyx_k_9;
-      break;
-      case NPY_ULONG:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":119
- *                 elif t == NPY_UINT:        f = "I"
- *                 elif t == NPY_LONG:        f = "l"
- *                 elif t == NPY_ULONG:       f = "L"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_LONGLONG:    f = "q"
- *                 elif t == NPY_ULONGLONG:   f = "Q"
- */
-      __pyx_v_f = __pyx_k_10;
-      break;
-      case NPY_LONGLONG:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":120
- *                 elif t == NPY_LONG:        f = "l"
- *                 elif t == NPY_ULONG:       f = "L"
- *                 elif t == NPY_LONGLONG:    f = "q"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_ULONGLONG:   f = "Q"
- *                 elif t == NPY_FLOAT:       f = "f"
- */
-      __pyx_v_f = __pyx_k_11;
-      break;
-      case NPY_ULONGLONG:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":121
- *                 elif t == NPY_ULONG:       f = "L"
- *                 elif t == NPY_LONGLONG:    f = "q"
- *                 elif t == NPY_ULONGLONG:   f = "Q"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_FLOAT:       f = "f"
- *                 elif t == NPY_DOUBLE:      f = "d"
- */
-      __pyx_v_f = __pyx_k_12;
-      break;
-      case NPY_FLOAT:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":122
- *                 elif t == NPY_LONGLONG:    f = "q"
- *                 elif t == NPY_ULONGLONG:   f = "Q"
- *                 elif t == NPY_FLOAT:       f = "f"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_DOUBLE:      f = "d"
- *                 elif t == NPY_LONGDOUBLE:  f = "g"
- */
-      __pyx_v_f = __pyx_k_13;
-      break;
-      case NPY_DOUBLE:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":123
- *                 elif t == NPY_ULONGLONG:   f = "Q"
- *                 elif t == NPY_FLOAT:       f = "f"
- *                 elif t == NPY_DOUBLE:      f = "d"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_LONGDOUBLE:  f = "g"
- *                 elif t == NPY_CFLOAT:      f = "Zf"
- */
-      __pyx_v_f = __pyx_k_14;
-      break;
-      case NPY_LONGDOUBLE:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":124
- *                 elif t == NPY_FLOAT:       f = "f"
- *                 elif t == NPY_DOUBLE:      f = "d"
- *                 elif t == NPY_LONGDOUBLE:  f = "g"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_CFLOAT:      f = "Zf"
- *                 elif t == NPY_CDOUBLE:     f = "Zd"
- */
-      __pyx_v_f = __pyx_k_15;
-      break;
-      case NPY_CFLOAT:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":125
- *                 elif t == NPY_DOUBLE:      f = "d"
- *                 elif t == NPY_LONGDOUBLE:  f = "g"
- *                 elif t == NPY_CFLOAT:      f = "Zf"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_CDOUBLE:     f = "Zd"
- *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
- */
-      __pyx_v_f = __pyx_k_16;
-      break;
-      case NPY_CDOUBLE:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":126
- *                 elif t == NPY_LONGDOUBLE:  f = "g"
- *                 elif t == NPY_CFLOAT:      f = "Zf"
- *                 elif t == NPY_CDOUBLE:     f = "Zd"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
- *                 elif t == NPY_OBJECT:      f = "O"
- */
-      __pyx_v_f = __pyx_k_17;
-      break;
-      case NPY_CLONGDOUBLE:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":127
- *                 elif t == NPY_CFLOAT:      f = "Zf"
- *                 elif t == NPY_CDOUBLE:     f = "Zd"
- *                 elif t == NPY_CLONGDOUBLE: f = "Zg"             # <<<<<<<<<<<<<<
- *                 elif t == NPY_OBJECT:      f = "O"
- *                 else:
- */
-      __pyx_v_f = __pyx_k_18;
-      break;
-      case NPY_OBJECT:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":128
- *                 elif t == NPY_CDOUBLE:     f = "Zd"
- *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
- *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
- *                 else:
- *                     raise ValueError("unknown dtype code in numpy.pxd (%d)" % t)
- */
-      __pyx_v_f = __pyx_k_19;
-      break;
-      default:
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":130
- *                 elif t == NPY_OBJECT:      f = "O"
- *                 else:
- *                     raise ValueError("unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
- *                 info.format = f
- *                 return
- */
-      __pyx_2 = PyInt_FromLong(__pyx_v_t); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      __pyx_t_1 = PyNumber_Remainder(__pyx_kp_20, __pyx_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      PyTuple_SET_ITEM(__pyx_3, 0, __pyx_t_1);
-      __pyx_t_1 = 0;
-      __pyx_2 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-      __Pyx_Raise(__pyx_2, 0, 0);
-      Py_DECREF(__pyx_2); __pyx_2 = 0;
-      {__pyx_filename = __pyx_f[1]; __pyx_lineno = 130; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      break;
-    }
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":131
- *                 else:
- *                     raise ValueError("unknown dtype code in numpy.pxd (%d)" % t)
- *                 info.format = f             # <<<<<<<<<<<<<<
- *                 return
- *             else:
- */
-    __pyx_v_info->format = __pyx_v_f;
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":132
- *                     raise ValueError("unknown dtype code in numpy.pxd (%d)" % t)
- *                 info.format = f
- *                 return             # <<<<<<<<<<<<<<
- *             else:
- *                 info.format = <char*>stdlib.malloc(255) # static size
- */
-    __pyx_r = 0;
-    goto __pyx_L0;
-    goto __pyx_L12;
-  }
-  /*else*/ {
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":134
- *                 return
- *             else:
- *                 info.format = <char*>stdlib.malloc(255) # static size             # <<<<<<<<<<<<<<
- *                 f = info.format
- *                 stack = [iter(descr.fields.iteritems())]
- */
-    __pyx_v_info->format = ((char *)malloc(255));
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":135
- *             else:
- *                 info.format = <char*>stdlib.malloc(255) # static size
- *                 f = info.format             # <<<<<<<<<<<<<<
- *                 stack = [iter(descr.fields.iteritems())]
- * 
- */
-    __pyx_v_f = __pyx_v_info->format;
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":136
- *                 info.format = <char*>stdlib.malloc(255) # static size
- *                 f = info.format
- *                 stack = [iter(descr.fields.iteritems())]             # <<<<<<<<<<<<<<
- * 
- *                 while True:
- */
-    __pyx_3 = PyObject_GetAttr(__pyx_v_descr->fields, __pyx_kp_iteritems); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    __pyx_2 = PyObject_Call(__pyx_3, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_3); __pyx_3 = 0;
-    __pyx_3 = PyObject_GetIter(__pyx_2); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    Py_DECREF(__pyx_2); __pyx_2 = 0;
-    __pyx_2 = PyList_New(1); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 136; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-    PyList_SET_ITEM(__pyx_2, 0, __pyx_3);
-    __pyx_3 = 0;
-    Py_DECREF(((PyObject *)__pyx_v_stack));
-    __pyx_v_stack = __pyx_2;
-    __pyx_2 = 0;
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":138
- *                 stack = [iter(descr.fields.iteritems())]
- * 
- *                 while True:             # <<<<<<<<<<<<<<
- *                     iterator = stack[-1]
- *                     descr = None
- */
-    while (1) {
-      __pyx_1 = 1;
-      if (!__pyx_1) break;
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":139
- * 
- *                 while True:
- *                     iterator = stack[-1]             # <<<<<<<<<<<<<<
- *                     descr = None
- *                     while descr is None:
- */
-      __pyx_3 = __Pyx_GetItemInt(((PyObject *)__pyx_v_stack), -1, 0); if (!__pyx_3) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 139; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-      Py_DECREF(__pyx_v_iterator);
-      __pyx_v_iterator = __pyx_3;
-      __pyx_3 = 0;
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":140
- *                 while True:
- *                     iterator = stack[-1]
- *                     descr = None             # <<<<<<<<<<<<<<
- *                     while descr is None:
- *                         try:
- */
-      Py_INCREF(Py_None);
-      Py_DECREF(((PyObject *)__pyx_v_descr));
-      __pyx_v_descr = ((PyArray_Descr *)Py_None);
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":141
- *                     iterator = stack[-1]
- *                     descr = None
- *                     while descr is None:             # <<<<<<<<<<<<<<
- *                         try:
- *                             descr = iterator.next()[1][0]
- */
-      while (1) {
-        __pyx_1 = (((PyObject *)__pyx_v_descr) == Py_None);
-        if (!__pyx_1) break;
-
-        /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":142
- *                     descr = None
- *                     while descr is None:
- *                         try:             # <<<<<<<<<<<<<<
- *                             descr = iterator.next()[1][0]
- *                         except StopIteration:
- */
-        {
-          PyObject *__pyx_save_exc_type, *__pyx_save_exc_value, *__pyx_save_exc_tb;
-          __Pyx_ExceptionSave(&__pyx_save_exc_type, &__pyx_save_exc_value, &__pyx_save_exc_tb);
-          /*try:*/ {
-
-            /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":143
- *                     while descr is None:
- *                         try:
- *                             descr = iterator.next()[1][0]             # <<<<<<<<<<<<<<
- *                         except StopIteration:
- *                             stack.pop()
- */
-            __pyx_2 = PyObject_GetAttr(__pyx_v_iterator, __pyx_kp_next); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
-            __pyx_3 = PyObject_Call(__pyx_2, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
-            Py_DECREF(__pyx_2); __pyx_2 = 0;
-            __pyx_2 = __Pyx_GetItemInt(__pyx_3, 1, 0); if (!__pyx_2) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
-            Py_DECREF(__pyx_3); __pyx_3 = 0;
-            __pyx_3 = __Pyx_GetItemInt(__pyx_2, 0, 0); if (!__pyx_3) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
-            Py_DECREF(__pyx_2); __pyx_2 = 0;
-            if (!(__Pyx_TypeTest(__pyx_3, __pyx_ptype_5numpy_dtype))) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 143; __pyx_clineno = __LINE__; goto __pyx_L17_error;}
-            Py_DECREF(((PyObject *)__pyx_v_descr));
-            __pyx_v_descr = ((PyArray_Descr *)__pyx_3);
-            __pyx_3 = 0;
-          }
-          Py_XDECREF(__pyx_save_exc_type); __pyx_save_exc_type = 0;
-          Py_XDECREF(__pyx_save_exc_value); __pyx_save_exc_value = 0;
-          Py_XDECREF(__pyx_save_exc_tb); __pyx_save_exc_tb = 0;
-          goto __pyx_L22_try;
-          __pyx_L17_error:;
-          Py_XDECREF(__pyx_2); __pyx_2 = 0;
-          Py_XDECREF(__pyx_3); __pyx_3 = 0;
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":144
- *                         try:
- *                             descr = iterator.next()[1][0]
- *                         except StopIteration:             # <<<<<<<<<<<<<<
- *                             stack.pop()
- *                             if len(stack) > 0:
- */
-          __pyx_4 = PyErr_ExceptionMatches(__pyx_builtin_StopIteration);
-          if (__pyx_4) {
-            __Pyx_AddTraceback("numpy.__getbuffer__");
-            if (__Pyx_GetException(&__pyx_2, &__pyx_3, &__pyx_5) < 0) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
-
-            /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":145
- *                             descr = iterator.next()[1][0]
- *                         except StopIteration:
- *                             stack.pop()             # <<<<<<<<<<<<<<
- *                             if len(stack) > 0:
- *                                 f[0] = 125 #"}"
- */
-            __pyx_6 = PyObject_GetAttr(((PyObject *)__pyx_v_stack), __pyx_kp_pop); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
-            __pyx_7 = PyObject_Call(__pyx_6, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 145; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
-            Py_DECREF(__pyx_6); __pyx_6 = 0;
-            Py_DECREF(__pyx_7); __pyx_7 = 0;
-
-            /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":146
- *                         except StopIteration:
- *                             stack.pop()
- *                             if len(stack) > 0:             # <<<<<<<<<<<<<<
- *                                 f[0] = 125 #"}"
- *                                 f += 1
- */
-            __pyx_8 = PyObject_Length(((PyObject *)__pyx_v_stack)); if (unlikely(__pyx_8 == -1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 146; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
-            __pyx_1 = (__pyx_8 > 0);
-            if (__pyx_1) {
-
-              /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":147
- *                             stack.pop()
- *                             if len(stack) > 0:
- *                                 f[0] = 125 #"}"             # <<<<<<<<<<<<<<
- *                                 f += 1
- *                                 iterator = stack[-1]
- */
-              (__pyx_v_f[0]) = 125;
-
-              /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":148
- *                             if len(stack) > 0:
- *                                 f[0] = 125 #"}"
- *                                 f += 1             # <<<<<<<<<<<<<<
- *                                 iterator = stack[-1]
- *                             else:
- */
-              __pyx_v_f += 1;
-
-              /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":149
- *                                 f[0] = 125 #"}"
- *                                 f += 1
- *                                 iterator = stack[-1]             # <<<<<<<<<<<<<<
- *                             else:
- *                                 f[0] = 0 # Terminate string!
- */
-              __pyx_6 = __Pyx_GetItemInt(((PyObject *)__pyx_v_stack), -1, 0); if (!__pyx_6) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 149; __pyx_clineno = __LINE__; goto __pyx_L19_except_error;}
-              Py_DECREF(__pyx_v_iterator);
-              __pyx_v_iterator = __pyx_6;
-              __pyx_6 = 0;
-              goto __pyx_L23;
-            }
-            /*else*/ {
-
-              /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":151
- *                                 iterator = stack[-1]
- *                             else:
- *                                 f[0] = 0 # Terminate string!             # <<<<<<<<<<<<<<
- *                                 return
- * 
- */
-              (__pyx_v_f[0]) = 0;
-
-              /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":152
- *                             else:
- *                                 f[0] = 0 # Terminate string!
- *                                 return             # <<<<<<<<<<<<<<
- * 
- *                     hasfields = PyDataType_HASFIELDS(descr)
- */
-              __pyx_r = 0;
-              Py_DECREF(__pyx_2); __pyx_2 = 0;
-              Py_DECREF(__pyx_3); __pyx_3 = 0;
-              Py_DECREF(__pyx_5); __pyx_5 = 0;
-              goto __pyx_L20_except_return;
-            }
-            __pyx_L23:;
-            Py_DECREF(__pyx_2); __pyx_2 = 0;
-            Py_DECREF(__pyx_3); __pyx_3 = 0;
-            Py_DECREF(__pyx_5); __pyx_5 = 0;
-            goto __pyx_L18_exception_handled;
-          }
-          __pyx_L19_except_error:;
-          Py_XDECREF(__pyx_save_exc_type);
-          Py_XDECREF(__pyx_save_exc_value);
-          Py_XDECREF(__pyx_save_exc_tb);
-          goto __pyx_L1_error;
-          __pyx_L20_except_return:;
-          __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-          goto __pyx_L0;
-          __pyx_L18_exception_handled:;
-          __Pyx_ExceptionReset(__pyx_save_exc_type, __pyx_save_exc_value, __pyx_save_exc_tb);
-          __pyx_L22_try:;
-        }
-      }
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":154
- *                                 return
- * 
- *                     hasfields = PyDataType_HASFIELDS(descr)             # <<<<<<<<<<<<<<
- *                     if not hasfields:
- *                         t = descr.type_num
- */
-      __pyx_v_hasfields = PyDataType_HASFIELDS(__pyx_v_descr);
-
-      /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":155
- * 
- *                     hasfields = PyDataType_HASFIELDS(descr)
- *                     if not hasfields:             # <<<<<<<<<<<<<<
- *                         t = descr.type_num
- *                         if f - info.format > 240: # this should leave room for "T{" and "}" as well
- */
-      __pyx_1 = (!__pyx_v_hasfields);
-      if (__pyx_1) {
-
-        /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":156
- *                     hasfields = PyDataType_HASFIELDS(descr)
- *                     if not hasfields:
- *                         t = descr.type_num             # <<<<<<<<<<<<<<
- *                         if f - info.format > 240: # this should leave room for "T{" and "}" as well
- *                             raise RuntimeError("Format string allocated too short.")
- */
-        __pyx_v_t = __pyx_v_descr->type_num;
-
-        /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":157
- *                     if not hasfields:
- *                         t = descr.type_num
- *                         if f - info.format > 240: # this should leave room for "T{" and "}" as well             # <<<<<<<<<<<<<<
- *                             raise RuntimeError("Format string allocated too short.")
- * 
- */
-        __pyx_1 = ((__pyx_v_f - __pyx_v_info->format) > 240);
-        if (__pyx_1) {
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":158
- *                         t = descr.type_num
- *                         if f - info.format > 240: # this should leave room for "T{" and "}" as well
- *                             raise RuntimeError("Format string allocated too short.")             # <<<<<<<<<<<<<<
- * 
- *                         # Until ticket #99 is fixed, use integers to avoid warnings
- */
-          __pyx_7 = PyTuple_New(1); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          Py_INCREF(__pyx_kp_21);
-          PyTuple_SET_ITEM(__pyx_7, 0, __pyx_kp_21);
-          __pyx_6 = PyObject_Call(__pyx_builtin_RuntimeError, ((PyObject *)__pyx_7), NULL); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          Py_DECREF(((PyObject *)__pyx_7)); __pyx_7 = 0;
-          __Pyx_Raise(__pyx_6, 0, 0);
-          Py_DECREF(__pyx_6); __pyx_6 = 0;
-          {__pyx_filename = __pyx_f[1]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          goto __pyx_L25;
-        }
-        __pyx_L25:;
-
-        /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":161
- * 
- *                         # Until ticket #99 is fixed, use integers to avoid warnings
- *                         if   t == NPY_BYTE:        f[0] =  98 #"b"             # <<<<<<<<<<<<<<
- *                         elif t == NPY_UBYTE:       f[0] =  66 #"B"
- *                         elif t == NPY_SHORT:       f[0] = 104 #"h"
- */
-        switch (__pyx_v_t) {
-          case NPY_BYTE:
-          (__pyx_v_f[0]) = 98;
-          break;
-          case NPY_UBYTE:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":162
- *                         # Until ticket #99 is fixed, use integers to avoid warnings
- *                         if   t == NPY_BYTE:        f[0] =  98 #"b"
- *                         elif t == NPY_UBYTE:       f[0] =  66 #"B"             # <<<<<<<<<<<<<<
- *                         elif t == NPY_SHORT:       f[0] = 104 #"h"
- *                         elif t == NPY_USHORT:      f[0] =  72 #"H"
- */
-          (__pyx_v_f[0]) = 66;
-          break;
-          case NPY_SHORT:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":163
- *                         if   t == NPY_BYTE:        f[0] =  98 #"b"
- *                         elif t == NPY_UBYTE:       f[0] =  66 #"B"
- *                         elif t == NPY_SHORT:       f[0] = 104 #"h"             # <<<<<<<<<<<<<<
- *                         elif t == NPY_USHORT:      f[0] =  72 #"H"
- *                         elif t == NPY_INT:         f[0] = 105 #"i"
- */
-          (__pyx_v_f[0]) = 104;
-          break;
-          case NPY_USHORT:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":164
- *                         elif t == NPY_UBYTE:       f[0] =  66 #"B"
- *                         elif t == NPY_SHORT:       f[0] = 104 #"h"
- *                         elif t == NPY_USHORT:      f[0] =  72 #"H"             # <<<<<<<<<<<<<<
- *                         elif t == NPY_INT:         f[0] = 105 #"i"
- *                         elif t == NPY_UINT:        f[0] =  73 #"I"
- */
-          (__pyx_v_f[0]) = 72;
-          break;
-          case NPY_INT:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":165
- *                         elif t == NPY_SHORT:       f[0] = 104 #"h"
- *                         elif t == NPY_USHORT:      f[0] =  72 #"H"
- *                         elif t == NPY_INT:         f[0] = 105 #"i"             # <<<<<<<<<<<<<<
- *                         elif t == NPY_UINT:        f[0] =  73 #"I"
- *                         elif t == NPY_LONG:        f[0] = 108 #"l"
- */
-          (__pyx_v_f[0]) = 105;
-          break;
-          case NPY_UINT:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":166
- *                         elif t == NPY_USHORT:      f[0] =  72 #"H"
- *                         elif t == NPY_INT:         f[0] = 105 #"i"
- *                         elif t == NPY_UINT:        f[0] =  73 #"I"             # <<<<<<<<<<<<<<
- *                         elif t == NPY_LONG:        f[0] = 108 #"l"
- *                         elif t == NPY_ULONG:       f[0] = 76  #"L"
- */
-          (__pyx_v_f[0]) = 73;
-          break;
-          case NPY_LONG:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":167
- *                         elif t == NPY_INT:         f[0] = 105 #"i"
- *                         elif t == NPY_UINT:        f[0] =  73 #"I"
- *                         elif t == NPY_LONG:        f[0] = 108 #"l"             # <<<<<<<<<<<<<<
- *                         elif t == NPY_ULONG:       f[0] = 76  #"L"
- *                         elif t == NPY_LONGLONG:    f[0] = 113 #"q"
- */
-          (__pyx_v_f[0]) = 108;
-          break;
-          case NPY_ULONG:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":168
- *                         elif t == NPY_UINT:        f[0] =  73 #"I"
- *                         elif t == NPY_LONG:        f[0] = 108 #"l"
- *                         elif t == NPY_ULONG:       f[0] = 76  #"L"             # <<<<<<<<<<<<<<
- *                         elif t == NPY_LONGLONG:    f[0] = 113 #"q"
- *                         elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
- */
-          (__pyx_v_f[0]) = 76;
-          break;
-          case NPY_LONGLONG:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":169
- *                         elif t == NPY_LONG:        f[0] = 108 #"l"
- *                         elif t == NPY_ULONG:       f[0] = 76  #"L"
- *                         elif t == NPY_LONGLONG:    f[0] = 113 #"q"             # <<<<<<<<<<<<<<
- *                         elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
- *                         elif t == NPY_FLOAT:       f[0] = 102 #"f"
- */
-          (__pyx_v_f[0]) = 113;
-          break;
-          case NPY_ULONGLONG:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":170
- *                         elif t == NPY_ULONG:       f[0] = 76  #"L"
- *                         elif t == NPY_LONGLONG:    f[0] = 113 #"q"
- *                         elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"             # <<<<<<<<<<<<<<
- *                         elif t == NPY_FLOAT:       f[0] = 102 #"f"
- *                         elif t == NPY_DOUBLE:      f[0] = 100 #"d"
- */
-          (__pyx_v_f[0]) = 81;
-          break;
-          case NPY_FLOAT:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":171
- *                         elif t == NPY_LONGLONG:    f[0] = 113 #"q"
- *                         elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
- *                         elif t == NPY_FLOAT:       f[0] = 102 #"f"             # <<<<<<<<<<<<<<
- *                         elif t == NPY_DOUBLE:      f[0] = 100 #"d"
- *                         elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
- */
-          (__pyx_v_f[0]) = 102;
-          break;
-          case NPY_DOUBLE:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":172
- *                         elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
- *                         elif t == NPY_FLOAT:       f[0] = 102 #"f"
- *                         elif t == NPY_DOUBLE:      f[0] = 100 #"d"             # <<<<<<<<<<<<<<
- *                         elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
- *                         elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1
- */
-          (__pyx_v_f[0]) = 100;
-          break;
-          case NPY_LONGDOUBLE:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":173
- *                         elif t == NPY_FLOAT:       f[0] = 102 #"f"
- *                         elif t == NPY_DOUBLE:      f[0] = 100 #"d"
- *                         elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"             # <<<<<<<<<<<<<<
- *                         elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1
- *                         elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1
- */
-          (__pyx_v_f[0]) = 103;
-          break;
-          case NPY_CFLOAT:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":174
- *                         elif t == NPY_DOUBLE:      f[0] = 100 #"d"
- *                         elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
- *                         elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1             # <<<<<<<<<<<<<<
- *                         elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1
- *                         elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1
- */
-          (__pyx_v_f[0]) = 90;
-          (__pyx_v_f[1]) = 102;
-          __pyx_v_f += 1;
-          break;
-          case NPY_CDOUBLE:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":175
- *                         elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
- *                         elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1
- *                         elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1             # <<<<<<<<<<<<<<
- *                         elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1
- *                         elif t == NPY_OBJECT:      f[0] = 79 #"O"
- */
-          (__pyx_v_f[0]) = 90;
-          (__pyx_v_f[1]) = 100;
-          __pyx_v_f += 1;
-          break;
-          case NPY_CLONGDOUBLE:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":176
- *                         elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1
- *                         elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1
- *                         elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1             # <<<<<<<<<<<<<<
- *                         elif t == NPY_OBJECT:      f[0] = 79 #"O"
- *                         else:
- */
-          (__pyx_v_f[0]) = 90;
-          (__pyx_v_f[1]) = 103;
-          __pyx_v_f += 1;
-          break;
-          case NPY_OBJECT:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":177
- *                         elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1
- *                         elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1
- *                         elif t == NPY_OBJECT:      f[0] = 79 #"O"             # <<<<<<<<<<<<<<
- *                         else:
- *                             raise ValueError("unknown dtype code in numpy.pxd (%d)" % t)
- */
-          (__pyx_v_f[0]) = 79;
-          break;
-          default:
-
-          /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":179
- *                         elif t == NPY_OBJECT:      f[0] = 79 #"O"
- *                         else:
- *                             raise ValueError("unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
- *                         f += 1
- *                     else:
- */
-          __pyx_2 = PyInt_FromLong(__pyx_v_t); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          __pyx_t_1 = PyNumber_Remainder(__pyx_kp_22, __pyx_2); if (unlikely(!__pyx_t_1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          Py_DECREF(__pyx_2); __pyx_2 = 0;
-          __pyx_3 = PyTuple_New(1); if (unlikely(!__pyx_3)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          PyTuple_SET_ITEM(__pyx_3, 0, __pyx_t_1);
-          __pyx_t_1 = 0;
-          __pyx_5 = PyObject_Call(__pyx_builtin_ValueError, ((PyObject *)__pyx_3), NULL); if (unlikely(!__pyx_5)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          Py_DECREF(((PyObject *)__pyx_3)); __pyx_3 = 0;
-          __Pyx_Raise(__pyx_5, 0, 0);
-          Py_DECREF(__pyx_5); __pyx_5 = 0;
-          {__pyx_filename = __pyx_f[1]; __pyx_lineno = 179; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-          break;
-        }
-
-        /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":180
- *                         else:
- *                             raise ValueError("unknown dtype code in numpy.pxd (%d)" % t)
- *                         f += 1             # <<<<<<<<<<<<<<
- *                     else:
- *                         f[0] = 84 #"T"
- */
-        __pyx_v_f += 1;
-        goto __pyx_L24;
-      }
-      /*else*/ {
-
-        /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":182
- *                         f += 1
- *                     else:
- *                         f[0] = 84 #"T"             # <<<<<<<<<<<<<<
- *                         f[1] = 123 #"{"
- *                         f += 2
- */
-        (__pyx_v_f[0]) = 84;
-
-        /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":183
- *                     else:
- *                         f[0] = 84 #"T"
- *                         f[1] = 123 #"{"             # <<<<<<<<<<<<<<
- *                         f += 2
- *                         stack.append(iter(descr.fields.iteritems()))
- */
-        (__pyx_v_f[1]) = 123;
-
-        /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":184
- *                         f[0] = 84 #"T"
- *                         f[1] = 123 #"{"
- *                         f += 2             # <<<<<<<<<<<<<<
- *                         stack.append(iter(descr.fields.iteritems()))
- * 
- */
-        __pyx_v_f += 2;
-
-        /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":185
- *                         f[1] = 123 #"{"
- *                         f += 2
- *                         stack.append(iter(descr.fields.iteritems()))             # <<<<<<<<<<<<<<
- * 
- *         def __releasebuffer__(ndarray self, Py_buffer* info):
- */
-        __pyx_7 = PyObject_GetAttr(__pyx_v_descr->fields, __pyx_kp_iteritems); if (unlikely(!__pyx_7)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        __pyx_6 = PyObject_Call(__pyx_7, ((PyObject *)__pyx_empty_tuple), NULL); if (unlikely(!__pyx_6)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_7); __pyx_7 = 0;
-        __pyx_2 = PyObject_GetIter(__pyx_6); if (unlikely(!__pyx_2)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_6); __pyx_6 = 0;
-        __pyx_4 = PyList_Append(((PyObject *)__pyx_v_stack), __pyx_2); if (unlikely(__pyx_4 == -1)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 185; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-        Py_DECREF(__pyx_2); __pyx_2 = 0;
-      }
-      __pyx_L24:;
-    }
-  }
-  __pyx_L12:;
-
-  __pyx_r = 0;
-  goto __pyx_L0;
-  __pyx_L1_error:;
-  Py_XDECREF(__pyx_2);
-  Py_XDECREF(__pyx_3);
-  Py_XDECREF(__pyx_5);
-  Py_XDECREF(__pyx_6);
-  Py_XDECREF(__pyx_7);
-  __Pyx_AddTraceback("numpy.ndarray.__getbuffer__");
-  __pyx_r = -1;
-  Py_DECREF(__pyx_v_info->obj); __pyx_v_info->obj = NULL;
-  goto __pyx_L2;
-  __pyx_L0:;
-  if (__pyx_v_info->obj == Py_None) { Py_DECREF(Py_None); __pyx_v_info->obj = NULL; }
-  __pyx_L2:;
-  Py_XDECREF(__pyx_v_descr);
-  Py_DECREF(__pyx_v_stack);
-  Py_DECREF(__pyx_v_iterator);
-  return __pyx_r;
-}
-
-/* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":187
- *                         stack.append(iter(descr.fields.iteritems()))
- * 
- *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
- *             if PyArray_HASFIELDS(self):
- *                 stdlib.free(info.format)
- */
-
-static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info); /*proto*/
-static void __pyx_pf_5numpy_7ndarray___releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info) {
-  int __pyx_1;
-  int __pyx_2;
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":188
- * 
- *         def __releasebuffer__(ndarray self, Py_buffer* info):
- *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
- *                 stdlib.free(info.format)
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
- */
-  __pyx_1 = PyArray_HASFIELDS(((PyArrayObject *)__pyx_v_self));
-  if (__pyx_1) {
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":189
- *         def __releasebuffer__(ndarray self, Py_buffer* info):
- *             if PyArray_HASFIELDS(self):
- *                 stdlib.free(info.format)             # <<<<<<<<<<<<<<
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
- *                 stdlib.free(info.strides)
- */
-    free(__pyx_v_info->format);
-    goto __pyx_L5;
-  }
-  __pyx_L5:;
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":190
- *             if PyArray_HASFIELDS(self):
- *                 stdlib.free(info.format)
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
- *                 stdlib.free(info.strides)
- *                 # info.shape was stored after info.strides in the same block
- */
-  __pyx_2 = ((sizeof(npy_intp)) != (sizeof(Py_ssize_t)));
-  if (__pyx_2) {
-
-    /* "/var/lib/python-support/python2.6/Cython/Includes/numpy.pxd":191
- *                 stdlib.free(info.format)
- *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
- *                 stdlib.free(info.strides)             # <<<<<<<<<<<<<<
- *                 # info.shape was stored after info.strides in the same block
- * 
- */
-    free(__pyx_v_info->strides);
-    goto __pyx_L6;
-  }
-  __pyx_L6:;
-
-}
-
-static struct PyMethodDef __pyx_methods[] = {
-  {"palette_improve", (PyCFunction)__pyx_pf_3lib_6_utils_palette_improve, METH_VARARGS|METH_KEYWORDS, 0},
-  {"get_length", (PyCFunction)__pyx_pf_3lib_6_utils_get_length, METH_O, 0},
-  {"pix_diff", (PyCFunction)__pyx_pf_3lib_6_utils_pix_diff, METH_VARARGS|METH_KEYWORDS, 0},
-  {"pix_swap", (PyCFunction)__pyx_pf_3lib_6_utils_pix_swap, METH_VARARGS|METH_KEYWORDS, 0},
-  {"spline", (PyCFunction)__pyx_pf_3lib_6_utils_spline, METH_VARARGS|METH_KEYWORDS, 0},
-  {"cdiff", (PyCFunction)__pyx_pf_3lib_6_utils_cdiff, METH_VARARGS|METH_KEYWORDS, 0},
-  {"pblend", (PyCFunction)__pyx_pf_3lib_6_utils_pblend, METH_VARARGS|METH_KEYWORDS, 0},
-  {0, 0, 0, 0}
-};
-
-static void __pyx_init_filenames(void); /*proto*/
-
-#if PY_MAJOR_VERSION >= 3
-static struct PyModuleDef __pyx_moduledef = {
-    PyModuleDef_HEAD_INIT,
-    "_utils",
-    0, /* m_doc */
-    -1, /* m_size */
-    __pyx_methods /* m_methods */,
-    NULL, /* m_reload */
-    NULL, /* m_traverse */
-    NULL, /* m_clear */
-    NULL /* m_free */
-};
-#endif
-
-static __Pyx_StringTabEntry __pyx_string_tab[] = {
-  {&__pyx_kp_orig, __pyx_k_orig, sizeof(__pyx_k_orig), 1, 1, 1},
-  {&__pyx_kp_ntries, __pyx_k_ntries, sizeof(__pyx_k_ntries), 1, 1, 1},
-  {&__pyx_kp_trysize, __pyx_k_trysize, sizeof(__pyx_k_trysize), 1, 1, 1},
-  {&__pyx_kp_pal, __pyx_k_pal, sizeof(__pyx_k_pal), 1, 1, 1},
-  {&__pyx_kp_i0, __pyx_k_i0, sizeof(__pyx_k_i0), 1, 1, 1},
-  {&__pyx_kp_23, __pyx_k_23, sizeof(__pyx_k_23), 1, 1, 1},
-  {&__pyx_kp_cps, __pyx_k_cps, sizeof(__pyx_k_cps), 1, 1, 1},
-  {&__pyx_kp_times, __pyx_k_times, sizeof(__pyx_k_times), 1, 1, 1},
-  {&__pyx_kp_ti, __pyx_k_ti, sizeof(__pyx_k_ti), 1, 1, 1},
-  {&__pyx_kp_ci, __pyx_k_ci, sizeof(__pyx_k_ci), 1, 1, 1},
-  {&__pyx_kp_bi, __pyx_k_bi, sizeof(__pyx_k_bi), 1, 1, 1},
-  {&__pyx_kp_to, __pyx_k_to, sizeof(__pyx_k_to), 1, 1, 1},
-  {&__pyx_kp_co, __pyx_k_co, sizeof(__pyx_k_co), 1, 1, 1},
-  {&__pyx_kp_bo, __pyx_k_bo, sizeof(__pyx_k_bo), 1, 1, 1},
-  {&__pyx_kp_curve, __pyx_k_curve, sizeof(__pyx_k_curve), 1, 1, 1},
-  {&__pyx_kp_amp, __pyx_k_amp, sizeof(__pyx_k_amp), 1, 1, 1},
-  {&__pyx_kp_freq, __pyx_k_freq, sizeof(__pyx_k_freq), 1, 1, 1},
-  {&__pyx_kp_slope, __pyx_k_slope, sizeof(__pyx_k_slope), 1, 1, 1},
-  {&__pyx_kp_mode, __pyx_k_mode, sizeof(__pyx_k_mode), 1, 1, 1},
-  {&__pyx_kp_peak, __pyx_k_peak, sizeof(__pyx_k_peak), 1, 1, 1},
-  {&__pyx_kp_d, __pyx_k_d, sizeof(__pyx_k_d), 1, 1, 1},
-  {&__pyx_kp_i, __pyx_k_i, sizeof(__pyx_k_i), 1, 1, 1},
-  {&__pyx_kp_s, __pyx_k_s, sizeof(__pyx_k_s), 1, 1, 1},
-  {&__pyx_kp_e, __pyx_k_e, sizeof(__pyx_k_e), 1, 1, 1},
-  {&__pyx_kp_numpy, __pyx_k_numpy, sizeof(__pyx_k_numpy), 1, 1, 1},
-  {&__pyx_kp_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 1, 1},
-  {&__pyx_kp_random, __pyx_k_random, sizeof(__pyx_k_random), 1, 1, 1},
-  {&__pyx_kp_rn, __pyx_k_rn, sizeof(__pyx_k_rn), 0, 1, 1},
-  {&__pyx_kp_copy, __pyx_k_copy, sizeof(__pyx_k_copy), 1, 1, 1},
-  {&__pyx_kp_get_length, __pyx_k_get_length, sizeof(__pyx_k_get_length), 1, 1, 1},
-  {&__pyx_kp_pix_swap, __pyx_k_pix_swap, sizeof(__pyx_k_pix_swap), 1, 1, 1},
-  {&__pyx_kp_randint, __pyx_k_randint, sizeof(__pyx_k_randint), 1, 1, 1},
-  {&__pyx_kp_pix_diff, __pyx_k_pix_diff, sizeof(__pyx_k_pix_diff), 1, 1, 1},
-  {&__pyx_kp_zeros, __pyx_k_zeros, sizeof(__pyx_k_zeros), 1, 1, 1},
-  {&__pyx_kp_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 1, 1, 1},
-  {&__pyx_kp_24, __pyx_k_24, sizeof(__pyx_k_24), 1, 1, 1},
-  {&__pyx_kp_cdiff, __pyx_k_cdiff, sizeof(__pyx_k_cdiff), 1, 1, 1},
-  {&__pyx_kp_cos, __pyx_k_cos, sizeof(__pyx_k_cos), 1, 1, 1},
-  {&__pyx_kp_pi, __pyx_k_pi, sizeof(__pyx_k_pi), 1, 1, 1},
-  {&__pyx_kp_sinh, __pyx_k_sinh, sizeof(__pyx_k_sinh), 1, 1, 1},
-  {&__pyx_kp_tanh, __pyx_k_tanh, sizeof(__pyx_k_tanh), 1, 1, 1},
-  {&__pyx_kp_exp, __pyx_k_exp, sizeof(__pyx_k_exp), 1, 1, 1},
-  {&__pyx_kp_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 1, 1, 1},
-  {&__pyx_kp_sin, __pyx_k_sin, sizeof(__pyx_k_sin), 1, 1, 1},
-  {&__pyx_kp_sign, __pyx_k_sign, sizeof(__pyx_k_sign), 1, 1, 1},
-  {&__pyx_kp_25, __pyx_k_25, sizeof(__pyx_k_25), 0, 0, 0},
-  {&__pyx_kp_26, __pyx_k_26, sizeof(__pyx_k_26), 0, 0, 0},
-  {&__pyx_kp_27, __pyx_k_27, sizeof(__pyx_k_27), 0, 0, 0},
-  {&__pyx_kp_28, __pyx_k_28, sizeof(__pyx_k_28), 0, 0, 0},
-  {&__pyx_kp_29, __pyx_k_29, sizeof(__pyx_k_29), 0, 0, 0},
-  {&__pyx_kp_30, __pyx_k_30, sizeof(__pyx_k_30), 0, 0, 0},
-  {&__pyx_kp_31, __pyx_k_31, sizeof(__pyx_k_31), 0, 0, 0},
-  {&__pyx_kp___getbuffer__, __pyx_k___getbuffer__, sizeof(__pyx_k___getbuffer__), 1, 1, 1},
-  {&__pyx_kp___releasebuffer__, __pyx_k___releasebuffer__, sizeof(__pyx_k___releasebuffer__), 1, 1, 1},
-  {&__pyx_kp_info, __pyx_k_info, sizeof(__pyx_k_info), 1, 1, 1},
-  {&__pyx_kp_flags, __pyx_k_flags, sizeof(__pyx_k_flags), 1, 1, 1},
-  {&__pyx_kp_iteritems, __pyx_k_iteritems, sizeof(__pyx_k_iteritems), 1, 1, 1},
-  {&__pyx_kp_next, __pyx_k_next, sizeof(__pyx_k_next), 1, 1, 1},
-  {&__pyx_kp_StopIteration, __pyx_k_StopIteration, sizeof(__pyx_k_StopIteration), 1, 1, 1},
-  {&__pyx_kp_pop, __pyx_k_pop, sizeof(__pyx_k_pop), 1, 1, 1},
-  {&__pyx_kp_RuntimeError, __pyx_k_RuntimeError, sizeof(__pyx_k_RuntimeError), 1, 1, 1},
-  {&__pyx_kp_1, __pyx_k_1, sizeof(__pyx_k_1), 0, 0, 0},
-  {&__pyx_kp_2, __pyx_k_2, sizeof(__pyx_k_2), 0, 0, 0},
-  {&__pyx_kp_20, __pyx_k_20, sizeof(__pyx_k_20), 0, 0, 0},
-  {&__pyx_kp_21, __pyx_k_21, sizeof(__pyx_k_21), 0, 0, 0},
-  {&__pyx_kp_22, __pyx_k_22, sizeof(__pyx_k_22), 0, 0, 0},
-  {0, 0, 0, 0, 0, 0}
-};
-static int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_ValueError = __Pyx_GetName(__pyx_b, __pyx_kp_ValueError); if (!__pyx_builtin_ValueError) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 174; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_StopIteration = __Pyx_GetName(__pyx_b, __pyx_kp_StopIteration); if (!__pyx_builtin_StopIteration) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 144; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_builtin_RuntimeError = __Pyx_GetName(__pyx_b, __pyx_kp_RuntimeError); if (!__pyx_builtin_RuntimeError) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 158; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-static int __Pyx_InitGlobals(void) {
-  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_255 = PyInt_FromLong(255); if (unlikely(!__pyx_int_255)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_253 = PyInt_FromLong(253); if (unlikely(!__pyx_int_253)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_252 = PyInt_FromLong(252); if (unlikely(!__pyx_int_252)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  if (__Pyx_InitStrings(__pyx_string_tab) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  return 0;
-  __pyx_L1_error:;
-  return -1;
-}
-
-#if PY_MAJOR_VERSION < 3
-PyMODINIT_FUNC init_utils(void); /*proto*/
-PyMODINIT_FUNC init_utils(void)
-#else
-PyMODINIT_FUNC PyInit__utils(void); /*proto*/
-PyMODINIT_FUNC PyInit__utils(void)
-#endif
-{
-  PyObject *__pyx_1 = 0;
-  __pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_empty_tuple)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Library function declarations ---*/
-  __pyx_init_filenames();
-  /*--- Initialize various global constants etc. ---*/
-  if (unlikely(__Pyx_InitGlobals() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Module creation code ---*/
-  #if PY_MAJOR_VERSION < 3
-  __pyx_m = Py_InitModule4("_utils", __pyx_methods, 0, 0, PYTHON_API_VERSION);
-  #else
-  __pyx_m = PyModule_Create(&__pyx_moduledef);
-  #endif
-  if (!__pyx_m) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  #if PY_MAJOR_VERSION < 3
-  Py_INCREF(__pyx_m);
-  #endif
-  __pyx_b = PyImport_AddModule(__Pyx_BUILTIN_MODULE_NAME);
-  if (!__pyx_b) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_b) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;};
-  /*--- Builtin init code ---*/
-  if (unlikely(__Pyx_InitCachedBuiltins() < 0)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_skip_dispatch = 0;
-  /*--- Global init code ---*/
-  /*--- Function export code ---*/
-  /*--- Type init code ---*/
-  /*--- Type import code ---*/
-  __pyx_ptype_5numpy_dtype = __Pyx_ImportType("numpy", "dtype", sizeof(PyArray_Descr)); if (unlikely(!__pyx_ptype_5numpy_dtype)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 30; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  __pyx_ptype_5numpy_ndarray = __Pyx_ImportType("numpy", "ndarray", sizeof(PyArrayObject)); if (unlikely(!__pyx_ptype_5numpy_ndarray)) {__pyx_filename = __pyx_f[1]; __pyx_lineno = 36; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  /*--- Function import code ---*/
-  /*--- Execution code ---*/
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":1
- * import numpy as np             # <<<<<<<<<<<<<<
- * cimport numpy as np
- * import random as rn
- */
-  __pyx_1 = __Pyx_Import(__pyx_kp_numpy, 0); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyObject_SetAttr(__pyx_m, __pyx_kp_np, __pyx_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 1; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  /* "/home/vitor/coding/fr0st/trunk/lib/_utils.pyx":3
- * import numpy as np
- * cimport numpy as np
- * import random as rn             # <<<<<<<<<<<<<<
- * 
- * """
- */
-  __pyx_1 = __Pyx_Import(__pyx_kp_random, 0); if (unlikely(!__pyx_1)) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  if (PyObject_SetAttr(__pyx_m, __pyx_kp_rn, __pyx_1) < 0) {__pyx_filename = __pyx_f[0]; __pyx_lineno = 3; __pyx_clineno = __LINE__; goto __pyx_L1_error;}
-  Py_DECREF(__pyx_1); __pyx_1 = 0;
-
-  /* "/var/lib/python-support/python2.6/Cython/Includes/stdlib.pxd":2
- * 
- * cdef extern from "stdlib.h":             # <<<<<<<<<<<<<<
- *     ctypedef unsigned long size_t
- *     void free(void *ptr)
- */
-  #if PY_MAJOR_VERSION < 3
-  return;
-  #else
-  return __pyx_m;
-  #endif
-  __pyx_L1_error:;
-  Py_XDECREF(__pyx_1);
-  __Pyx_AddTraceback("lib._utils");
-  #if PY_MAJOR_VERSION >= 3
-  return NULL;
-  #endif
-}
-
-static const char *__pyx_filenames[] = {
-  "_utils.pyx",
-  "numpy.pxd",
-};
-
-/* Runtime support code */
-
-static void __pyx_init_filenames(void) {
-  __pyx_f = __pyx_filenames;
-}
-
-static void __Pyx_RaiseDoubleKeywordsError(
-    const char* func_name,
-    PyObject* kw_name)
-{
-    PyErr_Format(PyExc_TypeError,
-        #if PY_MAJOR_VERSION >= 3
-        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
-        #else
-        "%s() got multiple values for keyword argument '%s'", func_name,
-        PyString_AS_STRING(kw_name));
-        #endif
-}
-
-static void __Pyx_RaiseArgtupleInvalid(
-    const char* func_name,
-    int exact,
-    Py_ssize_t num_min,
-    Py_ssize_t num_max,
-    Py_ssize_t num_found)
-{
-    Py_ssize_t num_expected;
-    const char *number, *more_or_less;
-
-    if (num_found < num_min) {
-        num_expected = num_min;
-        more_or_less = "at least";
-    } else {
-        num_expected = num_max;
-        more_or_less = "at most";
-    }
-    if (exact) {
-        more_or_less = "exactly";
-    }
-    number = (num_expected == 1) ? "" : "s";
-    PyErr_Format(PyExc_TypeError,
-        #if PY_VERSION_HEX < 0x02050000
-            "%s() takes %s %d positional argument%s (%d given)",
-        #else
-            "%s() takes %s %zd positional argument%s (%zd given)",
-        #endif
-        func_name, more_or_less, num_expected, number, num_found);
-}
-
-static int __Pyx_ParseOptionalKeywords(
-    PyObject *kwds,
-    PyObject **argnames[],
-    PyObject *kwds2,
-    PyObject *values[],
-    Py_ssize_t num_pos_args,
-    const char* function_name)
-{
-    PyObject *key = 0, *value = 0;
-    Py_ssize_t pos = 0;
-    PyObject*** name;
-    PyObject*** first_kw_arg = argnames + num_pos_args;
-
-    while (PyDict_Next(kwds, &pos, &key, &value)) {
-        #if PY_MAJOR_VERSION < 3
-        if (unlikely(!PyString_CheckExact(key)) && unlikely(!PyString_Check(key))) {
-        #else
-        if (unlikely(!PyUnicode_CheckExact(key)) && unlikely(!PyUnicode_Check(key))) {
-        #endif
-            goto invalid_keyword_type;
-        } else {
-            name = argnames;
-            while (*name && (**name != key)) name++;
-            if (*name) {
-                if (name < first_kw_arg) goto arg_passed_twice;
-                values[name-argnames] = value;
-            } else {
-                for (name = first_kw_arg; *name; name++) {
-                    #if PY_MAJOR_VERSION >= 3
-                    if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
-                        PyUnicode_Compare(**name, key) == 0) break;
-                    #else
-                    if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
-                        strcmp(PyString_AS_STRING(**name),
-                               PyString_AS_STRING(key)) == 0) break;
-                    #endif
-                }
-                if (*name) {
-                    values[name-argnames] = value;
-                } else {
-                    /* unexpected keyword found */
-                    for (name=argnames; name != first_kw_arg; name++) {
-                        if (**name == key) goto arg_passed_twice;
-                        #if PY_MAJOR_VERSION >= 3
-                        if (PyUnicode_GET_SIZE(**name) == PyUnicode_GET_SIZE(key) &&
-                            PyUnicode_Compare(**name, key) == 0) goto arg_passed_twice;
-                        #else
-                        if (PyString_GET_SIZE(**name) == PyString_GET_SIZE(key) &&
-                            strcmp(PyString_AS_STRING(**name),
-                                   PyString_AS_STRING(key)) == 0) goto arg_passed_twice;
-                        #endif
-                    }
-                    if (kwds2) {
-                        if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
-                    } else {
-                        goto invalid_keyword;
-                    }
-                }
-            }
-        }
-    }
-    return 0;
-arg_passed_twice:
-    __Pyx_RaiseDoubleKeywordsError(function_name, **name);
-    goto bad;
-invalid_keyword_type:
-    PyErr_Format(PyExc_TypeError,
-        "%s() keywords must be strings", function_name);
-    goto bad;
-invalid_keyword:
-    PyErr_Format(PyExc_TypeError,
-    #if PY_MAJOR_VERSION < 3
-        "%s() got an unexpected keyword argument '%s'",
-        function_name, PyString_AsString(key));
-    #else
-        "%s() got an unexpected keyword argument '%U'",
-        function_name, key);
-    #endif
-bad:
-    return -1;
-}
-
-static INLINE void __Pyx_SafeReleaseBuffer(Py_buffer* info) {
-  if (info->buf == NULL) return;
-  if (info->suboffsets == __Pyx_minusones) info->suboffsets = NULL;
-  __Pyx_ReleaseBuffer(info);
-}
-
-static INLINE void __Pyx_ZeroBuffer(Py_buffer* buf) {
-  buf->buf = NULL;
-  buf->obj = NULL;
-  buf->strides = __Pyx_zeros;
-  buf->shape = __Pyx_zeros;
-  buf->suboffsets = __Pyx_minusones;
-}
-
-static INLINE const char* __Pyx_ConsumeWhitespace(const char* ts) {
-  while (1) {
-    switch (*ts) {
-      case '@':
-      case 10:
-      case 13:
-      case ' ':
-        ++ts;
-        break;
-      case '=':
-      case '<':
-      case '>':
-      case '!':
-        PyErr_SetString(PyExc_ValueError, "Buffer acquisition error: Only native byte order, size and alignment supported.");
-        return NULL;               
-      default:
-        return ts;
-    }
-  }
-}
-
-static void __Pyx_BufferNdimError(Py_buffer* buffer, int expected_ndim) {
-  PyErr_Format(PyExc_ValueError,
-               "Buffer has wrong number of dimensions (expected %d, got %d)",
-               expected_ndim, buffer->ndim);
-}
-
-static const char* __Pyx_DescribeTokenInFormatString(const char* ts) {
-  switch (*ts) {
-    case 'b': return "char";
-    case 'B': return "unsigned char";
-    case 'h': return "short";
-    case 'H': return "unsigned short";
-    case 'i': return "int";
-    case 'I': return "unsigned int";
-    case 'l': return "long";
-    case 'L': return "unsigned long";
-    case 'q': return "long long";
-    case 'Q': return "unsigned long long";
-    case 'f': return "float";
-    case 'd': return "double";
-    case 'g': return "long double";
-    case 'Z': switch (*(ts+1)) {
-        case 'f': return "complex float";
-        case 'd': return "complex double";
-        case 'g': return "complex long double";
-        default: return "unparseable format string";
-    }
-    case 'T': return "a struct";
-    case 'O': return "Python object";
-    case 'P': return "a pointer";
-    default: return "unparseable format string";
-  }
-}
-
-static const char* __Pyx_CheckTypestring_nn___pyx_t_5numpy_float32_t(const char* ts) {
-    int ok;
-    ts = __Pyx_ConsumeWhitespace(ts); if (!ts) return NULL;
-    if (*ts == '1') ++ts;
-    switch (*ts) {
-      case 'f': ok = (sizeof(__pyx_t_5numpy_float32_t) == sizeof(float) && (__pyx_t_5numpy_float32_t)-1 < 0); break;
-      case 'd': ok = (sizeof(__pyx_t_5numpy_float32_t) == sizeof(double) && (__pyx_t_5numpy_float32_t)-1 < 0); break;
-      case 'g': ok = (sizeof(__pyx_t_5numpy_float32_t) == sizeof(long double) && (__pyx_t_5numpy_float32_t)-1 < 0); break;
-      default: ok = 0;
-    }
-    if (!(ok)) {
-      PyErr_Format(PyExc_ValueError, "Buffer dtype mismatch (expected numpy.float32_t, got %s)", __Pyx_DescribeTokenInFormatString(ts));
-      return NULL;
-    }
-    ++ts;
-    return ts;
-  }
-  
-static int __Pyx_GetBuffer_nn___pyx_t_5numpy_float32_t(PyObject* obj, Py_buffer* buf, int flags, int nd, int cast) {
-  const char* ts;
-  if (obj == Py_None) {
-    __Pyx_ZeroBuffer(buf);
-    return 0;
-  }
-  buf->buf = NULL;
-  if (__Pyx_GetBuffer(obj, buf, flags) == -1) goto fail;
-  if (buf->ndim != nd) {
-    __Pyx_BufferNdimError(buf, nd);
-    goto fail;
-  }
-  if (!cast) {
-    ts = buf->format;
-    ts = __Pyx_ConsumeWhitespace(ts);
-    if (!ts) goto fail;
-    ts = __Pyx_CheckTypestring_nn___pyx_t_5numpy_float32_t(ts);
-    if (!ts) goto fail;
-    ts = __Pyx_ConsumeWhitespace(ts);
-    if (!ts) goto fail;
-    if (*ts != 0) {
-      PyErr_Format(PyExc_ValueError,
-        "Buffer dtype mismatch (expected end, got %s)",
-        __Pyx_DescribeTokenInFormatString(ts));
-      goto fail;
-    }
-  } else {
-    if (buf->itemsize != sizeof(__pyx_t_5numpy_float32_t)) {
-      PyErr_SetString(PyExc_ValueError,
-        "Attempted cast of buffer to datatype of different size.");
-      goto fail;
-    }
-  }
-  if (buf->suboffsets == NULL) buf->suboffsets = __Pyx_minusones;
-  return 0;
-fail:;
-  __Pyx_ZeroBuffer(buf);
-  return -1;
-}
-static void __Pyx_RaiseBufferFallbackError(void) {
-  PyErr_Format(PyExc_ValueError,
-     "Buffer acquisition failed on assignment; and then reacquiring the old buffer failed too!");
-}
-
-
-static INLINE void __Pyx_ErrRestore(PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-
-    tmp_type = tstate->curexc_type;
-    tmp_value = tstate->curexc_value;
-    tmp_tb = tstate->curexc_traceback;
-    tstate->curexc_type = type;
-    tstate->curexc_value = value;
-    tstate->curexc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-
-static INLINE void __Pyx_ErrFetch(PyObject **type, PyObject **value, PyObject **tb) {
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->curexc_type;
-    *value = tstate->curexc_value;
-    *tb = tstate->curexc_traceback;
-
-    tstate->curexc_type = 0;
-    tstate->curexc_value = 0;
-    tstate->curexc_traceback = 0;
-}
-
-static void __Pyx_RaiseBufferIndexError(int axis) {
-  PyErr_Format(PyExc_IndexError,
-     "Out of bounds on buffer access (axis %d)", axis);
-}
-
-static const char* __Pyx_CheckTypestring_nn___pyx_t_5numpy_int32_t(const char* ts) {
-    int ok;
-    ts = __Pyx_ConsumeWhitespace(ts); if (!ts) return NULL;
-    if (*ts == '1') ++ts;
-    switch (*ts) {
-      case 'b': ok = (sizeof(__pyx_t_5numpy_int32_t) == sizeof(char) && (__pyx_t_5numpy_int32_t)-1 < 0); break;
-      case 'h': ok = (sizeof(__pyx_t_5numpy_int32_t) == sizeof(short) && (__pyx_t_5numpy_int32_t)-1 < 0); break;
-      case 'i': ok = (sizeof(__pyx_t_5numpy_int32_t) == sizeof(int) && (__pyx_t_5numpy_int32_t)-1 < 0); break;
-      case 'l': ok = (sizeof(__pyx_t_5numpy_int32_t) == sizeof(long) && (__pyx_t_5numpy_int32_t)-1 < 0); break;
-      case 'q': ok = (sizeof(__pyx_t_5numpy_int32_t) == sizeof(long long) && (__pyx_t_5numpy_int32_t)-1 < 0); break;
-      default: ok = 0;
-    }
-    if (!(ok)) {
-      PyErr_Format(PyExc_ValueError, "Buffer dtype mismatch (expected numpy.int32_t, got %s)", __Pyx_DescribeTokenInFormatString(ts));
-      return NULL;
-    }
-    ++ts;
-    return ts;
-  }
-  
-static int __Pyx_GetBuffer_nn___pyx_t_5numpy_int32_t(PyObject* obj, Py_buffer* buf, int flags, int nd, int cast) {
-  const char* ts;
-  if (obj == Py_None) {
-    __Pyx_ZeroBuffer(buf);
-    return 0;
-  }
-  buf->buf = NULL;
-  if (__Pyx_GetBuffer(obj, buf, flags) == -1) goto fail;
-  if (buf->ndim != nd) {
-    __Pyx_BufferNdimError(buf, nd);
-    goto fail;
-  }
-  if (!cast) {
-    ts = buf->format;
-    ts = __Pyx_ConsumeWhitespace(ts);
-    if (!ts) goto fail;
-    ts = __Pyx_CheckTypestring_nn___pyx_t_5numpy_int32_t(ts);
-    if (!ts) goto fail;
-    ts = __Pyx_ConsumeWhitespace(ts);
-    if (!ts) goto fail;
-    if (*ts != 0) {
-      PyErr_Format(PyExc_ValueError,
-        "Buffer dtype mismatch (expected end, got %s)",
-        __Pyx_DescribeTokenInFormatString(ts));
-      goto fail;
-    }
-  } else {
-    if (buf->itemsize != sizeof(__pyx_t_5numpy_int32_t)) {
-      PyErr_SetString(PyExc_ValueError,
-        "Attempted cast of buffer to datatype of different size.");
-      goto fail;
-    }
-  }
-  if (buf->suboffsets == NULL) buf->suboffsets = __Pyx_minusones;
-  return 0;
-fail:;
-  __Pyx_ZeroBuffer(buf);
-  return -1;
-}
-
-static int __Pyx_ArgTypeTest(PyObject *obj, PyTypeObject *type, int none_allowed,
-    const char *name, int exact)
-{
-    if (!type) {
-        PyErr_Format(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (none_allowed && obj == Py_None) return 1;
-    else if (exact) {
-        if (Py_TYPE(obj) == type) return 1;
-    }
-    else {
-        if (PyObject_TypeCheck(obj, type)) return 1;
-    }
-    PyErr_Format(PyExc_TypeError,
-        "Argument '%s' has incorrect type (expected %s, got %s)",
-        name, type->tp_name, Py_TYPE(obj)->tp_name);
-    return 0;
-}
-
-#if PY_MAJOR_VERSION < 3
-static int __Pyx_GetBuffer(PyObject *obj, Py_buffer *view, int flags) {
-  #if PY_VERSION_HEX >= 0x02060000
-  if (Py_TYPE(obj)->tp_flags & Py_TPFLAGS_HAVE_NEWBUFFER)
-      return PyObject_GetBuffer(obj, view, flags);
-  #endif
-  if (PyObject_TypeCheck(obj, __pyx_ptype_5numpy_ndarray)) return __pyx_pf_5numpy_7ndarray___getbuffer__(obj, view, flags);
-  else {
-  PyErr_Format(PyExc_TypeError, "'%100s' does not have the buffer interface", Py_TYPE(obj)->tp_name);
-  return -1;
-    }
-}
-
-static void __Pyx_ReleaseBuffer(Py_buffer *view) {
-  PyObject* obj = view->obj;
-  if (obj) {
-if (PyObject_TypeCheck(obj, __pyx_ptype_5numpy_ndarray)) __pyx_pf_5numpy_7ndarray___releasebuffer__(obj, view);
-    Py_DECREF(obj);
-    view->obj = NULL;
-  }
-}
-
-#endif
-
-static PyObject *__Pyx_Import(PyObject *name, PyObject *from_list) {
-    PyObject *__import__ = 0;
-    PyObject *empty_list = 0;
-    PyObject *module = 0;
-    PyObject *global_dict = 0;
-    PyObject *empty_dict = 0;
-    PyObject *list;
-    __import__ = PyObject_GetAttrString(__pyx_b, "__import__");
-    if (!__import__)
-        goto bad;
-    if (from_list)
-        list = from_list;
-    else {
-        empty_list = PyList_New(0);
-        if (!empty_list)
-            goto bad;
-        list = empty_list;
-    }
-    global_dict = PyModule_GetDict(__pyx_m);
-    if (!global_dict)
-        goto bad;
-    empty_dict = PyDict_New();
-    if (!empty_dict)
-        goto bad;
-    module = PyObject_CallFunction(__import__, "OOOO",
-        name, global_dict, empty_dict, list);
-bad:
-    Py_XDECREF(empty_list);
-    Py_XDECREF(__import__);
-    Py_XDECREF(empty_dict);
-    return module;
-}
-
-static int __Pyx_TypeTest(PyObject *obj, PyTypeObject *type) {
-    if (!type) {
-        PyErr_Format(PyExc_SystemError, "Missing type object");
-        return 0;
-    }
-    if (obj == Py_None || PyObject_TypeCheck(obj, type))
-        return 1;
-    PyErr_Format(PyExc_TypeError, "Cannot convert %s to %s",
-        Py_TYPE(obj)->tp_name, type->tp_name);
-    return 0;
-}
-
-static PyObject *__Pyx_GetName(PyObject *dict, PyObject *name) {
-    PyObject *result;
-    result = PyObject_GetAttr(dict, name);
-    if (!result)
-        PyErr_SetObject(PyExc_NameError, name);
-    return result;
-}
-
-static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb) {
-    Py_XINCREF(type);
-    Py_XINCREF(value);
-    Py_XINCREF(tb);
-    /* First, check the traceback argument, replacing None with NULL. */
-    if (tb == Py_None) {
-        Py_DECREF(tb);
-        tb = 0;
-    }
-    else if (tb != NULL && !PyTraceBack_Check(tb)) {
-        PyErr_SetString(PyExc_TypeError,
-            "raise: arg 3 must be a traceback or None");
-        goto raise_error;
-    }
-    /* Next, replace a missing value with None */
-    if (value == NULL) {
-        value = Py_None;
-        Py_INCREF(value);
-    }
-    #if PY_VERSION_HEX < 0x02050000
-    if (!PyClass_Check(type))
-    #else
-    if (!PyType_Check(type))
-    #endif
-    {
-        /* Raising an instance.  The value should be a dummy. */
-        if (value != Py_None) {
-            PyErr_SetString(PyExc_TypeError,
-                "instance exception may not have a separate value");
-            goto raise_error;
-        }
-        /* Normalize to raise <class>, <instance> */
-        Py_DECREF(value);
-        value = type;
-        #if PY_VERSION_HEX < 0x02050000
-            if (PyInstance_Check(type)) {
-                type = (PyObject*) ((PyInstanceObject*)type)->in_class;
-                Py_INCREF(type);
-            }
-            else {
-                type = 0;
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception must be an old-style class or instance");
-                goto raise_error;
-            }
-        #else
-            type = (PyObject*) Py_TYPE(type);
-            Py_INCREF(type);
-            if (!PyType_IsSubtype((PyTypeObject *)type, (PyTypeObject *)PyExc_BaseException)) {
-                PyErr_SetString(PyExc_TypeError,
-                    "raise: exception class must be a subclass of BaseException");
-                goto raise_error;
-            }
-        #endif
-    }
-    __Pyx_ErrRestore(type, value, tb);
-    return;
-raise_error:
-    Py_XDECREF(value);
-    Py_XDECREF(type);
-    Py_XDECREF(tb);
-    return;
-}
-
-static INLINE void __Pyx_ExceptionSave(PyObject **type, PyObject **value, PyObject **tb) {
-    PyThreadState *tstate = PyThreadState_GET();
-    *type = tstate->exc_type;
-    *value = tstate->exc_value;
-    *tb = tstate->exc_traceback;
-    Py_XINCREF(*type);
-    Py_XINCREF(*value);
-    Py_XINCREF(*tb);
-}
-
-static void __Pyx_ExceptionReset(PyObject *type, PyObject *value, PyObject *tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = type;
-    tstate->exc_value = value;
-    tstate->exc_traceback = tb;
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-}
-
-static int __Pyx_GetException(PyObject **type, PyObject **value, PyObject **tb) {
-    PyObject *tmp_type, *tmp_value, *tmp_tb;
-    PyThreadState *tstate = PyThreadState_GET();
-    __Pyx_ErrFetch(type, value, tb);
-    PyErr_NormalizeException(type, value, tb);
-    if (PyErr_Occurred())
-        goto bad;
-    Py_INCREF(*type);
-    Py_INCREF(*value);
-    Py_INCREF(*tb);
-    tmp_type = tstate->exc_type;
-    tmp_value = tstate->exc_value;
-    tmp_tb = tstate->exc_traceback;
-    tstate->exc_type = *type;
-    tstate->exc_value = *value;
-    tstate->exc_traceback = *tb;
-    /* Make sure tstate is in a consistent state when we XDECREF
-    these objects (XDECREF may run arbitrary code). */
-    Py_XDECREF(tmp_type);
-    Py_XDECREF(tmp_value);
-    Py_XDECREF(tmp_tb);
-    return 0;
-bad:
-    Py_XDECREF(*type);
-    Py_XDECREF(*value);
-    Py_XDECREF(*tb);
-    return -1;
-}
-
-
-#ifndef __PYX_HAVE_RT_ImportType
-#define __PYX_HAVE_RT_ImportType
-static PyTypeObject *__Pyx_ImportType(const char *module_name, const char *class_name,
-    long size)
-{
-    PyObject *py_module = 0;
-    PyObject *result = 0;
-    PyObject *py_name = 0;
-
-    py_module = __Pyx_ImportModule(module_name);
-    if (!py_module)
-        goto bad;
-    #if PY_MAJOR_VERSION < 3
-    py_name = PyString_FromString(class_name);
-    #else
-    py_name = PyUnicode_FromString(class_name);
-    #endif
-    if (!py_name)
-        goto bad;
-    result = PyObject_GetAttr(py_module, py_name);
-    Py_DECREF(py_name);
-    py_name = 0;
-    Py_DECREF(py_module);
-    py_module = 0;
-    if (!result)
-        goto bad;
-    if (!PyType_Check(result)) {
-        PyErr_Format(PyExc_TypeError, 
-            "%s.%s is not a type object",
-            module_name, class_name);
-        goto bad;
-    }
-    if (((PyTypeObject *)result)->tp_basicsize != size) {
-        PyErr_Format(PyExc_ValueError, 
-            "%s.%s does not appear to be the correct type object",
-            module_name, class_name);
-        goto bad;
-    }
-    return (PyTypeObject *)result;
-bad:
-    Py_XDECREF(py_module);
-    Py_XDECREF(result);
-    return 0;
-}
-#endif
-
-#ifndef __PYX_HAVE_RT_ImportModule
-#define __PYX_HAVE_RT_ImportModule
-static PyObject *__Pyx_ImportModule(const char *name) {
-    PyObject *py_name = 0;
-    PyObject *py_module = 0;
-
-    #if PY_MAJOR_VERSION < 3
-    py_name = PyString_FromString(name);
-    #else
-    py_name = PyUnicode_FromString(name);
-    #endif
-    if (!py_name)
-        goto bad;
-    py_module = PyImport_Import(py_name);
-    Py_DECREF(py_name);
-    return py_module;
-bad:
-    Py_XDECREF(py_name);
-    return 0;
-}
-#endif
-
-#include "compile.h"
-#include "frameobject.h"
-#include "traceback.h"
-
-static void __Pyx_AddTraceback(const char *funcname) {
-    PyObject *py_srcfile = 0;
-    PyObject *py_funcname = 0;
-    PyObject *py_globals = 0;
-    PyObject *empty_string = 0;
-    PyCodeObject *py_code = 0;
-    PyFrameObject *py_frame = 0;
-
-    #if PY_MAJOR_VERSION < 3
-    py_srcfile = PyString_FromString(__pyx_filename);
-    #else
-    py_srcfile = PyUnicode_FromString(__pyx_filename);
-    #endif
-    if (!py_srcfile) goto bad;
-    if (__pyx_clineno) {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
-        #else
-        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, __pyx_clineno);
-        #endif
-    }
-    else {
-        #if PY_MAJOR_VERSION < 3
-        py_funcname = PyString_FromString(funcname);
-        #else
-        py_funcname = PyUnicode_FromString(funcname);
-        #endif
-    }
-    if (!py_funcname) goto bad;
-    py_globals = PyModule_GetDict(__pyx_m);
-    if (!py_globals) goto bad;
-    #if PY_MAJOR_VERSION < 3
-    empty_string = PyString_FromStringAndSize("", 0);
-    #else
-    empty_string = PyBytes_FromStringAndSize("", 0);
-    #endif
-    if (!empty_string) goto bad;
-    py_code = PyCode_New(
-        0,            /*int argcount,*/
-        #if PY_MAJOR_VERSION >= 3
-        0,            /*int kwonlyargcount,*/
-        #endif
-        0,            /*int nlocals,*/
-        0,            /*int stacksize,*/
-        0,            /*int flags,*/
-        empty_string, /*PyObject *code,*/
-        __pyx_empty_tuple,  /*PyObject *consts,*/
-        __pyx_empty_tuple,  /*PyObject *names,*/
-        __pyx_empty_tuple,  /*PyObject *varnames,*/
-        __pyx_empty_tuple,  /*PyObject *freevars,*/
-        __pyx_empty_tuple,  /*PyObject *cellvars,*/
-        py_srcfile,   /*PyObject *filename,*/
-        py_funcname,  /*PyObject *name,*/
-        __pyx_lineno,   /*int firstlineno,*/
-        empty_string  /*PyObject *lnotab*/
-    );
-    if (!py_code) goto bad;
-    py_frame = PyFrame_New(
-        PyThreadState_GET(), /*PyThreadState *tstate,*/
-        py_code,             /*PyCodeObject *code,*/
-        py_globals,          /*PyObject *globals,*/
-        0                    /*PyObject *locals*/
-    );
-    if (!py_frame) goto bad;
-    py_frame->f_lineno = __pyx_lineno;
-    PyTraceBack_Here(py_frame);
-bad:
-    Py_XDECREF(py_srcfile);
-    Py_XDECREF(py_funcname);
-    Py_XDECREF(empty_string);
-    Py_XDECREF(py_code);
-    Py_XDECREF(py_frame);
-}
-
-static int __Pyx_InitStrings(__Pyx_StringTabEntry *t) {
-    while (t->p) {
-        #if PY_MAJOR_VERSION < 3
-        if (t->is_unicode && (!t->is_identifier)) {
-            *t->p = PyUnicode_DecodeUTF8(t->s, t->n - 1, NULL);
-        } else if (t->intern) {
-            *t->p = PyString_InternFromString(t->s);
-        } else {
-            *t->p = PyString_FromStringAndSize(t->s, t->n - 1);
-        }
-        #else  /* Python 3+ has unicode identifiers */
-        if (t->is_identifier || (t->is_unicode && t->intern)) {
-            *t->p = PyUnicode_InternFromString(t->s);
-        } else if (t->is_unicode) {
-            *t->p = PyUnicode_FromStringAndSize(t->s, t->n - 1);
-        } else {
-            *t->p = PyBytes_FromStringAndSize(t->s, t->n - 1);
-        }
-        #endif
-        if (!*t->p)
-            return -1;
-        ++t;
-    }
-    return 0;
-}
-
-/* Type Conversion Functions */
-
-static INLINE Py_ssize_t __pyx_PyIndex_AsSsize_t(PyObject* b) {
-  Py_ssize_t ival;
-  PyObject* x = PyNumber_Index(b);
-  if (!x) return -1;
-  ival = PyInt_AsSsize_t(x);
-  Py_DECREF(x);
-  return ival;
-}
-
-static INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
-   if (x == Py_True) return 1;
-   else if (x == Py_False) return 0;
-   else return PyObject_IsTrue(x);
-}
-
-static INLINE PY_LONG_LONG __pyx_PyInt_AsLongLong(PyObject* x) {
-    if (PyInt_CheckExact(x)) {
-        return PyInt_AS_LONG(x);
-    }
-    else if (PyLong_CheckExact(x)) {
-        return PyLong_AsLongLong(x);
-    }
-    else {
-        PY_LONG_LONG val;
-        PyObject* tmp = PyNumber_Int(x); if (!tmp) return (PY_LONG_LONG)-1;
-        val = __pyx_PyInt_AsLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-static INLINE unsigned PY_LONG_LONG __pyx_PyInt_AsUnsignedLongLong(PyObject* x) {
-    if (PyInt_CheckExact(x)) {
-        long val = PyInt_AS_LONG(x);
-        if (unlikely(val < 0)) {
-            PyErr_SetString(PyExc_TypeError, "Negative assignment to unsigned type.");
-            return (unsigned PY_LONG_LONG)-1;
-        }
-        return val;
-    }
-    else if (PyLong_CheckExact(x)) {
-        return PyLong_AsUnsignedLongLong(x);
-    }
-    else {
-        PY_LONG_LONG val;
-        PyObject* tmp = PyNumber_Int(x); if (!tmp) return (PY_LONG_LONG)-1;
-        val = __pyx_PyInt_AsUnsignedLongLong(tmp);
-        Py_DECREF(tmp);
-        return val;
-    }
-}
-
-
-static INLINE unsigned char __pyx_PyInt_unsigned_char(PyObject* x) {
-    if (sizeof(unsigned char) < sizeof(long)) {
-        long long_val = __pyx_PyInt_AsLong(x);
-        unsigned char val = (unsigned char)long_val;
-        if (unlikely((val != long_val)  || (long_val < 0))) {
-            PyErr_SetString(PyExc_OverflowError, "value too large to convert to unsigned char");
-            return (unsigned char)-1;
-        }
-        return val;
-    }
-    else {
-        return __pyx_PyInt_AsLong(x);
-    }
-}
-
-static INLINE unsigned short __pyx_PyInt_unsigned_short(PyObject* x) {
-    if (sizeof(unsigned short) < sizeof(long)) {
-        long long_val = __pyx_PyInt_AsLong(x);
-        unsigned short val = (unsigned short)long_val;
-        if (unlikely((val != long_val)  || (long_val < 0))) {
-            PyErr_SetString(PyExc_OverflowError, "value too large to convert to unsigned short");
-            return (unsigned short)-1;
-        }
-        return val;
-    }
-    else {
-        return __pyx_PyInt_AsLong(x);
-    }
-}
-
-static INLINE char __pyx_PyInt_char(PyObject* x) {
-    if (sizeof(char) < sizeof(long)) {
-        long long_val = __pyx_PyInt_AsLong(x);
-        char val = (char)long_val;
-        if (unlikely((val != long_val) )) {
-            PyErr_SetString(PyExc_OverflowError, "value too large to convert to char");
-            return (char)-1;
-        }
-        return val;
-    }
-    else {
-        return __pyx_PyInt_AsLong(x);
-    }
-}
-
-static INLINE short __pyx_PyInt_short(PyObject* x) {
-    if (sizeof(short) < sizeof(long)) {
-        long long_val = __pyx_PyInt_AsLong(x);
-        short val = (short)long_val;
-        if (unlikely((val != long_val) )) {
-            PyErr_SetString(PyExc_OverflowError, "value too large to convert to short");
-            return (short)-1;
-        }
-        return val;
-    }
-    else {
-        return __pyx_PyInt_AsLong(x);
-    }
-}
-
-static INLINE int __pyx_PyInt_int(PyObject* x) {
-    if (sizeof(int) < sizeof(long)) {
-        long long_val = __pyx_PyInt_AsLong(x);
-        int val = (int)long_val;
-        if (unlikely((val != long_val) )) {
-            PyErr_SetString(PyExc_OverflowError, "value too large to convert to int");
-            return (int)-1;
-        }
-        return val;
-    }
-    else {
-        return __pyx_PyInt_AsLong(x);
-    }
-}
-
-static INLINE long __pyx_PyInt_long(PyObject* x) {
-    if (sizeof(long) < sizeof(long)) {
-        long long_val = __pyx_PyInt_AsLong(x);
-        long val = (long)long_val;
-        if (unlikely((val != long_val) )) {
-            PyErr_SetString(PyExc_OverflowError, "value too large to convert to long");
-            return (long)-1;
-        }
-        return val;
-    }
-    else {
-        return __pyx_PyInt_AsLong(x);
-    }
-}
-
-static INLINE signed char __pyx_PyInt_signed_char(PyObject* x) {
-    if (sizeof(signed char) < sizeof(long)) {
-        long long_val = __pyx_PyInt_AsLong(x);
-        signed char val = (signed char)long_val;
-        if (unlikely((val != long_val) )) {
-            PyErr_SetString(PyExc_OverflowError, "value too large to convert to signed char");
-            return (signed char)-1;
-        }
-        return val;
-    }
-    else {
-        return __pyx_PyInt_AsLong(x);
-    }
-}
-
-static INLINE signed short __pyx_PyInt_signed_short(PyObject* x) {
-    if (sizeof(signed short) < sizeof(long)) {
-        long long_val = __pyx_PyInt_AsLong(x);
-        signed short val = (signed short)long_val;
-        if (unlikely((val != long_val) )) {
-            PyErr_SetString(PyExc_OverflowError, "value too large to convert to signed short");
-            return (signed short)-1;
-        }
-        return val;
-    }
-    else {
-        return __pyx_PyInt_AsLong(x);
-    }
-}
-
-static INLINE signed int __pyx_PyInt_signed_int(PyObject* x) {
-    if (sizeof(signed int) < sizeof(long)) {
-        long long_val = __pyx_PyInt_AsLong(x);
-        signed int val = (signed int)long_val;
-        if (unlikely((val != long_val) )) {
-            PyErr_SetString(PyExc_OverflowError, "value too large to convert to signed int");
-            return (signed int)-1;
-        }
-        return val;
-    }
-    else {
-        return __pyx_PyInt_AsLong(x);
-    }
-}
-
-static INLINE signed long __pyx_PyInt_signed_long(PyObject* x) {
-    if (sizeof(signed long) < sizeof(long)) {
-        long long_val = __pyx_PyInt_AsLong(x);
-        signed long val = (signed long)long_val;
-        if (unlikely((val != long_val) )) {
-            PyErr_SetString(PyExc_OverflowError, "value too large to convert to signed long");
-            return (signed long)-1;
-        }
-        return val;
-    }
-    else {
-        return __pyx_PyInt_AsLong(x);
-    }
-}
-
-static INLINE long double __pyx_PyInt_long_double(PyObject* x) {
-    if (sizeof(long double) < sizeof(long)) {
-        long long_val = __pyx_PyInt_AsLong(x);
-        long double val = (long double)long_val;
-        if (unlikely((val != long_val) )) {
-            PyErr_SetString(PyExc_OverflowError, "value too large to convert to long double");
-            return (long double)-1;
-        }
-        return val;
-    }
-    else {
-        return __pyx_PyInt_AsLong(x);
-    }
-}
-
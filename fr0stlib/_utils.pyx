@@ -1,9 +1,10 @@
+# cython: boundscheck=False, wraparound=False, cdivision=True
 import numpy as np
 cimport numpy as np
 import random as rn
 
-cdef extern from "math.h":
-    float floorf(float x)
+from libc.math cimport cos, sin, sinh, tanh, exp, pow, floor, M_PI
+from cython.parallel cimport prange
 
 
 """
@@ -12,133 +13,108 @@ get_length
 pix_diff
 pix_swap
 spline
+spline_at
 cdiff
-curve
+cdiff_array
+pblend
+pblend_array
 array_hsv2rgb
 interp_update_rgb
 interp_update_hsv
+
+The *_array and *_at functions take whole arrays of positions. Their work is
+done without the gil, and with parallel=True it's split over threads with
+OpenMP (if the module was compiled with it, otherwise it runs serially).
 """
 
+cdef inline int _pix_diff(float[:, :] pal, int i0, int i1) nogil:
+    cdef int diff = 0
+    cdef int i
+    for i in range(3):
+        diff += <int>((pal[i0,i] - pal[i1,i])**2)
+    return diff
+
+cdef inline void _pix_swap(float[:, :] pal, int i0, int i1) nogil:
+    cdef int i
+    cdef float tmp
+    for i in range(3):
+        tmp = pal[i0,i]
+        pal[i0,i] = pal[i1,i]
+        pal[i1,i] = tmp
+
+cdef int _get_length(float[:, :] pal) nogil:
+    cdef int length = 0
+    cdef int i
+    for i in range(1,256):
+        length += _pix_diff(pal, i, i-1)
+    return length
+
+
 def palette_improve(np.ndarray[ndim=2, dtype=np.float32_t] orig, int ntries,\
          int trysize):
-    cdef np.ndarray[ndim=2, dtype=np.float32_t] best = orig.copy()
-    cdef np.ndarray[ndim=2, dtype=np.float32_t] pal
-    cdef int best_len = get_length(best)
+    cdef np.ndarray[ndim=2, dtype=np.float32_t] best_arr = orig.copy()
+    cdef np.ndarray[ndim=2, dtype=np.float32_t] pal_arr
+    cdef float[:, :] best = best_arr
+    cdef float[:, :] pal
+    cdef int best_len = _get_length(best)
     cdef int j, i, i0, i1, as_is, swapd, pal_len
     for i in range(ntries):
-        pal = best.copy()
+        pal_arr = best_arr.copy()
+        pal = pal_arr
         for j in range(256):
-            pix_swap(pal, j, rn.randint(0, 255))
-        pal_len = get_length(pal)
+            _pix_swap(pal, j, rn.randint(0, 255))
+        pal_len = _get_length(pal)
         for j in range(trysize):
             i0 = (1 + rn.randint(0,253))
             i1 = (1 + rn.randint(0,253))
             if i0-i1==1:
-                as_is = (pix_diff(pal, i1-1, i1) +
-                        pix_diff(pal, i0, i0+1))
-                swapd = (pix_diff(pal, i1-1, i0) +
-                        pix_diff(pal, i0, i1+1))
+                as_is = (_pix_diff(pal, i1-1, i1) +
+                        _pix_diff(pal, i0, i0+1))
+                swapd = (_pix_diff(pal, i1-1, i0) +
+                        _pix_diff(pal, i0, i1+1))
             elif i1-i0==1:
-                as_is = (pix_diff(pal, i0-1, i0) +
-                      pix_diff(pal, i1, i1+1))
-                swapd = (pix_diff(pal, i0-1, i1) +
-                        pix_diff(pal, i1, i0+1))
+                as_is = (_pix_diff(pal, i0-1, i0) +
+                      _pix_diff(pal, i1, i1+1))
+                swapd = (_pix_diff(pal, i0-1, i1) +
+                        _pix_diff(pal, i1, i0+1))
             else:
-                as_is = (pix_diff(pal, i0, i0+1) +
-                        pix_diff(pal, i0, i0-1) +
-                        pix_diff(pal, i1, i1+1) +
-                        pix_diff(pal, i1, i1-1))
-                swapd = (pix_diff(pal, i1, i0+1) +
-                        pix_diff(pal, i1, i0-1) +
-                        pix_diff(pal, i0, i1+1) +
-                        pix_diff(pal, i0, i1-1))
+                as_is = (_pix_diff(pal, i0, i0+1) +
+                        _pix_diff(pal, i0, i0-1) +
+                        _pix_diff(pal, i1, i1+1) +
+                        _pix_diff(pal, i1, i1-1))
+                swapd = (_pix_diff(pal, i1, i0+1) +
+                        _pix_diff(pal, i1, i0-1) +
+                        _pix_diff(pal, i0, i1+1) +
+                        _pix_diff(pal, i0, i1-1))
             if swapd < as_is:
-                pix_swap(pal, i0, i1)
+                _pix_swap(pal, i0, i1)
                 pal_len += (swapd - as_is)
                 #end trysize loop
         if pal_len < best_len:
-            best = pal.copy()
+            best_arr = pal_arr
+            best = pal
             best_len = pal_len
         #end ntries loop
-    for i in xrange(256):
+    for i in range(256):
         i0 = (1 + rn.randint(0, 252))
         i1 = i0 + 1
-        as_is = (pix_diff(best, i0-1, i0) +
-            pix_diff(best, i1, i1+1))
-        swapd = (pix_diff(best, i0-1, i1) +
-            pix_diff(best, i0, i1+1))
+        as_is = (_pix_diff(best, i0-1, i0) +
+            _pix_diff(best, i1, i1+1))
+        swapd = (_pix_diff(best, i0-1, i1) +
+            _pix_diff(best, i0, i1+1))
         if swapd < as_is:
-            pix_swap(best, i0, i1)
-    return best
+            _pix_swap(best, i0, i1)
+    return best_arr
 
-def get_length(np.ndarray[ndim=2, dtype=np.float32_t] pal):
-    cdef int length = 0
-    cdef int i
-    for i in range(1,256):
-        length += pix_diff(pal, i, i-1)
-    return length
+def get_length(float[:, :] pal):
+    return _get_length(pal)
 
-def pix_diff(np.ndarray[ndim=2, dtype=np.float32_t] pal, int i0, int i1):
-    cdef int diff = 0
-    cdef int i
-    for i in range(3):
-        diff += (pal[i0,i] - pal[i1,i])**2
-    return diff
+def pix_diff(float[:, :] pal, int i0, int i1):
+    return _pix_diff(pal, i0, i1)
 
-def pix_swap(np.ndarray[ndim=2, dtype=np.float32_t] pal, int i0, int i1):
-    cdef int i
-    cdef float tmp
-    for i in range(3):
-        tmp = pal[i0,i]
-        pal[i0,i] = pal[i1,i]
-        pal[i1,i] = tmp
+def pix_swap(float[:, :] pal, int i0, int i1):
+    _pix_swap(pal, i0, i1)
 
-def spline(np.ndarray[ndim=1, dtype=np.float32_t] cps,
-           np.ndarray[ndim=1, dtype=np.int32_t] times,
-           int ti=0, int ci=-1, int bi=0, int to=0, int co=-1, int bo=0,
-           int curve=-1, float amp=0, int freq=1, float slope=1,
-           int mode=0, float peak=0.5):
-
-    cdef np.ndarray[ndim=1, dtype=np.float32_t] results
-    cdef float cona, conb, conc, cond
-    cdef float h00, h01, h10, h11
-    cdef float tani, tano
-    cdef int step = 0
-    cdef float i = 0.0
-    cdef int dt0, dt1, dt2
-    cdef float dv0, dv1, dv2
-
-    results = np.zeros(times[2]-times[1], dtype=np.float32)
-
-    cona = (1-ti)*(1-bi)*(1+ci)*0.5
-    conb = (1-ti)*(1+bi)*(1-ci)*0.5
-    conc = (1-to)*(1-bo)*(1-co)*0.5
-    cond = (1-to)*(1+bo)*(1+co)*0.5
-
-    dv0 = cps[1] - cps[0]
-    dv1 = cps[2] - cps[1]
-    dv2 = cps[3] - cps[2]
-    dt0 = times[1] - times[0]
-    dt1 = times[2] - times[1]
-    dt2 = times[3] - times[2]
-
-    while step < dt1:
-        h00 = 2*i**3 - 3*i**2 + 1
-        h01 = -2*i**3 + 3*i**2
-        h10 = i**3 - 2*i**2 + i
-        h11 = i**3 - i**2
-
-# ralf  q(k) = (x(k+1)-2*x(k) + x(k-1))/(x(k+1)-x(k-1))
-        tani =  cona*dv0 + conb*(dv1)
-        tano =  conc*dv1 + cond*dv2
-        if not (ti==0 and ci==-1 and bi==0): tani *= 2*dt1/(dt1+dt0)
-        if not (to==0 and co==-1 and bo==0): tano *= 2*dt2/(dt2+dt1)
-
-        results[step] = h00*cps[1] + h01*cps[2] + h10*tani + h11*tano
-        if curve<>-1: results[step] += cdiff(dv1, i, curve, amp, freq, slope, peak, mode)
-        i += 1.0/float(dt1)
-        step += 1
-    return results
 
 """
 Curve types:
@@ -147,8 +123,27 @@ Curve types:
     w/ amp + freq + slope: 7 - cos, 8 - sin
     w/ amp + peak: 9 - plin, 10 - ppar (w/mode - 0=--, 1=-+, 2=+-, 3=++)
 """
-def cdiff(float d, float i, int curve=0, float amp=0, int freq=1, float slope=1,
-          float peak=0.5, int mode=0):
+def _check_curve(int curve, int freq, float peak, int mode):
+    """Raises ValueError for settings _cdiff can't handle. This is done up
+    front, since the kernels themselves run without the gil."""
+    if curve < -1 or curve > 10:
+        raise ValueError('invalid curve')
+    if curve in (7, 8) and freq <= 0:
+        raise ValueError('Frequency must be positive non-zero')
+    if curve in (9, 10) and (peak <= 0.0 or peak >= 1.0):
+        raise ValueError('peak need to be 0-1')
+    if curve == 10 and (mode < 0 or mode > 3):
+        raise ValueError('invalid mode')
+
+
+cdef inline double _sign(double x) nogil:
+    if x > 0: return 1.0
+    elif x < 0: return -1.0
+    return x
+
+
+cdef double _cdiff(float d, float i, int curve, float amp, int freq,
+                   float slope, float peak, int mode) nogil:
     cdef float val
 
     if i==0: return 0.0
@@ -166,42 +161,32 @@ def cdiff(float d, float i, int curve=0, float amp=0, int freq=1, float slope=1,
         val = (d + amp) * (1 - (1-i)**2)
     elif curve==3:
         if d==0 and amp==0: return 0.0
-        val = (0.5*(d+amp)*(np.cos((i+1)*np.pi)+1))**slope
+        val = pow(0.5*(d+amp)*(cos((i+1)*M_PI)+1), slope)
     elif curve==4:
         if d==0: return 0.0
-        val = (np.sinh((2*i-1)*slope) + np.sinh(slope))/(2*np.sinh(slope))/d
+        val = (sinh((2*i-1)*slope) + sinh(slope))/(2*sinh(slope))/d
     elif curve==5:
         if d==0: return 0.0
-        val = (np.tanh((2*i-1)*slope) + np.tanh(slope))/(2*np.tanh(slope))/d
+        val = (tanh((2*i-1)*slope) + tanh(slope))/(2*tanh(slope))/d
     elif curve==6:
         if d==0 and amp==0: return 0.0
-        val = (d+amp) * ((1-np.exp(-slope*i))/(1-np.exp(-slope)))
+        val = (d+amp) * ((1-exp(-slope*i))/(1-exp(-slope)))
     elif curve==7:
-        if freq<=0:
-            raise ValueError('Frequency much be positive non-zero')
         if amp==0: return 0.0
-        val = (0.5*amp*(np.cos(2*freq*i*np.pi + np.pi)+1))**slope + i*d
+        val = pow(0.5*amp*(cos(2*freq*i*M_PI + M_PI)+1), slope) + i*d
     elif curve==8:
-        if freq<=0:
-            raise ValueError('Frequency must be positive non-zero')
         if amp==0: return 0.0
-        val = amp*np.sin(i*np.pi*2*freq) + i*d
-        if np.sign(val**slope) <> np.sign(val):
-            val = val**slope * np.sign(val)
+        val = amp*sin(i*M_PI*2*freq) + i*d
+        if _sign(pow(val, slope)) != _sign(val):
+            val = pow(val, slope) * _sign(val)
         else:
-            val = val**slope
+            val = pow(val, slope)
     elif curve==9:
-        if peak <= 0.0 or peak >= 1.0:
-            raise ValueError('peak need to be 0-1')
         if amp==0: return 0.0
         if  i <= peak: val = i * (amp/peak)
         elif i > peak: val = (1-i)*(amp/(1-peak))
         val += i*d
     elif curve==10:
-        if peak <= 0.0 or peak >= 1.0:
-            raise ValueError('peak need to be 0-1')
-        if mode < 0 or mode > 3:
-            raise ValueError('invalid mode')
         if amp==0: return 0.0
         elif mode==0:
             if  i <= peak: val = amp * (1-(1-(i/peak))**2)
@@ -216,11 +201,138 @@ def cdiff(float d, float i, int curve=0, float amp=0, int freq=1, float slope=1,
             if  i <= peak: val = amp * (i/peak)**2
             elif i > peak: val = amp * ((1-i)/(1-peak))**2
         val += i*d
-    else:
-        raise ValueError('invalid curve')
 
     return val - i*d
 
+
+def cdiff(float d, float i, int curve=0, float amp=0, int freq=1, float slope=1,
+          float peak=0.5, int mode=0):
+    if i==0: return 0.0
+    _check_curve(curve, freq, peak, mode)
+    return _cdiff(d, i, curve, amp, freq, slope, peak, mode)
+
+
+def cdiff_array(float d, float[:] i not None, int curve=0, float amp=0,
+                int freq=1, float slope=1, float peak=0.5, int mode=0,
+                bint parallel=False):
+    """cdiff for an array of positions."""
+    cdef np.ndarray[ndim=1, dtype=np.float32_t] results_arr
+    cdef float[:] results
+    cdef Py_ssize_t k, n = i.shape[0]
+
+    _check_curve(curve, freq, peak, mode)
+    results_arr = np.empty(n, dtype=np.float32)
+    results = results_arr
+    if parallel:
+        for k in prange(n, nogil=True):
+            results[k] = _cdiff(d, i[k], curve, amp, freq, slope, peak, mode)
+    else:
+        with nogil:
+            for k in range(n):
+                results[k] = _cdiff(d, i[k], curve, amp, freq, slope, peak,
+                                    mode)
+    return results_arr
+
+
+cdef struct _Segment:
+    # Kochanek-Bartels segment between cps[1] and cps[2].
+    float p1, p2, tani, tano, dv1
+    int curve, freq, mode
+    float amp, slope, peak
+
+
+cdef _Segment _make_segment(float[:] cps, int[:] times,
+                            int ti, int ci, int bi, int to, int co, int bo,
+                            int curve, float amp, int freq, float slope,
+                            int mode, float peak):
+    cdef _Segment seg
+    cdef float cona, conb, conc, cond
+    cdef float dv0, dv1, dv2
+    cdef int dt0, dt1, dt2
+
+    cona = (1-ti)*(1-bi)*(1+ci)*0.5
+    conb = (1-ti)*(1+bi)*(1-ci)*0.5
+    conc = (1-to)*(1-bo)*(1-co)*0.5
+    cond = (1-to)*(1+bo)*(1+co)*0.5
+
+    dv0 = cps[1] - cps[0]
+    dv1 = cps[2] - cps[1]
+    dv2 = cps[3] - cps[2]
+    dt0 = times[1] - times[0]
+    dt1 = times[2] - times[1]
+    dt2 = times[3] - times[2]
+
+# ralf  q(k) = (x(k+1)-2*x(k) + x(k-1))/(x(k+1)-x(k-1))
+    seg.tani = cona*dv0 + conb*dv1
+    seg.tano = conc*dv1 + cond*dv2
+    if not (ti==0 and ci==-1 and bi==0): seg.tani *= 2.0*dt1/(dt1+dt0)
+    if not (to==0 and co==-1 and bo==0): seg.tano *= 2.0*dt2/(dt2+dt1)
+
+    seg.p1 = cps[1]
+    seg.p2 = cps[2]
+    seg.dv1 = dv1
+    seg.curve = curve
+    seg.amp = amp
+    seg.freq = freq
+    seg.slope = slope
+    seg.mode = mode
+    seg.peak = peak
+    return seg
+
+
+cdef inline float _spline_value(_Segment *seg, float i) nogil:
+    cdef float h00, h01, h10, h11, val
+    h00 = 2*i**3 - 3*i**2 + 1
+    h01 = -2*i**3 + 3*i**2
+    h10 = i**3 - 2*i**2 + i
+    h11 = i**3 - i**2
+    val = h00*seg.p1 + h01*seg.p2 + h10*seg.tani + h11*seg.tano
+    if seg.curve != -1:
+        val += _cdiff(seg.dv1, i, seg.curve, seg.amp, seg.freq, seg.slope,
+                      seg.peak, seg.mode)
+    return val
+
+
+def spline_at(float[:] cps not None, int[:] times not None,
+              float[:] t not None,
+              int ti=0, int ci=-1, int bi=0, int to=0, int co=-1, int bo=0,
+              int curve=-1, float amp=0, int freq=1, float slope=1,
+              int mode=0, float peak=0.5, bint parallel=False):
+    """Evaluates the segment of spline between cps[1] and cps[2] at the
+    positions t, which go from 0 at cps[1] to 1 at cps[2]."""
+    cdef np.ndarray[ndim=1, dtype=np.float32_t] results_arr
+    cdef float[:] results
+    cdef _Segment seg
+    cdef Py_ssize_t k, n = t.shape[0]
+
+    if curve != -1:
+        _check_curve(curve, freq, peak, mode)
+    seg = _make_segment(cps, times, ti, ci, bi, to, co, bo,
+                        curve, amp, freq, slope, mode, peak)
+    results_arr = np.empty(n, dtype=np.float32)
+    results = results_arr
+    if parallel:
+        for k in prange(n, nogil=True):
+            results[k] = _spline_value(&seg, t[k])
+    else:
+        with nogil:
+            for k in range(n):
+                results[k] = _spline_value(&seg, t[k])
+    return results_arr
+
+
+def spline(float[:] cps not None, int[:] times not None,
+           int ti=0, int ci=-1, int bi=0, int to=0, int co=-1, int bo=0,
+           int curve=-1, float amp=0, int freq=1, float slope=1,
+           int mode=0, float peak=0.5, bint parallel=False):
+    """Evaluates the segment between cps[1] and cps[2] at each step between
+    times[1] and times[2]."""
+    cdef int steps = times[2] - times[1]
+    t = np.arange(steps, dtype=np.float32) / np.float32(steps)
+    return spline_at(cps, times, t, ti, ci, bi, to, co, bo,
+                     curve, amp, freq, slope, mode, peak, parallel)
+
+
 """
 pblend
   s = starting value
@@ -229,7 +341,7 @@ pblend
   curves=0 - lin
          1 - cos
 """
-def pblend(float s, float e, float i, int curve=0):
+cdef inline double _pblend(float s, float e, float i, int curve) nogil:
     if i==0: return s
     elif i==1: return e
 
@@ -237,191 +349,156 @@ def pblend(float s, float e, float i, int curve=0):
 
     if curve==0:
         return s + ((e-s) * i)
-    elif curve==1:
-        return s + (0.5*(e-s)*(np.cos((i+1)*np.pi)+1))
     else:
+        return s + (0.5*(e-s)*(cos((i+1)*M_PI)+1))
+
+
+def pblend(float s, float e, float i, int curve=0):
+    if i==0: return s
+    elif i==1: return e
+
+    if s==e: return s
+
+    if curve not in (0, 1):
         raise ValueError('invalid curve')
+    return _pblend(s, e, i, curve)
+
 
+def pblend_array(float[:] s not None, float[:] e not None,
+                 float[:] i not None, int curve=0, bint parallel=False):
+    """pblend for arrays of equal length. Returns a float64 array."""
+    cdef np.ndarray[ndim=1, dtype=np.float64_t] results_arr
+    cdef double[:] results
+    cdef Py_ssize_t k, n = i.shape[0]
 
-def array_hsv2rgb(np.ndarray[ndim=2, dtype=np.uint8_t] rgb not None, 
-                  np.ndarray[ndim=2, dtype=np.float32_t] hsv not None):
+    if s.shape[0] != n or e.shape[0] != n:
+        raise ValueError('arrays must have the same length')
+    if curve not in (0, 1):
+        raise ValueError('invalid curve')
+    results_arr = np.empty(n, dtype=np.float64)
+    results = results_arr
+    if parallel:
+        for k in prange(n, nogil=True):
+            results[k] = _pblend(s[k], e[k], i[k], curve)
+    else:
+        with nogil:
+            for k in range(n):
+                results[k] = _pblend(s[k], e[k], i[k], curve)
+    return results_arr
+
+
+cdef inline void _hsv2rgb(float h, float s, float v,
+                          float *r, float *g, float *b) nogil:
+    cdef float f, p, q, t
+    cdef int i
+
+    if s == 0.0:
+        r[0] = g[0] = b[0] = v
+        return
+
+    i = <int>floor(h * 6)
+    f = (h * 6.0) - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i % 6
+    if i < 0:
+        i += 6
+
+    if i == 0:
+        r[0], g[0], b[0] = v, t, p
+    elif i == 1:
+        r[0], g[0], b[0] = q, v, p
+    elif i == 2:
+        r[0], g[0], b[0] = p, v, t
+    elif i == 3:
+        r[0], g[0], b[0] = p, q, v
+    elif i == 4:
+        r[0], g[0], b[0] = t, p, v
+    else:
+        r[0], g[0], b[0] = v, p, q
+
+
+def array_hsv2rgb(np.uint8_t[:, :] rgb not None,
+                  float[:, :] hsv not None):
     """HSV -> RGB color conversion of 1D images
 
     """
 
-    cdef float h, s, v
     cdef float r, g, b
-    cdef float f, p, q, t
-    cdef int i
+    cdef Py_ssize_t pixel
+
+    with nogil:
+        for pixel in range(hsv.shape[0]):
+            _hsv2rgb(hsv[pixel, 0], hsv[pixel, 1], hsv[pixel, 2], &r, &g, &b)
+            rgb[pixel, 0] = <np.uint8_t>(r * 255)
+            rgb[pixel, 1] = <np.uint8_t>(g * 255)
+            rgb[pixel, 2] = <np.uint8_t>(b * 255)
+
 
-    for pixel in range(hsv.shape[0]):
-        h = hsv[pixel, 0]
-        s = hsv[pixel, 1]
-        v = hsv[pixel, 2]
-
-        if s == 0.0:
-            rgb[pixel, 0] = v * 255
-            rgb[pixel, 1] = v * 255
-            rgb[pixel, 2] = v * 255
-            continue
-
-        i = <int>floorf(h * 6)
-        f = (h * 6.0) - i
-        p = v * (1.0 - s)
-        q = v * (1.0 - s * f)
-        t = v * (1.0 - s * (1.0 - f))
-        i = i % 6
-
-        if i == 0:
-            rgb[pixel, 0] = v * 255
-            rgb[pixel, 1] = t * 255
-            rgb[pixel, 2] = p * 255
-        elif i == 1:
-            rgb[pixel, 0] = q * 255
-            rgb[pixel, 1] = v * 255
-            rgb[pixel, 2] = p * 255
-        elif i == 2:
-            rgb[pixel, 0] = p * 255
-            rgb[pixel, 1] = v * 255
-            rgb[pixel, 2] = t * 255
-        elif i == 3:
-            rgb[pixel, 0] = p * 255
-            rgb[pixel, 1] = q * 255
-            rgb[pixel, 2] = v * 255
-        elif i == 4:
-            rgb[pixel, 0] = t * 255
-            rgb[pixel, 1] = p * 255
-            rgb[pixel, 2] = v * 255
-        elif i == 5:
-            rgb[pixel, 0] = v * 255
-            rgb[pixel, 1] = p * 255
-            rgb[pixel, 2] = q * 255
-
-
-def interp_update_rgb(np.ndarray[ndim=2, dtype=np.float32_t] palette not None,
+def interp_update_rgb(float[:, :] palette not None,
         int r_index, int g_index, int b_index,
         int h_index, int s_index, int v_index):
     """HSV->RGB conversion for pixels holding both types in the same array
-    
+
     NOTE: RGB channels are in range 0..1
     """
 
-    cdef float h, s, v
     cdef float r, g, b
-    cdef float f, p, q, t
-    cdef int i
+    cdef Py_ssize_t pixel
+
+    with nogil:
+        for pixel in range(palette.shape[0]):
+            _hsv2rgb(palette[pixel, h_index], palette[pixel, s_index],
+                     palette[pixel, v_index], &r, &g, &b)
+            palette[pixel, r_index] = r
+            palette[pixel, g_index] = g
+            palette[pixel, b_index] = b
 
-    for pixel in range(palette.shape[0]):
-        h = palette[pixel, h_index]
-        s = palette[pixel, s_index]
-        v = palette[pixel, v_index]
-
-        if s == 0.0:
-            palette[pixel, r_index] = v
-            palette[pixel, b_index] = v
-            palette[pixel, g_index] = v
-            continue
-
-        i = <int>floorf(h * 6)
-        f = (h * 6.0) - i
-        p = v * (1.0 - s)
-        q = v * (1.0 - s * f)
-        t = v * (1.0 - s * (1.0 - f))
-        i = i % 6
-
-        if i == 0:
-            palette[pixel, r_index] = v
-            palette[pixel, g_index] = t
-            palette[pixel, b_index] = p
-        elif i == 1:
-            palette[pixel, r_index] = q
-            palette[pixel, g_index] = v
-            palette[pixel, b_index] = p
-        elif i == 2:
-            palette[pixel, r_index] = p
-            palette[pixel, g_index] = v
-            palette[pixel, b_index] = t
-        elif i == 3:
-            palette[pixel, r_index] = p
-            palette[pixel, g_index] = q
-            palette[pixel, b_index] = v
-        elif i == 4:
-            palette[pixel, r_index] = t
-            palette[pixel, g_index] = p
-            palette[pixel, b_index] = v
-        elif i == 5:
-            palette[pixel, r_index] = v
-            palette[pixel, g_index] = p
-            palette[pixel, b_index] = q
-
-
-
-def interp_update_hsv(np.ndarray[ndim=2, dtype=np.float32_t] palette not None,
+
+
+def interp_update_hsv(float[:, :] palette not None,
         int r_index, int g_index, int b_index,
         int h_index, int s_index, int v_index):
     """RGB->HSV conversion for pixels holding both types in the same array
-    
+
     NOTE: RGB channels are in range 0..1
     """
 
+    cdef float r, g, b
     cdef float maxc, minc, diff
     cdef float rc, gc, bc, h
+    cdef Py_ssize_t pixel
 
-    for pixel in range(palette.shape[0]):
-        r = palette[pixel, r_index]
-        g = palette[pixel, g_index]
-        b = palette[pixel, b_index]
-
-        if r > g:
-            if r > b:
-                maxc = r
-            else:
-                maxc = b
-        else:
-            if g > b:
-                maxc = g
-            else:
-                maxc = b
-
-        if r < g:
-            if r < b:
-                minc = r
-            else:
-                minc = b
-        else:
-            if g < b:
-                minc = g
-            else:
-                minc = b
+    with nogil:
+        for pixel in range(palette.shape[0]):
+            r = palette[pixel, r_index]
+            g = palette[pixel, g_index]
+            b = palette[pixel, b_index]
 
-        palette[pixel, v_index] = maxc
+            maxc = max(r, max(g, b))
+            minc = min(r, min(g, b))
 
-        if minc == maxc:
-            palette[pixel, h_index] = 0.0
-            palette[pixel, s_index] = 0.0
-            continue
+            palette[pixel, v_index] = maxc
 
-        diff = maxc - minc
+            if minc == maxc or maxc == 0.0:
+                palette[pixel, h_index] = 0.0
+                palette[pixel, s_index] = 0.0
+                continue
 
-        if max == 0.0:
-            palette[pixel, s_index] = 0.0
-            palette[pixel, h_index] = 0.0
-            continue
-
-        palette[pixel, s_index] = diff / maxc
-
-        rc = (maxc - r) / diff
-        gc = (maxc - g) / diff
-        bc = (maxc - b) / diff
-
-        if r == maxc:
-            h = bc - gc
-        elif g == maxc:
-            h = 2.0 + rc - bc
-        else:
-            h = 4.0 + gc - rc
-
-        palette[pixel, h_index] = (h/6) % 1.0
+            diff = maxc - minc
+            palette[pixel, s_index] = diff / maxc
 
+            rc = (maxc - r) / diff
+            gc = (maxc - g) / diff
+            bc = (maxc - b) / diff
 
+            if r == maxc:
+                h = bc - gc
+            elif g == maxc:
+                h = 2.0 + rc - bc
+            else:
+                h = 4.0 + gc - rc
 
+            h = h / 6
+            palette[pixel, h_index] = h - floor(h)
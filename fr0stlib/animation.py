@@ -0,0 +1,254 @@
+"""Keyframe animation.
+
+The functions in fr0stlib.functions interpolate one value of one frame per
+call. Animation instead packs the keyframes into arrays once, and evaluates
+any number of frames for all attributes with a few numpy operations."""
+import numpy
+
+from fr0stlib import save_flames_binary
+from fr0stlib.functions import drange, cardinal_basis, array_rgb2hls, \
+     array_rgb2hsv, array_hls2rgb, array_hsv2rgb
+
+
+def _numeric(v):
+    return type(v) in (int, float, numpy.float64)
+
+
+def _to_polar(coefs):
+    # coefs are (a,d,b,e,c,f), so pairs are the x, y and o vectors.
+    x, y = coefs[..., 0::2], coefs[..., 1::2]
+    return numpy.hypot(x, y), numpy.degrees(numpy.arctan2(y, x))
+
+
+def _from_polar(r, theta):
+    theta = numpy.radians(theta)
+    coefs = numpy.empty(r.shape[:-1] + (6,))
+    coefs[..., 0::2] = r * numpy.cos(theta)
+    coefs[..., 1::2] = r * numpy.sin(theta)
+    return coefs
+
+
+
+class Animation(object):
+    """Interpolates between a list of keyframes, with n frames from one key to
+    the next. Frames are returned as Flame objects by indexing or iterating,
+    or as binary flames by iter_binary and save_binary.
+
+    The options are the same as those of fr0stlib.functions.interp:
+      curve  - Shape of the transition between keys (lin, par, npar, cos,
+               sinh, tanh), with a as its parameter.
+      t      - Tension of the smoothing spline.
+      smooth - Pass smoothly through keys instead of stopping at each one.
+               Needs 4 keys, or 3 when looping.
+      loop   - Go from the last key back to the first.
+      p_space- Coefficient interpolation space (rect, polar)
+      c_space- Color interpolation space (rgb, hls, hsv)
+
+    Xforms missing from some keys are added with zero weight, so they fade in
+    and out. Attributes missing from an xform are taken to be 0 if they are
+    variations, else they keep the value of the first key that has them."""
+
+    def __init__(self, keys, n=50, curve='lin', a=1.0, t=0.5, smooth=False,
+                 loop=True, p_space='polar', c_space='rgb',
+                 flamename='frame', offset=0):
+        if len(keys) < 2:
+            raise ValueError("At least 2 keyframes are needed.")
+        if c_space not in ('rgb', 'hls', 'hsv'):
+            raise ValueError("Unknown color space: %s" % c_space)
+        self.n = n
+        self.curve = curve
+        self.a = a
+        self.t = t
+        self.loop = loop
+        self.smooth = smooth and len(keys) >= (3 if loop else 4)
+        self.p_space = p_space
+        self.c_space = c_space
+        self.flamename = flamename
+        self.offset = offset
+        self.nk = len(keys)
+        self._pack(keys)
+
+
+    def _pack(self, keys):
+        keys = [k.copy() for k in keys]
+        nx = max(len(k.xform) for k in keys)
+        final = any(k.final for k in keys)
+        for k in keys:
+            while len(k.xform) < nx:
+                k.add_xform(weight=0)
+            if final and not k.final:
+                k.add_final()
+        self.template = keys[0]
+
+        # Flame attributes, with tuples (center, background) spread over
+        # several columns.
+        attrs, defaults = [], {}
+        for k in keys:
+            for name, v in k.iter_attributes():
+                if name in ("name", "size") or name in defaults:
+                    continue
+                if _numeric(v) or (type(v) in (tuple, list) and v
+                                   and all(_numeric(i) for i in v)):
+                    attrs.append(name)
+                    defaults[name] = v
+        self._flame_attrs, columns = [], []
+        for name in attrs:
+            values = [getattr(k, name, defaults[name]) for k in keys]
+            if _numeric(defaults[name]):
+                self._flame_attrs.append((name, len(columns), None))
+                columns.append(values)
+            elif all(len(v) == len(defaults[name]) for v in values):
+                self._flame_attrs.append((name, len(columns), len(values[0])))
+                columns.extend(zip(*values))
+        self._flame_values = numpy.array(columns, numpy.float64).reshape(
+            len(columns), len(keys)).T
+
+        # Xform attributes of all slots (xforms, then the final) in one array.
+        slots = [list(k.iter_xforms()) for k in keys]
+        self._xform_attrs, columns = [], []
+        for slot, xforms in enumerate(zip(*slots)):
+            attrs, defaults = [], {}
+            for x in xforms:
+                for name, v in x.iter_attributes():
+                    if _numeric(v) and name not in defaults:
+                        attrs.append(name)
+                        defaults[name] = v
+            for name in attrs:
+                self._xform_attrs.append((slot, name))
+                columns.append([getattr(x, name, defaults[name])
+                                for x in xforms])
+        self._xform_values = numpy.array(columns, numpy.float64).reshape(
+            len(columns), len(keys)).T
+        self._weights = numpy.array([name == "weight" for slot, name
+                                     in self._xform_attrs], bool)
+
+        self._coefs = numpy.array([[x.coefs for x in xforms]
+                                   for xforms in slots], numpy.float64)
+        self._post = numpy.array([[x.post.coefs for x in xforms]
+                                  for xforms in slots], numpy.float64)
+        self._chaos = numpy.array([[x.chaos[:] for x in k.xform]
+                                   for k in keys], numpy.float64)
+
+        palettes = numpy.array([k.gradient.data for k in keys], numpy.float64)
+        if self.c_space == 'hls':
+            palettes = array_rgb2hls(palettes.reshape(-1, 3))
+        elif self.c_space == 'hsv':
+            palettes = array_rgb2hsv(palettes.reshape(-1, 3))
+        self._palettes = palettes.reshape(len(keys), 256, 3)
+
+
+    def __len__(self):
+        return self.n * (self.nk if self.loop else self.nk - 1)
+
+
+    def _frame_weights(self, frames):
+        """Returns the keys each frame is blended from and their weights, as
+        two (frames, keys) arrays."""
+        frames = numpy.asarray(frames, int)
+        seg, i = divmod(frames, self.n)
+        s = drange(0., 1., self.n, i, curve=self.curve, a=self.a)
+        if self.smooth:
+            idx = seg[:, None] + numpy.arange(-1, 3)
+            powers = s[:, None] ** numpy.arange(4)
+            weights = numpy.dot(powers, cardinal_basis(self.t))
+        else:
+            idx = seg[:, None] + numpy.arange(2)
+            weights = numpy.column_stack((1-s, s))
+        if self.loop:
+            idx %= self.nk
+        else:
+            idx = numpy.clip(idx, 0, self.nk - 1)
+        return idx, weights
+
+
+    def _blend(self, values, idx, weights):
+        return numpy.einsum("fj,fj...->f...", weights, values[idx])
+
+
+    def evaluate(self, frames):
+        """Evaluates a sequence of frame indices, and returns a dict of arrays
+        with the frame index as their first dimension: flame and xform
+        attributes, coefs, post, chaos and palette."""
+        idx, w = self._frame_weights(frames)
+        blend = lambda values: self._blend(values, idx, w)
+
+        xform = blend(self._xform_values)
+        xform[:, self._weights] = numpy.clip(xform[:, self._weights], 0, 100)
+
+        if self.p_space == 'polar':
+            coefs = _from_polar(*map(blend, _to_polar(self._coefs)))
+            post = _from_polar(*map(blend, _to_polar(self._post)))
+        else:
+            coefs = blend(self._coefs)
+            post = blend(self._post)
+
+        palette = blend(self._palettes).reshape(-1, 3)
+        if self.c_space == 'hls':
+            palette = array_hls2rgb(palette)
+        elif self.c_space == 'hsv':
+            palette = array_hsv2rgb(palette)
+        else:
+            palette = numpy.clip(palette, 0, 255).astype(numpy.uint8)
+
+        return dict(flame=blend(self._flame_values), xform=xform,
+                    coefs=coefs, post=post, chaos=blend(self._chaos),
+                    palette=palette.reshape(len(idx), 256, 3))
+
+
+    def _make_flame(self, index, values, j):
+        flame = self.template.copy()
+        flame.name = self.flamename + str(self.offset + index)
+        row = values["flame"][j].tolist()
+        for name, col, length in self._flame_attrs:
+            if length is None:
+                setattr(flame, name, row[col])
+            else:
+                setattr(flame, name, row[col:col+length])
+
+        xforms = list(flame.iter_xforms())
+        row = values["xform"][j].tolist()
+        for (slot, name), v in zip(self._xform_attrs, row):
+            setattr(xforms[slot], name, v)
+        for x, coefs, post in zip(xforms, values["coefs"][j],
+                                  values["post"][j]):
+            x.coefs = coefs.tolist()
+            x.post.coefs = post.tolist()
+        for x, chaos in zip(flame.xform, values["chaos"][j]):
+            x.chaos[:] = chaos.tolist()
+
+        flame.gradient.data = values["palette"][j]
+        return flame
+
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Frame index out of range")
+        return self._make_flame(index, self.evaluate([index]), 0)
+
+
+    def iter_flames(self, frames=None, chunksize=64):
+        """Yields frames as Flame objects. frames defaults to all of them.
+        Frames are evaluated chunksize at a time to limit memory use."""
+        if frames is None:
+            frames = xrange(len(self))
+        frames = list(frames)
+        for start in xrange(0, len(frames), chunksize):
+            chunk = frames[start:start+chunksize]
+            values = self.evaluate(chunk)
+            for j, index in enumerate(chunk):
+                yield self._make_flame(index, values, j)
+
+    __iter__ = iter_flames
+
+
+    def iter_binary(self, frames=None):
+        """Yields frames packed by Flame.to_binary."""
+        for flame in self.iter_flames(frames):
+            yield flame.to_binary()
+
+
+    def save_binary(self, filename, frames=None):
+        """Saves frames to a binary flame file."""
+        save_flames_binary(filename, *self.iter_flames(frames))
@@ -1,4 +1,10 @@
+from __future__ import with_statement
 import os, sys, cmath, numpy, colorsys, random
+from fr0stlib import _utils as utils
+if not hasattr(utils, "pblend_array"):
+    # A leftover _utils binary, built from an older _utils.pyx.
+    raise ImportError("fr0stlib._utils is out of date, rebuild it with "
+                      "'python setup.py build_ext --inplace'.")
 from math import *
 
 #-------------------------------------------------------------------------------
@@ -57,8 +63,90 @@ def hsv2rgb(color):
     s = clip(s,0,1)
     v = clip(v,0,1)
     return tuple(int(x*255) for x in colorsys.hsv_to_rgb(h,s,v))
-    
-    
+
+
+# The array versions below work on (n, 3) arrays and give the same results as
+# the functions above applied to each row. Rgb values are 0-255.
+
+def array_rgb2hls(rgb):
+    rgb = numpy.asarray(rgb, numpy.float64) / 255.
+    r, g, b = rgb.T
+    maxc = rgb.max(1)
+    minc = rgb.min(1)
+    diff = maxc - minc
+    gray = diff == 0
+    diff[gray] = 1 # Avoid division by zero, these entries are reset below.
+    l = (minc + maxc) / 2.
+    s = numpy.where(l <= 0.5, diff / numpy.where(gray, 1, maxc + minc),
+                    diff / numpy.where(gray, 1, 2. - maxc - minc))
+    rc = (maxc-r) / diff
+    gc = (maxc-g) / diff
+    bc = (maxc-b) / diff
+    h = numpy.where(r == maxc, bc-gc, numpy.where(g == maxc, 2.+rc-bc,
+                                                  4.+gc-rc))
+    h = (h/6.) % 1.
+    h[gray] = 0.
+    s[gray] = 0.
+    return numpy.column_stack((h, l, s))
+
+def array_rgb2hsv(rgb):
+    rgb = numpy.asarray(rgb, numpy.float64) / 255.
+    r, g, b = rgb.T
+    maxc = rgb.max(1)
+    minc = rgb.min(1)
+    diff = maxc - minc
+    gray = diff == 0
+    diff[gray] = 1
+    s = diff / numpy.where(maxc == 0, 1, maxc)
+    rc = (maxc-r) / diff
+    gc = (maxc-g) / diff
+    bc = (maxc-b) / diff
+    h = numpy.where(r == maxc, bc-gc, numpy.where(g == maxc, 2.+rc-bc,
+                                                  4.+gc-rc))
+    h = (h/6.) % 1.
+    h[gray] = 0.
+    s[gray] = 0.
+    return numpy.column_stack((h, s, maxc))
+
+def _hls_value(m1, m2, hue):
+    hue = hue % 1.
+    return numpy.where(hue < 1/6., m1 + (m2-m1)*hue*6.,
+           numpy.where(hue < 0.5, m2,
+           numpy.where(hue < 2/3., m1 + (m2-m1)*(2/3.-hue)*6., m1)))
+
+def array_hls2rgb(hls):
+    h, l, s = numpy.asarray(hls, numpy.float64).T
+    h = array_clip(h, 0, 1, True)
+    l = numpy.clip(l, 0, 1)
+    s = numpy.clip(s, 0, 1)
+    m2 = numpy.where(l <= 0.5, l * (1.+s), l+s-(l*s))
+    m1 = 2.*l - m2
+    rgb = numpy.column_stack((_hls_value(m1, m2, h + 1/3.),
+                              _hls_value(m1, m2, h),
+                              _hls_value(m1, m2, h - 1/3.)))
+    gray = s == 0
+    rgb[gray] = l[gray, None]
+    return (rgb * 255).astype(numpy.uint8)
+
+def array_hsv2rgb(hsv):
+    h, s, v = numpy.asarray(hsv, numpy.float64).T
+    h = array_clip(h, 0, 1, True)
+    s = numpy.clip(s, 0, 1)
+    v = numpy.clip(v, 0, 1)
+    i = (h*6.).astype(int)
+    f = (h*6.) - i
+    p = v*(1.-s)
+    q = v*(1.-s*f)
+    t = v*(1.-s*(1.-f))
+    i = i % 6
+    choices = ((v, t, p), (q, v, p), (p, v, t), (p, q, v), (t, p, v), (v, p, q))
+    rgb = numpy.column_stack([numpy.choose(i, [c[channel] for c in choices])
+                              for channel in range(3)])
+    gray = s == 0
+    rgb[gray] = v[gray, None]
+    return (rgb * 255).astype(numpy.uint8)
+
+
 #-------------------------------------------------------------------------------
 #General utils
 """
@@ -77,6 +165,21 @@ def clip(v, mini, maxi, rotate=False):
         elif v < mini: v = mini
     return v
 
+def array_clip(v, mini, maxi, rotate=False):
+    """Clip for arrays."""
+    if rotate:
+        return numpy.where(v > maxi, v-maxi+mini,
+                           numpy.where(v < mini, v+maxi-mini, v))
+    return numpy.clip(v, mini, maxi)
+
+def array_pblend(s, e, i, curve=0):
+    """Vectorized version of _utils.pblend. The arguments are broadcast
+    against each other, and the blending is done by _utils.pblend_array."""
+    s, e, i = numpy.broadcast_arrays(*(numpy.asarray(x, numpy.float32)
+                                       for x in (s, e, i)))
+    return utils.pblend_array(s.flatten(), e.flatten(), i.flatten(),
+                              curve).reshape(i.shape)
+
 #-------------------------------------------------------------------------------
 #Interpolation and smoothing code
 """
@@ -156,35 +259,41 @@ def interp(cps, n, i, **kwargs):
             return ifunc(cps[:2], n, i%n, **kwargs)
 #---end interp
 
-def drange(x, y, n, i, **kwargs):
-    #Set defaults
-    curve = kwargs.get('curve','lin')
-    a     = kwargs.get('a',1.0)
-    peak  = kwargs.get('peak',0.5)
-    freq  = kwargs.get('freq',1)
-
-    m=float(n)
-
+def _position(n, i, curve='lin', a=1.0):
+    """Returns how far along (0 to 1) step i out of n is, following curve.
+    For cos, a is left to the caller, which raises the whole value to it."""
+    s = numpy.asarray(i, numpy.float64) / n
     if curve=='par':
-        d = (y-x)/(m**2)
-        return (x+d*(i**2))
+        return s**2
     elif curve=='npar':
-        d = (y-x)/(m**2)
-        return (y-d*((n-i)**2))
+        return 1 - (1-s)**2
     elif curve=='cos':
-        d = y-x
-        return (x+d*((cos(pi + (i/m)*pi))+1)/2)**a
+        return (numpy.cos(pi + s*pi) + 1) / 2
     elif curve=='sinh':
-        d = y-x
-        if d<>0: return x+((sinh(a*(2*i-m)/m) - sinh(-a)) / (2*sinh(a*(2*n-m)/m)/d))
-        else:    return 0
+        return (numpy.sinh(a*(2*s-1)) + sinh(a)) / (2*sinh(a))
     elif curve=='tanh':
-        d = y-x
-        if d<>0: return x+((tanh(a*(2*i-m)/m) - tanh(-a)) / (2*tanh(a*(2*n-m)/m)/d))
-        else:    return 0
+        return (numpy.tanh(a*(2*s-1)) + tanh(a)) / (2*tanh(a))
     else:
-        d = (y-x)/m
-        return x+d*i
+        return s
+
+def _result(value, i):
+    """Scalar steps give plain floats, which to_string writes as before."""
+    if numpy.ndim(i) == 0:
+        return float(value)
+    return value
+
+"""
+drange - Value at step i of n between x and y. i can also be an array of
+    steps, in which case an array of values is returned.
+"""
+def drange(x, y, n, i, **kwargs):
+    #Set defaults
+    curve = kwargs.get('curve','lin')
+    a     = kwargs.get('a',1.0)
+    value = x + (y-x) * _position(n, i, curve, a)
+    if curve=='cos':
+        value = value**a
+    return _result(value, i)
 #---end drange
 
 """
@@ -194,47 +303,56 @@ def prange(x, y, n, i, curve='lin', a=1.0, peak=0.5, freq=1):
     n1=int(peak*n)
     n2=n-n1
     m=float(n)
-    
-    if curve=='pp-par':     #par up, par down
-        if i<n1: return drange(x,y,n1,i,curve='par',a=a)
-        else:    return drange(y,x,n2,i-n1,curve='par',a=a)
-    elif curve=='pn-par':   #par up, npar down
-        if i<n1: return drange(x,y,n1,i,curve='par',a=a)
-        else:    return drange(y,x,n2,i-n1,curve='npar',a=a)
-    elif curve=='np-par':   #npar up, par down (smooth parabolic shape)
-        if i<n1: return drange(x,y,n1,i,curve='npar',a=a)
-        else:    return drange(y,x,n2,i-n1,curve='par',a=a)
-    elif curve=='nn-par':   #npar up, npar down
-        if i<n1: return drange(x,y,n1,i,curve='npar',a=a)
-        else:    return drange(y,x,n2,i-n1,curve='npar',a=a)
-    elif curve=='sin':      #sine wave (positive and negative)
-        d = y-x
-        if d<>0: return x+d*sin((i/m)*pi*2*freq)
-        else:    return 0
-    elif curve=='cos':     #cosine wave (positive only)
-        d = y-x
-        if d<>0: return (x+d*((cos(pi + (i/m)*pi*2*freq))+1)/2)**a
-        else:    return 0
-    else:                   #linear
-        if i<n1: return drange(x,y,n1,i,curve='lin',a=a)
-        else:    return drange(y,x,n2,i-n1,curve='lin',a=a)
+    i = numpy.asarray(i, numpy.float64)
+
+    if curve=='sin':        #sine wave (positive and negative)
+        return _result(x + (y-x)*numpy.sin((i/m)*pi*2*freq), i)
+    elif curve=='cos':      #cosine wave (positive only)
+        return _result((x + (y-x)*((numpy.cos(pi + (i/m)*pi*2*freq)+1)/2))**a,
+                       i)
+
+    up, down = {'pp-par': ('par', 'par'),   #par up, par down
+                'pn-par': ('par', 'npar'),  #par up, npar down
+                'np-par': ('npar', 'par'),  #npar up, par down (smooth)
+                'nn-par': ('npar', 'npar'), #npar up, npar down
+                }.get(curve, ('lin', 'lin'))
+    # Both halves are evaluated for all steps, so one of them may divide by
+    # zero where it isn't used.
+    with numpy.errstate(divide='ignore', invalid='ignore'):
+        return _result(numpy.where(i < n1, drange(x,y,n1,i,curve=up,a=a),
+                                   drange(y,x,n2,i-n1,curve=down,a=a)), i)
 #---end prange
 
+_basis_cache = {}
+
+def _cached_basis(key, make):
+    """Returns the basis matrix for key, building it with make only once."""
+    try:
+        return _basis_cache[key]
+    except KeyError:
+        if len(_basis_cache) > 256:
+            _basis_cache.clear()
+        M = _basis_cache[key] = make()
+        M.setflags(write=False)
+        return M
+
+def cardinal_basis(t):
+    """Basis matrix of a cardinal spline with tension t, for the powers
+    (1, v, v**2, v**3)."""
+    return _cached_basis(('cardinal', t), lambda: numpy.array(
+        ((0,1,0,0)
+        ,(-t,0,t,0)
+        ,(2*t,t-3,3-2*t,-t)
+        ,(-t,2-t,t-2,t)), numpy.float64))
+
 def vector(cps, n, i, t=0.5, **kwargs):
     if 1 < len(cps) < 4:
         return drange(cps[0], cps[1], n, i, **kwargs)
     elif len(cps)==4:
-##        if cache:
-        v = drange(0, 1, n, i, **kwargs)
-        cps = numpy.array(cps)
-        M = numpy.array(((0,1,0,0)
-                        ,(-t,0,t,0)
-                        ,(2*t,t-3,3-2*t,-t)
-                        ,(-t,2-t,t-2,t)))
-
-        W = numpy.array(v*j for j in range(4))
-        vp = numpy.dot(M,cps)
-        return numpy.dot(W,vp)
+        v = drange(0., 1., n, i, **kwargs)
+        W = numpy.power.outer(v, numpy.arange(4))
+        return _result(numpy.dot(numpy.dot(W, cardinal_basis(t)),
+                                 numpy.asarray(cps, numpy.float64)), i)
     else:
         #exception code
         print "You have the wrong number of cps."
@@ -248,11 +366,12 @@ def vector2d(cps, n, i, p_space='polar', **kwargs):
         cps = tmp
 
     xcps, ycps = zip(*cps)
-    
+    x, y = vector(xcps,n,i,**kwargs), vector(ycps,n,i,**kwargs)
+
     if p_space=='polar':
-        return rect((vector(xcps,n,i,**kwargs),vector(ycps,n,i,**kwargs)))
-    else:
-        return (vector(xcps,n,i,**kwargs),vector(ycps,n,i,**kwargs))
+        theta = numpy.radians(y)
+        x, y = x*numpy.cos(theta), x*numpy.sin(theta)
+    return _result(x, i), _result(y, i)
 #---end vector2d
 
 def vector3d(cps, n, i, c_space='rgb', **kwargs):
@@ -261,20 +380,24 @@ def vector3d(cps, n, i, c_space='rgb', **kwargs):
 ##    if c_space=='hls':
 ##        cps = [rgb2hls(c) for c in cps]
 
-    rcps, gcps, bcps = zip(*cps)
-    
+    values = [vector(c,n,i,**kwargs) for c in zip(*cps)]
+
+    if numpy.ndim(i):
+        # An array of steps gives an (n, 3) array of colors.
+        values = numpy.column_stack(values)
+        if c_space=='hls':
+            return array_hls2rgb(values)
+        elif c_space=='hsv':
+            return array_hsv2rgb(values)
+        else:
+            return numpy.clip(values, 0, 255)
+
     if c_space=='hls':
-        return hls2rgb((vector(rcps,n,i,**kwargs)
-                       ,vector(gcps,n,i,**kwargs)
-                       ,vector(bcps,n,i,**kwargs)))
+        return hls2rgb(values)
     elif c_space=='hsv':
-        return hsv2rgb((vector(rcps,n,i,**kwargs)
-                       ,vector(gcps,n,i,**kwargs)
-                       ,vector(bcps,n,i,**kwargs)))
+        return hsv2rgb(values)
     else:
-        return (clip(vector(rcps,n,i,**kwargs),0,255)
-               ,clip(vector(gcps,n,i,**kwargs),0,255)
-               ,clip(vector(bcps,n,i,**kwargs),0,255))
+        return tuple(clip(v,0,255) for v in values)
 #---end vector3d
 
 class cp():
@@ -338,15 +461,9 @@ def get_spline(cps, **kwargs):
                      ,**kwargs)
 
 
-def spline(cps, times, splinea=(0,0,0), splineb=(0,0,0), curve='lin', a=1):
-    if times[0]<0:
-        for t in times: t -= times[0]
+def _kochanek_bartels_basis(splinea, splineb):
     ta, ca, ba = splinea
     tb, cb, bb = splineb
-    n = times[2] - times[1]
-    v = []
-    for i in xrange(n):
-        v.append(drange(0,1,n,i,curve=curve, a=a))
     fa = (1-ta)*(1+ca)*(1+ba)
     fb = (1-ta)*(1-ca)*(1-ba)
     fc = (1-tb)*(1-cb)*(1+bb)
@@ -354,18 +471,28 @@ def spline(cps, times, splinea=(0,0,0), splineb=(0,0,0), curve='lin', a=1):
     M = numpy.array([[-fa,4+fa-fb-fc,-4+fb+fc-fd,fd]
                     ,[2*fa,-6-2*fa+2*fb+fc,6-2*fb-fc+fd,-fd]
                     ,[-fa,fa-fb,fb,0]
-                    ,[0,2,0,0]])
-    M = M/2.0
+                    ,[0,2,0,0]], numpy.float64)
+    return M/2.0
+
+def spline(cps, times, splinea=(0,0,0), splineb=(0,0,0), curve='lin', a=1,
+           i=None):
+    """Values of the segment between cps[1] and cps[2], at the steps i (all
+    the steps of the segment by default)."""
+    if times[0]<0:
+        for t in times: t -= times[0]
+    n = times[2] - times[1]
+    if i is None:
+        i = numpy.arange(n)
+    v = drange(0., 1., n, i, curve=curve, a=a)
+    M = _cached_basis(('kb', tuple(splinea), tuple(splineb)),
+                      lambda: _kochanek_bartels_basis(splinea, splineb))
     vals = [cps[0] * (2*times[0])/(times[0]+times[1])
            ,cps[1]
            ,cps[2]
            ,cps[3] * (2*times[2])/(times[2]+times[3])]
-    C = numpy.array(vals)
-    MxC = numpy.dot(M,C)
-    S = []
-    for t in v:
-        S.append(numpy.array([t**3,t**2,t,1]))
-    return numpy.dot(numpy.array(S), MxC)
+    MxC = numpy.dot(M, numpy.array(vals))
+    S = numpy.power.outer(v, numpy.arange(3, -1, -1))
+    return numpy.dot(S, MxC)
 #---end spline
 
 def spline_check(cps):
@@ -294,7 +294,8 @@ class MainWindow(wx.Frame):
             if os.path.exists(path):
                 os.remove(path)
 
-        self.renderer.exitflag = True
+        self.renderer.Exit()
+        self.tree.thumbcache.flush()
 
         # Remove all temp files
         recover_file = os.path.join(wx.GetApp().UserDataDir, 'paths.temp')
@@ -421,7 +422,7 @@ class MainWindow(wx.Frame):
                 else:
                     lst = []
                 lst.append(flame.to_string())
-                fr0stlib.save_flames(newpath, *lst)
+                fr0stlib.save_flames(newpath, *lst, changed=[len(lst)-1])
         dlg.Destroy()
 
 
@@ -542,15 +543,19 @@ class MainWindow(wx.Frame):
         lst = self.tree.GetDataList()
     
         if self.tree.parentselected:
+            changed = [i for i, data in enumerate(lst) if data.HasChanged()]
             for data, item in zip(lst, self.tree.GetItemChildren()):
                 data.Reset()
                 self.tree.SetItemText(item, data.name)
         else:
+            changed = [self.tree.GetIndexOfItem(self.tree.item)[-1]]
             data = self.tree.itemdata
             data.Reset()
             self.tree.SetItemText(self.tree.item, data.name)
-                
-        fr0stlib.save_flames(path, *(data[0] for data in lst))
+
+        # Only the flames that were reset need to be written out.
+        fr0stlib.save_flames(path, *(data[0] for data in lst),
+                             changed=changed)
         # Make sure Undo and Redo get set correctly.
         self.SetFlame(self.flame, rezoom=False)
         
@@ -638,6 +643,7 @@ class MainWindow(wx.Frame):
                               load_flames = self.load_flames,
                               preview = self.preview,
                               large_preview = self.large_preview,
+                              play = self.play,
                               dialog = self.editorframe.make_dialog,
                               get_file_path = self.tree.GetFilePath,
                               VERSION = fr0stlib.VERSION,
@@ -706,6 +712,28 @@ class MainWindow(wx.Frame):
             self.previewframe.RenderPreview()
 
 
+    def play(self, frames, fps=None, loop=True):
+        """Plays a sequence of flames in the preview window. Blocks until
+        playback ends, the window is closed or the script is stopped."""
+        self.StartPlayback(frames, fps, loop)
+        try:
+            while self.previewframe.playback is not None:
+                time.sleep(.1)
+        finally:
+            self.StopPlayback()
+
+
+    @InMain
+    def StartPlayback(self, frames, fps, loop):
+        self.previewframe.Show(True)
+        self.previewframe.Play(frames, fps, loop)
+
+
+    @InMain
+    def StopPlayback(self):
+        self.previewframe.Stop()
+
+
     @InMain
     def OnPreview(self):
         # only update a select few of all the panels.
@@ -737,14 +765,20 @@ class MainWindow(wx.Frame):
 
 
     @InMain
-    def OnImageReady(self, callback, (w,h), output_buffer, channels):
+    def OnImageReady(self, callback, (w,h), output_buffer, channels,
+                     display_size=None):
         if channels == 3:
             fun = wx.BitmapFromBuffer
         elif channels == 4:
             fun = wx.BitmapFromBufferRGBA
         else:
             raise ValueError("need 3 or 4 channels, not %s" % channels)
-        callback(fun(w, h, output_buffer))
+        bmp = fun(w, h, output_buffer)
+        if display_size and display_size != (w, h):
+            # Early passes of progressive previews are scaled up.
+            image = bmp.ConvertToImage().Scale(*display_size)
+            bmp = wx.BitmapFromImage(image)
+        callback(bmp)
 
 
 
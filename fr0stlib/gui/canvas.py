@@ -6,7 +6,7 @@ from wx.lib.floatcanvas.Utilities import BBox
 from fr0stlib.decorators import Bind, BindEvents
 from fr0stlib import polar, rect, Xform
 from fr0stlib import pyflam3
-from fr0stlib.pyflam3 import Genome, c_double, RandomContext, flam3_xform_preview
+from fr0stlib.pyflam3 import c_double, RandomContext, flam3_xform_preview
 from fr0stlib.gui.config import config
 
 
@@ -32,7 +32,7 @@ class VarPreview(FC.PointSet):
 
     def var_preview(self, xform, range, numvals, depth):
         result = (c_double * (2* (2*numvals+1)**2))()
-        genome = Genome.from_string(xform._parent.to_string(True))[0]
+        genome = xform._parent.to_genome()
         index = xform.index
         if index is None:
             index = genome.final_xform_index
@@ -132,6 +132,14 @@ config = {"active-vars": ('linear',
           "Img-Type": ".png",
           "Bits": 0,
           "renderer": "flam3",
+          "Thumbnail-Threads": 0,
+          "Progressive-Preview": True,
+          "Render-Cache-Size": 64,
+          "Playback-Settings": {"quality": 10,
+                                "estimator": 0,
+                                "filter_radius": 0},
+          "Playback-FPS": 25,
+          "Playback-Buffer": 32,
           "Rect-Main": None,
           "Rect-Editor": None,
           "Rect-Preview": None,
@@ -8,6 +8,7 @@ from fr0stlib import Flame
 from fr0stlib.decorators import *
 import fr0stlib
 from fr0stlib.gui.itemdata import ItemData
+from fr0stlib.thumbcache import ThumbnailCache, thumbnail_key
 
 
 class TreePanel(wx.Panel):
@@ -45,8 +46,10 @@ class TreePanel(wx.Panel):
 
         string = self.parent.flame.to_string()
         # Check if flame has changed. to_string is needed to detect identical
-        # flames saved in different apps. This comparison takes about 5ms.
-        if not force and Flame(data[-1]).to_string() == string:
+        # flames saved in different apps, but the string is usually one we
+        # generated ourselves, so compare it directly first.
+        if not force and (data[-1] == string or
+                          Flame(data[-1]).to_string() == string):
             return
 
         # Update the child
@@ -193,6 +196,7 @@ class TreePanel(wx.Panel):
 
 class FlameTree(treemixin.DragAndDrop, treemixin.VirtualTree, wx.TreeCtrl):
     newimgindex = itertools.count(3).next
+    thumbnail_settings = dict(quality=10, estimator=1, filter_radius=0)
 
     def __init__(self, parent, *args, **kwargs):
         self.parent = parent
@@ -215,11 +219,18 @@ class FlameTree(treemixin.DragAndDrop, treemixin.VirtualTree, wx.TreeCtrl):
         self.SetImageList(il)
         self.il = il
         self.isz = isz
+        self.thumbcache = ThumbnailCache(os.path.join(wx.GetApp().ConfigDir,
+                                                      'thumbnails.cache'))
 
         self.root = self.AddRoot("The Root Item")
         self.item = None
+        self.flag = None
         self.flamefiles = []
         self._dragging = False
+        self._ranking = False
+
+        for event in wx.EVT_SCROLLWIN, wx.EVT_MOUSEWHEEL, wx.EVT_SIZE:
+            self.Bind(event, self.OnScroll)
 
 
     def SetFlames(self, path, *flamestrings):
@@ -230,18 +241,20 @@ class FlameTree(treemixin.DragAndDrop, treemixin.VirtualTree, wx.TreeCtrl):
         self.RefreshItems()
         parent = self.itemparent
 
-        # cancel all outstanding thumbnails.
-        self.parent.parent.renderer.thumbqueue[:] = []
+        # cancel all outstanding thumbnails. The flag identifies thumbnails
+        # belonging to the file that is currently open.
+        flag = self.flag = wx.NewId()
+        self.parent.parent.renderer.CancelThumbnails(flag)
+        self.thumbcache.flush()
 
         self.Expand(parent)
         
-        flag = self.flag = wx.NewId()
-        
         for child, data in zip(self.GetItemChildren(parent),
                                (i[0] for i in lst)):
             self.RenderThumbnail(child, data, flag)
             # Set item to default until thumbnail is ready.
             self.SetItemImage(child, 2)
+        self.RankThumbnails()
 
         self.SelectItem(parent)
         self.SelectItem(self.GetItemByIndex((0,0)))
@@ -253,17 +266,57 @@ class FlameTree(treemixin.DragAndDrop, treemixin.VirtualTree, wx.TreeCtrl):
         if child is None:
             child = self.item
             data = self.GetFlameData(child)
+        if flag is None:
+            flag = self.flag
+        key = thumbnail_key(data[-1], self.isz, self.thumbnail_settings)
+        cached = self.thumbcache.get(key)
+        if cached:
+            self.UpdateThumbnail(wx.BitmapFromBuffer(self.isz[0], self.isz[1],
+                                                     cached),
+                                 child, data, flag)
+            return
         req = self.parent.parent.renderer.ThumbnailRequest
-        req(partial(self.UpdateThumbnail, child=child, data=data, flag=flag),
-            data[-1], self.isz, quality=10, estimator=1, filter_radius=0)
+        req(partial(self.UpdateThumbnail, child=child, data=data, flag=flag,
+                    key=key),
+            data[-1], self.isz, key=id(data), flag=flag,
+            **self.thumbnail_settings)
+
+
+    def RankThumbnails(self):
+        """Makes pending thumbnails of visible items render first, followed by
+        the ones closest to them."""
+        self._ranking = False
+        if not self.flamefiles:
+            return
+        children = list(self.GetItemChildren())
+        visible = [i for i, child in enumerate(children)
+                   if self.IsVisible(child)]
+        if not visible:
+            return
+        first, last = visible[0], visible[-1]
+        ranks = dict((id(self.GetFlameData(child)),
+                      max(first - i, i - last, 0))
+                     for i, child in enumerate(children))
+        self.parent.parent.renderer.RankThumbnails(ranks)
+
+
+    def OnScroll(self, e):
+        e.Skip()
+        # The tree only scrolls after this handler, and scroll events come in
+        # bursts, so rank thumbnails once things have settled.
+        if not self._ranking:
+            self._ranking = True
+            wx.CallAfter(self.RankThumbnails)
 
 
-    def UpdateThumbnail(self, bmp, child, data, flag):
+    def UpdateThumbnail(self, bmp, child, data, flag, key=None):
         """Callback function to process rendered thumbnails."""
         if flag and flag != self.flag:
             # This means the current thumbnail was for a file that is no longer
             # open. Trying to update with this itemid would cause a crash.
             return
+        if key:
+            self.thumbcache.put(key, bmp.ConvertToImage().GetData())
         index = data.imgindex = self.il.Add(bmp)
         self.SetItemImage(child, index)
 
@@ -296,8 +349,11 @@ class FlameTree(treemixin.DragAndDrop, treemixin.VirtualTree, wx.TreeCtrl):
 
         self._dragging = False
         
+        # Only the flames between the two positions have moved.
+        changed = range(min(fromindex, toindex), max(fromindex, toindex) + 1)
         fr0stlib.save_flames(self.GetFilePath(),
-                             *(data[0] for data in self.GetDataList()))
+                             *(data[0] for data in self.GetDataList()),
+                             changed=changed)
 
 
     def GetItem(self, indices):
@@ -7,7 +7,7 @@ from fr0stlib.gui.utils import LoadIcon, MultiSliderMixin, Box, NumberTextCtrl,\
                           SizePanel
 from fr0stlib.gui.config import config
 from fr0stlib.gui.constants import ID
-from fr0stlib.pyflam3 import flam3_colorhist, Genome
+from fr0stlib.pyflam3 import flam3_colorhist
 from ctypes import c_double
 
 class MainNotebook(wx.Notebook):
@@ -328,7 +328,7 @@ class Gradient(wx.Panel):
     def DrawHistogram(self, dc=None):
         """ Create and draw the color histogram."""
         dc = dc or wx.ClientDC(self)
-        genome = Genome.from_string(self.parent.flame.to_string(True))[0]
+        genome = self.parent.flame.to_genome()
         array = (c_double *256)()
         flam3_colorhist(genome, 1, array)
         dc.DrawLines([(i*1.5, 30-j*500) for i,j in enumerate(array)], 2, 2)
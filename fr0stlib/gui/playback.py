@@ -0,0 +1,170 @@
+from __future__ import with_statement
+import time, traceback
+from threading import Condition
+from multiprocessing import cpu_count
+
+from fr0stlib.decorators import Threaded
+from fr0stlib.render import flam3_render_array
+from fr0stlib.pyflam3 import output_buffer_pool
+
+
+class FrameRing(object):
+    """Bounded ring of rendered frames, filled ahead of playback.
+
+    Frames are numbered by their position in the playback (seq), which keeps
+    counting up across loops. Producers claim the next seq to render, at most
+    capacity frames ahead of the last one shown, and skip those the consumer
+    has already passed. The consumer takes the latest frame that's due,
+    dropping any older ones. Frames which failed to render are put with None
+    as their data, so playback moves past them."""
+
+    def __init__(self, nframes, capacity, loop=True):
+        self.nframes = nframes
+        self.capacity = capacity
+        self.loop = loop
+        self.condition = Condition()
+        self.stopped = False
+        self.shown = -1
+        self.dropped = 0
+        self._next = 0
+        self._ring = [None] * capacity
+
+
+    def claim(self):
+        """Blocks until there's room for another frame and returns its seq,
+        or None once playback is stopped or all frames are claimed."""
+        with self.condition:
+            while True:
+                if self.stopped:
+                    return None
+                self._next = max(self._next, self.shown + 1)
+                if not self.loop and self._next >= self.nframes:
+                    return None
+                if self._next <= self.shown + self.capacity:
+                    self._next += 1
+                    return self._next - 1
+                self.condition.wait()
+
+
+    def obsolete(self, seq):
+        """Frames which have been passed by playback needn't be rendered."""
+        return self.stopped or seq <= self.shown
+
+
+    def put(self, seq, data):
+        with self.condition:
+            if not self.obsolete(seq):
+                self._ring[seq % self.capacity] = seq, data
+
+
+    def take(self, due):
+        """Returns the (seq, data) of the latest frame up to seq due, or None
+        if no newer frame than the last one shown is ready. data is None if
+        the frame failed to render."""
+        with self.condition:
+            best = None
+            for i, entry in enumerate(self._ring):
+                if entry is None or entry[0] <= self.shown:
+                    continue
+                if entry[0] <= due:
+                    self._ring[i] = None
+                    if best is None or entry[0] > best[0]:
+                        best = entry
+            if best is None:
+                return None
+            self.dropped += best[0] - self.shown - 1
+            self.shown = best[0]
+            self.condition.notify_all()
+            return best
+
+
+    def finished(self):
+        return self.stopped or (not self.loop
+                                and self.shown >= self.nframes - 1)
+
+
+    def stop(self):
+        with self.condition:
+            self.stopped = True
+            self._ring = [None] * self.capacity
+            self.condition.notify_all()
+
+
+
+class Playback(object):
+    """Plays a sequence of frames (Flame objects or strings, e.g. a list or
+    a fr0stlib.animation.Animation) at a fixed frame rate.
+
+    Worker threads render frames ahead into a FrameRing. next_frame is polled
+    from the gui, and returns a new image when one is due. Playback keeps to
+    the clock: if rendering falls behind, frames are dropped rather than
+    slowing down. The clock starts once the first frame is ready."""
+
+    def __init__(self, frames, size, fps=25, loop=True, capacity=32,
+                 nthreads=0, **settings):
+        self.frames = frames
+        self.size = tuple(size)
+        self.fps = float(fps)
+        self.settings = settings
+        self.ring = FrameRing(len(frames), capacity, loop)
+        self._start = None
+        for i in range(nthreads or cpu_count()):
+            self.RenderLoop()
+
+
+    @Threaded
+    def RenderLoop(self):
+        ring = self.ring
+        while True:
+            seq = ring.claim()
+            if seq is None:
+                return
+            flame = self.frames[seq % len(self.frames)]
+            try:
+                image = flam3_render_array(
+                    flame, self.size, pool=output_buffer_pool, nthreads=1,
+                    fixed_seed=True, progress_func=lambda *a: ring.obsolete(seq),
+                    **self.settings)
+            except Exception:
+                # A broken frame is skipped, but still has to be marked as
+                # done, or playback would wait for it forever.
+                traceback.print_exc()
+                ring.put(seq, None)
+                continue
+            try:
+                if not ring.obsolete(seq):
+                    ring.put(seq, image.tostring())
+            finally:
+                output_buffer_pool.release(image)
+
+
+    def next_frame(self):
+        """Returns (index, rgb string) of the frame to show now, or None if
+        it's not time for a new frame or it isn't rendered yet."""
+        if self._start is None:
+            due = 0
+        else:
+            due = int((time.time() - self._start) * self.fps)
+        entry = self.ring.take(due)
+        if entry is None:
+            return None
+        if self._start is None:
+            self._start = time.time()
+        seq, data = entry
+        if data is None:
+            return None
+        return seq % len(self.frames), data
+
+
+    @property
+    def finished(self):
+        return self.ring.finished()
+
+
+    @property
+    def dropped(self):
+        return self.ring.dropped
+
+
+    def stop(self):
+        self.ring.stop()
@@ -3,6 +3,7 @@ import wx, sys, numpy as N
 from fr0stlib.decorators import *
 from config import config
 from _events import InMain
+from playback import Playback
 
 
 class PreviewFrame(wx.Frame):
@@ -25,6 +26,9 @@ class PreviewFrame(wx.Frame):
 
         # This must be 0,0 so OnIdle doesn't render anything on startup.
         self._lastsize = 0,0
+
+        self.playback = None
+        self.timer = wx.Timer(self)
         
         self.SetSize((520,413))
         self.SetMinSize((128,119)) # This makes for a 120x90 bitmap
@@ -39,6 +43,7 @@ class PreviewFrame(wx.Frame):
 
     @Bind(wx.EVT_CLOSE)
     def OnExit(self,e): 
+        self.Stop()
         self.Show(False)
         self.Parent.Raise()
 
@@ -76,14 +81,19 @@ class PreviewFrame(wx.Frame):
         self.RenderPreview()
         
 
-    def RenderPreview(self, flame=None):
-        flame = flame or self.parent.flame
-
+    def GetRenderSize(self):
         pw, ph = map(float, self.GetPanelSize())
         fw, fh = map(float, self.parent.flame.size)
 
         ratio = min(pw/fw, ph/fh)
-        size = int(fw * ratio), int(fh * ratio)
+        return int(fw * ratio), int(fh * ratio)
+
+
+    def RenderPreview(self, flame=None):
+        if self.playback is not None:
+            return
+        flame = flame or self.parent.flame
+        size = self.GetRenderSize()
         
         req = self.parent.renderer.LargePreviewRequest
         req(self.RenderCallback, flame, size, progress_func=self.prog_func,
@@ -103,6 +113,45 @@ class PreviewFrame(wx.Frame):
         self.SetStatusText("rendering: %.2f %%" %fraction)
 
 
+    def Play(self, frames, fps=None, loop=True):
+        """Plays a sequence of flames, rendered ahead by worker threads."""
+        self.Stop()
+        fps = fps or config["Playback-FPS"]
+        self.playback = Playback(frames, self.GetRenderSize(), fps, loop,
+                                 config["Playback-Buffer"],
+                                 **config["Playback-Settings"])
+        # Poll at twice the frame rate, so frames are shown close to on time.
+        self.timer.Start(max(1, int(500 / fps)))
+
+
+    def Stop(self):
+        if self.playback is None:
+            return
+        self.timer.Stop()
+        self.playback.stop()
+        self.playback = None
+        self.RenderPreview()
+
+
+    @Bind(wx.EVT_TIMER)
+    def OnTimer(self, e):
+        playback = self.playback
+        if playback is None:
+            return
+        frame = playback.next_frame()
+        if frame is not None:
+            # Bitmaps are only created here, since wx isn't thread safe.
+            index, data = frame
+            bmp = wx.BitmapFromBuffer(playback.size[0], playback.size[1],
+                                      data)
+            self.image.UpdateBitmap(bmp)
+            self.SetStatusText("playing: frame %s/%s, %s fps, %s dropped"
+                               % (index + 1, len(playback.frames),
+                                  int(playback.fps), playback.dropped))
+        if playback.finished:
+            self.Stop()
+
+
         
 class PreviewBase(wx.Panel):
     HasChanged = False
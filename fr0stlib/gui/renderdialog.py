@@ -12,6 +12,7 @@ from functools import partial
 from collections import defaultdict
 
 from fr0stlib import Flame
+from fr0stlib.render import BatchRenderer, RenderJob, flam3_render_tiled
 from fr0stlib.gui.utils import NumberTextCtrl, Box, MyChoice, MakeTCs, SizePanel
 from fr0stlib.gui.config import config
 from fr0stlib.gui.constants import ID
@@ -166,6 +167,7 @@ class RenderDialog(wx.Frame):
 
         self.progflag = 0
         self.rendering = False
+        self.engine = None
 	
         self.Center(wx.CENTER_ON_SCREEN)
         self.SetBackgroundColour(wx.NullColour)
@@ -371,10 +373,10 @@ class RenderDialog(wx.Frame):
                              'Fr0st', wx.OK).ShowModal()
             return
 
-        if self.mem.GetRequired() > self.mem.GetFree() + .5:
-            # TODO: offer between slicing and cancel
-            wx.MessageDialog(self, "Not enough memory for render.",
-                             'Fr0st', wx.OK).ShowModal()
+        tiled = self.mem.GetRequired() > self.mem.GetFree() + .5
+        if tiled and wx.MessageDialog(self, "Not enough memory for render.\n\n"
+                                      "Do you want to render in tiles?",
+                                      'Fr0st', wx.YES_NO).ShowModal() == wx.ID_NO:
             return
 
         # Interpolate flame names, make repeated names unique, and ensure all
@@ -433,6 +435,13 @@ class RenderDialog(wx.Frame):
         config["Img-Dir"] = os.path.dirname(destination)
         config["Img-Type"] = ty
 
+        if tiled:
+            self.RenderTiled(paths, size, kwds)
+            return
+        elif config["renderer"] == "flam3":
+            self.RenderBatch(paths, size, kwds)
+            return
+
         req = self.parent.renderer.RenderRequest
         backup = open(os.path.join(wx.GetApp().ConfigDir,'renders.flame'), 'a')
         for i, path in zip(self.selections, paths):
@@ -447,6 +456,105 @@ class RenderDialog(wx.Frame):
         self.t = time.time()
 
 
+    def MakeJobs(self, paths, size, kwds):
+        settings = dict(kwds)
+        quality = settings.pop("quality")
+        jobs = []
+        backup = open(os.path.join(wx.GetApp().ConfigDir,'renders.flame'), 'a')
+        for i, path in zip(self.selections, paths):
+            data = self.choices[i]
+            jobs.append(RenderJob(data[-1], size, quality, settings, path))
+            backup.write(data[-1] + "\n")
+        backup.close()
+        self.names = [self.choices[i].name for i in self.selections]
+        return jobs
+
+
+    def RenderBatch(self, paths, size, kwds):
+        """Renders all selected flames in parallel, using a BatchRenderer."""
+        kwds = dict(kwds)
+        nthreads = int(kwds.pop("nthreads"))
+        jobs = self.MakeJobs(paths, size, kwds)
+        self.progress = [0.] * len(jobs)
+        engine = BatchRenderer(nthreads=nthreads,
+                               memory=self.mem.GetFree() * 1024**2)
+        prog = self.parent.renderer.prog_wrapper(self.JobProgress, "bgflag")
+        self.engine = engine
+        self.RunBatch(engine, jobs, prog)
+        self.t = time.time()
+
+
+    @Threaded
+    def RunBatch(self, engine, jobs, prog):
+        try:
+            engine.run(jobs, prog, self.OnJobDone)
+        finally:
+            self.OnBatchDone()
+
+
+    def RenderTiled(self, paths, size, kwds):
+        """Renders the selected flames one after the other, each split into
+        as many tiles as needed to fit into free memory."""
+        jobs = self.MakeJobs(paths, size, kwds)
+        progs = [self.parent.renderer.prog_wrapper(
+                     self.MakeProg(name, i + 1, len(jobs)), "bgflag")
+                 for i, name in enumerate(self.names)]
+        self.RunTiled(jobs, progs, self.mem.GetFree() * 1024**2)
+        self.t = time.time()
+
+
+    @Threaded
+    def RunTiled(self, jobs, progs, memory):
+        try:
+            for job, prog in zip(jobs, progs):
+                if not flam3_render_tiled(job.flame, job.size, job.quality,
+                                          job.path, memory=memory,
+                                          progress_func=prog, **job.settings):
+                    break
+        finally:
+            self.OnBatchDone()
+
+
+    @Catches(wx.PyDeadObjectError)
+    def JobProgress(self, index, fraction, stage, eta):
+        if self.progflag == 1:
+            return 1
+        self.OnJobProgress(index, fraction, stage, eta)
+        return self.progflag
+
+
+    def BatchStatus(self, index):
+        return "rendering %s/%s (%s)" %(index + 1, len(self.names),
+                                        self.names[index])
+
+
+    @InMain
+    def OnJobProgress(self, index, fraction, stage, eta):
+        if stage == 0:
+            self.progress[index] = fraction
+            self.SetStatusText("%s: %.2f %% \tETA: %02d:%02d:%02d"
+                               %(self.BatchStatus(index), fraction,
+                                 eta/3600, eta%3600/60, eta%60))
+        else:
+            self.SetStatusText("%s: %.2f %% \trunning density estimation"
+                               %(self.BatchStatus(index), fraction))
+        self.gauge.SetValue(sum(self.progress) / len(self.progress))
+
+
+    @InMain
+    def OnJobDone(self, index, result):
+        self.progress[index] = 100.
+        self.gauge.SetValue(sum(self.progress) / len(self.progress))
+
+
+    @InMain
+    def OnBatchDone(self):
+        self.rendering = False
+        self.progflag = 0
+        self.engine = None
+        self.CleanProg()
+
+
     def MakeProg(self, name, index, lenght):
         string = "rendering %s/%s (%s): %%.2f %%%% \t" %(index, lenght, name)
         str_iter = string + "ETA: %02d:%02d:%02d"
@@ -475,8 +583,10 @@ class RenderDialog(wx.Frame):
             
     def CancelRender(self):
         self.progflag = 1
-        # HACK: prevent future renders from being passed to flame.
-        del self.parent.renderer.bgqueue[:]
+        if self.engine is not None:
+            self.engine.cancel()
+        # Prevent queued renders from being passed to flam3.
+        self.parent.renderer.CancelRenders()
         
 
     def CleanProg(self):
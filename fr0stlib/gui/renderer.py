@@ -1,52 +1,205 @@
-import time, sys, traceback
-from collections import defaultdict
+from __future__ import with_statement
+import sys, traceback, itertools
+from collections import deque
+from functools import partial
+from threading import Condition, Lock
+from multiprocessing import cpu_count
 from wx import PyDeadObjectError
 
 from fr0stlib.decorators import Catches, Threaded
-from fr0stlib.render import flam3_render, flam4_render
+from fr0stlib.render import flam3_render_array, flam4_render
+from fr0stlib.pyflam3 import output_buffer_pool
 from fr0stlib.gui.config import config
+from fr0stlib import Flame
+from fr0stlib.thumbcache import flame_hash
 
 
-class Renderer():
+def progressive_passes(size, quality, steps=2):
+    """Returns a list of (size, quality) passes for a progressive preview:
+    a coarse pass at 1/2**steps of the size, followed by the full render.
+    Passes don't build on each other, so the coarse one only adds about
+    1/4**steps of the work."""
+    w, h = size
+    return [((max(1, w >> steps), max(1, h >> steps)), quality),
+            ((w, h), quality)]
+
+
+
+class _Passes(list):
+    """The pending passes of a preview request. key is the render cache key
+    of its final pass, computed when the request starts rendering."""
+    key = None
+
+
+
+class RenderCache(object):
+    """Keeps the images of recent renders in memory, up to max_bytes. The
+    least recently used ones are evicted first."""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._entries = {}
+        self._size = 0
+        self._clock = itertools.count().next
+        self._lock = Lock()
+
+
+    @staticmethod
+    def key(args, kwds):
+        """Returns the key of a render request. Flame objects are keyed by
+        their current state."""
+        flame, size = args[:2]
+        if isinstance(flame, Flame):
+            flame = flame.to_string()
+        digest = flame_hash(flame).digest()
+        settings = sorted((k, v) for k, v in kwds.iteritems()
+                          if k not in ("progress_func", "nthreads",
+                                       "display_size"))
+        return digest, tuple(size), tuple(settings)
+
+
+    def __contains__(self, key):
+        return key in self._entries
+
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry[0] = self._clock()
+            return entry[1]
+
+
+    def put(self, key, data):
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old[1])
+            self._entries[key] = [self._clock(), data]
+            self._size += len(data)
+            if self._size > self.max_bytes:
+                # Evict down to 90% of the limit, so a full cache doesn't
+                # need to sort its entries on every insert.
+                stamps = sorted((v[0], k) for k, v in self._entries.iteritems())
+                for stamp, k in stamps:
+                    if self._size <= self.max_bytes * 0.9:
+                        break
+                    self._size -= len(self._entries.pop(k)[1])
+
+
+
+class Renderer(object):
+    """Schedules render requests on several threads. The preview thread
+    handles previews before large previews, a pool of thumbnail threads
+    handles thumbnails and the background thread handles final renders, which
+    are paused through their progress function whenever there are previews or
+    thumbnails to do.
+
+    All threads sleep on a condition until a request comes in."""
+
     def __init__(self, parent):
         self.parent = parent
+        self.previewqueue = deque()
+        self.largepreviewqueue = deque()
         self.thumbqueue = []
-        self.previewqueue = []
-        self.largepreviewqueue = []
-        self.bgqueue = []
+        self.bgqueue = deque()
+        self.condition = Condition()
         self.exitflag = 0
         self.previewflag = 0
-        self.bgflag = 0
+        self.thumbflag = None
+        self.busy = False
+        self.thumbbusy = 0
+        self.cache = RenderCache(config["Render-Cache-Size"] * 1024**2)
         if "-debug" not in sys.argv:
             # TODO: remove this.
             self.RenderLoop()
             self.bgRenderLoop()
+            nthreads = config["Thumbnail-Threads"] or cpu_count()
+            for i in range(nthreads):
+                self.ThumbnailLoop()
+
+
+    @property
+    def bgflag(self):
+        """Pauses background renders while previews are pending."""
+        if (self.busy or self.thumbbusy or self.previewqueue
+            or self.largepreviewqueue or self.thumbqueue):
+            return 2
+        return 0
+
+
+    def _request(self, queue, item, replace=False):
+        with self.condition:
+            if replace:
+                queue.clear()
+            queue.append(item)
+            self.condition.notify_all()
 
 
     def ThumbnailRequest(self, callback, *args, **kwds):
-        """Schedules a thumbnail to be rendered."""
+        """Schedules a thumbnail to be rendered.
+
+        key identifies the thumbnail for RankThumbnails. flag is the
+        generation the request belongs to; it's dropped, or aborted if
+        already rendering, once CancelThumbnails starts a new generation."""
+        key = kwds.pop("key", None)
+        flag = kwds.pop("flag", None)
         # These settings are hardcoded on purpose, they can't be overridden
-        # by the calling code.
+        # by the calling code. Thumbnails are rendered in parallel by the
+        # thumbnail threads instead of using several threads each.
         kwds["nthreads"] = 1
         kwds["fixed_seed"] = True
         kwds["renderer"] = "flam3"
+        kwds["progress_func"] = partial(self.thumb_prog, flag)
         
-        self.thumbqueue.append((callback,args,kwds))
+        self._request(self.thumbqueue, (key, (callback,args,kwds)))
+
+
+    def RankThumbnails(self, ranks):
+        """Reorders pending thumbnails by the rank given to their key in the
+        ranks dict, lowest first. Thumbnails without a rank go last."""
+        default = len(ranks)
+        with self.condition:
+            self.thumbqueue.sort(key=lambda i: ranks.get(i[0], default))
+
+
+    def thumb_prog(self, flag, *args):
+        return self.exitflag or (flag is not None and flag != self.thumbflag)
+
+
+    def _passes(self, callback, args, kwds):
+        """Splits a preview request into a list of progressively better
+        passes, if progressive previews are enabled. Each pass is displayed
+        at the full size of the request."""
+        if not config["Progressive-Preview"]:
+            return _Passes([(callback,args,kwds)])
+        flame, size = args[:2]
+        kwds["display_size"] = tuple(size)
+        return _Passes((callback, (flame, pass_size) + args[2:],
+                        dict(kwds, quality=quality))
+                       for pass_size, quality
+                       in progressive_passes(size, kwds.get("quality", 1)))
 
 
     def PreviewRequest(self, callback, *args, **kwds):
         """Schedules a render immediately after the current render is done.
-        Cancels previous requests (assuming they are obsolete)."""
+        Cancels previous requests (assuming they are obsolete), including
+        any passes of a progressive preview that haven't rendered yet."""
         kwds["nthreads"] = 1
         kwds["fixed_seed"] = True
         kwds["renderer"] = "flam3"
         self.previewflag = 1
         
-        self.previewqueue = [(callback,args,kwds)]
+        self._request(self.previewqueue, self._passes(callback,args,kwds),
+                      replace=True)
 
         
     def LargePreviewRequest(self, callback, *args, **kwds):
-        """Makes a preview request with a progress function."""
+        """Makes a preview request with a progress function. A running large
+        preview is aborted, as it's obsolete."""
         prog_func = kwds.get("progress_func", None)
         if not prog_func:
             raise KeyError("You must specify a progress function")
@@ -54,7 +207,8 @@ class Renderer():
         kwds["renderer"] = kwds.get("renderer", config["renderer"])
         self.previewflag = 1
 
-        self.largepreviewqueue = [(callback,args,kwds)]
+        self._request(self.largepreviewqueue,
+                      self._passes(callback,args,kwds), replace=True)
 
 
     def RenderRequest(self, callback, *args, **kwds):
@@ -66,60 +220,155 @@ class Renderer():
         kwds["progress_func"] = self.prog_wrapper(prog_func, "bgflag")
         kwds["renderer"] = kwds.get("renderer", config["renderer"])
 
-        self.bgqueue.append((callback,args,kwds))
+        self._request(self.bgqueue, (callback,args,kwds))
+
+
+    def CancelThumbnails(self, flag=None):
+        """Drops all pending thumbnails and starts a new generation."""
+        with self.condition:
+            self.thumbflag = flag
+            del self.thumbqueue[:]
+
+
+    def CancelRenders(self):
+        with self.condition:
+            self.bgqueue.clear()
+
+
+    def Exit(self):
+        with self.condition:
+            self.exitflag = 1
+            self.condition.notify_all()
         
 
     @Threaded
     def RenderLoop(self):
-        while not self.exitflag:
-            queue = (self.previewqueue or self.thumbqueue 
-                     or self.largepreviewqueue)
-            if queue:
-                self.bgflag = 2 # Pauses the other thread
+        queues = self.previewqueue, self.largepreviewqueue
+        while True:
+            with self.condition:
+                self.busy = False
+                while not self.exitflag and not any(queues):
+                    self.condition.wait()
+                if self.exitflag:
+                    return
+                # Preview queues hold lists of passes. A list stays queued
+                # until its last pass is taken, so a new request replacing it
+                # abandons the remaining passes.
+                queue = (i for i in queues if i).next()
+                passes = queue[0]
+                item = passes.pop(0)
+                if not passes:
+                    queue.popleft()
+                self.busy = True
                 self.previewflag = 0
-                self.process(*queue.pop(0))
-                self.bgflag = 0
-            else:
-                time.sleep(.01)  # Ideal interval needs to be tested
+            if passes.key is None:
+                passes.key = self.cache.key(*(passes or [item])[-1][1:])
+            if passes and passes.key in self.cache:
+                # The final pass is cached, skip straight to it.
+                with self.condition:
+                    if passes:
+                        item = passes.pop()
+                        del passes[:]
+                        if queue and queue[0] is passes:
+                            queue.popleft()
+            # Only the final pass is cached.
+            self.process(*item, key=None if passes else passes.key)
+
+
+    @Threaded
+    def ThumbnailLoop(self):
+        while True:
+            with self.condition:
+                while not self.exitflag and not self.thumbqueue:
+                    self.condition.wait()
+                if self.exitflag:
+                    return
+                key, item = self.thumbqueue.pop(0)
+                self.thumbbusy += 1
+            try:
+                self.process(*item, key=self.cache.key(*item[1:]))
+            finally:
+                with self.condition:
+                    self.thumbbusy -= 1
 
 
     @Threaded
     def bgRenderLoop(self):
-        while not self.exitflag:
-            queue = self.bgqueue
-            if queue:
-                self.process(*queue.pop(0))
-            else:
-                time.sleep(.01)
+        while True:
+            with self.condition:
+                while not self.exitflag and not self.bgqueue:
+                    self.condition.wait()
+                if self.exitflag:
+                    return
+                item = self.bgqueue.popleft()
+            self.process(*item)
 
 
     @Catches(PyDeadObjectError)
-    def process(self, callback, args, kwds):
+    def process(self, callback, args, kwds, key=None):
+        """Renders a request and passes the image on to its callback. If
+        its render cache key is given, the image is looked up in and stored
+        to the cache."""
         renderer = kwds.pop("renderer")
+        display_size = kwds.pop("display_size", None)
+        if renderer == 'flam4':
+            channels = 4
+        else:
+            channels = kwds.get('transparent', False) + 3
+
+        output_buffer = key and self.cache.get(key)
+        if output_buffer:
+            pooled = False
+        else:
+            output_buffer, aborted = self.render(renderer, args, kwds)
+            if output_buffer is None:
+                return
+            pooled = renderer == "flam3"
+            if key and not aborted:
+                self.cache.put(key, str(buffer(output_buffer)))
+
+        try:
+            # HACK: If by the time the render finishes it has been obsoleted,
+            # don't return the buffer in case of a large preview.
+            if hasattr(callback, "_can_cancel") and self.previewflag:
+                return        
+        
+            # args[1] is always size...
+            self.parent.OnImageReady(callback, args[1], output_buffer,
+                                     channels, display_size)
+        finally:
+            # OnImageReady has copied the image into a bitmap by now.
+            if pooled:
+                output_buffer_pool.release(output_buffer)
+
+
+    def render(self, renderer, args, kwds):
+        """Returns the output buffer (None if rendering failed) and whether
+        the render was aborted by its progress function."""
         if renderer == "flam3":
-            render = flam3_render
+            # Buffers come from a pool, as previews and thumbnails are
+            # rendered over and over at the same sizes.
+            render = partial(flam3_render_array, pool=output_buffer_pool)
         elif renderer == "flam4":
             render = flam4_render
         else:
             raise ValueError("Invalid renderer: %s" % renderer)
+
+        aborted = []
+        prog_func = kwds.get("progress_func")
+        if prog_func is not None:
+            def progress_func(*a):
+                res = prog_func(*a)
+                if res == 1:
+                    aborted.append(True)
+                return res
+            kwds["progress_func"] = progress_func
         try:
-            output_buffer = render(*args,**kwds)
+            return render(*args,**kwds), bool(aborted)
         except Exception:
             # Make sure render thread never crashes due to malformed flames.
             traceback.print_exc()
-            return
-
-        # HACK: If by the time the render finishes it has been obsoleted,
-        # don't return the buffer in case of a large preview.
-        if hasattr(callback, "_can_cancel") and self.previewflag:
-            return        
-        
-        if renderer == 'flam4':
-            channels = 4
-        else:
-            channels = kwds.get('transparent', False) + 3
-        # args[1] is always size...
-        self.parent.OnImageReady(callback, args[1], output_buffer, channels)
+            return None, True
         
 
     def prog_wrapper(self, f, flag):
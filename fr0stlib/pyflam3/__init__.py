@@ -22,8 +22,78 @@
 from __future__ import with_statement
 import sys
 import os
+import threading
+import collections
+import re
+import struct
 from _flam3 import *
 import marshal as marshal
+import numpy
+
+
+# Flame attributes which map directly onto a genome field, along with the
+# type the field expects. Others are either handled explicitly in from_flame
+# or ignored, as flam3_parse_xml2 would.
+_genome_attributes = {"time": ("time", float),
+                      "zoom": ("zoom", float),
+                      "brightness": ("brightness", float),
+                      "contrast": ("contrast", float),
+                      "gamma": ("gamma", float),
+                      "vibrancy": ("vibrancy", float),
+                      "highlight_power": ("highlight_power", float),
+                      "gamma_threshold": ("gam_lin_thresh", float),
+                      "hue": ("hue_rotation", float),
+                      "quality": ("sample_density", float),
+                      "passes": ("nbatches", int),
+                      "temporal_samples": ("ntemporal_samples", int),
+                      "oversample": ("spatial_oversample", int),
+                      "supersample": ("spatial_oversample", int),
+                      "filter": ("spatial_filter_radius", float),
+                      "estimator_radius": ("estimator", float),
+                      "estimator_minimum": ("estimator_minimum", float),
+                      "estimator_curve": ("estimator_curve", float)}
+
+_palette_modes = {"step": 0, "linear": 1}
+
+_xform_parameters = set(name for name, _, _, _ in variable_list)
+
+# Versions of flam3 whose flam3_xform is mirrored by BaseXForm.
+_direct_versions = re.compile(r"(^|-)2\.8")
+
+
+def _xform_stride():
+    """Measures sizeof(flam3_xform) in the loaded library from the xforms it
+    allocates. New xforms have identity coefs followed by identity post
+    coefs, and the distance between the first two of those is the stride.
+    Returns None if they aren't where BaseXForm has them."""
+    genome = BaseGenome()
+    clear_cp(byref(genome), flam3_defaults_on)
+    # More xforms than are looked at, so everything read is allocated.
+    flam3_add_xforms(byref(genome), 4, 0, 0)
+    try:
+        data = string_at(cast(genome.xform, c_void_p).value,
+                         2 * sizeof(BaseXForm) + 96)
+    finally:
+        clear_cp(byref(genome), flam3_defaults_on)
+    identity = struct.pack("12d", 1, 0, 0, 1, 0, 0, 1, 0, 0, 1, 0, 0)
+    first = data.find(identity)
+    second = data.find(identity, first + 1)
+    if first != BaseXForm.c.offset or second == -1:
+        return None
+    return second - first
+
+
+def _can_build_genomes():
+    """Genomes can only be filled in directly if the library exports the
+    functions needed, and lays out its xforms like BaseXForm. Writing them
+    otherwise would corrupt its heap."""
+    if clear_cp is None or flam3_add_xforms is None:
+        return False
+    if not _direct_versions.search(flam3_version() or ""):
+        return False
+    return _xform_stride() == sizeof(BaseXForm)
+
+direct_genomes = _can_build_genomes()
 
 
 class Genome(BaseGenome):
@@ -39,7 +109,7 @@ class Genome(BaseGenome):
     def render(self, transparent=0, ntemporal_samples=1, temporal_filter=1.0,
                estimator=9, estimator_curve=.4, estimator_minimum=0,
                spatial_oversample=1, filter_radius=1., filter_kernel=0,
-               **kwargs):
+               output_buffer=None, **kwargs):
         
         self.ntemporal_samples = ntemporal_samples
         self.temporal_filter_width = temporal_filter
@@ -59,7 +129,12 @@ class Genome(BaseGenome):
         frame.genomes = cast(pointer(self), POINTER(BaseGenome))
         frame.ngenomes = 1
 
-        output_buffer = allocate_output_buffer(self.size, transparent+3)
+        nbytes = self.width * self.height * (transparent+3)
+        if output_buffer is None:
+            output_buffer = allocate_output_buffer(self.size, transparent+3)
+        elif sizeof(output_buffer) != nbytes:
+            raise ValueError("Output buffer has %s bytes, expected %s"
+                             % (sizeof(output_buffer), nbytes))
 
         stats = RenderStats()
         flam3_render(byref(frame), output_buffer, flam3_field_both,
@@ -109,6 +184,86 @@ class Genome(BaseGenome):
         return genomes
 
 
+    @classmethod
+    def from_flame(cls, flame):
+        """Builds a genome straight from a fr0stlib Flame object, filling in
+        the flam3 structures without going through xml. Falls back on
+        parsing xml if the loaded library doesn't allow it."""
+        if not direct_genomes:
+            return cls.from_string(flame.to_string())[0]
+
+        genome = cls()
+        clear_cp(byref(genome), flam3_defaults_on)
+
+        # flam3 allocates the xforms and the chaos array, so they're laid
+        # out exactly as it expects.
+        flam3_add_xforms(byref(genome), len(flame.xform), 0, 0)
+        if flame.final:
+            flam3_add_xforms(byref(genome), 1, 0, 1)
+
+        name = flame.name or ""
+        if isinstance(name, unicode):
+            name = name.encode("utf-8")
+        genome.name = name[:flam3_name_len]
+        genome.width, genome.height = (int(i) for i in flame.size)
+        genome._center[:] = genome.rot_center[:] = flame.center
+        genome.pixels_per_unit = flame.scale * flame.size[0] / 100.
+        genome.rotate = flame.rotate
+        genome.background[:] = flame.background
+
+        for name, val in flame.__dict__.iteritems():
+            if name in _genome_attributes:
+                field, ty = _genome_attributes[name]
+                setattr(genome, field, ty(val))
+
+        mode = getattr(flame, "palette_mode", None)
+        if mode in _palette_modes:
+            genome.palette_mode = _palette_modes[mode]
+
+        palette = numpy.empty((256, 5))
+        palette[:,0] = numpy.arange(256)
+        palette[:,1:4] = flame.gradient.data / 255.
+        palette[:,4] = 1.0
+        memmove(byref(genome.palette), palette.ctypes.data,
+                sizeof(BasePalette))
+
+        for i, xform in enumerate(flame.iter_xforms()):
+            cls._fill_xform(genome.xform[i], xform)
+
+        chaos = cast(genome.chaos, POINTER(POINTER(c_double)))
+        for i, xform in enumerate(flame.xform):
+            for j, val in enumerate(xform.chaos[:]):
+                chaos[i][j] = val
+                if val != 1:
+                    genome.chaos_enable = 1
+
+        return genome
+
+
+    @staticmethod
+    def _fill_xform(struct, xform):
+        struct.var = (c_double * flam3_nvariations)()
+        for name, val in xform.__dict__.iteritems():
+            if name in variations:
+                struct.var[variations[name]] = val
+            elif name in _xform_parameters:
+                setattr(struct, name, val)
+
+        (struct.c[0][0], struct.c[0][1], struct.c[1][0],
+         struct.c[1][1], struct.c[2][0], struct.c[2][1]) = xform.screen_coefs
+        (struct.post[0][0], struct.post[0][1], struct.post[1][0],
+         struct.post[1][1], struct.post[2][0], struct.post[2][1]
+         ) = xform.post.screen_coefs
+        struct.has_post = xform.post.isactive()
+
+        if not xform.isfinal():
+            struct.density = xform.weight
+        struct.color = xform.color
+        struct.color_speed = xform.color_speed
+        struct.animate = xform.animate
+        struct.opacity = xform.opacity
+
+
     @classmethod
     def from_file(cls, filename=None, handle=None, defaults=True):
         ncps = c_int()
@@ -154,6 +309,130 @@ class Genome(BaseGenome):
 
 
 
+class OutputBufferPool(object):
+    """Keeps the output buffers of finished renders for reuse, keyed by their
+    size in bytes. Streams of renders of the same size (previews, thumbnails)
+    then don't allocate a new buffer for each frame.
+
+    At most maxsize free buffers of each size are kept."""
+
+    def __init__(self, maxsize=4):
+        self.maxsize = maxsize
+        self._free = collections.defaultdict(list)
+        self._lock = threading.Lock()
+
+
+    def get(self, size, channels):
+        """Returns a buffer for an image of the given size and channels. Its
+        contents are undefined."""
+        nbytes = size[0] * size[1] * channels
+        with self._lock:
+            free = self._free.get(nbytes)
+            if free:
+                return free.pop()
+        return allocate_output_buffer(size, channels)
+
+
+    def release(self, buf):
+        """Returns a buffer to the pool. buf can also be a numpy array viewing
+        a buffer, as returned by fr0stlib.render.flam3_render_array. The
+        buffer must not be used afterwards."""
+        while isinstance(buf, numpy.ndarray):
+            buf = buf.base
+        with self._lock:
+            free = self._free[sizeof(buf)]
+            if len(free) < self.maxsize:
+                free.append(buf)
+
+
+    def clear(self):
+        with self._lock:
+            self._free.clear()
+
+
+output_buffer_pool = OutputBufferPool()
+
+
+
+class GenomeSequence(object):
+    """Interpolates frames between keyframe genomes with flam3_interpolate,
+    the way flam3-animate does. The keyframes are copied into one genome
+    array up front, and each frame is interpolated in C into the same result
+    genome, which can be rendered directly.
+
+    There are n frames from one key to the next. With loop, the sequence
+    continues from the last key back to the first. With smooth, keys are
+    joined by splines instead of straight lines, which needs at least 4 keys
+    (or 3 with loop).
+
+    The sequence takes over the xforms of the genomes passed in. They are
+    freed by close, after which neither the genomes nor any frame returned
+    can be used."""
+
+    def __init__(self, genomes, n=50, loop=False, smooth=False, stagger=0.0):
+        nk = len(genomes)
+        if nk < 2:
+            raise ValueError("At least 2 keyframes are needed.")
+        self.n = n
+        self.loop = loop
+        self.stagger = stagger
+        self.nframes = n * (nk if loop else nk - 1)
+        smooth = smooth and nk >= (3 if loop else 4)
+
+        # A looping sequence wraps around by repeating keys at both ends,
+        # so every segment has a neighbour on each side for the spline.
+        if loop:
+            order = [nk - 1] + range(nk) + [0, 1]
+            times = range(-1, nk + 2)
+            self._owned = range(1, nk + 1)
+        else:
+            order = range(nk)
+            times = range(nk)
+            self._owned = order
+        self._genomes = (BaseGenome * len(order))()
+        for slot, (index, time) in enumerate(zip(order, times)):
+            key = self._genomes[slot]
+            memmove(byref(key), byref(genomes[index]), sizeof(BaseGenome))
+            key.time = time * n
+            key.interpolation = (flam3_interpolation_smooth if smooth
+                                 else flam3_interpolation_linear)
+        self.result = Genome()
+
+
+    def __len__(self):
+        return self.nframes
+
+
+    def frame(self, index):
+        """Interpolates the given frame into self.result and returns it. The
+        result is overwritten by the next call."""
+        if not 0 <= index < self.nframes:
+            raise IndexError("Frame index out of range")
+        flam3_interpolate(self._genomes, len(self._genomes), float(index),
+                          self.stagger, byref(self.result))
+        return self.result
+
+
+    def __iter__(self):
+        for index in xrange(self.nframes):
+            yield self.frame(index)
+
+
+    def close(self):
+        if self._genomes is None:
+            return
+        if clear_cp is None:
+            # Without clear_cp, the genomes are left alone, as the ones
+            # parsed by from_string always are.
+            self._genomes = None
+            return
+        for slot in self._owned:
+            clear_cp(byref(self._genomes[slot]), flam3_defaults_on)
+        clear_cp(byref(self.result), flam3_defaults_on)
+        self._genomes = None
+
+
+
 class Frame(BaseFrame):
     def __init__(self, fixed_seed=False, aspect=1.0, buffer_depth=33, time=0,
                  bytes_per_channel=1, progress_func=None, nthreads=0,
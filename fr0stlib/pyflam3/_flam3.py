@@ -81,7 +81,52 @@ class PaletteEntry(Structure):
 class BasePalette(Structure):
     _fields_ = [('entries', PaletteEntry * 256)]
 
-class BaseXForm(Structure): pass
+class BaseXForm(Structure):
+    # Mirrors flam3_xform from flam3.h. The parametric variation members are
+    # declared in the same order as variable_list, which follows the header.
+    _fields_ = [ ('var', c_double * flam3_nvariations)
+               , ('c', (c_double * 2) * 3)
+               , ('post', (c_double * 2) * 3)
+               , ('density', c_double)
+               , ('color', c_double)
+               , ('color_speed', c_double)
+               , ('animate', c_double)
+               , ('opacity', c_double)
+               , ('vis_adjusted', c_double)
+               , ('padding', c_int)
+               , ('wind', c_double * 2)
+               , ('precalc_angles_flag', c_int)
+               , ('precalc_atan_xy_flag', c_int)
+               , ('precalc_atan_yx_flag', c_int)
+               , ('has_preblur', c_double)
+               , ('has_post', c_int)
+               ] + [(name, c_double) for name, _, _, _ in variable_list] + [
+                 ('persp_vsin', c_double)
+               , ('persp_vfcos', c_double)
+               , ('julian_rN', c_double)
+               , ('julian_cn', c_double)
+               , ('juliascope_rN', c_double)
+               , ('juliascope_cn', c_double)
+               , ('wedgeJulia_rN', c_double)
+               , ('wedgeJulia_cn', c_double)
+               , ('wedgeJulia_cf', c_double)
+               , ('radialBlur_spinvar', c_double)
+               , ('radialBlur_zoomvar', c_double)
+               , ('waves_dx2', c_double)
+               , ('waves_dy2', c_double)
+               , ('disc2_sinadd', c_double)
+               , ('disc2_cosadd', c_double)
+               , ('disc2_timespi', c_double)
+               , ('super_shape_pm_4', c_double)
+               , ('super_shape_pneg1_n1', c_double)
+               , ('num_active_vars', c_int)
+               , ('active_var_weights', c_double * flam3_nvariations)
+               , ('varFunc', c_int * flam3_nvariations)
+               , ('motion_freq', c_int)
+               , ('motion_func', c_int)
+               , ('motion', c_void_p)
+               , ('num_motion', c_int)
+               ]
 
 class BaseGenome(Structure):
     _fields_ = [ ('name', c_char * (flam3_name_len + 1))
@@ -218,6 +263,19 @@ flam3_malloc.restype = c_void_p
 flam3_free = libflam3.flam3_free
 flam3_free.argtypes = [c_void_p]
 
+# Not every build of libflam3 exports these two (the bundled windows dll
+# doesn't), so they're None when missing.
+
+# void clear_cp(flam3_genome *cp, int def_flag);
+clear_cp = getattr(libflam3, 'clear_cp', None)
+if clear_cp is not None:
+    clear_cp.argtypes = [POINTER(BaseGenome), c_int]
+
+# void flam3_add_xforms(flam3_genome *cp, int num_to_add, int interp_padding, int final_flag);
+flam3_add_xforms = getattr(libflam3, 'flam3_add_xforms', None)
+if flam3_add_xforms is not None:
+    flam3_add_xforms.argtypes = [POINTER(BaseGenome), c_int, c_int, c_int]
+
 #int flam3_estimate_bounding_box(flam3_genome *cp, double eps, int nsamples,
 #             double *bmin, double *bmax, randctx *rc)
 libflam3.flam3_estimate_bounding_box.argtypes = [POINTER(BaseGenome), c_double, c_int, POINTER(c_double), POINTER(c_double), POINTER(RandomContext)]
@@ -24,6 +24,10 @@ flam3_nxforms = 12
 flam3_parent_fn_len = 30
 flam3_interpolation_linear = 0
 flam3_interpolation_smooth = 1
+flam3_inttype_linear = 0
+flam3_inttype_log = 1
+flam3_inttype_compat = 2
+flam3_inttype_older = 3
 flam3_palette_interpolation_hsv = 0
 flam3_palette_interpolation_sweep = 1
 flam3_max_action_length = 10000
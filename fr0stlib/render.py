@@ -1,16 +1,19 @@
-from fr0stlib.pyflam3 import Genome
-from fr0stlib import Flame
+from __future__ import with_statement
+import os, sys, time, math, fnmatch, optparse, multiprocessing, Queue, \
+       collections, traceback, threading, struct, zlib
+from ctypes import byref, cast, pointer, POINTER
+import numpy
+import Image
 
+from fr0stlib import Flame, iter_flames
 
-def flam3_render(flame, size, quality, **kwds):
-    """Passes render requests on to flam3."""
+
+def _prepare_genome(flame, size, quality):
     flame = flame if type(flame) is Flame else Flame(flame)
-#    try:
-    genome = Genome.from_string(flame.to_string())[0]
-#    except Exception:
-#        raise ValueError("Error while parsing flame string.")
-        
-    width,height = size
+    genome = flame.to_genome()
+
+    # flam3 takes integer sizes, while Flame.size is parsed as floats.
+    width,height = map(int, size)
 
     try:
         genome.pixels_per_unit /= genome.width/float(width) # Adjusts scale
@@ -20,10 +23,32 @@ def flam3_render(flame, size, quality, **kwds):
     genome.width = width
     genome.height = height
     genome.sample_density = quality
+    return genome
+
+
+def flam3_render(flame, size, quality, **kwds):
+    """Passes render requests on to flam3. An output_buffer of the right size
+    can be passed in to be rendered into, instead of allocating a new one."""
+    genome = _prepare_genome(flame, size, quality)
     output_buffer, stats = genome.render(**kwds)
     return output_buffer
 
 
+def flam3_render_array(flame, size, quality, pool=None, **kwds):
+    """Like flam3_render, but returns the image as a (height, width, channels)
+    uint8 array, which is a view of the output buffer rather than a copy.
+
+    If a pool (see pyflam3.OutputBufferPool) is given, the buffer is taken
+    from it. The array should then be passed to pool.release once it's no
+    longer needed."""
+    channels = int(kwds.get("transparent", 0)) + 3
+    if pool is not None:
+        kwds["output_buffer"] = pool.get(size, channels)
+    output_buffer = flam3_render(flame, size, quality, **kwds)
+    return numpy.frombuffer(output_buffer, numpy.uint8).reshape(
+        size[1], size[0], channels)
+
+
 def flam4_render(flame, size, quality, **kwds):
     """Passes requests on to flam4. Works on windows only for now."""
     from fr0stlib.pyflam3 import _flam4
@@ -32,3 +57,521 @@ def flam4_render(flame, size, quality, **kwds):
     output_buffer = _flam4.renderFlam4(flam4Flame, size, quality, **kwds)
     return output_buffer
 
+
+def flam3_memory_required(flame, size, quality, spatial_oversample=1,
+                          buffer_depth=33, transparent=0, **kwds):
+    """Returns the number of bytes flam3 needs to render the flame with the
+    given settings, including the output buffer."""
+    from fr0stlib.pyflam3 import Frame, BaseGenome, \
+         flam3_render_memory_required
+    genome = _prepare_genome(flame, size, quality)
+    genome.spatial_oversample = int(spatial_oversample)
+    frame = Frame(fixed_seed=True, buffer_depth=int(buffer_depth), nthreads=1)
+    frame.genomes = cast(pointer(genome), POINTER(BaseGenome))
+    frame.ngenomes = 1
+    return (flam3_render_memory_required(byref(frame))
+            + size[0] * size[1] * (int(transparent) + 3))
+
+
+def save_image(path, output_buffer, size, channels=3):
+    """Saves an rgb(a) buffer as returned by flam3_render. The image format
+    is determined by the extension of path."""
+    mode = "RGBA" if channels == 4 else "RGB"
+    Image.frombuffer(mode, size, output_buffer, "raw", mode, 0, 1).save(path)
+
+
+def _png_chunk(f, kind, data):
+    f.write(struct.pack(">I", len(data)))
+    f.write(kind)
+    f.write(data)
+    f.write(struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff))
+
+
+def save_png_rows(path, image, blocksize=1<<22):
+    """Saves a (height, width, channels) uint8 array as png, encoding a block
+    of rows at a time. Unlike save_image, the array is never copied as a
+    whole, so it can be a memmap larger than the available memory."""
+    h, w, channels = image.shape
+    rows = max(1, blocksize // (w * channels + 1))
+    compressor = zlib.compressobj()
+    with open(path, "wb") as f:
+        f.write("\x89PNG\r\n\x1a\n")
+        _png_chunk(f, "IHDR", struct.pack(">IIBBBBB", w, h, 8,
+                                          6 if channels == 4 else 2, 0, 0, 0))
+        for y in xrange(0, h, rows):
+            block = numpy.zeros((min(rows, h - y), w * channels + 1),
+                                numpy.uint8)
+            # The first byte of each row is its filter type, 0 (none).
+            block[:, 1:] = image[y:y + rows].reshape(len(block), -1)
+            data = compressor.compress(block.tostring())
+            if data:
+                _png_chunk(f, "IDAT", data)
+        _png_chunk(f, "IDAT", compressor.flush())
+        _png_chunk(f, "IEND", "")
+
+
+
+def tile_margin(filter_radius=1., estimator=9, spatial_oversample=1, **kwds):
+    """Returns the number of pixels by which neighbouring tiles overlap. The
+    spatial filter and density estimation spread each point over nearby
+    pixels, so the edges of a tile are only valid this far inside it."""
+    return int(math.ceil(3 * filter_radius
+                         + float(estimator) / spatial_oversample)) + 1
+
+
+def _tile_edges(length, n):
+    return [length * i // n for i in range(n + 1)]
+
+
+def tile_grid(flame, size, quality, memory, **kwds):
+    """Returns the smallest (columns, rows) grid for which every tile,
+    overlap included, can be rendered in the given number of bytes."""
+    flame = flame if type(flame) is Flame else Flame(flame)
+    w, h = size
+    margin = tile_margin(**kwds)
+    required = flam3_memory_required(flame, size, quality, **kwds)
+    n = max(1, int(math.ceil(required / float(memory))))
+    while True:
+        cols = min(w, max(1, int(round(math.sqrt(n * w / float(h))))))
+        rows = min(h, int(math.ceil(n / float(cols))))
+        tile = (-(-w // cols) + 2 * margin, -(-h // rows) + 2 * margin)
+        if flam3_memory_required(flame, tile, quality, **kwds) <= memory:
+            return cols, rows
+        if cols == w and rows == h:
+            raise MemoryError("Not enough memory to render a single tile.")
+        n += 1
+
+
+def flam3_render_tiled(flame, size, quality, path, memory=None, tiles=None,
+                       progress_func=None, **kwds):
+    """Renders the flame to path in overlapping tiles, so images that don't
+    fit in memory can be rendered. Each tile is rendered with its own camera
+    and its overlap is trimmed before being written to a raw file next to
+    path, which is converted to the final image once all tiles are done.
+
+    Only png images are written from the raw file without loading them into
+    memory. Other formats are saved by PIL, which needs the whole image in
+    memory, so their size is still limited by it.
+
+    tiles is a (columns, rows) grid. If not given, it's chosen by tile_grid
+    so that each tile fits in memory bytes.
+
+    progress_func is called like the flam3 progress function, with the
+    fraction of the whole image. Returns False if the render was aborted."""
+    flame = flame if type(flame) is Flame else Flame(flame)
+    if tiles is None:
+        tiles = tile_grid(flame, size, quality, memory, **kwds)
+    w, h = size
+    cols, rows = tiles
+    channels = int(kwds.get("transparent", 0)) + 3
+    margin = tile_margin(**kwds)
+
+    genome = _prepare_genome(flame, size, quality)
+    # Tiles are moved by shifting the center only. The rotation center stays
+    # where it is, so rotated flames line up across tiles.
+    center = genome._center[:]
+    ppu = genome.pixels_per_unit
+
+    ntiles = cols * rows
+    state = {"done": 0, "aborted": False}
+    def prog(py_object, fraction, stage, eta):
+        res = progress_func(py_object, (state["done"] + fraction / 100.)
+                            * 100. / ntiles, stage, eta)
+        if res == 1:
+            state["aborted"] = True
+        return res
+
+    if progress_func is not None:
+        kwds["progress_func"] = prog
+    temp = path + ".tiles"
+    image = numpy.memmap(temp, numpy.uint8, "w+", shape=(h, w, channels))
+    try:
+        xs, ys = _tile_edges(w, cols), _tile_edges(h, rows)
+        for y0, y1 in zip(ys, ys[1:]):
+            for x0, x1 in zip(xs, xs[1:]):
+                genome.width = x1 - x0 + 2 * margin
+                genome.height = y1 - y0 + 2 * margin
+                genome._center[0] = center[0] + ((x0 + x1) / 2. - w / 2.) / ppu
+                genome._center[1] = center[1] + ((y0 + y1) / 2. - h / 2.) / ppu
+                output_buffer, stats = genome.render(**kwds)
+                if state["aborted"]:
+                    return False
+                tile = numpy.frombuffer(output_buffer, numpy.uint8)
+                tile = tile.reshape(genome.height, genome.width, channels)
+                image[y0:y1, x0:x1] = tile[margin:margin + y1 - y0,
+                                           margin:margin + x1 - x0]
+                image.flush()
+                state["done"] += 1
+        if os.path.splitext(path)[1].lower() == ".png":
+            save_png_rows(path, image)
+        else:
+            save_image(path, image, size, channels)
+        return True
+    finally:
+        del image
+        os.remove(temp)
+
+
+def flam3_render_sequence(flames, n, size, quality, path, loop=False,
+                          smooth=False, frames=None, progress_func=None,
+                          done_func=None, **kwds):
+    """Renders an animation between keyframe flames, with n frames from one
+    key to the next (see pyflam3.GenomeSequence). Frames are interpolated by
+    flam3 and rendered straight from the resulting genome, without being
+    turned into Flame objects.
+
+    path is formatted with the frame index, e.g. "frame{index:04d}.png".
+    frames is a list of frame indices to render, all of them by default.
+
+    progress_func is called like the flam3 progress function, with the
+    fraction of the whole sequence. done_func is called with the index and
+    path of each saved frame. Returns False if the render was aborted."""
+    from fr0stlib.pyflam3 import GenomeSequence, output_buffer_pool
+    genomes = [_prepare_genome(flame, size, quality) for flame in flames]
+    sequence = GenomeSequence(genomes, n, loop=loop, smooth=smooth)
+    if frames is None:
+        frames = range(len(sequence))
+    channels = int(kwds.get("transparent", 0)) + 3
+
+    state = {"done": 0, "aborted": False}
+    def prog(py_object, fraction, stage, eta):
+        res = progress_func(py_object, (state["done"] + fraction / 100.)
+                            * 100. / len(frames), stage, eta)
+        if res == 1:
+            state["aborted"] = True
+        return res
+
+    if progress_func is not None:
+        kwds["progress_func"] = prog
+    output_buffer = output_buffer_pool.get(size, channels)
+    try:
+        for done, index in enumerate(frames):
+            state["done"] = done
+            genome = sequence.frame(index)
+            genome.render(output_buffer=output_buffer, **kwds)
+            if state["aborted"]:
+                return False
+            framepath = path.format(index=index)
+            save_image(framepath, output_buffer, size, channels)
+            if done_func is not None:
+                done_func(index, framepath)
+        return True
+    finally:
+        output_buffer_pool.release(output_buffer)
+        sequence.close()
+
+
+
+RenderJob = collections.namedtuple("RenderJob",
+                                   "flame size quality settings path")
+
+
+_worker = {}
+
+def _init_worker(queue, control):
+    _worker["queue"] = queue
+    _worker["control"] = control
+
+
+def _render_job(index, job, nthreads):
+    queue, control = _worker["queue"], _worker["control"]
+    def prog(py_object, fraction, stage, eta):
+        queue.put((index, fraction, stage, eta))
+        return control.value
+    settings = dict(job.settings, nthreads=nthreads, progress_func=prog)
+    output_buffer = flam3_render(job.flame, job.size, job.quality, **settings)
+    if control.value == 1:
+        # Render was aborted, the buffer is incomplete.
+        return False
+    save_image(job.path, output_buffer, job.size,
+               int(settings.get("transparent", 0)) + 3)
+    return True
+
+
+class BatchRenderer(object):
+    """Renders a list of RenderJobs to disk, running several of them at the
+    same time in a pool of processes.
+
+    njobs:    maximum number of concurrent renders. Defaults to the number
+              of cpus.
+    nthreads: total number of threads, divided among the concurrent renders.
+              Defaults to the number of cpus.
+    memory:   maximum number of bytes used by all running renders, as
+              estimated by flam3_memory_required. A job which needs more
+              than this on its own is still rendered, but alone. None means
+              no limit.
+
+    Threads are divided among each batch of jobs started together, so
+    renders held back by the memory limit leave their threads to the
+    others."""
+
+    def __init__(self, njobs=None, nthreads=None, memory=None):
+        self.njobs = njobs or multiprocessing.cpu_count()
+        self.nthreads = nthreads or multiprocessing.cpu_count()
+        self.memory = memory
+        self._canceled = threading.Event()
+
+
+    def cancel(self):
+        """Cancels a running batch from another thread. Unlike cancelling
+        through progress_func, this doesn't wait for a progress message."""
+        self._canceled.set()
+
+
+    def run(self, jobs, progress_func=None, done_func=None):
+        """Renders all jobs, blocking until they are done.
+
+        progress_func(index, fraction, stage, eta) is called with the progress
+        of the job at jobs[index]. Its return value works like that of the
+        flam3 progress function: 1 cancels all jobs and 2 pauses them.
+
+        done_func(index, result) is called when a job ends, with result being
+        True if the image was saved, False if the render was canceled or the
+        exception raised by the render.
+
+        Returns the list of results, with None for jobs which were canceled
+        before they started."""
+        self._canceled.clear()
+        jobs = [job._replace(flame=job.flame.to_string())
+                if isinstance(job.flame, Flame) else job for job in jobs]
+        if not jobs:
+            return []
+        required = [flam3_memory_required(job.flame, job.size, job.quality,
+                                          **job.settings) for job in jobs]
+        njobs = min(self.njobs, len(jobs))
+
+        queue = multiprocessing.Queue()
+        control = multiprocessing.Value("i", 0)
+        pool = multiprocessing.Pool(njobs, _init_worker, (queue, control))
+        pending = collections.deque(range(len(jobs)))
+        running, threads = {}, {}
+        results = [None] * len(jobs)
+        try:
+            while pending or running:
+                if self._canceled.is_set():
+                    control.value = 1
+                if control.value == 1:
+                    pending.clear()
+                elif control.value == 0:
+                    self._admit(pool, jobs, required, pending, running,
+                                threads, njobs)
+                try:
+                    index, fraction, stage, eta = queue.get(timeout=.05)
+                except Queue.Empty:
+                    pass
+                else:
+                    # A cancel is final, whatever later messages return.
+                    if progress_func is not None and control.value != 1:
+                        control.value = progress_func(index, fraction,
+                                                      stage, eta) or 0
+                for index, result in running.items():
+                    if not result.ready():
+                        continue
+                    del running[index]
+                    del threads[index]
+                    try:
+                        results[index] = result.get()
+                    except Exception as e:
+                        traceback.print_exc()
+                        results[index] = e
+                    if done_func is not None:
+                        done_func(index, results[index])
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+        return results
+
+
+    def _admit(self, pool, jobs, required, pending, running, threads, njobs):
+        batch = []
+        used = sum(required[i] for i in running)
+        while pending and len(running) + len(batch) < njobs:
+            index = pending[0]
+            if ((running or batch) and self.memory is not None
+                and used + required[index] > self.memory):
+                break
+            used += required[index]
+            batch.append(pending.popleft())
+        if not batch:
+            return
+        free = self.nthreads - sum(threads.itervalues())
+        nthreads = max(1, free // len(batch))
+        for index in batch:
+            threads[index] = nthreads
+            running[index] = pool.apply_async(_render_job,
+                                              (index, jobs[index], nthreads))
+
+
+
+def _parse_size(option, opt, value, parser):
+    try:
+        size = tuple(int(i) for i in value.lower().split("x"))
+    except ValueError:
+        size = ()
+    if len(size) not in (1, 2) or min(size) <= 0:
+        raise optparse.OptionValueError("%s must be WIDTH or WIDTHxHEIGHT, "
+                                        "not %r" % (opt, value))
+    parser.values.size = size
+
+
+def _make_parser():
+    parser = optparse.OptionParser(
+        usage="%prog [options] FILE.flame...",
+        description="Renders flames to image files, without a gui.")
+    add = parser.add_option
+    add("-n", "--name", action="append", dest="names", metavar="GLOB",
+        help="only render flames whose name matches GLOB. Can be repeated.")
+    add("-s", "--size", action="callback", callback=_parse_size, type="string",
+        metavar="WxH", help="image size. With only a width, the aspect ratio "
+        "of the flame is kept. Default is the size of the flame.")
+    add("-q", "--quality", type="float", help="samples per pixel. Default is "
+        "the quality of the flame, or 100.")
+    add("-x", "--oversample", type="int", default=1,
+        help="spatial oversample. Default %default.")
+    add("-e", "--estimator", type="float", default=9,
+        help="density estimator radius. Default %default.")
+    add("--estimator-curve", type="float", default=.4)
+    add("--estimator-minimum", type="float", default=0)
+    add("--filter-radius", type="float", default=1.)
+    add("--buffer-depth", type="choice", choices=("32", "33", "64"),
+        default="33", help="32 and 64 bit int or 32 bit float (33) buffers.")
+    add("-t", "--transparent", action="store_true", default=False,
+        help="render with an alpha channel (png only).")
+    add("-o", "--output", default="{name}.png", metavar="TEMPLATE",
+        help="output path. {name} is replaced by the flame name, {file} by "
+        "the name of the flame file and {index} by the position of the flame in "
+        "it. The extension selects the image format. Default %default.")
+    add("-j", "--jobs", type="int", default=1,
+        help="number of flames rendered at the same time. Default %default.")
+    add("--threads", type="int", default=0,
+        help="total number of render threads. Default is the number of cpus.")
+    add("--memory", type="float", metavar="MB",
+        help="limit the memory used by concurrent renders.")
+    add("-a", "--animate", type="int", metavar="N",
+        help="render an animation with N frames between each of the "
+        "selected flames, instead of the flames themselves. {index} in the "
+        "output path is then the frame number.")
+    add("--loop", action="store_true", default=False,
+        help="animate from the last flame back to the first.")
+    add("--smooth", action="store_true", default=False,
+        help="animate along splines instead of straight lines.")
+    return parser
+
+
+def _select_flames(paths, names):
+    for path in paths:
+        file = os.path.splitext(os.path.basename(path))[0]
+        for index, flame in enumerate(iter_flames(path)):
+            if names and not any(fnmatch.fnmatchcase(flame.name, i)
+                                 for i in names):
+                continue
+            yield file, index, flame
+
+
+def _make_job(opts, file, index, flame):
+    if not opts.size:
+        size = tuple(int(i) for i in flame.size)
+    elif len(opts.size) == 1:
+        w, ratio = opts.size[0], flame.size[1] / float(flame.size[0])
+        size = w, max(1, int(round(w * ratio)))
+    else:
+        size = opts.size
+    quality = opts.quality or getattr(flame, "quality", 100)
+    settings = dict(spatial_oversample=opts.oversample,
+                    estimator=opts.estimator,
+                    estimator_curve=opts.estimator_curve,
+                    estimator_minimum=opts.estimator_minimum,
+                    filter_radius=opts.filter_radius,
+                    buffer_depth=int(opts.buffer_depth),
+                    transparent=int(opts.transparent))
+    path = opts.output.format(name=flame.name, file=file, index=index)
+    return RenderJob(flame.to_string(), tuple(size), quality, settings, path)
+
+
+def _render_animation(opts, flames):
+    file, index, first = flames[0]
+    job = _make_job(opts, file, index, first)
+    path = opts.output.replace("{name}", first.name).replace("{file}", file)
+    dirname = os.path.dirname(path)
+    if dirname and not os.path.exists(dirname):
+        os.makedirs(dirname)
+
+    state = {"last": time.time(), "count": 0}
+    def done(index, framepath):
+        now = time.time()
+        print "frame %s -> %s (%.2fs)" % (index, framepath, now - state["last"])
+        sys.stdout.flush()
+        state["last"] = now
+        state["count"] += 1
+
+    t0 = time.time()
+    flam3_render_sequence([flame for file, index, flame in flames],
+                          opts.animate, job.size, job.quality, path,
+                          loop=opts.loop, smooth=opts.smooth,
+                          done_func=done, nthreads=opts.threads,
+                          **job.settings)
+    total = time.time() - t0
+    print "Rendered %s frames in %.2fs (%.2fs per frame)" % (
+        state["count"], total, total / max(1, state["count"]))
+    return 0
+
+
+def main(argv=None):
+    """Command line entry point, see --help."""
+    parser = _make_parser()
+    opts, paths = parser.parse_args(argv)
+    if not paths:
+        parser.error("no flame files given")
+    if opts.animate is not None:
+        if opts.animate < 1:
+            parser.error("--animate needs at least 1 frame")
+        if "{index" not in opts.output:
+            parser.error("the output path of an animation needs {index}")
+        flames = list(_select_flames(paths, opts.names))
+        if len(flames) < 2:
+            parser.error("an animation needs at least 2 flames")
+        return _render_animation(opts, flames)
+
+    jobs, names = [], []
+    for file, index, flame in _select_flames(paths, opts.names):
+        jobs.append(_make_job(opts, file, index, flame))
+        names.append(flame.name)
+    if not jobs:
+        print >> sys.stderr, "No flames to render."
+        return 1
+    for job in jobs:
+        dirname = os.path.dirname(job.path)
+        if dirname and not os.path.exists(dirname):
+            os.makedirs(dirname)
+
+    started = {}
+    def progress(index, fraction, stage, eta):
+        started.setdefault(index, time.time())
+    def done(index, result):
+        elapsed = time.time() - started.get(index, t0)
+        status = ("%.2fs" % elapsed if result is True
+                  else "failed: %s" % (result,))
+        print "[%s/%s] %s -> %s (%s)" % (index + 1, len(jobs), names[index],
+                                          jobs[index].path, status)
+        sys.stdout.flush()
+
+    memory = opts.memory * 1024**2 if opts.memory else None
+    engine = BatchRenderer(opts.jobs, opts.threads, memory)
+    t0 = time.time()
+    results = engine.run(jobs, progress, done)
+    total = time.time() - t0
+    ok = results.count(True)
+    pixels = sum(job.size[0] * job.size[1] for job, result
+                 in zip(jobs, results) if result is True)
+    print "Rendered %s of %s flames in %.2fs (%.2fs per flame, %.0f " \
+          "pixels/s)" % (ok, len(jobs), total, total / len(jobs),
+                         pixels / total if total else 0)
+    return 0 if ok == len(jobs) else 1
+
+
+if __name__ == "__main__":
+    # Run through the package module, so that jobs and worker functions
+    # pickle under their real name instead of __main__.
+    from fr0stlib import render
+    sys.exit(render.main())
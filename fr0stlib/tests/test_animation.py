@@ -0,0 +1,77 @@
+from unittest import TestCase
+import numpy
+
+
+from fr0stlib import Flame
+from fr0stlib.animation import Animation
+from fr0stlib.functions import drange
+
+
+
+def make_key(scale, angle, color):
+    flame = Flame()
+    flame.scale = scale
+    flame.add_xform(weight=1, julia=0.5)
+    flame.xform[0].rotate(angle)
+    flame.gradient[:] = color
+    return flame
+
+
+class TestAnimation(TestCase):
+    def setUp(self):
+        self.keys = [make_key(10, 0, (0, 0, 0)),
+                     make_key(20, 90, (100, 200, 250)),
+                     make_key(40, 180, (250, 0, 100))]
+        self.keys[1].add_xform(weight=2)
+
+    def testKeys(self):
+        anim = Animation(self.keys, n=10)
+
+        self.assertEquals(len(anim), 30)
+        for i, key in enumerate(self.keys):
+            frame = anim[i * 10]
+            self.assertEquals(frame.name, "frame%d" % (i * 10))
+            self.assertAlmostEquals(frame.scale, key.scale)
+            self.assertEquals(frame.gradient.data.tolist(),
+                              key.gradient.data.tolist())
+            for a, b in zip(frame.xform[0].coefs, key.xform[0].coefs):
+                self.assertAlmostEquals(a, b)
+
+    def testLinear(self):
+        anim = Animation(self.keys, n=10, curve='par', p_space='rect')
+
+        for i, frame in enumerate(anim):
+            seg, j = divmod(i, 10)
+            x, y = self.keys[seg], self.keys[(seg + 1) % 3]
+            self.assertAlmostEquals(frame.scale,
+                                    drange(x.scale, y.scale, 10, j, curve='par'))
+            self.assertAlmostEquals(frame.xform[0].a, drange(
+                x.xform[0].a, y.xform[0].a, 10, j, curve='par'))
+
+    def testPadded(self):
+        anim = Animation(self.keys, n=10)
+
+        self.assertEquals(len(anim[0].xform), 2)
+        self.assertEquals(anim[0].xform[1].weight, 0)
+        self.assertAlmostEquals(anim[5].xform[1].weight, 1)
+        self.assertAlmostEquals(anim[5].xform[0].julia, 0.5)
+
+    def testSmooth(self):
+        anim = Animation(self.keys, n=10, smooth=True, loop=False,
+                         p_space='rect')
+        self.assertFalse(anim.smooth)
+
+        self.keys.append(make_key(80, 270, (0, 0, 0)))
+        anim = Animation(self.keys, n=10, smooth=True, loop=False,
+                         p_space='rect')
+        scales = [f.scale for f in anim]
+        self.assertEquals(len(scales), 30)
+        self.assertAlmostEquals(scales[10], 20)
+        self.assertAlmostEquals(scales[20], 40)
+        self.assert_(numpy.all(numpy.diff(scales) > 0))
+
+    def testColorSpace(self):
+        for c_space in ('hls', 'hsv'):
+            anim = Animation(self.keys, n=10, c_space=c_space)
+            diff = anim[10].gradient.data.astype(int) - (100, 200, 250)
+            self.assert_(numpy.abs(diff).max() <= 1)
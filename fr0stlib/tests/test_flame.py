@@ -0,0 +1,207 @@
+from unittest import TestCase
+import numpy
+
+
+from fr0stlib import Flame, Xform, XformArray
+from fr0stlib.pyflam3.variations import variations
+
+
+
+def uncached_string(flame):
+    flame.__dict__.pop("_strings", None)
+    for x in flame.iter_xforms():
+        x.__dict__.pop("_string", None)
+    flame.gradient._string = None, None
+    return flame.to_string()
+
+
+
+def contents(flame):
+    """Returns the data of a flame, independent of attribute order."""
+    return (sorted(flame.iter_attributes()),
+            [(sorted(x.iter_attributes()), x.coefs, x.post.coefs, x.chaos[:])
+             for x in flame.iter_xforms()],
+            flame.gradient.to_string())
+
+
+
+class TestFlameString(TestCase):
+    def setUp(self):
+        self.flame = Flame()
+        self.flame.add_xform()
+        self.flame.add_xform(julia=1)
+
+    def testCached(self):
+        string = self.flame.to_string()
+
+        self.assert_(self.flame.to_string() is string)
+        self.assertNotEquals(self.flame.to_string(omit_details=True), string)
+
+    def assertChanged(self, change):
+        string = self.flame.to_string()
+        change()
+        new = self.flame.to_string()
+
+        self.assertNotEquals(new, string)
+        self.assertEquals(new, uncached_string(self.flame))
+
+    def testFlameAttribute(self):
+        self.assertChanged(lambda: setattr(self.flame, "brightness", 10))
+
+    def testXformAttribute(self):
+        self.assertChanged(lambda: self.flame.xform[0].rotate(30))
+
+    def testDeleteAttribute(self):
+        self.flame.brightness = 10
+        self.assertChanged(lambda: delattr(self.flame, "brightness"))
+        self.assertChanged(lambda: delattr(self.flame.xform[1], "julia"))
+
+    def testPost(self):
+        self.assertChanged(lambda: self.flame.xform[1].post.move_x(1, 0))
+
+    def testChaos(self):
+        self.assertChanged(
+            lambda: self.flame.xform[0].chaos.__setitem__(1, 0.5))
+
+    def testXforms(self):
+        self.assertChanged(self.flame.add_xform)
+        self.assertChanged(self.flame.add_final)
+        self.assertChanged(self.flame.xform[0].delete)
+
+    def testPalette(self):
+        def change():
+            self.flame.gradient[3] = 10, 20, 30
+        self.assertChanged(change)
+
+
+
+class TestCopy(TestCase):
+    def setUp(self):
+        self.flame = Flame()
+        self.flame.add_xform()
+        self.flame.add_xform(julia=1)
+        self.flame.add_final(spherical=1)
+        self.flame.xform[0].chaos[1] = 0.5
+        self.flame.xform[1].post.coefs = 2, 0, 0, 2, 0, 0
+        self.flame.gradient[0] = 1, 2, 3
+
+    def testCopy(self):
+        copy = self.flame.copy()
+
+        self.assertEquals(contents(copy), contents(self.flame))
+        for x in copy.iter_xforms():
+            self.assert_(x._parent is copy)
+            self.assert_(x.post._parent is x)
+        self.assert_(copy.xform[0].chaos._parent is copy.xform[0])
+
+    def testIndependent(self):
+        string = self.flame.to_string()
+        copy = self.flame.copy()
+        copy.xform[0].rotate(30)
+        copy.xform[0].chaos[1] = 0
+        copy.xform[1].post.move_x(1, 0)
+        copy.final.delete()
+        copy.gradient[0] = 4, 5, 6
+        copy.add_xform()
+
+        self.assertEquals(self.flame.to_string(), string)
+        self.assertEquals(uncached_string(self.flame), string)
+
+    def testXformCopy(self):
+        xf = self.flame.xform[0].copy()
+
+        self.assertEquals(len(self.flame.xform), 3)
+        self.assert_(self.flame.xform[2] is xf)
+        self.assertEquals(xf.coefs, self.flame.xform[0].coefs)
+        self.assertEquals(xf.chaos[:], [1, 0.5, 1])
+        self.assert_(self.flame.final.copy() is None)
+
+
+
+class TestXformArray(TestCase):
+    def setUp(self):
+        self.flame = Flame()
+        self.flame.add_xform(weight=1)
+        self.flame.add_xform(weight=3, julia=0.5, blob=1, blob_low=0.3)
+        self.flame.xform[0].chaos[1] = 0.5
+
+    def testArrays(self):
+        arr = XformArray(self.flame)
+
+        self.assertEquals(len(arr), 2)
+        self.assertEquals(arr.weight.tolist(), [1, 3])
+        self.assertEquals(arr.variations[1, variations["julia"]], 0.5)
+        self.assertEquals(arr.chaos.tolist(), [[1, 0.5], [1, 1]])
+        self.assert_(numpy.isnan(arr.params[0]).all())
+
+    def testApply(self):
+        expected = self.flame.copy()
+        for x in expected.xform:
+            x.rotate(45)
+            x.weight /= 4.
+        expected.xform[1].linear = 0.5
+
+        arr = XformArray(self.flame)
+        arr.rotate(45)
+        arr.normalize_weights()
+        arr.variations[1, variations["linear"]] = 0.5
+        arr.apply(self.flame)
+
+        self.assertEquals(contents(self.flame)[1:], contents(expected)[1:])
+        for x, y in zip(self.flame.xform, expected.xform):
+            for a, b in zip(x.coefs, y.coefs):
+                self.assertAlmostEquals(a, b)
+
+
+
+class TestXformList(TestCase):
+    def setUp(self):
+        self.flame = Flame()
+        for i in range(3):
+            self.flame.add_xform()
+        self.flame.add_final()
+        for i, x in enumerate(self.flame.xform):
+            x.chaos[:] = [i * 3 + j for j in range(3)]
+
+    def chaos(self):
+        return [x.chaos[:] for x in self.flame.xform]
+
+    def testIndex(self):
+        self.assertEquals([x.index for x in self.flame.xform], [0, 1, 2])
+        self.assertEquals(self.flame.final.index, None)
+        self.assertEquals(len(self.flame.final.chaos), 0)
+
+    def testAppend(self):
+        self.flame.add_xform()
+
+        self.assertEquals(self.flame.xform[3].index, 3)
+        self.assertEquals(self.chaos(), [[0, 1, 2, 1], [3, 4, 5, 1],
+                                         [6, 7, 8, 1], [1, 1, 1, 1]])
+
+    def testDelete(self):
+        xform = self.flame.xform[1]
+        xform.delete()
+
+        self.assertEquals([x.index for x in self.flame.xform], [0, 1])
+        self.assertEquals(self.chaos(), [[0, 2], [6, 8]])
+        self.assertRaises(ValueError, getattr, xform, "index")
+
+    def testInsert(self):
+        self.flame.xform.insert(1, Xform(self.flame, coefs=(1, 0, 0, 1, 0, 0)))
+
+        self.assertEquals([x.index for x in self.flame.xform], [0, 1, 2, 3])
+        self.assertEquals(self.chaos(), [[0, 1, 1, 2], [1, 1, 1, 1],
+                                         [3, 1, 4, 5], [6, 1, 7, 8]])
+
+    def testReverse(self):
+        self.flame.xform.reverse()
+
+        self.assertEquals([x.index for x in self.flame.xform], [0, 1, 2])
+        self.assertEquals(self.chaos(), [[8, 7, 6], [5, 4, 3], [2, 1, 0]])
+
+    def testCompact(self):
+        self.flame.add_xform()
+        self.flame.xform[3].chaos[1] = 0.5
+
+        self.assertEquals(list.__len__(self.flame.xform[3].chaos), 2)
+        self.assertEquals(self.flame.xform[3].chaos[:], [1, 0.5, 1, 1])
@@ -0,0 +1,222 @@
+from unittest import TestCase
+import os
+import tempfile
+
+
+import fr0stlib
+from fr0stlib import Flame, save_flames, load_flame_strings, \
+     load_flames, iter_flame_strings, iter_flames, \
+     save_flames_binary, load_flames_binary, binary_cache_path
+
+
+
+def make_flames(*names):
+    return ['<flame name="%s" size="64 48" >\n'
+            '   <xform weight="1" linear="1" coefs="1 0 0 1 0 0" />\n'
+            '   <xform weight="1" julia="1" coefs="1 0 0 1 0 0" />\n'
+            '</flame>' % name for name in names]
+
+
+
+class TestIterFlames(TestCase):
+    def setUp(self):
+        self.flames = make_flames("first", "second", "third")
+        fd, self.path = tempfile.mkstemp(suffix=".flame")
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def write(self, flames):
+        with open(self.path, "w") as f:
+            f.write('<flames name="Fr0st Batch">\n%s\n</flames>'
+                    % "\n".join(flames))
+        with open(self.path) as f:
+            return f.read()
+
+    def testChunkBoundaries(self):
+        self.write(self.flames)
+        for chunksize in (1, 7, 8, 100, 65536):
+            self.assertEquals(list(iter_flame_strings(self.path, chunksize)),
+                              self.flames)
+
+    def testLargeFlame(self):
+        # A flame spanning many chunks.
+        big = make_flames("big")[0].replace(
+            "</flame>", "<xform weight=\"1\" linear=\"1\" />" * 500
+            + "</flame>")
+        self.write([self.flames[0], big, self.flames[1]])
+        self.assertEquals(list(iter_flame_strings(self.path, 16)),
+                          [self.flames[0], big, self.flames[1]])
+
+    def testNestedFlames(self):
+        nested = make_flames("outer")[0].replace(
+            "</flame>", "<edit><flame name=\"inner\" /></edit></flame>")
+        data = self.write([nested, self.flames[1]])
+
+        # Strings are split the same as when reading the whole file.
+        for chunksize in (5, 65536):
+            self.assertEquals(list(iter_flame_strings(self.path, chunksize)),
+                              Flame.re_flame.findall(data))
+
+        # Only the top level flames are loaded.
+        self.assertEquals([f.name for f in iter_flames(self.path)],
+                          ["outer", "second"])
+        self.assertEquals([f.name for f in load_flames(self.path)],
+                          ["outer", "second"])
+
+
+
+class TestSaveFlames(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "test.flame")
+        self.flames = make_flames("first", "second", "third")
+        save_flames(self.path, *self.flames[:2])
+
+    def tearDown(self):
+        for name in os.listdir(self.dir):
+            os.remove(os.path.join(self.dir, name))
+        os.rmdir(self.dir)
+
+    def testSave(self):
+        self.assertEquals(load_flame_strings(self.path), self.flames[:2])
+        self.assertEquals(os.listdir(self.dir), ["test.flame"])
+
+    def testBackup(self):
+        save_flames(self.path, *self.flames)
+
+        self.assertEquals(load_flame_strings(self.path), self.flames)
+        self.assertEquals(
+            load_flame_strings(os.path.join(self.dir, "test.bak")),
+            self.flames[:2])
+
+    def testAppend(self):
+        save_flames(self.path, *self.flames, changed=[])
+
+        self.assertEquals(load_flame_strings(self.path), self.flames)
+
+    def testAppendInterrupted(self):
+        # Fails after the first appended flame has been written.
+        calls = []
+        def fail(flame, compact=False):
+            if calls:
+                raise KeyboardInterrupt
+            calls.append(flame)
+            return flame
+        fr0stlib._flame_string, old = fail, fr0stlib._flame_string
+        try:
+            self.assertRaises(KeyboardInterrupt, save_flames, self.path,
+                              *self.flames * 2, **dict(changed=[]))
+        finally:
+            fr0stlib._flame_string = old
+
+        self.assertEquals(load_flame_strings(self.path), self.flames[:2])
+        self.assertEquals(os.listdir(self.dir), ["test.flame"])
+
+    def testSameLength(self):
+        # Flames not marked as changed are still compared to the file.
+        edited = self.flames[0].replace("first", "FIRST")
+        save_flames(self.path, edited, self.flames[1], changed=[])
+
+        self.assertEquals(load_flame_strings(self.path),
+                          [edited, self.flames[1]])
+
+    def testChanged(self):
+        edited = make_flames("edited")[0]
+        save_flames(self.path, edited, self.flames[1], changed=[0])
+
+        self.assertEquals(load_flame_strings(self.path),
+                          [edited, self.flames[1]])
+
+    def testRemoved(self):
+        save_flames(self.path, self.flames[1], changed=[])
+
+        self.assertEquals(load_flame_strings(self.path), self.flames[1:2])
+
+    def testFlameObjects(self):
+        flames = load_flames(self.path)
+        save_flames(self.path, *flames)
+        saved = load_flame_strings(self.path)
+
+        # Unchanged flames are detected, so only the new one is written.
+        def rewrite(*args, **kwds):
+            raise AssertionError("file rewritten")
+        fr0stlib._write_flames, old = rewrite, fr0stlib._write_flames
+        try:
+            save_flames(self.path, *flames + [self.flames[2]], changed=[])
+        finally:
+            fr0stlib._write_flames = old
+        self.assertEquals(load_flame_strings(self.path),
+                          saved + self.flames[2:])
+
+        # An edited one isn't.
+        flames[0].name = "edited"
+        save_flames(self.path, *flames + [self.flames[2]], changed=[])
+        self.assertEquals([f.name for f in load_flames(self.path)],
+                          ["edited", "second", "third"])
+
+    def testMode(self):
+        # New files follow the umask, instead of being private like
+        # temporary files.
+        umask = os.umask(022)
+        try:
+            os.remove(self.path)
+            save_flames(self.path, *self.flames)
+        finally:
+            os.umask(umask)
+        self.assertEquals(os.stat(self.path).st_mode & 0777, 0644)
+
+
+
+class TestBinaryFlames(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "test.flame")
+        save_flames(self.path, *make_flames("first", "second"))
+
+    def tearDown(self):
+        for name in os.listdir(self.dir):
+            os.remove(os.path.join(self.dir, name))
+        os.rmdir(self.dir)
+
+    def assertSameFlames(self, flames, other):
+        self.assertEquals(len(flames), len(other))
+        for flame, copy in zip(flames, other):
+            self.assertEquals(sorted(flame.__dict__), sorted(copy.__dict__))
+            self.assertEquals(flame.name, copy.name)
+            self.assertEquals(flame.size, copy.size)
+            self.assertEquals([sorted(x.__dict__) for x in flame.xform],
+                              [sorted(x.__dict__) for x in copy.xform])
+            self.assertEquals([x.coefs for x in flame.xform],
+                              [x.coefs for x in copy.xform])
+            self.assertEquals([x.julia for x in flame.xform],
+                              [x.julia for x in copy.xform])
+            self.assertEquals(flame.gradient.to_string(),
+                              copy.gradient.to_string())
+
+    def testRoundTrip(self):
+        flames = load_flames(self.path)
+        flames[0].xform[0].post.coefs = 2, 0, 0, 2, 0, 0
+        flames[0].xform[1].chaos[0] = 0.5
+        flames[0].gradient[10] = 1, 2, 3
+        binpath = os.path.join(self.dir, "test.flamebin")
+        save_flames_binary(binpath, *flames)
+        loaded = load_flames_binary(binpath)
+
+        self.assertSameFlames(flames, loaded)
+        self.assertEquals(loaded[0].xform[0].post.coefs, (2, 0, 0, 2, 0, 0))
+        self.assertEquals(loaded[0].xform[1].chaos[:], [0.5, 1])
+
+    def testCache(self):
+        flames = load_flames(self.path, cache=True)
+        cachepath = binary_cache_path(self.path)
+
+        self.assertTrue(os.path.exists(cachepath))
+        self.assertSameFlames(load_flames(self.path, cache=True), flames)
+
+        save_flames(self.path, *make_flames("third"))
+        os.utime(self.path, (0, 0))
+
+        self.assertEquals([f.name for f in load_flames(self.path, cache=True)],
+                          ["third"])
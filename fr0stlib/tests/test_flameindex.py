@@ -0,0 +1,93 @@
+from unittest import TestCase
+import os
+import tempfile
+
+
+from fr0stlib import FlameIndex
+
+
+
+class TestFlameIndex(TestCase):
+    def setUp(self):
+        self.flames = ['<flame name="%s" size="64 48" >\n'
+                       '   <xform weight="1" linear="1" coefs="1 0 0 1 0 0" />\n'
+                       '   <xform weight="1" julia="1" coefs="1 0 0 1 0 0" />\n'
+                       '</flame>' % name
+                       for name in ("first", "second", "third")]
+
+        fd, self.path = tempfile.mkstemp(suffix=".flame")
+        os.close(fd)
+        self.write(self.flames[:2])
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def write(self, flames):
+        with open(self.path, "w") as f:
+            f.write('<flames name="Fr0st Batch">\n%s\n</flames>'
+                    % "\n".join(flames))
+
+    def testIndex(self):
+        index = FlameIndex(self.path)
+
+        self.assertEquals(len(index), 2)
+        self.assertEquals(index.names(), ["first", "second"])
+        self.assertEquals([e.nxforms for e in index.entries], [2, 2])
+
+    def testRandomAccess(self):
+        index = FlameIndex(self.path)
+
+        self.assertEquals(index[1], self.flames[1])
+        self.assertEquals(index["first"], self.flames[0])
+        self.assertRaises(KeyError, index.__getitem__, "missing")
+
+    def testAppend(self):
+        index = FlameIndex(self.path)
+        offsets = [e.offset for e in index.entries]
+
+        self.write(self.flames)
+        # Make sure the change is detected even on coarse mtime resolution.
+        os.utime(self.path, (0, 0))
+
+        self.assertEquals(len(index), 3)
+        self.assertEquals([e.offset for e in index.entries[:2]], offsets)
+        self.assertEquals(index["third"], self.flames[2])
+
+    def testRewrite(self):
+        index = FlameIndex(self.path)
+
+        self.write(self.flames[2:])
+        os.utime(self.path, (0, 0))
+
+        self.assertEquals(index.names(), ["third"])
+
+    def testRewriteSameLayout(self):
+        index = FlameIndex(self.path)
+
+        # Same layout, different flames, and a flame appended.
+        changed = [f.replace("first", "FIRST").replace("second", "SECOND")
+                   for f in self.flames]
+        self.write(changed)
+        os.utime(self.path, (0, 0))
+
+        self.assertEquals(index.names(), ["FIRST", "SECOND", "third"])
+        self.assertEquals(index[0], changed[0])
+
+    def testRewriteTail(self):
+        # Only the head of the file and the end of the indexed data are
+        # compared, so a change to the last indexed flame is still noticed.
+        class SmallSample(FlameIndex):
+            sample_size = 16
+        index = SmallSample(self.path)
+        self.write(self.flames[:1] + [self.flames[1].replace("second", "2nd")]
+                   + self.flames[2:])
+        os.utime(self.path, (0, 0))
+
+        self.assertEquals(index.names(), ["first", "2nd", "third"])
+
+    def testEscapedName(self):
+        self.write([self.flames[0].replace("first", "a &amp; &quot;b&quot;")])
+        index = FlameIndex(self.path)
+
+        self.assertEquals(index.names(), ['a & "b"'])
+        self.assertEquals(index['a & "b"'], index[0])
@@ -0,0 +1,134 @@
+from unittest import TestCase
+from math import pi, cos, sin, sinh, tanh
+import numpy
+
+
+from fr0stlib.functions import drange, prange, vector, vector2d, vector3d, \
+     spline
+
+
+
+CURVES = 'lin', 'par', 'npar', 'cos', 'sinh', 'tanh'
+
+
+def old_drange(x, y, n, i, curve='lin', a=1.0):
+    """drange as it was before it worked on arrays."""
+    m = float(n)
+    d = y-x
+    if curve=='par':
+        return x+d/(m**2)*(i**2)
+    elif curve=='npar':
+        return y-d/(m**2)*((n-i)**2)
+    elif curve=='cos':
+        return (x+d*((cos(pi + (i/m)*pi))+1)/2)**a
+    elif curve=='sinh':
+        return x+((sinh(a*(2*i-m)/m) - sinh(-a)) / (2*sinh(a*(2*n-m)/m)/d))
+    elif curve=='tanh':
+        return x+((tanh(a*(2*i-m)/m) - tanh(-a)) / (2*tanh(a*(2*n-m)/m)/d))
+    return x+d/m*i
+
+
+def old_prange(x, y, n, i, curve, a=1.0, freq=1):
+    m = float(n)
+    if curve=='sin':
+        return x+(y-x)*sin((i/m)*pi*2*freq)
+    return (x+(y-x)*((cos(pi + (i/m)*pi*2*freq))+1)/2)**a
+
+
+
+class TestRegression(TestCase):
+    def testDrange(self):
+        for curve in CURVES:
+            for i in range(11):
+                self.assertAlmostEquals(drange(2., 5., 10, i, curve=curve),
+                                        old_drange(2., 5., 10, i, curve))
+        # a still shapes the sinh and tanh curves the same way.
+        for curve in ('sinh', 'tanh'):
+            self.assertAlmostEquals(drange(2., 5., 10, 3, curve=curve, a=3.),
+                                    old_drange(2., 5., 10, 3, curve, 3.))
+
+    def testPrange(self):
+        for curve in ('sin', 'cos'):
+            for i in range(11):
+                self.assertAlmostEquals(
+                    prange(2., 5., 10, i, curve=curve, freq=2),
+                    old_prange(2., 5., 10, i, curve, freq=2))
+
+    def testCosPower(self):
+        # With curve='cos', a raises the whole value to its power, so it's
+        # (2 + 3*0.5)**2 = 12.25 halfway.
+        self.assertAlmostEquals(drange(2., 5., 10, 5, curve='cos', a=2.),
+                                12.25)
+        steps = numpy.arange(11)
+        for i, value in zip(steps, drange(2., 5., 10, steps, curve='cos',
+                                          a=2.)):
+            self.assertAlmostEquals(value, old_drange(2., 5., 10, i, 'cos', 2.))
+        for i, value in zip(steps, prange(2., 5., 10, steps, curve='cos',
+                                          a=2., freq=2)):
+            self.assertAlmostEquals(value,
+                                    old_prange(2., 5., 10, i, 'cos', 2., 2))
+
+    def testScalarType(self):
+        # Flame.to_string only writes round floats as ints for real floats.
+        self.assertEquals(type(drange(0, 8, 2, 1)), float)
+        self.assertEquals(type(prange(0, 8, 4, 1, curve='cos')), float)
+        self.assertEquals(type(prange(0, 8, 4, 1, curve='pp-par')), float)
+        self.assertEquals(type(vector((0, 1, 2, 3), 4, 1)), float)
+        self.assertEquals(map(type, vector2d(((1, 2), (3, 4)), 4, 1)),
+                          [float, float])
+
+
+class TestArrayInterpolation(TestCase):
+    def assertArray(self, func, *args, **kwds):
+        steps = numpy.arange(10)
+        result = func(steps, *args, **kwds)
+        for i in steps:
+            numpy.testing.assert_almost_equal(result[i],
+                                              func(i, *args, **kwds))
+
+    def testDrange(self):
+        for curve in CURVES:
+            self.assertArray(lambda i: drange(2., 5., 10, i, curve=curve,
+                                              a=2.))
+            self.assertEquals(drange(2., 2., 10, 3, curve=curve), 2.)
+        self.assertAlmostEquals(drange(2., 5., 10, 5, curve='par'), 2.75)
+
+    def testPrange(self):
+        for curve in ('pp-par', 'pn-par', 'np-par', 'nn-par', 'sin', 'cos',
+                      'lin'):
+            self.assertArray(lambda i: prange(2., 5., 10, i, curve=curve))
+        self.assertAlmostEquals(prange(2., 5., 10, 5), 5.)
+
+    def testVector(self):
+        cps = [0., 1., 3., 4.]
+        self.assertArray(lambda i: vector(cps, 10, i, t=0.3, curve='cos'))
+        self.assertAlmostEquals(vector(cps, 10, 0), 1.)
+        self.assertAlmostEquals(vector(cps, 10, 10), 3.)
+
+    def testVector2d(self):
+        cps = [(1., 0.), (0., 1.)]
+        self.assertArray(lambda i: numpy.column_stack(vector2d(cps, 10, i))
+                         if numpy.ndim(i) else vector2d(cps, 10, i))
+        x, y = vector2d(cps, 10, 5)
+        self.assertAlmostEquals(x, y)
+        self.assertAlmostEquals(x**2 + y**2, 1.)
+
+    def testVector3d(self):
+        cps = [(0., 100., 255.), (255., 0., 100.)]
+        self.assertArray(lambda i: vector3d(cps, 10, i))
+        cps = [(0., .5, 1.), (.5, .5, 1.)]
+        for c_space in ('hls', 'hsv'):
+            steps = numpy.arange(10)
+            colors = vector3d(cps, 10, steps, c_space=c_space)
+            self.assertEquals(colors.tolist(),
+                              [list(vector3d(cps, 10, i, c_space=c_space))
+                               for i in steps])
+
+    def testSpline(self):
+        cps, times = [0., 1., 3., 4.], [0, 10, 20, 30]
+        values = spline(cps, times, (0.2, 0, 0), (0, 0.1, 0), curve='par')
+
+        self.assertEquals(values.shape, (10,))
+        numpy.testing.assert_almost_equal(
+            spline(cps, times, (0.2, 0, 0), (0, 0.1, 0), curve='par',
+                   i=numpy.array([3, 7])), values[[3, 7]])
@@ -4,7 +4,7 @@ from cStringIO import StringIO
 from functools import partial
 
 
-from fr0stlib import Palette
+from fr0stlib import Palette, ParsingError, rgb2hls, hls2rgb, clip
 
 
 
@@ -115,3 +115,64 @@ class TestPalette(TestCase):
 
 
 
+
+    def make_palette(self):
+        tree = etree.parse(StringIO(self.xml))
+        return Palette.from_flame_element(tree.getroot())
+
+    def check_adjust(self, name, value, scale, channel):
+        palette = self.make_palette()
+        getattr(palette, name)(value)
+
+        for idx in range(256):
+            hls = list(rgb2hls(self.data[idx]))
+            hls[channel] = clip(hls[channel] + value / scale, 0, 1,
+                                channel == 0)
+            self.check_index(palette, idx, hls2rgb(hls))
+
+    def testHue(self):
+        self.check_adjust("hue", 100, 360., 0)
+
+    def testSaturation(self):
+        self.check_adjust("saturation", -40, 100., 2)
+
+    def testBrightness(self):
+        self.check_adjust("brightness", 30, 100., 1)
+
+    def testRollRotate(self):
+        palette = self.make_palette()
+        palette.rotate(-10)
+
+        rotated = self.data[10:] + self.data[:10]
+
+        for idx in range(256):
+            self.check_index(palette, idx, rotated[idx])
+
+    def testToString(self):
+        palette = self.make_palette()
+
+        self.assertEquals(palette.to_string(), ''.join(
+            '   <color index="%s" rgb="%s %s %s"/>\n' % ((idx,) + color)
+            for idx, color in enumerate(self.data)))
+
+    def testCompact(self):
+        palette = self.make_palette()
+        string = palette.to_string(compact=True)
+        element = etree.fromstring('<flame>%s</flame>' % string)
+
+        self.assertEquals(string.count('\n'), 34)
+        self.assertEquals(Palette.from_flame_element(element).to_string(),
+                          palette.to_string())
+
+    def testFromColors(self):
+        palette = self.make_palette()
+        element = etree.fromstring('<flame>%s</flame>' % palette.to_string())
+
+        self.assertEquals(Palette.from_flame_element(element).data.tolist(),
+                          palette.data.tolist())
+
+    def testInvalidHex(self):
+        element = etree.fromstring('<flame><palette count="256" format="RGB">'
+                                   '00FF</palette></flame>')
+
+        self.assertRaises(ParsingError, Palette.from_flame_element, element)
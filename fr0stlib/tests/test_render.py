@@ -0,0 +1,220 @@
+from unittest import TestCase
+import os
+import collections
+import tempfile
+import threading
+import time
+import struct
+import zlib
+import sys
+import shutil
+import StringIO
+import numpy
+
+
+from fr0stlib import Flame, render
+from fr0stlib.render import BatchRenderer, RenderJob, save_png_rows, \
+     flam3_render_tiled
+
+
+
+class FakePool(object):
+    def __init__(self):
+        self.started = []
+
+    def apply_async(self, f, args):
+        self.started.append(args)
+        return args
+
+
+
+def fake_render(flame, size, quality, progress_func=None, **kwds):
+    time.sleep(float(flame))
+    return "\0" * (size[0] * size[1] * 3)
+
+
+
+class TestBatchRenderer(TestCase):
+    def setUp(self):
+        self.saved = []
+        self.old = render.flam3_render, render.save_image, \
+                   render.flam3_memory_required
+        render.flam3_render = fake_render
+        render.save_image = lambda path, *a: self.saved.append(path)
+        render.flam3_memory_required = lambda *a, **k: 1
+
+    def tearDown(self):
+        render.flam3_render, render.save_image, \
+            render.flam3_memory_required = self.old
+
+    def job(self, seconds, path="out.png"):
+        return RenderJob(str(seconds), (4, 3), 1, {}, path)
+
+    def testThreadSplit(self):
+        engine = BatchRenderer(njobs=4, nthreads=8, memory=10)
+        jobs = [self.job(0)] * 4
+        required = [6, 6, 1, 1]
+        pool, pending = FakePool(), collections.deque(range(4))
+        running, threads = {}, {}
+
+        # Only the first job fits, so it gets all threads.
+        engine._admit(pool, jobs, required, pending, running, threads, 4)
+        self.assertEquals([(i, n) for i, job, n in pool.started], [(0, 8)])
+
+        # Once it's done, the rest fit and share them.
+        del running[0], threads[0]
+        engine._admit(pool, jobs, required, pending, running, threads, 4)
+        self.assertEquals([(i, n) for i, job, n in pool.started[1:]],
+                          [(1, 2), (2, 2), (3, 2)])
+
+    def testRun(self):
+        done = []
+        engine = BatchRenderer(njobs=2, nthreads=2)
+        results = engine.run([self.job(0, "a.png"), self.job(0, "b.png")],
+                             done_func=lambda *a: done.append(a))
+
+        self.assertEquals(results, [True, True])
+        self.assertEquals(sorted(done), [(0, True), (1, True)])
+
+    def testCancel(self):
+        # Jobs don't report any progress, so the cancel has to be noticed
+        # without a progress message.
+        engine = BatchRenderer(njobs=1, nthreads=1)
+        threading.Timer(.2, engine.cancel).start()
+        results = engine.run([self.job(.5)] * 3)
+
+        self.assertEquals(results, [False, None, None])
+
+
+
+def read_png(path):
+    """Decodes the pngs written by save_png_rows."""
+    with open(path, "rb") as f:
+        data = f.read()
+    assert data[:8] == "\x89PNG\r\n\x1a\n"
+    pos, chunks = 8, []
+    while pos < len(data):
+        length, = struct.unpack(">I", data[pos:pos+4])
+        kind, body = data[pos+4:pos+8], data[pos+8:pos+8+length]
+        crc, = struct.unpack(">I", data[pos+8+length:pos+12+length])
+        assert crc == zlib.crc32(kind + body) & 0xffffffff
+        chunks.append((kind, body))
+        pos += 12 + length
+    w, h, depth, color = struct.unpack(">IIBB", chunks[0][1][:10])
+    channels = 4 if color == 6 else 3
+    raw = zlib.decompress("".join(b for k, b in chunks if k == "IDAT"))
+    rows = numpy.fromstring(raw, numpy.uint8).reshape(h, w * channels + 1)
+    assert not rows[:, 0].any()
+    return rows[:, 1:].reshape(h, w, channels)
+
+
+
+class FakeGenome(object):
+    """Renders each pixel as its (x, y) position in the whole image."""
+    pixels_per_unit = 1.
+
+    def __init__(self, size):
+        self.size = size
+        self._center = [0., 0.]
+
+    def render(self, **kwds):
+        x0 = self._center[0] + (self.size[0] - self.width) / 2.
+        y0 = self._center[1] + (self.size[1] - self.height) / 2.
+        y, x = numpy.mgrid[:self.height, :self.width]
+        tile = numpy.zeros((self.height, self.width, 3), numpy.uint8)
+        tile[..., 0] = x + x0
+        tile[..., 1] = y + y0
+        return tile.tostring(), None
+
+
+
+class TestTiledRender(TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix=".png")
+        os.close(fd)
+        self.old = render._prepare_genome
+        render._prepare_genome = lambda flame, size, quality: FakeGenome(size)
+
+    def tearDown(self):
+        render._prepare_genome = self.old
+        os.remove(self.path)
+
+    def testPng(self):
+        image = numpy.random.randint(0, 256, (13, 7, 4)).astype(numpy.uint8)
+        save_png_rows(self.path, image, blocksize=50)
+
+        self.assert_((read_png(self.path) == image).all())
+
+    def testTiles(self):
+        size = 50, 30
+        self.assert_(flam3_render_tiled(Flame(), size, 1, self.path,
+                                        tiles=(3, 2), filter_radius=0,
+                                        estimator=0))
+
+        image = read_png(self.path)
+        y, x = numpy.mgrid[:size[1], :size[0]]
+        self.assert_((image[..., 0] == x).all())
+        self.assert_((image[..., 1] == y).all())
+        self.assertFalse(os.path.exists(self.path + ".tiles"))
+
+
+
+def checked_render(flame, size, quality, **kwds):
+    # flam3 takes sizes as c_ints, which don't accept floats.
+    if not all(type(i) is int for i in size):
+        raise TypeError("int expected instead of float")
+    return "\0" * (size[0] * size[1] * 3)
+
+
+def record_image(path, output_buffer, size, channels=3):
+    with open(path, "w") as f:
+        f.write(repr(size))
+
+
+
+class TestCommandLine(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "test.flame")
+        with open(self.path, "w") as f:
+            f.write('<flames>\n%s\n</flames>' % "\n".join(
+                '<flame name="%s" size="64 48" >\n'
+                '   <xform weight="1" linear="1" coefs="1 0 0 1 0 0" />\n'
+                '</flame>' % name for name in ("first", "second")))
+        self.old = render.flam3_render, render.save_image, \
+                   render.flam3_memory_required, sys.stdout
+        render.flam3_render = checked_render
+        render.save_image = record_image
+        render.flam3_memory_required = lambda *a, **k: 1
+        sys.stdout = StringIO.StringIO()
+
+    def tearDown(self):
+        render.flam3_render, render.save_image, \
+            render.flam3_memory_required, sys.stdout = self.old
+        shutil.rmtree(self.dir)
+
+    def main(self, *args):
+        output = os.path.join(self.dir, "out", "{file}-{index}-{name}.png")
+        return render.main([self.path, "-o", output] + list(args))
+
+    def rendered(self):
+        d = os.path.join(self.dir, "out")
+        return dict((name, open(os.path.join(d, name)).read())
+                    for name in os.listdir(d))
+
+    def testRender(self):
+        self.assertEquals(self.main(), 0)
+        self.assertEquals(self.rendered(),
+                          {"test-0-first.png": "(64, 48)",
+                           "test-1-second.png": "(64, 48)"})
+
+    def testOptions(self):
+        self.assertEquals(self.main("-n", "sec*", "-s", "32", "-j", "2"), 0)
+        self.assertEquals(self.rendered(), {"test-1-second.png": "(32, 24)"})
+
+    def testNoFlames(self):
+        sys.stderr, old = StringIO.StringIO(), sys.stderr
+        try:
+            self.assertEquals(self.main("-n", "missing"), 1)
+        finally:
+            sys.stderr = old
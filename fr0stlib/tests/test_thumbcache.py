@@ -0,0 +1,80 @@
+from unittest import TestCase
+import os
+import shutil
+import tempfile
+
+
+from fr0stlib.thumbcache import ThumbnailCache, thumbnail_key
+
+
+
+SETTINGS = dict(quality=10, estimator=1)
+
+class TestThumbnailKey(TestCase):
+    def testName(self):
+        a = '<flame name="a" size="10 10"><xform weight="1" linear="1"/></flame>'
+        b = '<flame name="b" size="10 10"><xform weight="1" linear="1"/></flame>'
+
+        self.assertEquals(thumbnail_key(a, (23, 23), SETTINGS),
+                          thumbnail_key(b, (23, 23), SETTINGS))
+        self.assertEquals(thumbnail_key(a, (23, 23), SETTINGS),
+                          thumbnail_key(unicode(a), (23, 23), SETTINGS))
+
+    def testDifferent(self):
+        a = '<flame name="a"><xform weight="1" linear="1"/></flame>'
+        b = '<flame name="a"><xform weight="1" julia="1"/></flame>'
+        key = thumbnail_key(a, (23, 23), SETTINGS)
+
+        self.assertNotEquals(key, thumbnail_key(b, (23, 23), SETTINGS))
+        self.assertNotEquals(key, thumbnail_key(a, (24, 23), SETTINGS))
+        self.assertNotEquals(key, thumbnail_key(a, (23, 23), {}))
+
+
+
+class TestThumbnailCache(TestCase):
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, "thumbnails.cache")
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def testPersist(self):
+        cache = ThumbnailCache(self.path)
+        cache.put("a" * 20, "abc")
+        cache.put("b" * 20, "defg")
+        cache.flush()
+
+        cache = ThumbnailCache(self.path)
+        self.assertEquals(len(cache), 2)
+        self.assertEquals(cache.get("a" * 20), "abc")
+        self.assertEquals(cache.get("b" * 20), "defg")
+        self.assertEquals(cache.get("c" * 20), None)
+
+    def testLookupKeepsFile(self):
+        cache = ThumbnailCache(self.path)
+        cache.put("a" * 20, "abc")
+        cache.flush()
+        os.remove(self.path)
+
+        # Lookups alone don't cause the file to be rewritten.
+        self.assertEquals(cache.get("a" * 20), "abc")
+        cache.flush()
+        self.assertFalse(os.path.exists(self.path))
+
+    def testEvict(self):
+        cache = ThumbnailCache(self.path, max_bytes=30)
+        for key in "abc":
+            cache.put(key * 20, "x" * 10)
+        cache.get("a" * 20)
+        cache.put("d" * 20, "x" * 10)
+
+        self.assert_("a" * 20 in cache)
+        self.assert_("b" * 20 not in cache)
+        self.assert_("d" * 20 in cache)
+
+    def testCorrupt(self):
+        with open(self.path, "wb") as f:
+            f.write("garbage")
+
+        self.assertEquals(len(ThumbnailCache(self.path)), 0)
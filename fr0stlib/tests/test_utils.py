@@ -0,0 +1,162 @@
+from unittest import TestCase
+from math import pi, cos
+import colorsys
+import numpy
+
+
+from fr0stlib import _utils as utils
+from fr0stlib.functions import array_pblend
+
+
+
+def old_pblend(s, e, i, curve=0):
+    """pblend as it was before it was typed."""
+    if i==0: return s
+    elif i==1: return e
+    if s==e: return s
+    if curve==0:
+        return s + ((e-s) * i)
+    return s + (0.5*(e-s)*(cos((i+1)*pi)+1))
+
+
+def random_blends(n):
+    s, e, i = numpy.random.random((3, n)).astype(numpy.float32)
+    # The values pblend treats specially.
+    i[:3] = 0, 1, .5
+    e[2] = s[2]
+    return s, e, i
+
+
+
+class TestPblend(TestCase):
+    def testArray(self):
+        s, e, i = random_blends(500)
+        for curve in (0, 1):
+            result = utils.pblend_array(s, e, i, curve)
+            self.assertEquals(result.dtype, numpy.float64)
+            for args, value in zip(zip(s, e, i), result):
+                self.assertEquals(utils.pblend(*args + (curve,)), value)
+                self.assertAlmostEquals(old_pblend(*args + (curve,)), value,
+                                        5)
+
+    def testParallel(self):
+        s, e, i = random_blends(100000)
+        for curve in (0, 1):
+            self.assert_((utils.pblend_array(s, e, i, curve, parallel=True)
+                          == utils.pblend_array(s, e, i, curve)).all())
+
+    def testArrayPblend(self):
+        # Blends from one color to another, as Palette.from_seed does.
+        start, end = (10, 200, 30), (250, 0, 30)
+        i = (numpy.arange(64) / 64.)[:,None]
+        for curve in (0, 1):
+            result = array_pblend(start, end, i, curve)
+            self.assertEquals(result.shape, (64, 3))
+            for step, color in zip(i[:,0], result):
+                self.assertEquals(tuple(color),
+                                  tuple(utils.pblend(x, y, step, curve)
+                                        for x, y in zip(start, end)))
+
+    def testInvalid(self):
+        s, e, i = random_blends(10)
+        self.assertRaises(ValueError, utils.pblend_array, s, e, i, 2)
+        self.assertRaises(ValueError, utils.pblend_array, s, e[:5], i)
+        self.assertRaises(ValueError, array_pblend, s, e, i, 2)
+
+
+
+class TestColors(TestCase):
+    def setUp(self):
+        self.colors = numpy.random.random((500, 3)).astype(numpy.float32)
+        self.colors[:2] = (.3, 0, .7), (0, 0, 0)
+
+    def testHsv2Rgb(self):
+        rgb = numpy.zeros((len(self.colors), 3), numpy.uint8)
+        utils.array_hsv2rgb(rgb, self.colors)
+        for hsv, color in zip(self.colors, rgb):
+            expected = [int(c * 255) for c in colorsys.hsv_to_rgb(*hsv)]
+            self.assert_(numpy.abs(color - expected).max() <= 1)
+
+    def testInterpUpdateRgb(self):
+        palette = numpy.zeros((len(self.colors), 6), numpy.float32)
+        palette[:, 3:] = self.colors
+        utils.interp_update_rgb(palette, 0, 1, 2, 3, 4, 5)
+        for hsv, rgb in zip(self.colors, palette[:, :3]):
+            self.assert_(numpy.allclose(rgb, colorsys.hsv_to_rgb(*hsv),
+                                        atol=1e-5))
+
+    def testInterpUpdateHsv(self):
+        palette = numpy.zeros((len(self.colors), 6), numpy.float32)
+        palette[:, :3] = self.colors
+        utils.interp_update_hsv(palette, 0, 1, 2, 3, 4, 5)
+        for rgb, hsv in zip(self.colors, palette[:, 3:]):
+            self.assert_(numpy.allclose(hsv, colorsys.rgb_to_hsv(*rgb),
+                                        atol=1e-5))
+
+
+
+class TestCdiff(TestCase):
+    # Every curve, with each mode of curve 10.
+    settings = [dict(curve=curve) for curve in range(-1, 10)] + \
+               [dict(curve=10, mode=mode) for mode in range(4)]
+
+    def testArray(self):
+        i = numpy.random.random(200).astype(numpy.float32)
+        i[0] = 0
+        for kwds in self.settings:
+            kwds = dict(kwds, amp=.5, freq=2, slope=2, peak=.3)
+            result = utils.cdiff_array(.7, i, **kwds)
+            expected = [utils.cdiff(.7, x, **kwds) for x in i]
+            self.assert_(numpy.allclose(result, expected), kwds)
+
+    def testParallel(self):
+        i = numpy.random.random(100000).astype(numpy.float32)
+        for kwds in self.settings:
+            kwds = dict(kwds, amp=.5)
+            self.assert_((utils.cdiff_array(.7, i, parallel=True, **kwds)
+                          == utils.cdiff_array(.7, i, **kwds)).all())
+
+    def testInvalid(self):
+        i = numpy.zeros(3, numpy.float32)
+        self.assertRaises(ValueError, utils.cdiff_array, 1, i, curve=11)
+        self.assertRaises(ValueError, utils.cdiff_array, 1, i, curve=9,
+                          peak=1)
+
+
+
+class TestSpline(TestCase):
+    cps = numpy.array((3, 5, 11, 2), numpy.float32)
+    times = numpy.array((0, 10, 17, 30), numpy.int32)
+
+    def testSplineAt(self):
+        # spline is spline_at at each step of the segment.
+        steps = numpy.arange(7, dtype=numpy.float32) / numpy.float32(7)
+        for kwds in ({}, dict(ti=1, ci=0, bi=-1, to=0, co=1, bo=1),
+                     dict(curve=7, amp=2, freq=3)):
+            self.assert_((utils.spline_at(self.cps, self.times, steps, **kwds)
+                          == utils.spline(self.cps, self.times, **kwds)).all())
+
+    def testParallel(self):
+        t = numpy.random.random(100000).astype(numpy.float32)
+        for kwds in ({}, dict(ci=0, bi=1, curve=8, amp=1, slope=2)):
+            self.assert_((utils.spline_at(self.cps, self.times, t,
+                                          parallel=True, **kwds)
+                          == utils.spline_at(self.cps, self.times, t,
+                                             **kwds)).all())
+        self.assert_((utils.spline(self.cps, self.times, parallel=True)
+                      == utils.spline(self.cps, self.times)).all())
+
+    def testDefaults(self):
+        # Without tension, continuity or bias, the segment is a straight line
+        # at every step between times[1] and times[2].
+        result = utils.spline(self.cps, self.times)
+        expected = 5 + 6 * numpy.arange(7) / 7.
+        self.assertEquals(len(result), 7)
+        self.assert_(numpy.allclose(result, expected, atol=1e-5))
+
+    def testInvalid(self):
+        cps = numpy.zeros(4, numpy.float32)
+        times = numpy.arange(4, dtype=numpy.int32)
+        self.assertRaises(ValueError, utils.spline, cps, times, curve=11)
+        self.assertRaises(ValueError, utils.spline, cps, times, curve=7,
+                          freq=0)
@@ -0,0 +1,145 @@
+from __future__ import with_statement
+import os
+import struct
+import hashlib
+import tempfile
+import threading
+import re
+
+
+_re_name = re.compile(r'\sname="[^"]*"')
+
+def flame_hash(string):
+    """Returns a sha1 object of a flame string. The flame name is left out,
+    since it doesn't affect the image. The string isn't parsed, which keeps
+    this cheap enough to run on whole files; flames that only differ in
+    formatting just get different hashes."""
+    if isinstance(string, unicode):
+        string = string.encode("utf-8")
+    end = string.find(">")
+    h = hashlib.sha1(_re_name.sub("", string[:end], 1))
+    h.update(string[end:])
+    return h
+
+
+def thumbnail_key(string, size, settings):
+    """Returns a hash identifying the thumbnail of a flame."""
+    h = flame_hash(string)
+    h.update(repr((tuple(size), sorted(settings.items()))))
+    return h.digest()
+
+
+
+class ThumbnailCache(object):
+    """Stores rendered thumbnails in a single packed file. Entries are the raw
+    image data, looked up by thumbnail_key. When the cache grows past
+    max_bytes, the least recently used entries are evicted.
+
+    The whole cache is kept in memory, and only written back by flush."""
+
+    _magic = "FR0STTHM"
+    _version = 1
+    _header = struct.Struct("<8sI")
+    _record = struct.Struct("<20sQI")
+
+    def __init__(self, path, max_bytes=32 * 1024**2):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._entries = {}
+        self._size = 0
+        self._clock = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+        try:
+            self._load()
+        except (IOError, struct.error, ValueError):
+            # A missing or corrupt cache is simply rebuilt.
+            self._entries.clear()
+            self._size = 0
+
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            buf = f.read()
+        magic, version = self._header.unpack_from(buf)
+        if magic != self._magic or version != self._version:
+            raise ValueError("%s is not a thumbnail cache" % self.path)
+        offset = self._header.size
+        while offset < len(buf):
+            key, stamp, length = self._record.unpack_from(buf, offset)
+            offset += self._record.size
+            data = buf[offset:offset + length]
+            if len(data) != length:
+                raise ValueError("Truncated thumbnail cache")
+            offset += length
+            self._entries[key] = [stamp, data]
+            self._size += length
+            self._clock = max(self._clock, stamp)
+
+
+    def __len__(self):
+        return len(self._entries)
+
+
+    def __contains__(self, key):
+        return key in self._entries
+
+
+    def get(self, key):
+        """Returns the data stored under key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            # Recency is only tracked in memory. Marking the cache dirty here
+            # would rewrite the whole file after every lookup.
+            self._clock += 1
+            entry[0] = self._clock
+            return entry[1]
+
+
+    def put(self, key, data):
+        with self._lock:
+            old = self._entries.get(key)
+            if old is not None:
+                self._size -= len(old[1])
+            self._clock += 1
+            self._entries[key] = [self._clock, data]
+            self._size += len(data)
+            self._dirty = True
+            if self._size > self.max_bytes:
+                self._evict()
+
+
+    def _evict(self):
+        # Evict down to 90% of the limit, so a full cache doesn't need to
+        # sort its entries on every insert.
+        target = self.max_bytes * 0.9
+        stamps = sorted((v[0], k) for k, v in self._entries.iteritems())
+        for stamp, key in stamps:
+            if self._size <= target:
+                break
+            self._size -= len(self._entries.pop(key)[1])
+
+
+    def flush(self):
+        """Writes the cache to disk if it has changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            dirname = os.path.dirname(os.path.abspath(self.path))
+            fd, temppath = tempfile.mkstemp(suffix=".tmp", dir=dirname)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(self._header.pack(self._magic, self._version))
+                    for key, (stamp, data) in self._entries.iteritems():
+                        f.write(self._record.pack(key, stamp, len(data)))
+                        f.write(data)
+            except:
+                os.remove(temppath)
+                raise
+            if os.path.exists(self.path):
+                # rename can't overwrite existing files on windows.
+                os.remove(self.path)
+            os.rename(temppath, self.path)
+            self._dirty = False
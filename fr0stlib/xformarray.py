@@ -0,0 +1,121 @@
+import numpy
+
+from fr0stlib.pyflam3.variations import variations, variation_list, \
+     variable_list
+from fr0stlib.pyflam3.constants import flam3_nvariations
+
+
+_params = [name for name, _, _, _ in variable_list]
+_param_ids = dict((name, i) for i, name in enumerate(_params))
+_attributes = "weight", "color", "color_speed", "animate", "opacity"
+
+
+class XformArray(object):
+    """Columnar copy of the (non-final) xforms of a flame. Row i of each
+    array belongs to flame.xform[i]:
+
+    coefs:      (n, 6) affine coefs, in the same order as Xform.coefs.
+    post:       (n, 6) post coefs.
+    weight, color, color_speed, animate, opacity:
+                (n,) xform attributes.
+    variations: (n, flam3_nvariations) variation weights, indexed by the
+                ids in pyflam3.variations.variations.
+    params:     (n, len(variable_list)) variation parameters. Parameters
+                which aren't set on an xform are nan.
+    chaos:      (n, n) matrix, where chaos[i, j] is the chaos value xform i
+                has towards xform j.
+
+    Bulk edits can be done as numpy operations on whole columns, and are
+    written back to the flame with apply."""
+
+    def __init__(self, flame):
+        xforms = flame.xform
+        n = len(xforms)
+        self.coefs = numpy.array([x.coefs for x in xforms],
+                                 numpy.float64).reshape(n, 6)
+        self.post = numpy.array([x.post.coefs for x in xforms],
+                                numpy.float64).reshape(n, 6)
+        for name in _attributes:
+            setattr(self, name, numpy.array([getattr(x, name) for x in xforms],
+                                            numpy.float64))
+        self.variations = numpy.zeros((n, flam3_nvariations))
+        self.params = numpy.empty((n, len(_params)))
+        self.params.fill(numpy.nan)
+        for i, x in enumerate(xforms):
+            for k, v in x.__dict__.iteritems():
+                if k in variations:
+                    self.variations[i, variations[k]] = v
+                elif k in _param_ids:
+                    self.params[i, _param_ids[k]] = v
+        self.chaos = numpy.array([x.chaos[:] for x in xforms],
+                                 numpy.float64).reshape(n, n)
+
+
+    def __len__(self):
+        return len(self.coefs)
+
+
+    def copy(self):
+        new = object.__new__(type(self))
+        new.__dict__.update((k, v.copy()) for k, v in self.__dict__.iteritems())
+        return new
+
+
+    def apply(self, flame):
+        """Writes the arrays back to the xforms of flame, which must have the
+        same number of xforms the array was created with."""
+        if len(flame.xform) != len(self):
+            raise ValueError("Flame has %s xforms, expected %s"
+                             % (len(flame.xform), len(self)))
+        for i, x in enumerate(flame.xform):
+            x.coefs = self.coefs[i].tolist()
+            x.post.coefs = self.post[i].tolist()
+            for name in _attributes:
+                v = float(getattr(self, name)[i])
+                if v != getattr(x, name):
+                    setattr(x, name, v)
+            row = self.variations[i]
+            ids = set(numpy.flatnonzero(row))
+            ids.update(variations[k] for k in x.__dict__ if k in variations)
+            for id in ids:
+                setattr(x, variation_list[id], float(row[id]))
+            for id in numpy.flatnonzero(~numpy.isnan(self.params[i])):
+                setattr(x, _params[id], float(self.params[i, id]))
+            x.chaos[:] = self.chaos[i].tolist()
+
+
+    def rotate(self, deg):
+        """Rotates the x and y vectors of all xforms, like Xform.rotate."""
+        angle = numpy.radians(deg)
+        cos, sin = numpy.cos(angle), numpy.sin(angle)
+        for x, y in ((0, 1), (2, 3)):
+            vx, vy = self.coefs[:, x].copy(), self.coefs[:, y].copy()
+            self.coefs[:, x] = vx * cos - vy * sin
+            self.coefs[:, y] = vx * sin + vy * cos
+
+
+    def scale(self, v):
+        """Scales the x and y vectors of all xforms, like Xform.scale."""
+        self.coefs[:, :4] *= v
+
+
+    def normalize_weights(self):
+        """Scales xform weights so they add up to 1."""
+        total = self.weight.sum()
+        if total:
+            self.weight /= total
+
+
+    def blend(self, other, t):
+        """Returns a new array linearly interpolated between self (t=0) and
+        other (t=1). Parameters missing on one side take the other's value."""
+        if self.coefs.shape != other.coefs.shape:
+            raise ValueError("Can't blend arrays of different sizes")
+        new = self.copy()
+        for k, v in new.__dict__.iteritems():
+            a, b = getattr(self, k), getattr(other, k)
+            if k == "params":
+                a = numpy.where(numpy.isnan(a), b, a)
+                b = numpy.where(numpy.isnan(b), a, b)
+            v[:] = a + (b - a) * t
+        return new
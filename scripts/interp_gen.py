@@ -17,17 +17,17 @@ def interpolation(keys, n=50, **kwargs):
     tmp = []
     if loop:
         for i in xrange(len(keys)-1):
-            k1 = Flame(string=keys[i].to_string())
-            k2 = Flame(string=keys[i+1].to_string())
+            k1 = keys[i].copy()
+            k2 = keys[i+1].copy()
             equalize_flame_attributes(k1, k2)
             if loops: tmp.append(k1)
             tmp.append(k1)
             if i==len(keys)-2:tmp.append(k2)
-        tmp.append(Flame(string=keys[-1].to_string()))
+        tmp.append(keys[-1].copy())
     else:
         for i in xrange(len(keys)):
-            k1 = Flame(string=keys[i-1].to_string())
-            k2 = Flame(string=keys[i].to_string())
+            k1 = keys[i-1].copy()
+            k2 = keys[i].copy()
             equalize_flame_attributes(k1, k2)
             if loops: tmp.append(k2)
             tmp.append(k2)
@@ -1,46 +1,34 @@
 ''' "It's aliiiiive!" he screamed, as the rotating sheep
 mutated in realtime before his very eyes.'''
 
-import time
 
-def ScriptHack(func):
-    # First, hack our way around some "limitations". I want to keep
-    # all changes confined to this script, at least for now.
-    # Don't do this at home.
+class Rotation(object):
+    """One full turn of all animated xforms, 3 degrees per frame. Frames are
+    only made when the preview window asks for them, from the flame as it is
+    then. Edits show up once the frames already buffered have played."""
 
-    # Prevent normal updates to the preview window.
-    global preview
-    preview = self.image.RenderPreview
-    self.image.RenderPreview = lambda *a, **k: None
+    def __init__(self, flame, step=3):
+        self.flame = flame
+        self.step = step
 
-    # Make the GUI believe the script is not running, so it'll
-    # allow us to modify things on the canvas.
-    self.scriptrunning = False
-
-    # On to the actual script
-    try:
-        func()
-    finally:
-        # Undo the hackery. Stopping the script raises an
-        # exception, so we need the finally clause.
-        self.image.RenderPreview = preview
-        preview()
-        large_preview()
 
+    def __len__(self):
+        return 360 // self.step
 
 
-def main():
-    """This is the actual script."""
-    rot = 0
-    while True:
-        rot = (rot-3) % 360
-        f = flame.copy()
+    def __getitem__(self, i):
+        f = self.flame.copy()
         for x in f.xform:
             if x.animate:
-                x.rotate(rot)
-        preview(f)
-        time.sleep(0.05)
+                x.rotate(-self.step * i)
+        return f
+
 
 
 if __name__ == "__main__":
-    ScriptHack(main)
+    # Make the GUI believe the script is not running, so the flame can still
+    # be edited while it plays. It's reset when the script ends.
+    self.scriptrunning = False
+
+    # Loops until the preview window is closed or the script is stopped.
+    play(Rotation(flame))
@@ -26,6 +26,7 @@ from distutils.extension import Extension
 from Cython.Distutils import build_ext
 import commands
 import os
+import sys
 
 
 # Taken from partiwm(http://partiwm.org/)
@@ -55,6 +56,17 @@ def numpy_compiler_options():
     return {'include_dirs': [numpy.get_include()]}
 
 
+def openmp_compiler_options():
+    # The array kernels in _utils can run in parallel with OpenMP. Without
+    # it they still build, and run on a single thread.
+    if sys.platform == 'win32':
+        return {'extra_compile_args': ['/openmp']}
+    elif sys.platform == 'darwin':
+        return {}
+    return {'extra_compile_args': ['-fopenmp'],
+            'extra_link_args': ['-fopenmp']}
+
+
 def merge_options(x, y):
     for k, v in y.iteritems():
         if k not in x:
@@ -79,7 +91,7 @@ setup(
     name = "_utils",
     ext_modules=[
         _Extension("fr0stlib._utils", ["fr0stlib/_utils.pyx"],
-            numpy_compiler_options()
+            numpy_compiler_options(), openmp_compiler_options()
         ),
     ],
     cmdclass = {'build_ext': build_ext}
@@ -30,7 +30,10 @@ cython_sources = [
 
 c_sources = [os.path.splitext(x)[0] + '.c' for x in cython_sources]
 
-if not os.path.exists(c_sources[0]):
+# The generated .c isn't kept in the repository, so it's made here, and made
+# again whenever the .pyx is newer.
+if not os.path.exists(c_sources[0]) or \
+   os.path.getmtime(c_sources[0]) < os.path.getmtime(cython_sources[0]):
     # Need to cythonize the source files
     try:
         from Cython.Compiler.Main import compile as cython_compile
@@ -225,7 +228,8 @@ setup(
 
     ext_modules=[
         Extension(fr0st_package_name + "._utils", [fr0st_package_name + "/_utils.c"], 
-            include_dirs=[numpy.get_include()]
+            include_dirs=[numpy.get_include()],
+            extra_compile_args=['/openmp'],
         ),
     ],
     zipfile = r'fr0st.zip',